@@ -0,0 +1,8 @@
+SUCCESS = 0
+ARGUMENT_ERROR = 2
+DEPENDENCY_ERROR = 10
+DATABASE_ERROR = 20
+REDIS_ERROR = 21
+SCHEDULER_ERROR = 22
+GUARD_REJECTED = 30
+RUNTIME_ERROR = 50
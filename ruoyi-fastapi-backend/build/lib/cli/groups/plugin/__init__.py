@@ -0,0 +1,3 @@
+from .command import app
+
+__all__ = ['app']
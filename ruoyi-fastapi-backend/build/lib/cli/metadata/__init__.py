@@ -0,0 +1,10 @@
+from cli.metadata.command_specs import COMPLETION_SHELL_SPEC_REGISTRY, CompletionShellSpec, CompletionShellSpecRegistry
+from cli.metadata.option_specs import ENVIRONMENT_OPTION_SERVICE, EnvironmentOptionService
+
+__all__ = [
+    'COMPLETION_SHELL_SPEC_REGISTRY',
+    'ENVIRONMENT_OPTION_SERVICE',
+    'CompletionShellSpec',
+    'CompletionShellSpecRegistry',
+    'EnvironmentOptionService',
+]
@@ -0,0 +1,3 @@
+from cli.runtime.base import RUNTIME_ENVIRONMENT, RuntimeEnvironmentService
+
+__all__ = ['RUNTIME_ENVIRONMENT', 'RuntimeEnvironmentService']
@@ -0,0 +1,3 @@
+from .service import APP_RUNTIME, AppRuntimeService
+
+__all__ = ['APP_RUNTIME', 'AppRuntimeService']
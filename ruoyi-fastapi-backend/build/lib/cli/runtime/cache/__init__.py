@@ -0,0 +1,3 @@
+from .service import CACHE_RUNTIME, CacheRuntimeService
+
+__all__ = ['CACHE_RUNTIME', 'CacheRuntimeService']
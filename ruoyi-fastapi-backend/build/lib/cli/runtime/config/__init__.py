@@ -0,0 +1,3 @@
+from .service import CONFIG_RUNTIME, ConfigRuntimeService
+
+__all__ = ['CONFIG_RUNTIME', 'ConfigRuntimeService']
@@ -0,0 +1,3 @@
+from .service import CRYPTO_RUNTIME, CryptoRuntimeService
+
+__all__ = ['CRYPTO_RUNTIME', 'CryptoRuntimeService']
@@ -0,0 +1,3 @@
+from .service import DATABASE_RUNTIME, DatabaseRuntimeService
+
+__all__ = ['DATABASE_RUNTIME', 'DatabaseRuntimeService']
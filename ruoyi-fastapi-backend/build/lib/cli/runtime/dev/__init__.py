@@ -0,0 +1,3 @@
+from .service import DEVELOPMENT_RUNTIME, DevelopmentRuntimeService
+
+__all__ = ['DEVELOPMENT_RUNTIME', 'DevelopmentRuntimeService']
@@ -0,0 +1,3 @@
+from .service import GEN_RUNTIME, GenRuntimeService
+
+__all__ = ['GEN_RUNTIME', 'GenRuntimeService']
@@ -0,0 +1,3 @@
+from .service import JOB_RUNTIME, JobRuntimeService
+
+__all__ = ['JOB_RUNTIME', 'JobRuntimeService']
@@ -0,0 +1,3 @@
+from .service import OPERATIONS_RUNTIME, OperationsRuntimeService
+
+__all__ = ['OPERATIONS_RUNTIME', 'OperationsRuntimeService']
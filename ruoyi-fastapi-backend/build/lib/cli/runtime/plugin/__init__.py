@@ -0,0 +1,3 @@
+from .service import PLUGIN_RUNTIME, CliPluginRuntimeService
+
+__all__ = ['PLUGIN_RUNTIME', 'CliPluginRuntimeService']
@@ -0,0 +1,26 @@
+from .backend import PluginBackendScaffoldTemplateBuilder
+from .builder import PluginScaffoldBuilder
+from .frontend import FrontendVersion, PluginFrontendScaffoldTemplateBuilder, PluginFrontendVersionResolver
+from .naming import PluginScaffoldNaming
+from .options import PluginScaffoldOptions, PluginScaffoldTemplateResolver
+from .payload import (
+    PluginScaffoldConflictPayload,
+    PluginScaffoldPayloadBuilder,
+    PluginScaffoldPlanPayload,
+    PluginScaffoldSuccessPayload,
+)
+
+__all__ = [
+    'FrontendVersion',
+    'PluginBackendScaffoldTemplateBuilder',
+    'PluginFrontendScaffoldTemplateBuilder',
+    'PluginFrontendVersionResolver',
+    'PluginScaffoldBuilder',
+    'PluginScaffoldConflictPayload',
+    'PluginScaffoldNaming',
+    'PluginScaffoldOptions',
+    'PluginScaffoldPayloadBuilder',
+    'PluginScaffoldPlanPayload',
+    'PluginScaffoldSuccessPayload',
+    'PluginScaffoldTemplateResolver',
+]
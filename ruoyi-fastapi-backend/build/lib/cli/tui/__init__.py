@@ -0,0 +1,3 @@
+from cli.tui.commands import TUI_COMMAND_REGISTRATION
+
+__all__ = ['TUI_COMMAND_REGISTRATION']
@@ -0,0 +1,10 @@
+from cli.tui.actions.bootstrap import TUI_ACTION_EXECUTION_SERVICE, TUI_ACTION_PRESENTATION_SERVICE, TUI_ACTION_REGISTRY
+from cli.tui.actions.models import TuiActionResult, TuiActionSpec
+
+__all__ = [
+    'TUI_ACTION_EXECUTION_SERVICE',
+    'TUI_ACTION_PRESENTATION_SERVICE',
+    'TUI_ACTION_REGISTRY',
+    'TuiActionResult',
+    'TuiActionSpec',
+]
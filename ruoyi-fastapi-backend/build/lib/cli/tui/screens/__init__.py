@@ -0,0 +1,5 @@
+from cli.tui.screens.browser import BrowserScreen
+from cli.tui.screens.dashboard import DashboardScreen
+from cli.tui.screens.detail import DetailScreen
+
+__all__ = ['BrowserScreen', 'DashboardScreen', 'DetailScreen']
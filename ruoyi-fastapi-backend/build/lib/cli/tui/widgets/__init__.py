@@ -0,0 +1,27 @@
+from cli.tui.widgets.status_panel import MetricPanel, SignalRail, StatusPanel
+from cli.tui.widgets.workspace import (
+    NavigationItem,
+    RecordDetailView,
+    RecordNavigator,
+    RecordSummaryView,
+    SectionDetailView,
+    SectionNavigator,
+    WorkspaceHeader,
+    WorkspaceHero,
+    WorkspaceSidebar,
+)
+
+__all__ = [
+    'MetricPanel',
+    'NavigationItem',
+    'RecordDetailView',
+    'RecordNavigator',
+    'RecordSummaryView',
+    'SectionDetailView',
+    'SectionNavigator',
+    'SignalRail',
+    'StatusPanel',
+    'WorkspaceHeader',
+    'WorkspaceHero',
+    'WorkspaceSidebar',
+]
@@ -189,8 +189,7 @@ class CacheRuntimeService:
                     await redis.delete(*target_keys)
 
                 if clear_all:
-                    await redis_util.init_sys_dict(redis)
-                    await redis_util.init_sys_config(redis)
+                    await redis_util.warmup_sys_cache(redis)
 
                 result['message'] = '缓存清理完成'
                 return result
@@ -206,8 +205,7 @@ class CacheRuntimeService:
         redis_error = self.infrastructure_gateway.get_redis_error_class()
         try:
             async with self.redis_support.redis_session() as (redis, redis_util):
-                await redis_util.init_sys_dict(redis)
-                await redis_util.init_sys_config(redis)
+                await redis_util.warmup_sys_cache(redis)
                 return {'ok': True, 'message': '缓存预热完成'}
         except redis_error as exc:
             return self.redis_support.build_redis_error_result('缓存预热失败', exc)
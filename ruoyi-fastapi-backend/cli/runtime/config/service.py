@@ -245,8 +245,8 @@ class ConfigRuntimeService:
         async_session_local = self.infrastructure_gateway.get_async_session_local()
         config_dao = self.infrastructure_gateway.get_config_dao()
         config_vo_module = self.infrastructure_gateway.get_config_vo_module()
+        config_service = self.infrastructure_gateway.get_config_service()
         redis_util = self.infrastructure_gateway.get_redis_util()
-        redis_init_key_config = self.infrastructure_gateway.get_redis_init_key_config()
         redis_error = self.infrastructure_gateway.get_redis_error_class()
         existing_config = None
         target_config = None
@@ -292,7 +292,7 @@ class ConfigRuntimeService:
         redis = None
         try:
             redis = await redis_util.create_redis_pool(log_enabled=False)
-            await redis.set(f'{redis_init_key_config.SYS_CONFIG.key}:{config_key}', config_value)
+            await config_service.set_config_cache_services(redis, config_key, config_value)
         except redis_error as exc:
             return {
                 'ok': False,
@@ -346,7 +346,8 @@ class GenRuntimeService:
         try:
             async with async_session_local() as session:
                 if mode == 'zip':
-                    zip_bytes = await gen_table_service.batch_gen_code_services(session, normalized_table_names)
+                    zip_chunks = await gen_table_service.batch_gen_code_services(session, normalized_table_names)
+                    zip_bytes = b''.join([chunk async for chunk in zip_chunks])
                 else:
                     messages = []
                     for table_name in normalized_table_names:
@@ -1,19 +1,27 @@
+import asyncio
 import hashlib
 import json
+import math
+import random
+import time
+import uuid
+from collections import Counter
 from collections.abc import Awaitable, Callable, Sequence
 from datetime import datetime
 from functools import wraps
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 from fastapi import Request
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse, UJSONResponse
 from redis import asyncio as aioredis
+from redis.exceptions import RedisError
 from typing_extensions import ParamSpec
 
 from common.constant import HttpStatusConstant
 from common.context import RequestContext
 from common.enums import HttpMethod, RedisInitKeyConfig
+from config.env import AppConfig
 from exceptions.exception import LoginException
 from utils.api_annotation_util import ApiAnnotationUtil
 from utils.api_response_header_util import ApiResponseHeaderUtil
@@ -21,6 +29,7 @@ from utils.log_util import logger
 
 P = ParamSpec('P')
 R = TypeVar('R')
+ApiCacheStatus = Literal['HIT', 'MISS', 'STALE', 'COALESCED']
 
 
 class ApiCacheManager:
@@ -130,6 +139,91 @@ class ApiCacheManager:
         return await redis.delete(*cache_keys)
 
 
+class ApiCacheStats:
+    """
+    接口缓存命中统计工具类
+
+    统计数据先在进程内累计，再按固定间隔通过管道批量写入Redis，避免每次请求额外增加一次Redis往返。
+    """
+
+    STATUSES: tuple[ApiCacheStatus, ...] = ('HIT', 'MISS', 'STALE', 'COALESCED')
+    _FLUSH_INTERVAL = 1.0
+    _pending: Counter[tuple[str, str]] = Counter()
+    _last_flush_at = 0.0
+
+    @classmethod
+    def build_stats_key(cls, namespace: str) -> str:
+        """
+        生成命名空间统计键
+
+        :param namespace: 缓存命名空间
+        :return: 统计键
+        """
+        return f'{RedisInitKeyConfig.API_CACHE_STATS.key}:{namespace}'
+
+    @classmethod
+    async def record(cls, redis: aioredis.Redis, namespace: str, cache_status: ApiCacheStatus) -> None:
+        """
+        记录一次接口缓存访问结果
+
+        :param redis: Redis连接对象
+        :param namespace: 缓存命名空间
+        :param cache_status: 缓存访问结果
+        :return: None
+        """
+        cls._pending[(namespace, cache_status.lower())] += 1
+        if time.monotonic() - cls._last_flush_at >= cls._FLUSH_INTERVAL:
+            await cls.flush(redis)
+
+    @classmethod
+    async def flush(cls, redis: aioredis.Redis) -> None:
+        """
+        将进程内累计的统计数据写入Redis
+
+        :param redis: Redis连接对象
+        :return: None
+        """
+        cls._last_flush_at = time.monotonic()
+        pending, cls._pending = cls._pending, Counter()
+        if not pending:
+            return
+
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for (namespace, field), count in pending.items():
+                    pipe.hincrby(cls.build_stats_key(namespace), field, count)
+                await pipe.execute()
+        except RedisError as e:
+            cls._pending.update(pending)
+            logger.warning(f'接口缓存统计写入失败: {e}')
+
+    @classmethod
+    async def get_stats(cls, redis: aioredis.Redis) -> dict[str, dict[str, int]]:
+        """
+        获取各命名空间的接口缓存命中统计
+
+        :param redis: Redis连接对象
+        :return: 以命名空间为键的hit/miss/stale/coalesced计数
+        """
+        await cls.flush(redis)
+        stats_keys = [key async for key in redis.scan_iter(match=cls.build_stats_key('*'))]
+        if not stats_keys:
+            return {}
+
+        async with redis.pipeline(transaction=False) as pipe:
+            for stats_key in stats_keys:
+                pipe.hgetall(stats_key)
+            stats_values = await pipe.execute()
+
+        prefix_length = len(cls.build_stats_key(''))
+        return {
+            stats_key[prefix_length:]: {
+                cache_status.lower(): int(values.get(cache_status.lower(), 0)) for cache_status in cls.STATUSES
+            }
+            for stats_key, values in sorted(zip(stats_keys, stats_values, strict=True))
+        }
+
+
 class _ApiCacheSupport:
     """
     接口缓存装饰器共用工具基类
@@ -200,7 +294,19 @@ class _ApiCacheSupport:
 class ApiCache(_ApiCacheSupport):
     """
     接口缓存装饰器，仅用于幂等且返回JSON的接口
+
+    同一缓存键未命中时，本进程内通过共享Future合并并发请求，跨进程通过短期Redis锁保证只有一个请求重新计算；
+    缓存软过期后在宽限期内继续返回旧内容，仅由抢到重新计算锁的请求刷新缓存。
+    """
+
+    _LOCK_POLL_INTERVAL = 0.05
+    _RELEASE_LOCK_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
     """
+    _inflight: dict[str, asyncio.Future[str | None]] = {}
 
     def __init__(
         self,
@@ -209,6 +315,7 @@ class ApiCache(_ApiCacheSupport):
         vary_by_user: bool = True,
         methods: Sequence[HttpMethod] | None = None,
         cache_response_codes: set[int] | None = None,
+        stale_seconds: int | None = None,
     ) -> None:
         """
         初始化接口缓存装饰器
@@ -218,6 +325,7 @@ class ApiCache(_ApiCacheSupport):
         :param vary_by_user: 是否按当前登录用户隔离缓存
         :param methods: 允许启用缓存的HttpMethod枚举列表，为None时默认仅缓存GET请求
         :param cache_response_codes: 允许缓存的业务响应码，为None时默认仅缓存成功响应
+        :param stale_seconds: 缓存过期后允许返回旧内容的秒数，为None时使用全局配置
         """
         self.namespace = namespace
         self.expire_seconds = expire_seconds
@@ -226,6 +334,7 @@ class ApiCache(_ApiCacheSupport):
         self.cache_response_codes = (
             cache_response_codes if cache_response_codes is not None else {HttpStatusConstant.SUCCESS}
         )
+        self.stale_seconds = stale_seconds
 
     def __call__(self, func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
         """
@@ -247,16 +356,143 @@ class ApiCache(_ApiCacheSupport):
 
             cache_key = await self._build_cache_key(request)
             cached_response = await redis.get(cache_key)
+            stale_payload = None
             if cached_response:
-                return self._build_cached_response(cached_response)  # type: ignore[return-value]
+                cached_payload = json.loads(cached_response)
+                if not self._is_payload_stale(cached_payload):
+                    return await self._respond_cached(redis, cached_payload, 'HIT')  # type: ignore[return-value]
+                stale_payload = cached_payload
+
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                # 本进程已有请求在重新计算：有旧内容时直接返回，否则等待其结果
+                if stale_payload is not None:
+                    return await self._respond_cached(redis, stale_payload, 'STALE')  # type: ignore[return-value]
+                serialized_response = await self._wait_for_inflight(inflight)
+                if serialized_response is not None:
+                    return await self._respond_cached(  # type: ignore[return-value]
+                        redis, json.loads(serialized_response), 'COALESCED'
+                    )
+
+            return await self._load_response(request, redis, cache_key, stale_payload, func, *args, **kwargs)
 
-            result = await func(*args, **kwargs)
-            await self._cache_response(redis, cache_key, result)
+        return wrapper
+
+    async def _load_response(
+        self,
+        request: Request,
+        redis: aioredis.Redis,
+        cache_key: str,
+        stale_payload: dict[str, Any] | None,
+        func: Callable[P, Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """
+        作为本进程内该缓存键的唯一计算者获取响应，并在集群内抢占重新计算锁
+
+        :param request: 当前请求对象
+        :param redis: Redis连接对象
+        :param cache_key: 接口缓存键
+        :param stale_payload: 已软过期的缓存载荷，不存在时为None
+        :param func: 被缓存的异步接口函数
+        :param args: 位置参数
+        :param kwargs: 关键字参数
+        :return: 接口响应
+        """
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        serialized_response = None
+        try:
+            lock_key = self._build_lock_key(cache_key)
+            lock_token = uuid.uuid4().hex
+            if not await redis.set(lock_key, lock_token, nx=True, ex=AppConfig.app_api_cache_lock_seconds):
+                lock_token = None
+                if stale_payload is not None:
+                    return await self._respond_cached(redis, stale_payload, 'STALE')  # type: ignore[return-value]
+                serialized_response = await self._wait_for_peer(redis, cache_key, lock_key)
+                if serialized_response is not None:
+                    return await self._respond_cached(  # type: ignore[return-value]
+                        redis, json.loads(serialized_response), 'COALESCED'
+                    )
+
+            try:
+                result = await func(*args, **kwargs)
+                serialized_response = await self._cache_response(redis, cache_key, result)
+            finally:
+                if lock_token is not None:
+                    await redis.eval(self._RELEASE_LOCK_SCRIPT, 1, lock_key, lock_token)
             ApiResponseHeaderUtil.merge_headers(request, {'X-Api-Cache': 'MISS'})
+            await ApiCacheStats.record(redis, self.namespace, 'MISS')
 
             return result
+        finally:
+            # 计算失败或响应不可缓存时结果为None，等待中的请求将自行执行接口
+            if self._inflight.get(cache_key) is future:
+                self._inflight.pop(cache_key)
+            if not future.done():
+                future.set_result(serialized_response)
 
-        return wrapper
+    async def _wait_for_inflight(self, inflight: asyncio.Future[str | None]) -> str | None:
+        """
+        等待本进程内正在进行的重新计算完成
+
+        :param inflight: 重新计算结果Future
+        :return: 序列化后的缓存内容，超时或不可缓存时返回None
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(inflight), timeout=AppConfig.app_api_cache_lock_seconds)
+        except asyncio.TimeoutError:
+            return None
+
+    async def _wait_for_peer(self, redis: aioredis.Redis, cache_key: str, lock_key: str) -> str | None:
+        """
+        等待其他进程完成重新计算并写入缓存
+
+        :param redis: Redis连接对象
+        :param cache_key: 接口缓存键
+        :param lock_key: 重新计算锁键
+        :return: 序列化后的缓存内容，锁已释放仍未写入或等待超时时返回None
+        """
+        deadline = time.monotonic() + AppConfig.app_api_cache_lock_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self._LOCK_POLL_INTERVAL)
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.get(cache_key)
+                pipe.exists(lock_key)
+                cached_response, is_locked = await pipe.execute()
+            if cached_response:
+                return cached_response
+            if not is_locked:
+                return None
+
+        return None
+
+    def _build_lock_key(self, cache_key: str) -> str:
+        """
+        生成缓存键对应的重新计算锁键
+
+        :param cache_key: 接口缓存键
+        :return: 重新计算锁键
+        """
+        return f'{RedisInitKeyConfig.API_CACHE_LOCK.key}:{cache_key.split(":", 1)[1]}'
+
+    def _get_stale_seconds(self) -> int:
+        """
+        获取缓存过期后允许返回旧内容的秒数
+
+        :return: 宽限秒数
+        """
+        return self.stale_seconds if self.stale_seconds is not None else AppConfig.app_api_cache_stale_seconds
+
+    def _is_payload_stale(self, cached_payload: dict[str, Any]) -> bool:
+        """
+        判断缓存载荷是否已软过期
+
+        :param cached_payload: 缓存载荷
+        :return: 是否已软过期
+        """
+        return cached_payload.get('fresh_until', math.inf) <= time.time()
 
     def _is_request_method_allowed(self, request: Request) -> bool:
         """
@@ -312,19 +548,6 @@ class ApiCache(_ApiCacheSupport):
             authorization = request.headers.get('Authorization', '')
             return hashlib.sha256(authorization.encode('utf-8')).hexdigest() if authorization else ''
 
-    def _serialize_response(self, result: Any) -> str | None:
-        """
-        将响应对象序列化为可存入缓存的字符串
-
-        :param result: 原始接口返回结果
-        :return: 序列化后的缓存内容，不可缓存时返回None
-        """
-        response_payload = self._extract_response_payload(result)
-        if response_payload is None:
-            return None
-
-        return json.dumps(response_payload, ensure_ascii=False)
-
     def _extract_response_payload(self, result: Any) -> dict[str, Any] | None:
         """
         提取可缓存的响应载荷
@@ -365,14 +588,28 @@ class ApiCache(_ApiCacheSupport):
             'headers': {},
         }
 
-    def _build_cached_response(self, cached_response: str) -> JSONResponse:
+    async def _respond_cached(
+        self, redis: aioredis.Redis, cached_payload: dict[str, Any], cache_status: ApiCacheStatus
+    ) -> JSONResponse:
+        """
+        记录缓存访问结果并根据缓存载荷重建响应
+
+        :param redis: Redis连接对象
+        :param cached_payload: 缓存载荷
+        :param cache_status: 缓存访问结果
+        :return: 重建后的JSON响应对象
+        """
+        await ApiCacheStats.record(redis, self.namespace, cache_status)
+        return self._build_cached_response(cached_payload, cache_status)
+
+    def _build_cached_response(self, cached_payload: dict[str, Any], cache_status: ApiCacheStatus) -> JSONResponse:
         """
         根据缓存内容重建JSON响应对象
 
-        :param cached_response: 缓存中读取到的响应字符串
+        :param cached_payload: 缓存载荷
+        :param cache_status: 缓存访问结果
         :return: 重建后的JSON响应对象
         """
-        cached_payload = json.loads(cached_response)
         cached_content = self._refresh_response_time(cached_payload['content'])
         response = JSONResponse(
             status_code=cached_payload['status_code'],
@@ -380,26 +617,35 @@ class ApiCache(_ApiCacheSupport):
             headers=cached_payload.get('headers'),
             media_type=cached_payload.get('media_type'),
         )
-        response.headers['X-Api-Cache'] = 'HIT'
+        response.headers['X-Api-Cache'] = cache_status
 
         return response
 
-    async def _cache_response(self, redis: aioredis.Redis, cache_key: str, result: Any) -> None:
+    async def _cache_response(self, redis: aioredis.Redis, cache_key: str, result: Any) -> str | None:
         """
         将接口响应写入接口缓存
 
+        软过期时间按配置比例随机缩短以错开同批缓存的过期时刻，Redis过期时间在软过期基础上延长宽限期。
+
         :param redis: Redis连接对象
         :param cache_key: 接口缓存键
         :param result: 原始接口返回结果
-        :return: None
+        :return: 序列化后的缓存内容，不可缓存时返回None
         """
-        serialized_response = self._serialize_response(result)
-        if serialized_response is None:
-            return
+        response_payload = self._extract_response_payload(result)
+        if response_payload is None:
+            return None
 
-        await redis.set(cache_key, serialized_response, ex=self.expire_seconds)
+        fresh_seconds = self.expire_seconds * (1 - random.uniform(0, AppConfig.app_api_cache_expire_jitter))
+        response_payload['fresh_until'] = time.time() + fresh_seconds
+        serialized_response = json.dumps(response_payload, ensure_ascii=False)
+        await redis.set(
+            cache_key, serialized_response, px=max(1, int((fresh_seconds + self._get_stale_seconds()) * 1000))
+        )
         logger.debug(f'接口缓存写入成功: {cache_key}')
 
+        return serialized_response
+
     def _filter_response_headers(self, headers: dict[str, str]) -> dict[str, str]:
         """
         过滤不适合直接回放的响应头
@@ -8,8 +8,6 @@ from enum import Enum
 from functools import wraps
 from typing import Any, Literal, TypeVar
 
-import httpx
-from async_lru import alru_cache
 from fastapi import Request
 from fastapi.responses import JSONResponse, ORJSONResponse, UJSONResponse
 from starlette.status import HTTP_200_OK
@@ -18,7 +16,7 @@ from user_agents import parse
 
 from common.context import RequestContext
 from common.enums import BusinessType
-from config.env import AppConfig
+from config.env import AppConfig, LogConfig
 from exceptions.exception import (
     FileRangeNotSatisfiableException,
     LoginException,
@@ -26,9 +24,10 @@ from exceptions.exception import (
     ServiceWarning,
 )
 from module_admin.entity.vo.log_vo import LogininforModel, OperLogModel
-from module_admin.service.log_service import LogQueueService
+from module_admin.service.log_service import LogAggregatorService, LogQueueService
 from utils.client_ip_util import ClientIPUtil
 from utils.dependency_util import DependencyUtil
+from utils.ip_location_util import INNER_IP_LOCATION, IpLocationUtil
 from utils.log_util import LogSanitizer, logger
 from utils.response_util import ResponseUtil
 
@@ -114,6 +113,7 @@ class Log:
     _RESPONSE_INCLUDE_ROOTS = tuple(item.value for item in ResponseLogFieldRoot)
     _MISSING = object()
     _AMBIGUOUS = object()
+    _raw_event_decorators: dict[tuple, 'Log'] = {}
 
     def __init__(
         self,
@@ -168,61 +168,54 @@ class Log:
             DependencyUtil.check_exclude_routes(request, err_msg='当前路由不在认证规则内，不可使用Log装饰器')
             request_method = request.method
             user_agent = request.headers.get('User-Agent') or ''
-            # 获取操作类型
-            operator_type = self._get_oper_type(user_agent)
             # 获取请求的url
             oper_url = request.url.path
             # 获取请求ip
             oper_ip = ClientIPUtil.get_client_ip(request)
-            # 获取请求ip归属区域
-            oper_location = await self._get_oper_location(oper_ip)
+            # 原始事件模式下，操作日志的IP归属、脱敏、字段筛选与截断延后到日志消费者批量处理
+            raw_event_enabled = self.log_type != 'login' and LogConfig.log_raw_event_enabled
             # 获取请求参数
-            oper_param_payload = LogSanitizer.sanitize_data(await self._get_request_params(request))
-            oper_param = self._build_log_text(
-                oper_param_payload,
-                self.request_log_mode,
-                self.request_include_fields,
-                self.request_exclude_fields,
-                payload_kind='request',
-            )
-            # 日志表请求参数字段长度最大为2000，因此在此处判断长度
-            oper_param = self._limit_log_text(oper_param, self._oper_param_len, '请求参数过长')
+            request_params = await self._get_request_params(request)
+            oper_location = ''
+            oper_param = ''
+            if not raw_event_enabled:
+                # 获取请求ip归属区域
+                oper_location = await self._get_oper_location(oper_ip, self._get_request_redis(request))
+                oper_param = self._build_request_log_text(request_params)
 
             # 获取操作时间
             oper_time = datetime.now()
             # 此处在登录之前向原始函数传递一些登录信息，用于监测在线用户的相关信息
             login_log = self._get_login_log(user_agent, oper_ip, oper_location, oper_time, kwargs)
-            try:
-                # 调用原始函数
-                result = await func(*args, **kwargs)
-            except (LoginException, ServiceWarning) as e:
-                logger.warning(e.message)
-                result = ResponseUtil.failure(data=e.data, msg=e.message)
-            except ServiceException as e:
-                logger.error(e.message)
-                result = ResponseUtil.error(data=e.data, msg=e.message)
-            except FileRangeNotSatisfiableException:
-                raise
-            except Exception as e:
-                logger.exception(e)
-                result = ResponseUtil.error(msg=str(e))
+            # 调用原始函数
+            result = await self._call_func(func, *args, **kwargs)
             # 获取请求耗时
             cost_time = float(time.perf_counter() - start_time) * 1000
             # 判断请求是否来自api文档
             request_from_swagger, request_from_redoc = self._is_request_from_swagger_or_redoc(request)
+            if raw_event_enabled:
+                raw_event = self._build_raw_operation_event(
+                    func_path=func_path,
+                    request_method=request_method,
+                    user_agent=user_agent,
+                    oper_url=oper_url,
+                    oper_ip=oper_ip,
+                    request_params=request_params,
+                    raw_result=self._get_raw_result(result, request_from_swagger, request_from_redoc),
+                    oper_time=oper_time,
+                    cost_time=cost_time,
+                )
+                if raw_event is not None:
+                    await LogQueueService.enqueue_raw_operation_log(request, raw_event, func_path)
+                    return result
+                # 原始载荷超出上限时回退为请求链路内处理，避免Stream消息过大
+                oper_location = await self._get_oper_location(oper_ip, self._get_request_redis(request))
+                oper_param = self._build_request_log_text(request_params)
             # 根据响应结果的类型使用不同的方法获取响应结果参数
             sanitized_result_dict = LogSanitizer.sanitize_data(
                 self._get_result_dict(result, request_from_swagger, request_from_redoc)
             )
-            json_result = self._build_log_text(
-                sanitized_result_dict,
-                self.response_log_mode,
-                self.response_include_fields,
-                self.response_exclude_fields,
-                payload_kind='response',
-            )
-            # 日志表返回参数字段长度最大为2000，因此在此处判断长度
-            json_result = self._limit_log_text(json_result, self._json_result_len, '返回参数过长')
+            json_result = self._build_response_log_text(sanitized_result_dict)
             # 根据响应结果获取响应状态及异常信息
             status, error_msg = self._get_status_and_error_msg(sanitized_result_dict)
             # 根据日志类型向对应的日志表插入数据
@@ -251,7 +244,7 @@ class Log:
                     businessType=self.business_type,
                     method=func_path,
                     requestMethod=request_method,
-                    operatorType=operator_type,
+                    operatorType=self._get_oper_type(user_agent),
                     operName=oper_name,
                     deptName=dept_name,
                     operUrl=oper_url,
@@ -270,6 +263,30 @@ class Log:
 
         return wrapper
 
+    @staticmethod
+    async def _call_func(func: Callable[P, Awaitable[R]], *args: P.args, **kwargs: P.kwargs) -> Any:
+        """
+        调用被装饰函数，并将业务异常转换为统一响应结果
+
+        :param func: 被装饰函数
+        :return: 被装饰函数的返回结果或异常对应的响应结果
+        """
+        try:
+            result = await func(*args, **kwargs)
+        except (LoginException, ServiceWarning) as e:
+            logger.warning(e.message)
+            result = ResponseUtil.failure(data=e.data, msg=e.message)
+        except ServiceException as e:
+            logger.error(e.message)
+            result = ResponseUtil.error(data=e.data, msg=e.message)
+        except FileRangeNotSatisfiableException:
+            raise
+        except Exception as e:
+            logger.exception(e)
+            result = ResponseUtil.error(msg=str(e))
+
+        return result
+
     def _get_decorator_func_path(self, func: Callable) -> str:
         """
         获取被装饰函数所在路径
@@ -298,6 +315,188 @@ class Log:
         """
         return overflow_text if len(log_text) > max_length else log_text
 
+    def _build_request_log_text(self, request_params: dict[str, Any]) -> str:
+        """
+        对请求参数脱敏并按请求日志策略构建日志文本
+
+        :param request_params: 原始结构化请求参数
+        :return: 请求参数日志文本
+        """
+        oper_param = self._build_log_text(
+            LogSanitizer.sanitize_data(request_params),
+            self.request_log_mode,
+            self.request_include_fields,
+            self.request_exclude_fields,
+            payload_kind='request',
+        )
+        # 日志表请求参数字段长度最大为2000，因此在此处判断长度
+        return self._limit_log_text(oper_param, self._oper_param_len, '请求参数过长')
+
+    def _build_response_log_text(self, sanitized_result_dict: dict[str, Any]) -> str:
+        """
+        按响应日志策略构建日志文本
+
+        :param sanitized_result_dict: 已完成脱敏的响应结果字典
+        :return: 响应结果日志文本
+        """
+        json_result = self._build_log_text(
+            sanitized_result_dict,
+            self.response_log_mode,
+            self.response_include_fields,
+            self.response_exclude_fields,
+            payload_kind='response',
+        )
+        # 日志表返回参数字段长度最大为2000，因此在此处判断长度
+        return self._limit_log_text(json_result, self._json_result_len, '返回参数过长')
+
+    def _build_raw_operation_event(
+        self,
+        func_path: str,
+        request_method: str,
+        user_agent: str,
+        oper_url: str,
+        oper_ip: str,
+        request_params: dict[str, Any],
+        raw_result: str,
+        oper_time: datetime,
+        cost_time: float,
+    ) -> dict[str, Any] | None:
+        """
+        构建操作日志原始事件，仅包含采集数据与当前装饰器的日志策略
+
+        :param func_path: 被装饰函数路径
+        :param request_method: 请求方式
+        :param user_agent: 用户代理字符串
+        :param oper_url: 请求URL
+        :param oper_ip: 请求IP
+        :param request_params: 原始结构化请求参数
+        :param raw_result: 原始响应结果JSON文本
+        :param oper_time: 操作时间
+        :param cost_time: 请求耗时（毫秒）
+        :return: 原始事件，原始载荷超出上限时返回None
+        """
+        raw_params = json.dumps(request_params, ensure_ascii=False, default=str)
+        if len(raw_params) + len(raw_result) > LogConfig.log_raw_event_max_payload_length:
+            return None
+        current_user = RequestContext.get_current_user()
+        return {
+            'title': self.title,
+            'businessType': self.business_type,
+            'method': func_path,
+            'requestMethod': request_method,
+            'userAgent': user_agent,
+            'operName': current_user.user.user_name,
+            'deptName': current_user.user.dept.dept_name if current_user.user.dept else None,
+            'operUrl': oper_url,
+            'operIp': oper_ip,
+            'operTime': oper_time.isoformat(),
+            'costTime': int(cost_time),
+            'rawParams': raw_params,
+            'rawResult': raw_result,
+            'logOptions': {
+                'requestLogMode': self.request_log_mode,
+                'responseLogMode': self.response_log_mode,
+                'requestIncludeFields': list(self.request_include_fields),
+                'responseIncludeFields': list(self.response_include_fields),
+                'requestExcludeFields': list(self.request_exclude_fields),
+                'responseExcludeFields': list(self.response_exclude_fields),
+            },
+        }
+
+    def _build_operation_log_from_raw_event(self, raw_event: dict[str, Any], oper_location: str) -> OperLogModel:
+        """
+        根据原始事件完成脱敏、字段筛选与截断，构建操作日志模型
+
+        :param raw_event: 操作日志原始事件
+        :param oper_location: 请求IP归属区域
+        :return: 操作日志模型
+        """
+        oper_param = self._build_request_log_text(json.loads(raw_event.get('rawParams') or '{}'))
+        try:
+            result_dict = json.loads(raw_event.get('rawResult') or '{}')
+        except json.JSONDecodeError:
+            result_dict = {}
+        sanitized_result_dict = LogSanitizer.sanitize_data(result_dict if isinstance(result_dict, dict) else {})
+        status, error_msg = self._get_status_and_error_msg(sanitized_result_dict)
+        operation_log = OperLogModel(
+            title=self.title,
+            businessType=self.business_type,
+            method=raw_event.get('method'),
+            requestMethod=raw_event.get('requestMethod'),
+            operatorType=self._get_oper_type(raw_event.get('userAgent')),
+            operName=raw_event.get('operName'),
+            deptName=raw_event.get('deptName'),
+            operUrl=raw_event.get('operUrl'),
+            operIp=raw_event.get('operIp'),
+            operLocation=oper_location,
+            operParam=oper_param,
+            jsonResult=self._build_response_log_text(sanitized_result_dict),
+            status=status,
+            errorMsg=error_msg,
+            operTime=raw_event.get('operTime'),
+            costTime=raw_event.get('costTime'),
+        )
+        # 与请求链路内入队保持一致，对最终日志模型再做一次脱敏
+        return OperLogModel(**LogSanitizer.sanitize_data(operation_log.model_dump(by_alias=True, exclude_none=True)))
+
+    @classmethod
+    def _get_raw_event_decorator(cls, raw_event: dict[str, Any]) -> 'Log':
+        """
+        根据原始事件中的日志策略获取复用的装饰器实例
+
+        :param raw_event: 操作日志原始事件
+        :return: 日志装饰器实例
+        """
+        log_options = raw_event.get('logOptions') or {}
+        cache_key = (
+            raw_event.get('title'),
+            raw_event.get('businessType'),
+            log_options.get('requestLogMode', 'full'),
+            log_options.get('responseLogMode', 'full'),
+            tuple(log_options.get('requestIncludeFields') or ()),
+            tuple(log_options.get('responseIncludeFields') or ()),
+            tuple(log_options.get('requestExcludeFields') or ()),
+            tuple(log_options.get('responseExcludeFields') or ()),
+        )
+        decorator = cls._raw_event_decorators.get(cache_key)
+        if decorator is None:
+            decorator = cls(
+                title=cache_key[0],
+                business_type=BusinessType(int(cache_key[1])),
+                log_type='operation',
+                request_log_mode=cache_key[2],
+                response_log_mode=cache_key[3],
+                request_include_fields=cache_key[4],
+                response_include_fields=cache_key[5],
+                request_exclude_fields=cache_key[6],
+                response_exclude_fields=cache_key[7],
+            )
+            cls._raw_event_decorators[cache_key] = decorator
+        return decorator
+
+    @classmethod
+    async def build_operation_logs_from_raw_events(
+        cls, redis: Any, raw_events: list[dict[str, Any]]
+    ) -> list[OperLogModel]:
+        """
+        日志消费者批量富化操作日志原始事件，同一批次内相同IP仅查询一次归属区域
+
+        :param redis: Redis连接对象
+        :param raw_events: 操作日志原始事件列表
+        :return: 操作日志模型列表
+        """
+        oper_locations: dict[str, str] = {}
+        for oper_ip in dict.fromkeys(raw_event.get('operIp') or '' for raw_event in raw_events):
+            oper_locations[oper_ip] = (
+                await get_ip_location(oper_ip, redis) if AppConfig.app_ip_location_query else INNER_IP_LOCATION
+            )
+        return [
+            cls._get_raw_event_decorator(raw_event)._build_operation_log_from_raw_event(
+                raw_event, oper_locations[raw_event.get('operIp') or '']
+            )
+            for raw_event in raw_events
+        ]
+
     def _get_oper_type(self, user_agent: Any) -> int:
         """
         获取操作类型
@@ -314,19 +513,31 @@ class Log:
 
         return operator_type
 
-    async def _get_oper_location(self, oper_ip: str) -> str:
+    async def _get_oper_location(self, oper_ip: str, redis: Any = None) -> str:
         """
         获取请求IP归属区域
 
         :param oper_ip: 请求IP
+        :param redis: Redis连接对象，用于跨进程共享IP归属区域缓存
         :return: 请求IP归属区域
         """
-        oper_location = '内网IP'
+        oper_location = INNER_IP_LOCATION
         if AppConfig.app_ip_location_query:
-            oper_location = await get_ip_location(oper_ip)
+            oper_location = await get_ip_location(oper_ip, redis)
 
         return oper_location
 
+    @staticmethod
+    def _get_request_redis(request: Request) -> Any:
+        """
+        获取当前应用的Redis连接，应用未挂载Redis时返回None
+
+        :param request: Request对象
+        :return: Redis连接对象
+        """
+        app = request.scope.get('app') if hasattr(request, 'scope') else getattr(request, 'app', None)
+        return getattr(getattr(app, 'state', None), 'redis', None)
+
     async def _get_request_params(self, request: Request) -> dict[str, Any]:
         """
         获取请求参数
@@ -1015,30 +1226,30 @@ class Log:
 
         return result_dict
 
+    def _get_raw_result(self, result: Any, request_from_swagger: bool, request_from_redoc: bool) -> str:
+        """
+        获取未经脱敏的原始响应结果文本，JSON响应直接复用已序列化的响应体
 
-@alru_cache()
-async def get_ip_location(oper_ip: str) -> str:
+        :param result: 操作结果
+        :param request_from_swagger: 是否来自swagger请求
+        :param request_from_redoc: 是否来自redoc请求
+        :return: 原始响应结果文本
+        """
+        if isinstance(result, (JSONResponse, ORJSONResponse, UJSONResponse)):
+            return str(result.body, 'utf-8', errors='replace')
+
+        return json.dumps(self._get_result_dict(result, request_from_swagger, request_from_redoc), ensure_ascii=False)
+
+
+async def get_ip_location(oper_ip: str, redis: Any = None) -> str:
     """
     查询ip归属区域
 
     :param oper_ip: 需要查询的ip
+    :param redis: Redis连接对象，传入时启用跨进程共享缓存
     :return: ip归属区域
     """
-    oper_location = '内网IP'
-    try:
-        if oper_ip not in ['127.0.0.1', 'localhost']:
-            oper_location = '未知'
-            async with httpx.AsyncClient() as client:
-                ip_result = await client.get(f'https://qifu-api.baidubce.com/ip/geo/v1/district?ip={oper_ip}')
-                if ip_result.status_code == HTTP_200_OK:
-                    prov = ip_result.json().get('data', {}).get('prov')
-                    city = ip_result.json().get('data', {}).get('city')
-                    if prov or city:
-                        oper_location = f'{prov}-{city}'
-    except Exception as e:
-        oper_location = '未知'
-        print(e)
-    return oper_location
+    return await IpLocationUtil.get_ip_location(oper_ip, redis)
 
 
 def get_function_parameters_name_by_type(func: Callable, param_type: Any) -> list:
@@ -1083,3 +1294,6 @@ def get_function_parameters_value_by_name(func: Callable, name: str, *args, **kw
     parameters_value = bound_parameters.arguments.get(name)
 
     return parameters_value
+
+
+LogAggregatorService.register_raw_operation_log_builder(Log.build_operation_logs_from_raw_events)
@@ -1,10 +1,14 @@
 from fastapi import Depends, Request, params
-from sqlalchemy import ColumnElement, func, or_, select
+from sqlalchemy import ColumnElement, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.aspect.db_session import DBSessionDependency
 from common.context import RequestContext
 from config.database import Base
-from module_admin.entity.do.dept_do import SysDept
+from config.env import AppConfig
+from module_admin.entity.do.dept_do import SysDeptClosure
 from module_admin.entity.do.role_do import SysRoleDept
+from module_admin.service.data_scope_cache_service import DataScopeCacheService
 from utils.dependency_util import DependencyUtil
 
 
@@ -36,19 +40,48 @@ class GetDataScope:
         self.user_alias = user_alias
         self.dept_alias = dept_alias
 
-    def __call__(self, request: Request) -> ColumnElement:
+    async def __call__(self, request: Request, query_db: AsyncSession = DBSessionDependency()) -> ColumnElement:
         DependencyUtil.check_exclude_routes(request, err_msg='当前路由不在认证规则内，不可使用GetDataScope依赖项')
         current_user = RequestContext.get_current_user()
         user_id = current_user.user.user_id
         dept_id = current_user.user.dept_id
-        custom_data_scope_role_id_list = [
-            item.role_id for item in current_user.user.role if item.data_scope == self.DATA_SCOPE_CUSTOM
-        ]
+        roles = current_user.user.role
+        if current_user.user.admin or any(role.data_scope == self.DATA_SCOPE_ALL for role in roles):
+            return or_(True)
+        if not AppConfig.app_data_scope_cache_enabled or not hasattr(self.query_alias, self.dept_alias):
+            return self._build_param_sql(self._get_role_sql_list(roles, user_id, dept_id))
+
+        dept_scope_roles = [role for role in roles if role.data_scope in DataScopeCacheService.DEPT_DATA_SCOPES]
+        param_sql_list = self._get_role_sql_list(
+            [role for role in roles if role.data_scope not in DataScopeCacheService.DEPT_DATA_SCOPES], user_id, dept_id
+        )
+        if dept_scope_roles:
+            dept_ids = await DataScopeCacheService.get_data_scope_dept_ids(
+                request.app.state.redis,
+                query_db,
+                [(role.role_id, role.data_scope) for role in dept_scope_roles],
+                dept_id,
+            )
+            if len(dept_ids) > AppConfig.app_data_scope_max_in_size:
+                # 部门数量过多时展开的IN条件会使sql过长，回退为由数据库执行的子查询条件
+                param_sql_list.extend(self._get_role_sql_list(dept_scope_roles, user_id, dept_id))
+            else:
+                param_sql_list.append(getattr(self.query_alias, self.dept_alias).in_(dept_ids) if dept_ids else False)
+
+        return self._build_param_sql(param_sql_list)
+
+    def _get_role_sql_list(self, roles: list, user_id: int, dept_id: int | None) -> list[ColumnElement | bool]:
+        """
+        根据角色数据范围构建子查询形式的数据权限条件
+
+        :param roles: 角色列表
+        :param user_id: 用户id
+        :param dept_id: 用户部门id
+        :return: 数据权限条件列表
+        """
+        custom_data_scope_role_id_list = [item.role_id for item in roles if item.data_scope == self.DATA_SCOPE_CUSTOM]
         param_sql_list = []
-        for role in current_user.user.role:
-            if current_user.user.admin or role.data_scope == self.DATA_SCOPE_ALL:
-                param_sql_list = [True]
-                break
+        for role in roles:
             if role.data_scope == self.DATA_SCOPE_CUSTOM:
                 if len(custom_data_scope_role_id_list) > 1:
                     param_sql_list.append(
@@ -75,9 +108,7 @@ class GetDataScope:
             elif role.data_scope == self.DATA_SCOPE_DEPT_AND_CHILD:
                 param_sql_list.append(
                     getattr(self.query_alias, self.dept_alias).in_(
-                        select(SysDept.dept_id).where(
-                            or_(SysDept.dept_id == dept_id, func.find_in_set(dept_id, SysDept.ancestors))
-                        )
+                        select(SysDeptClosure.descendant_id).where(SysDeptClosure.ancestor_id == dept_id)
                     )
                     if dept_id is not None and hasattr(self.query_alias, self.dept_alias)
                     else False
@@ -90,6 +121,16 @@ class GetDataScope:
                 )
             else:
                 param_sql_list.append(False)
+        return param_sql_list
+
+    @staticmethod
+    def _build_param_sql(param_sql_list: list[ColumnElement | bool]) -> ColumnElement:
+        """
+        合并去重后的数据权限条件
+
+        :param param_sql_list: 数据权限条件列表
+        :return: 数据权限查询sql语句
+        """
         param_sql_list = list(dict.fromkeys(param_sql_list))
         param_sql = or_(*param_sql_list)
 
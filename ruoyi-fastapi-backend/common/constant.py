@@ -172,6 +172,7 @@ class ApiNamespace:
     LOGIN_USER_ROUTERS: 登录用户路由接口命名空间
     CAPTCHA_IMAGE: 图片验证码接口命名空间
     COMMON_UPLOAD: 通用上传接口命名空间
+    COMMON_EXPORT_JOB_CANCEL: 异步导出任务取消接口命名空间
     TRANSPORT_CRYPTO_PUBLIC_KEY: 传输层加密公钥接口命名空间
     TRANSPORT_CRYPTO_FRONTEND_CONFIG: 传输层加密前端配置接口命名空间
 
@@ -270,6 +271,7 @@ class ApiNamespace:
     COMMON_UPLOAD = 'common:upload'
     COMMON_PRIVATE_UPLOAD = 'common:private-upload'
     COMMON_FILE_DOWNLOAD = 'common:file-download'
+    COMMON_EXPORT_JOB_CANCEL = 'common:export-job-cancel'
     TRANSPORT_CRYPTO_PUBLIC_KEY = 'transport-crypto:public-key'
     TRANSPORT_CRYPTO_FRONTEND_CONFIG = 'transport-crypto:frontend-config'
 
@@ -103,11 +103,19 @@ class RedisInitKeyConfig(Enum):
         return self.value.get('remark')
 
     ACCESS_TOKEN = {'key': 'access_token', 'remark': '登录令牌信息'}
+    ONLINE_SESSION = {'key': 'online_session', 'remark': '在线会话索引'}
     SYS_DICT = {'key': 'sys_dict', 'remark': '数据字典'}
     SYS_CONFIG = {'key': 'sys_config', 'remark': '配置信息'}
     API_CACHE = {'key': 'api_cache', 'remark': '接口响应缓存'}
+    API_CACHE_LOCK = {'key': 'api_cache_lock', 'remark': '接口缓存重新计算锁'}
+    API_CACHE_STATS = {'key': 'api_cache_stats', 'remark': '接口缓存命中统计'}
     API_RATE_LIMIT = {'key': 'api_rate_limit', 'remark': '接口限流'}
     CAPTCHA_CODES = {'key': 'captcha_codes', 'remark': '图片验证码'}
     ACCOUNT_LOCK = {'key': 'account_lock', 'remark': '用户锁定'}
     PASSWORD_ERROR_COUNT = {'key': 'password_error_count', 'remark': '密码错误次数'}
     SMS_CODE = {'key': 'sms_code', 'remark': '短信验证码'}
+    IP_LOCATION = {'key': 'ip_location', 'remark': 'IP归属区域'}
+    PERMISSION_EPOCH = {'key': 'permission_epoch', 'remark': '权限版本号'}
+    USER_AUTH_SNAPSHOT = {'key': 'user_auth_snapshot', 'remark': '用户权限快照'}
+    DATA_SCOPE = {'key': 'data_scope', 'remark': '数据权限解析结果'}
+    USER_IMPORT_ERROR_REPORT = {'key': 'user_import_error_report', 'remark': '用户导入错误报告'}
@@ -89,6 +89,7 @@ class PageModel(BaseModel, Generic[T]):
     page_size: int = Field(description='每页记录数')
     total: int = Field(description='总记录数')
     has_next: bool = Field(description='是否有下一页')
+    next_cursor: str | None = Field(default=None, description='游标分页的下一页令牌')
 
 
 class PageResponseModel(PageModel, ResponseBaseModel, Generic[T]):
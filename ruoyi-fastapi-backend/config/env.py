@@ -29,6 +29,40 @@ class AppSettings(BaseSettings):
     app_reload: bool = True
     app_workers: int = 1
     app_ip_location_query: bool = True
+    app_ip_location_db_path: str = ''
+    app_ip_location_http_enabled: bool = True
+    app_ip_location_http_url: str = 'https://qifu-api.baidubce.com/ip/geo/v1/district?ip={ip}'
+    app_ip_location_http_timeout: float = 3.0
+    app_ip_location_cache_size: int = 10000
+    app_ip_location_cache_ttl: int = 86400
+    app_user_auth_cache_enabled: bool = True
+    app_user_auth_cache_expire_seconds: int = 1800
+    app_user_auth_local_cache_size: int = 1024
+    app_user_auth_local_cache_ttl: int = 60
+    app_data_scope_cache_enabled: bool = True
+    app_data_scope_cache_expire_seconds: int = 1800
+    app_data_scope_local_cache_size: int = 1024
+    app_data_scope_max_in_size: int = 1000
+    app_export_job_max_workers: int = 2
+    app_export_job_user_max_active: int = 2
+    app_export_job_file_retention_hours: int = 24
+    app_export_job_stale_minutes: int = 30
+    app_user_import_chunk_size: int = 5000
+    app_user_import_error_report_expire_minutes: int = 30
+    app_page_count_cache_size: int = 1024
+    app_page_count_cache_ttl: int = 30
+    app_page_concurrent_count_enabled: bool = True
+    app_api_cache_stale_seconds: int = 30
+    app_api_cache_expire_jitter: float = 0.1
+    app_api_cache_lock_seconds: int = 5
+    app_sys_near_cache_size: int = 1024
+    app_sys_near_cache_ttl: int = 300
+    app_file_public_cache_control: str = 'private, max-age=3600'
+    app_file_private_cache_control: str = 'private, no-cache'
+    app_file_static_cache_control: str = 'public, max-age=86400'
+    app_password_hash_max_workers: int = 4
+    app_password_hash_max_pending: int = 64
+    app_password_hash_queue_timeout: float = 10.0
     app_same_time_login: bool = True
     app_demo_mode: bool = False
     app_disable_swagger: bool = False
@@ -47,6 +81,7 @@ class JwtSettings(BaseSettings):
     jwt_algorithm: str = 'HS256'
     jwt_expire_minutes: int = 1440
     jwt_redis_expire_minutes: int = 30
+    jwt_redis_refresh_threshold_minutes: int = 20
 
     @field_validator('jwt_secret_key', mode='before')
     @classmethod
@@ -202,6 +237,12 @@ class LogSettings(BaseSettings):
     log_stream_claim_batch_size: int = 100
     log_stream_dedup_ttl: int = 3600
     log_stream_dedup_prefix: str = 'log:dedup'
+    log_stream_insert_chunk_size: int = 1000
+    log_raw_event_enabled: bool = False
+    log_raw_event_max_payload_length: int = 65536
+    log_job_queue_max_size: int = 10000
+    log_job_batch_size: int = 200
+    log_job_flush_interval_ms: int = 1000
 
     loguru_json: bool = False
     loguru_level: str = 'INFO'
@@ -234,6 +275,9 @@ class TransportCryptoSettings(BaseSettings):
     transport_crypto_max_get_url_length: int = 4096
     transport_crypto_clock_skew_seconds: int = 120
     transport_crypto_replay_ttl_seconds: int = 300
+    transport_crypto_session_enabled: bool = False
+    transport_crypto_session_ttl_seconds: int = 1800
+    transport_crypto_response_chunk_size: int = 65536
     transport_crypto_enabled_paths: str = ''
     transport_crypto_required_paths: str = ''
     transport_crypto_exclude_paths: str = (
@@ -273,10 +317,14 @@ class GenSettings:
     allow_overwrite = False
 
     GEN_PATH = 'vf_admin/gen_path'
+    # 模板字节码缓存目录，为空时仅在进程内缓存编译后的模板
+    TEMPLATE_BYTECODE_CACHE_PATH = ''
 
     def __init__(self) -> None:
         if not os.path.exists(self.GEN_PATH):
             os.makedirs(self.GEN_PATH)
+        if self.TEMPLATE_BYTECODE_CACHE_PATH and not os.path.exists(self.TEMPLATE_BYTECODE_CACHE_PATH):
+            os.makedirs(self.TEMPLATE_BYTECODE_CACHE_PATH)
 
 
 class UploadSettings:
@@ -91,23 +91,13 @@ class RedisUtil:
         logger.debug('✅️ 关闭redis连接成功')
 
     @classmethod
-    async def init_sys_dict(cls, redis: FastAPI) -> None:
+    async def warmup_sys_cache(cls, redis: aioredis.Redis) -> None:
         """
-        应用启动时缓存字典表
+        预热字典表与参数配置表缓存，应用启动时仅由Application leader执行
 
         :param redis: redis对象
         :return:
         """
         async with DataSourceRegistry.session() as session:
             await DictDataService.init_cache_sys_dict_services(session, redis)
-
-    @classmethod
-    async def init_sys_config(cls, redis: aioredis.Redis) -> None:
-        """
-        应用启动时缓存参数配置表
-
-        :param redis: redis对象
-        :return:
-        """
-        async with DataSourceRegistry.session() as session:
             await ConfigService.init_cache_sys_config_services(session, redis)
@@ -136,6 +136,22 @@ class SchedulerUtil:
     _session_local: Any | None = None
     _scheduler_configured: bool = False
 
+    # 任务执行日志异步批量写入
+    _job_log_queue: asyncio.Queue | None = None
+    _job_log_loop: asyncio.AbstractEventLoop | None = None
+    _job_log_writer_task: asyncio.Task | None = None
+    _job_log_stop_marker: object = object()
+    _job_log_stop_timeout_seconds: float = 10.0
+    _job_log_drop_warn_interval: int = 1000
+    _job_log_metrics: dict[str, int] = {
+        'enqueued': 0,
+        'dropped': 0,
+        'written': 0,
+        'failed': 0,
+        'batches': 0,
+        'high_watermark': 0,
+    }
+
     @staticmethod
     def _parse_job_args(job_args: str | None) -> list[Any] | None:
         """
@@ -339,7 +355,8 @@ class SchedulerUtil:
                 cls._add_job_to_scheduler(item)
                 cls._refresh_job_update_cache(str(item.job_id), item.update_time)
 
-        # 添加事件监听器
+        # 添加事件监听器，进程池任务的事件在线程中分发，需提前启动日志写入任务
+        cls.start_job_log_writer()
         scheduler.add_listener(cls.scheduler_event_listener, EVENT_ALL)
 
         if cls._should_enable_scheduler_sync():
@@ -828,14 +845,197 @@ class SchedulerUtil:
                 endTime=end_time,
                 createTime=end_time,
             )
-            session = cls._get_session_local()()
-            try:
-                JobLogService.add_job_log_services(session, job_log)
-            finally:
-                session.close()
+            cls._enqueue_job_log(job_log)
         except Exception as e:
             logger.error(f'❌ 记录任务执行日志失败: {e}')
 
+    @classmethod
+    def start_job_log_writer(cls) -> None:
+        """
+        启动任务执行日志异步批量写入任务
+
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        writer_task = cls._job_log_writer_task
+        if writer_task and not writer_task.done() and cls._job_log_loop is loop:
+            return
+        cls._job_log_loop = loop
+        # 容量由入队时自行判断，保证停止标记始终可以入队
+        cls._job_log_queue = asyncio.Queue()
+        cls._job_log_writer_task = asyncio.create_task(cls._run_job_log_writer(cls._job_log_queue))
+
+    @classmethod
+    async def stop_job_log_writer(cls) -> None:
+        """
+        停止任务执行日志写入任务，并落库队列中剩余的日志
+
+        :return: None
+        """
+        writer_task = cls._job_log_writer_task
+        queue = cls._job_log_queue
+        cls._job_log_writer_task = None
+        cls._job_log_queue = None
+        cls._job_log_loop = None
+        if not writer_task or writer_task.done() or queue is None:
+            return
+        # 写入任务消费到停止标记时落库当前批次后退出
+        queue.put_nowait(cls._job_log_stop_marker)
+        try:
+            await asyncio.wait_for(writer_task, cls._job_log_stop_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f'⚠️ 任务执行日志落库超时，剩余{queue.qsize()}条日志未写入')
+        except asyncio.CancelledError:
+            pass
+
+    @classmethod
+    def get_job_log_writer_metrics(cls) -> dict[str, int]:
+        """
+        获取任务执行日志写入指标
+
+        :return: 入队、丢弃、写入、失败、批次数、队列峰值与当前队列长度
+        """
+        queue = cls._job_log_queue
+        return {**cls._job_log_metrics, 'queue_size': queue.qsize() if queue else 0}
+
+    @classmethod
+    def _enqueue_job_log(cls, job_log: JobLogModel) -> None:
+        """
+        将任务执行日志投递到写入队列，可在任意线程中调用
+
+        :param job_log: 任务执行日志对象
+        :return: None
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        # 非Leader worker直接执行任务时在事件循环中按需启动写入任务
+        if running_loop is not None and cls._job_log_loop is not running_loop and not cls._is_closing:
+            cls.start_job_log_writer()
+        loop = cls._job_log_loop
+        if loop is None or loop.is_closed():
+            # 应用关闭后或写入任务未启动时退回同步写入
+            cls._write_job_log_sync(job_log)
+            return
+        if running_loop is loop:
+            cls._put_job_log(job_log)
+            return
+        # 进程池执行器的事件在线程中分发，需切回事件循环线程入队
+        try:
+            loop.call_soon_threadsafe(cls._put_job_log, job_log)
+        except RuntimeError:
+            cls._write_job_log_sync(job_log)
+
+    @classmethod
+    def _put_job_log(cls, job_log: JobLogModel) -> None:
+        """
+        在事件循环线程中将任务执行日志放入有界队列，队列满时丢弃
+
+        :param job_log: 任务执行日志对象
+        :return: None
+        """
+        queue = cls._job_log_queue
+        metrics = cls._job_log_metrics
+        if queue is None:
+            cls._write_job_log_sync(job_log)
+            return
+        if queue.qsize() >= LogConfig.log_job_queue_max_size:
+            metrics['dropped'] += 1
+            if metrics['dropped'] % cls._job_log_drop_warn_interval == 1:
+                logger.warning(f'⚠️ 任务执行日志队列已满，累计丢弃{metrics["dropped"]}条日志')
+            return
+        queue.put_nowait(job_log)
+        metrics['enqueued'] += 1
+        metrics['high_watermark'] = max(metrics['high_watermark'], queue.qsize())
+
+    @classmethod
+    def _write_job_log_sync(cls, job_log: JobLogModel) -> None:
+        """
+        使用同步会话写入单条任务执行日志
+
+        :param job_log: 任务执行日志对象
+        :return: None
+        """
+        session = cls._get_session_local()()
+        try:
+            JobLogService.add_job_log_services(session, job_log)
+        finally:
+            session.close()
+
+    @classmethod
+    async def _run_job_log_writer(cls, queue: asyncio.Queue) -> None:
+        """
+        按批大小或攒批时间将队列中的任务执行日志批量落库
+
+        :param queue: 任务执行日志队列
+        :return: None
+        """
+        stopping = False
+        while not stopping:
+            batch, stopping = await cls._collect_job_log_batch(queue)
+            if batch:
+                await cls._flush_job_logs(batch)
+
+    @classmethod
+    async def _collect_job_log_batch(cls, queue: asyncio.Queue) -> tuple[list[JobLogModel], bool]:
+        """
+        从队列中收集一批任务执行日志
+
+        :param queue: 任务执行日志队列
+        :return: 日志批次与是否收到停止标记
+        """
+        first_job_log = await queue.get()
+        if first_job_log is cls._job_log_stop_marker:
+            return [], True
+        batch = [first_job_log]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LogConfig.log_job_flush_interval_ms / 1000
+        while len(batch) < LogConfig.log_job_batch_size:
+            job_log = (
+                queue.get_nowait() if not queue.empty() else await cls._wait_job_log(queue, deadline - loop.time())
+            )
+            if job_log is None:
+                break
+            if job_log is cls._job_log_stop_marker:
+                return batch, True
+            batch.append(job_log)
+        return batch, False
+
+    @staticmethod
+    async def _wait_job_log(queue: asyncio.Queue, timeout: float) -> Any:
+        """
+        在攒批剩余时间内等待下一条任务执行日志
+
+        :param queue: 任务执行日志队列
+        :param timeout: 剩余等待时间（秒）
+        :return: 队列元素，超时返回None
+        """
+        if timeout <= 0:
+            return None
+        try:
+            return await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    @classmethod
+    async def _flush_job_logs(cls, batch: list[JobLogModel]) -> None:
+        """
+        批量写入任务执行日志，失败时记录指标不重试，避免阻塞后续日志
+
+        :param batch: 任务执行日志批次
+        :return: None
+        """
+        try:
+            async with DataSourceRegistry.session(DataBaseConfig.db_default_source) as session:
+                await JobLogService.add_job_log_batch_services(session, batch, LogConfig.log_stream_insert_chunk_size)
+        except Exception as e:
+            cls._job_log_metrics['failed'] += len(batch)
+            logger.error(f'❌ 批量写入{len(batch)}条任务执行日志失败: {e}')
+            return
+        cls._job_log_metrics['written'] += len(batch)
+        cls._job_log_metrics['batches'] += 1
+
     @classmethod
     def _prepare_scheduler_job_add(cls, job_info: JobModel) -> dict[str, Any]:
         """
@@ -921,6 +1121,8 @@ class SchedulerUtil:
             scheduler.shutdown()
             logger.info('✅️ 关闭定时任务成功')
         cls._scheduler_configured = False
+        # scheduler关闭后不再产生新事件，此时落库队列中剩余的任务日志
+        await cls.stop_job_log_writer()
         # 必须在Redis连接池关闭前，原子释放当前进程持有的Application leader租约
         redis = cls._redis
         cls._redis = None
@@ -1119,10 +1321,6 @@ class SchedulerUtil:
                         endTime=end_time,
                         createTime=datetime.now(),
                     )
-                    session = cls._get_session_local()()
-                    try:
-                        JobLogService.add_job_log_services(session, job_log)
-                    finally:
-                        session.close()
+                    cls._enqueue_job_log(job_log)
         except Exception as e:
             logger.error(f'❌ 调度任务事件监听器异常: {e}')
@@ -1,6 +1,8 @@
 from typing import Literal
 
 from config.database import Base, DataSourceRegistry
+from module_admin.service.dept_service import DeptService
+from module_admin.service.export_job_service import ExportJobService
 from utils.log_util import logger
 
 
@@ -24,3 +26,27 @@ async def init_create_table(
     if log_success_enabled:
         message = '✅️ 平台数据库元数据初始化完成' if stage == 'platform' else '✅️ 插件实体表同步完成'
         logger.bind(database_init_stage=stage).info(message)
+
+
+async def init_dept_closure() -> None:
+    """
+    部门层级闭包表为空而部门表存在数据时根据祖级列表自动重建，避免升级后按部门的数据权限查询不到数据
+
+    :return: None
+    """
+    async with DataSourceRegistry.session() as session:
+        closure_count = await DeptService.init_dept_closure_services(session)
+    if closure_count:
+        logger.info(f'✅️ 部门层级闭包表为空，已根据部门祖级列表重建{closure_count}条层级关系')
+
+
+async def init_expire_export_job() -> None:
+    """
+    升级安装的定时任务表缺少异步导出文件过期清理任务时自动补充登记，需在定时任务调度器加载任务前执行
+
+    :return: None
+    """
+    async with DataSourceRegistry.session() as session:
+        job_added = await ExportJobService.init_expire_export_job_services(session)
+    if job_added:
+        logger.info('✅️ 定时任务表缺少异步导出文件过期清理任务，已自动登记')
@@ -14,6 +14,7 @@ from utils.transport_crypto_util import (
     TransportCryptoMonitorUtil,
     TransportCryptoUtil,
     TransportSecurityUtil,
+    TransportSessionUtil,
 )
 
 
@@ -26,6 +27,7 @@ class TransportCryptoMiddleware:
     _ENCRYPT_RESPONSE_HEADER = 'x-body-encrypted'
     _ENCRYPT_ALG_HEADER = 'x-encrypt-alg'
     _ENCRYPT_KID_HEADER = 'x-key-id'
+    _RESPONSE_ALG_REQUEST_HEADER = 'x-transport-response-alg'
     _MONITOR_REQUEST_MODE_HEADER = 'x-transport-request-mode'
     _MONITOR_RESPONSE_MODE_HEADER = 'x-transport-response-mode'
     _MONITOR_STATUS_HEADER = 'x-transport-crypto-status'
@@ -215,18 +217,24 @@ class TransportCryptoMiddleware:
         envelope: dict[str, str],
     ) -> DecryptedTransportEnvelope:
         """
-        解密单个请求信封并执行时间窗、防重放校验
+        解密单个请求信封并执行时间窗、防重放校验，会话模式信封使用已协商的会话密钥解密
 
         :param request: 当前请求对象
         :param scope: 当前ASGI请求作用域
         :param envelope: 请求信封字典
         :return: 解密后的请求信封对象
         """
-        decrypted_payload = TransportCryptoUtil.decrypt_envelope(
-            envelope,
-            expected_method=str(scope.get('method', '')).upper(),
-            expected_path=self._normalize_path(str(scope.get('path', ''))),
-        )
+        expected_method = str(scope.get('method', '')).upper()
+        expected_path = self._normalize_path(str(scope.get('path', '')))
+        if TransportCryptoUtil.is_session_envelope(envelope):
+            transport_session = await TransportSessionUtil.get_session(request, str(envelope['sid']))
+            decrypted_payload = TransportCryptoUtil.decrypt_session_envelope(
+                envelope, transport_session, expected_method=expected_method, expected_path=expected_path
+            )
+        else:
+            decrypted_payload = TransportCryptoUtil.decrypt_envelope(
+                envelope, expected_method=expected_method, expected_path=expected_path
+            )
         TransportSecurityUtil.validate_timestamp(decrypted_payload.timestamp)
         await TransportSecurityUtil.validate_replay(request, decrypted_payload.kid, decrypted_payload.nonce)
         return decrypted_payload
@@ -288,11 +296,18 @@ class TransportCryptoMiddleware:
         """
         构建响应加密发送器，仅对JSON响应执行加密
 
+        客户端通过请求头声明支持分段流式响应算法时，响应体随应用输出逐段加密下发，
+        否则缓冲完整响应后整体加密
+
         :param scope: 当前ASGI请求作用域
         :param send: ASGI send函数
         :param crypto_context: 当前请求加密上下文
         :return: 包装后的ASGI send函数
         """
+        response_algorithm = Headers(scope=scope).get(self._RESPONSE_ALG_REQUEST_HEADER)
+        if response_algorithm == TransportCryptoUtil.get_chunked_response_envelope_algorithm():
+            return self._build_chunked_response_encryptor(app, scope, send, crypto_context)
+
         response_start_message: Message | None = None
         buffered_json_body: list[bytes] = []
         should_buffer_json = False
@@ -306,21 +321,7 @@ class TransportCryptoMiddleware:
                 content_type = headers.get('content-type', '')
                 should_buffer_json = 'application/json' in content_type
                 if not should_buffer_json:
-                    await TransportCryptoMonitorUtil.record_plain_response(app)
-                    await send(
-                        {
-                            **message,
-                            'headers': self._merge_response_headers(
-                                message.get('headers', []),
-                                self._build_monitor_headers(
-                                    request_mode='encrypted',
-                                    response_mode='plain',
-                                    crypto_status='ok',
-                                    kid=str(crypto_context['kid']),
-                                ),
-                            ),
-                        }
-                    )
+                    await self._send_plain_response_start(app, send, message, crypto_context)
                 return
 
             if message['type'] != 'http.response.body':
@@ -342,33 +343,14 @@ class TransportCryptoMiddleware:
                 method=str(scope.get('method', '')),
                 path=self._normalize_path(str(scope.get('path', ''))),
             )
-            response_headers = self._replace_header(
+            response_headers = self._build_encrypted_response_headers(
                 response_start_message.get('headers', []),
-                b'content-length',
-                str(len(encrypted_body)).encode('utf-8'),
-            )
-            response_headers = self._replace_header(response_headers, b'content-type', b'application/json')
-            response_headers = self._replace_header(
-                response_headers, self._ENCRYPT_RESPONSE_HEADER.encode('utf-8'), b'1'
+                crypto_context,
+                TransportCryptoUtil.get_response_envelope_algorithm(),
+                b'application/json',
             )
             response_headers = self._replace_header(
-                response_headers,
-                self._ENCRYPT_ALG_HEADER.encode('utf-8'),
-                TransportCryptoUtil.get_response_envelope_algorithm().encode('utf-8'),
-            )
-            response_headers = self._replace_header(
-                response_headers,
-                self._ENCRYPT_KID_HEADER.encode('utf-8'),
-                str(crypto_context['kid']).encode('utf-8'),
-            )
-            response_headers = self._merge_response_headers(
-                response_headers,
-                self._build_monitor_headers(
-                    request_mode='encrypted',
-                    response_mode='encrypted',
-                    crypto_status='ok',
-                    kid=str(crypto_context['kid']),
-                ),
+                response_headers, b'content-length', str(len(encrypted_body)).encode('utf-8')
             )
             await TransportCryptoMonitorUtil.record_encrypted_response(app, str(crypto_context['kid']))
             await send({**response_start_message, 'headers': response_headers})
@@ -376,6 +358,133 @@ class TransportCryptoMiddleware:
 
         return _encrypt_response
 
+    def _build_chunked_response_encryptor(
+        self,
+        app: FastAPI | None,
+        scope: Scope,
+        send: Send,
+        crypto_context: dict[str, str | bytes | bool],
+    ) -> Callable[[Message], Awaitable[None]]:
+        """
+        构建分段流式响应加密发送器，JSON响应体随应用输出逐段加密并立即下发
+
+        :param scope: 当前ASGI请求作用域
+        :param send: ASGI send函数
+        :param crypto_context: 当前请求加密上下文
+        :return: 包装后的ASGI send函数
+        """
+        chunked_encryptor = None
+
+        async def _encrypt_response(message: Message) -> None:
+            nonlocal chunked_encryptor
+
+            if message['type'] == 'http.response.start':
+                headers = Headers(raw=message.get('headers', []))
+                if 'application/json' not in headers.get('content-type', ''):
+                    await self._send_plain_response_start(app, send, message, crypto_context)
+                    return
+                chunked_encryptor = TransportCryptoUtil.create_chunked_response_encryptor(
+                    aes_key=crypto_context['aes_key'],
+                    kid=str(crypto_context['kid']),
+                    method=str(scope.get('method', '')),
+                    path=self._normalize_path(str(scope.get('path', ''))),
+                )
+                # 分段输出时无法预知加密后长度，移除content-length改为分块传输
+                response_headers = self._remove_header(
+                    self._build_encrypted_response_headers(
+                        message.get('headers', []),
+                        crypto_context,
+                        TransportCryptoUtil.get_chunked_response_envelope_algorithm(),
+                        b'application/x-ndjson',
+                    ),
+                    b'content-length',
+                )
+                await TransportCryptoMonitorUtil.record_encrypted_response(app, str(crypto_context['kid']))
+                await send({**message, 'headers': response_headers})
+                await send({'type': 'http.response.body', 'body': chunked_encryptor.start(), 'more_body': True})
+                return
+
+            if message['type'] != 'http.response.body' or chunked_encryptor is None:
+                await send(message)
+                return
+
+            for frame in chunked_encryptor.update(message.get('body', b'')):
+                await send({'type': 'http.response.body', 'body': frame, 'more_body': True})
+            if message.get('more_body', False):
+                return
+            for frame in chunked_encryptor.finalize():
+                await send({'type': 'http.response.body', 'body': frame, 'more_body': True})
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
+
+        return _encrypt_response
+
+    async def _send_plain_response_start(
+        self,
+        app: FastAPI | None,
+        send: Send,
+        message: Message,
+        crypto_context: dict[str, str | bytes | bool],
+    ) -> None:
+        """
+        加密请求对应非JSON响应时，以明文透传响应头并追加监控诊断头
+
+        :param send: ASGI send函数
+        :param message: 响应开始消息
+        :param crypto_context: 当前请求加密上下文
+        :return: None
+        """
+        await TransportCryptoMonitorUtil.record_plain_response(app)
+        await send(
+            {
+                **message,
+                'headers': self._merge_response_headers(
+                    message.get('headers', []),
+                    self._build_monitor_headers(
+                        request_mode='encrypted',
+                        response_mode='plain',
+                        crypto_status='ok',
+                        kid=str(crypto_context['kid']),
+                    ),
+                ),
+            }
+        )
+
+    def _build_encrypted_response_headers(
+        self,
+        headers: list[tuple[bytes, bytes]],
+        crypto_context: dict[str, str | bytes | bool],
+        algorithm: str,
+        content_type: bytes,
+    ) -> list[tuple[bytes, bytes]]:
+        """
+        构建加密响应头，写入加密标识、算法、密钥版本与监控诊断头
+
+        :param headers: 原始响应头列表
+        :param crypto_context: 当前请求加密上下文
+        :param algorithm: 响应信封算法标识
+        :param content_type: 加密响应内容类型
+        :return: 加密响应头列表
+        """
+        response_headers = self._replace_header(headers, b'content-type', content_type)
+        response_headers = self._replace_header(response_headers, self._ENCRYPT_RESPONSE_HEADER.encode('utf-8'), b'1')
+        response_headers = self._replace_header(
+            response_headers, self._ENCRYPT_ALG_HEADER.encode('utf-8'), algorithm.encode('utf-8')
+        )
+        response_headers = self._replace_header(
+            response_headers,
+            self._ENCRYPT_KID_HEADER.encode('utf-8'),
+            str(crypto_context['kid']).encode('utf-8'),
+        )
+        return self._merge_response_headers(
+            response_headers,
+            self._build_monitor_headers(
+                request_mode='encrypted',
+                response_mode='encrypted',
+                crypto_status='ok',
+                kid=str(crypto_context['kid']),
+            ),
+        )
+
     def _build_passthrough_response_observer(
         self,
         app: FastAPI | None,
@@ -429,11 +538,14 @@ class TransportCryptoMiddleware:
         :param decrypted_payload: 解密后的请求信封对象
         :return: 请求加密上下文字典
         """
-        return {
+        crypto_context = {
             'active': True,
             'kid': decrypted_payload.kid,
             'aes_key': decrypted_payload.aes_key,
         }
+        if decrypted_payload.session_id:
+            crypto_context['session_id'] = decrypted_payload.session_id
+        return crypto_context
 
     def _build_error_crypto_context(
         self,
@@ -681,6 +793,7 @@ class TransportCryptoMiddleware:
         if not message or message == '加密请求解析失败':
             return 'decrypt_failed'
         failure_reason_mapping = (
+            ('传输会话', 'session_invalid'),
             ('method/path与当前接口不匹配', 'aad_mismatch'),
             ('缺少合法的aad', 'aad_invalid'),
             ('已过期', 'timestamp_expired'),
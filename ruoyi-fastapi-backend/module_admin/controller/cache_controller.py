@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import Path, Request, Response
+from fastapi import Path, Query, Request, Response
 
 from common.annotation.rate_limit_annotation import ApiRateLimit, ApiRateLimitPreset
 from common.aspect.interface_auth import UserInterfaceAuthDependency
@@ -8,7 +8,7 @@ from common.aspect.pre_auth import PreAuthDependency
 from common.constant import ApiNamespace
 from common.router import APIRouterPro
 from common.vo import DataResponseModel, ResponseBaseModel
-from module_admin.entity.vo.cache_vo import CacheInfoModel, CacheMonitorModel
+from module_admin.entity.vo.cache_vo import CacheInfoModel, CacheKeyPageModel, CacheMonitorModel
 from module_admin.service.cache_service import CacheService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
@@ -63,6 +63,27 @@ async def get_monitor_cache_key(request: Request, cache_name: Annotated[str, Pat
     return ResponseUtil.success(data=cache_key_list_result)
 
 
+@cache_controller.get(
+    '/getKeyPage/{cache_name}',
+    summary='游标分页获取缓存键列表接口',
+    description='用于基于SCAN游标分页获取指定缓存名称下的缓存键列表，返回游标为0时表示遍历结束',
+    response_model=DataResponseModel[CacheKeyPageModel],
+    dependencies=[UserInterfaceAuthDependency('monitor:cache:list')],
+)
+async def get_monitor_cache_key_page(
+    request: Request,
+    cache_name: Annotated[str, Path(description='缓存名称')],
+    cursor: Annotated[int, Query(ge=0, description='本页起始游标，首页传0')] = 0,
+    page_size: Annotated[int, Query(alias='pageSize', ge=1, le=1000, description='每页期望返回的缓存键数量')] = 100,
+) -> Response:
+    cache_key_page_result = await CacheService.get_cache_monitor_cache_key_page_services(
+        request, cache_name, cursor, page_size
+    )
+    logger.info('获取成功')
+
+    return ResponseUtil.success(data=cache_key_page_result)
+
+
 @cache_controller.get(
     '/getValue/{cache_name}/{cache_key}',
     summary='获取缓存值接口',
@@ -10,6 +10,7 @@ from common.router import APIRouterPro
 from common.vo import DynamicResponseModel
 from module_admin.entity.vo.login_vo import CaptchaCode
 from module_admin.service.captcha_service import CaptchaService
+from module_admin.service.config_service import ConfigService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -25,10 +26,12 @@ captcha_controller = APIRouterPro(order_num=2, tags=['验证码模块'])
 @ApiRateLimit(namespace=ApiNamespace.CAPTCHA_IMAGE, preset=ApiRateLimitPreset.ANON_AUTH_CAPTCHA)
 async def get_captcha_image(request: Request) -> Response:
     captcha_enabled = (
-        await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.captchaEnabled') == 'true'
+        await ConfigService.query_config_list_from_cache_services(request.app.state.redis, 'sys.account.captchaEnabled')
+        == 'true'
     )
     register_enabled = (
-        await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.registerUser') == 'true'
+        await ConfigService.query_config_list_from_cache_services(request.app.state.redis, 'sys.account.registerUser')
+        == 'true'
     )
     session_id = str(uuid.uuid4())
     captcha_result = await CaptchaService.create_captcha_image_service()
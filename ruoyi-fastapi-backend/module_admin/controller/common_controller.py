@@ -10,10 +10,12 @@ from common.aspect.db_session import DBSessionDependency
 from common.aspect.pre_auth import CurrentUserDependency, PreAuthDependency
 from common.constant import ApiNamespace
 from common.router import APIRouterPro
-from common.vo import DynamicResponseModel
+from common.vo import DataResponseModel, DynamicResponseModel, PageResponseModel
 from module_admin.entity.vo.common_vo import UploadResponseModel
+from module_admin.entity.vo.export_job_vo import ExportJobModel, ExportJobPageQueryModel
 from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_admin.service.common_service import CommonService
+from module_admin.service.export_job_service import ExportJobService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 from utils.upload_util import UploadUtil
@@ -72,6 +74,7 @@ async def common_private_upload(
             },
         },
         206: {'description': '分段返回文件'},
+        304: {'description': '文件未修改，客户端缓存仍然有效'},
         416: {'description': '请求的字节范围不可满足'},
     },
 )
@@ -89,21 +92,79 @@ async def common_managed_file_download(
         current_user,
         str(file_id),
         range_header=request.headers.get('Range'),
+        if_none_match=request.headers.get('If-None-Match'),
+        if_range=request.headers.get('If-Range'),
     )
     logger.info(f'文件{file_id}下载成功')
 
-    return ResponseUtil.streaming(
-        data=download_result.data,
+    return ResponseUtil.file_download(
+        download_result=download_result,
         headers=UploadUtil.build_download_headers(
             download_result.filename,
             download_result.byte_range,
             download_result.accept_ranges,
         ),
         media_type='application/octet-stream',
-        status_code=206 if download_result.byte_range.is_partial else 200,
     )
 
 
+@common_controller.get(
+    '/export-jobs/list',
+    summary='获取异步导出任务分页列表接口',
+    description='用于获取当前用户发起的异步导出任务及下载路径',
+    response_model=PageResponseModel[ExportJobModel],
+)
+async def get_common_export_job_list(
+    request: Request,
+    export_job_page_query: Annotated[ExportJobPageQueryModel, Query()],
+    query_db: Annotated[AsyncSession, DBSessionDependency()],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
+) -> Response:
+    export_job_page_query_result = await ExportJobService.get_export_job_list_services(
+        query_db, current_user, export_job_page_query, is_page=True
+    )
+    logger.info('异步导出任务列表获取成功')
+
+    return ResponseUtil.success(model_content=export_job_page_query_result)
+
+
+@common_controller.get(
+    '/export-jobs/{job_id}',
+    summary='获取异步导出任务详情接口',
+    description='用于查询异步导出任务进度，完成后返回导出文件下载路径',
+    response_model=DataResponseModel[ExportJobModel],
+)
+async def get_common_export_job_detail(
+    request: Request,
+    job_id: UUID,
+    query_db: Annotated[AsyncSession, DBSessionDependency()],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
+) -> Response:
+    export_job = await ExportJobService.get_export_job_detail_services(query_db, current_user, str(job_id))
+    logger.info(f'异步导出任务{job_id}获取成功')
+
+    return ResponseUtil.success(data=export_job)
+
+
+@common_controller.put(
+    '/export-jobs/{job_id}/cancel',
+    summary='取消异步导出任务接口',
+    description='用于取消排队中或执行中的异步导出任务',
+    response_model=DataResponseModel[ExportJobModel],
+)
+@ApiRateLimit(namespace=ApiNamespace.COMMON_EXPORT_JOB_CANCEL, preset=ApiRateLimitPreset.USER_COMMON_MUTATION)
+async def cancel_common_export_job(
+    request: Request,
+    job_id: UUID,
+    query_db: Annotated[AsyncSession, DBSessionDependency()],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
+) -> Response:
+    export_job = await ExportJobService.cancel_export_job_services(query_db, current_user, str(job_id))
+    logger.info(f'异步导出任务{job_id}取消成功')
+
+    return ResponseUtil.success(msg='导出任务已取消', data=export_job)
+
+
 @common_controller.get(
     '/download',
     summary='通用文件下载接口',
@@ -134,15 +195,14 @@ async def common_download(
     )
     logger.info('下载成功')
 
-    return ResponseUtil.streaming(
-        data=download_result.data,
+    return ResponseUtil.file_download(
+        download_result=download_result,
         headers=UploadUtil.build_download_headers(
             download_result.filename,
             download_result.byte_range,
             download_result.accept_ranges,
         ),
         media_type='application/octet-stream',
-        status_code=206 if download_result.byte_range.is_partial else 200,
     )
 
 
@@ -169,13 +229,12 @@ async def common_download_resource(request: Request, resource: Annotated[str, Qu
     )
     logger.info('下载成功')
 
-    return ResponseUtil.streaming(
-        data=download_result.data,
+    return ResponseUtil.file_download(
+        download_result=download_result,
         headers=UploadUtil.build_download_headers(
             download_result.filename,
             download_result.byte_range,
             download_result.accept_ranges,
         ),
         media_type='application/octet-stream',
-        status_code=206 if download_result.byte_range.is_partial else 200,
     )
@@ -25,7 +25,6 @@ from module_admin.entity.vo.dict_vo import (
 )
 from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_admin.service.dict_service import DictDataService, DictTypeService
-from utils.common_util import bytes2file_response
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -206,7 +205,7 @@ async def export_system_dict_type_list(
     dict_type_export_result = await DictTypeService.export_dict_type_list_services(dict_type_query_result)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(dict_type_export_result))
+    return ResponseUtil.streaming(data=dict_type_export_result)
 
 
 @dict_controller.get(
@@ -367,4 +366,4 @@ async def export_system_dict_data_list(
     dict_data_export_result = await DictDataService.export_dict_data_list_services(dict_data_query_result)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(dict_data_export_result))
+    return ResponseUtil.streaming(data=dict_data_export_result)
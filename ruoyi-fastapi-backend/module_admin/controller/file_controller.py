@@ -723,6 +723,7 @@ async def get_system_file_access_log_list(
             },
         },
         206: {'description': '分段返回文件'},
+        304: {'description': '文件未修改，客户端缓存仍然有效'},
         416: {'description': '请求的字节范围不可满足'},
     },
     dependencies=[UserInterfaceAuthDependency('system:file:download')],
@@ -748,18 +749,19 @@ async def download_system_file(
         enforce_owner_permission=False,
         file_data_scope_sql=file_data_scope_sql,
         range_header=request.headers.get('Range'),
+        if_none_match=request.headers.get('If-None-Match'),
+        if_range=request.headers.get('If-Range'),
     )
     logger.info(f'文件{file_id}下载成功')
 
-    return ResponseUtil.streaming(
-        data=download_result.data,
+    return ResponseUtil.file_download(
+        download_result=download_result,
         headers=UploadUtil.build_download_headers(
             download_result.filename,
             download_result.byte_range,
             download_result.accept_ranges,
         ),
         media_type='application/octet-stream',
-        status_code=206 if download_result.byte_range.is_partial else 200,
     )
 
 
@@ -15,6 +15,7 @@ from common.constant import ApiGroup, ApiNamespace
 from common.enums import BusinessType
 from common.router import APIRouterPro
 from common.vo import DataResponseModel, PageResponseModel, ResponseBaseModel
+from module_admin.entity.vo.export_job_vo import ExportOptionModel
 from module_admin.entity.vo.job_vo import (
     DeleteJobLogModel,
     DeleteJobModel,
@@ -25,9 +26,9 @@ from module_admin.entity.vo.job_vo import (
     JobPageQueryModel,
 )
 from module_admin.entity.vo.user_vo import CurrentUserModel
+from module_admin.service.export_job_service import ExportJobService
 from module_admin.service.job_log_service import JobLogService
 from module_admin.service.job_service import JobService
-from utils.common_util import bytes2file_response
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -219,7 +220,7 @@ async def export_system_job_list(
     job_export_result = await JobService.export_job_list_services(request, job_query_result)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(job_export_result))
+    return ResponseUtil.streaming(data=job_export_result)
 
 
 @job_controller.get(
@@ -290,9 +291,10 @@ async def delete_system_job_log(
     response_class=StreamingResponse,
     responses={
         200: {
-            'description': '流式返回定时任务日志列表excel文件',
+            'description': '流式返回定时任务日志列表excel文件，异步导出时返回导出任务',
             'content': {
                 'application/octet-stream': {},
+                'application/json': {},
             },
         }
     },
@@ -303,11 +305,29 @@ async def delete_system_job_log(
 async def export_system_job_log_list(
     request: Request,
     job_log_page_query: Annotated[JobLogPageQueryModel, Form()],
+    export_option: Annotated[ExportOptionModel, Query()],
     query_db: Annotated[AsyncSession, DBSessionDependency()],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
 ) -> Response:
-    # 获取全量数据
-    job_log_query_result = await JobLogService.get_job_log_list_services(query_db, job_log_page_query, is_page=False)
-    job_log_export_result = await JobLogService.export_job_log_list_services(request, job_log_query_result)
+    if export_option.async_export:
+        export_job = await ExportJobService.submit_export_job_services(
+            query_db,
+            current_user,
+            'monitor:job-log',
+            '定时任务调度日志',
+            export_option.export_format,
+            job_log_page_query,
+            lambda export_db, on_progress: JobLogService.export_job_log_list_services(
+                request, export_db, job_log_page_query, export_option.export_format, on_progress
+            ),
+        )
+        logger.info(f'定时任务调度日志异步导出任务{export_job.job_id}创建成功')
+
+        return ResponseUtil.success(data=export_job)
+    # 通过服务端游标流式导出全量数据
+    job_log_export_result = await JobLogService.export_job_log_list_services(
+        request, query_db, job_log_page_query, export_option.export_format
+    )
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(job_log_export_result))
+    return ResponseUtil.streaming(data=job_log_export_result)
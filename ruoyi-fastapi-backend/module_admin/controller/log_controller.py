@@ -8,11 +8,12 @@ from common.annotation.log_annotation import Log
 from common.annotation.rate_limit_annotation import ApiRateLimit, ApiRateLimitPreset
 from common.aspect.db_session import DBSessionDependency
 from common.aspect.interface_auth import UserInterfaceAuthDependency
-from common.aspect.pre_auth import PreAuthDependency
+from common.aspect.pre_auth import CurrentUserDependency, PreAuthDependency
 from common.constant import ApiNamespace
 from common.enums import BusinessType
 from common.router import APIRouterPro
 from common.vo import PageResponseModel, ResponseBaseModel
+from module_admin.entity.vo.export_job_vo import ExportOptionModel
 from module_admin.entity.vo.log_vo import (
     DeleteLoginLogModel,
     DeleteOperLogModel,
@@ -22,8 +23,9 @@ from module_admin.entity.vo.log_vo import (
     OperLogPageQueryModel,
     UnlockUser,
 )
+from module_admin.entity.vo.user_vo import CurrentUserModel
+from module_admin.service.export_job_service import ExportJobService
 from module_admin.service.log_service import LoginLogService, OperationLogService
-from utils.common_util import bytes2file_response
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -101,9 +103,10 @@ async def delete_system_operation_log(
     response_class=StreamingResponse,
     responses={
         200: {
-            'description': '流式返回操作日志列表excel文件',
+            'description': '流式返回操作日志列表excel文件，异步导出时返回导出任务',
             'content': {
                 'application/octet-stream': {},
+                'application/json': {},
             },
         }
     },
@@ -114,18 +117,32 @@ async def delete_system_operation_log(
 async def export_system_operation_log_list(
     request: Request,
     operation_log_page_query: Annotated[OperLogPageQueryModel, Form()],
+    export_option: Annotated[ExportOptionModel, Query()],
     query_db: Annotated[AsyncSession, DBSessionDependency()],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
 ) -> Response:
-    # 获取全量数据
-    operation_log_query_result = await OperationLogService.get_operation_log_list_services(
-        query_db, operation_log_page_query, is_page=False
-    )
+    if export_option.async_export:
+        export_job = await ExportJobService.submit_export_job_services(
+            query_db,
+            current_user,
+            'monitor:operlog',
+            '操作日志',
+            export_option.export_format,
+            operation_log_page_query,
+            lambda export_db, on_progress: OperationLogService.export_operation_log_list_services(
+                request, export_db, operation_log_page_query, export_option.export_format, on_progress
+            ),
+        )
+        logger.info(f'操作日志异步导出任务{export_job.job_id}创建成功')
+
+        return ResponseUtil.success(data=export_job)
+    # 通过服务端游标流式导出全量数据
     operation_log_export_result = await OperationLogService.export_operation_log_list_services(
-        request, operation_log_query_result
+        request, query_db, operation_log_page_query, export_option.export_format
     )
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(operation_log_export_result))
+    return ResponseUtil.streaming(data=operation_log_export_result)
 
 
 @log_controller.get(
@@ -216,9 +233,10 @@ async def unlock_system_user(
     response_class=StreamingResponse,
     responses={
         200: {
-            'description': '流式返回登录日志列表excel文件',
+            'description': '流式返回登录日志列表excel文件，异步导出时返回导出任务',
             'content': {
                 'application/octet-stream': {},
+                'application/json': {},
             },
         }
     },
@@ -229,13 +247,29 @@ async def unlock_system_user(
 async def export_system_login_log_list(
     request: Request,
     login_log_page_query: Annotated[LoginLogPageQueryModel, Form()],
+    export_option: Annotated[ExportOptionModel, Query()],
     query_db: Annotated[AsyncSession, DBSessionDependency()],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
 ) -> Response:
-    # 获取全量数据
-    login_log_query_result = await LoginLogService.get_login_log_list_services(
-        query_db, login_log_page_query, is_page=False
+    if export_option.async_export:
+        export_job = await ExportJobService.submit_export_job_services(
+            query_db,
+            current_user,
+            'monitor:logininfor',
+            '登录日志',
+            export_option.export_format,
+            login_log_page_query,
+            lambda export_db, on_progress: LoginLogService.export_login_log_list_services(
+                export_db, login_log_page_query, export_option.export_format, on_progress
+            ),
+        )
+        logger.info(f'登录日志异步导出任务{export_job.job_id}创建成功')
+
+        return ResponseUtil.success(data=export_job)
+    # 通过服务端游标流式导出全量数据
+    login_log_export_result = await LoginLogService.export_login_log_list_services(
+        query_db, login_log_page_query, export_option.export_format
     )
-    login_log_export_result = await LoginLogService.export_login_log_list_services(login_log_query_result)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(login_log_export_result))
+    return ResponseUtil.streaming(data=login_log_export_result)
@@ -24,7 +24,9 @@ from module_admin.entity.vo.login_vo import (
     UserRegister,
 )
 from module_admin.entity.vo.user_vo import CurrentUserModel, EditUserModel
+from module_admin.service.config_service import ConfigService
 from module_admin.service.login_service import CustomOAuth2PasswordRequestForm, LoginService, oauth2_scheme
+from module_admin.service.online_service import OnlineService
 from module_admin.service.user_service import UserService
 from utils.jwt_util import JwtUtil
 from utils.log_util import logger
@@ -48,7 +50,8 @@ async def login(
     query_db: Annotated[AsyncSession, DBSessionDependency()],
 ) -> Response:
     captcha_enabled = (
-        await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.captchaEnabled') == 'true'
+        await ConfigService.query_config_list_from_cache_services(request.app.state.redis, 'sys.account.captchaEnabled')
+        == 'true'
     )
     user = UserLogin(
         userName=form_data.username,
@@ -71,19 +74,20 @@ async def login(
         },
         expires_delta=access_token_expires,
     )
-    if AppConfig.app_same_time_login:
-        await request.app.state.redis.set(
-            f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}',
-            access_token,
-            ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes),
-        )
-    else:
-        # 此方法可实现同一账号同一时间只能登录一次
-        await request.app.state.redis.set(
-            f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{result[0].user_id}',
-            access_token,
-            ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes),
-        )
+    # app_same_time_login为False时按用户id存储令牌，可实现同一账号同一时间只能登录一次
+    token_id = session_id if AppConfig.app_same_time_login else str(result[0].user_id)
+    await request.app.state.redis.set(
+        f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_id}',
+        access_token,
+        ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes),
+    )
+    await OnlineService.register_online_session(
+        request.app.state.redis,
+        token_id,
+        OnlineService.build_online_session(
+            result[0].user_name, result[1].dept_name if result[1] else None, user.login_info
+        ),
+    )
     await UserService.edit_user_services(
         query_db, EditUserModel(userId=result[0].user_id, loginDate=datetime.now(), type='status')
     )
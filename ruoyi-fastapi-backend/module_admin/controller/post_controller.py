@@ -18,7 +18,6 @@ from common.vo import DataResponseModel, PageResponseModel, ResponseBaseModel
 from module_admin.entity.vo.post_vo import DeletePostModel, PostModel, PostPageQueryModel
 from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_admin.service.post_service import PostService
-from utils.common_util import bytes2file_response
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -161,4 +160,4 @@ async def export_system_post_list(
     post_export_result = await PostService.export_post_list_services(post_query_result)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(post_export_result))
+    return ResponseUtil.streaming(data=post_export_result)
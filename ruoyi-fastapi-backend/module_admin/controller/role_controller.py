@@ -31,7 +31,6 @@ from module_admin.entity.vo.user_vo import CrudUserRoleModel, CurrentUserModel,
 from module_admin.service.dept_service import DeptService
 from module_admin.service.role_service import RoleService
 from module_admin.service.user_service import UserService
-from utils.common_util import bytes2file_response
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -249,7 +248,7 @@ async def export_system_role_list(
     role_export_result = await RoleService.export_role_list_services(role_query_result)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(role_export_result))
+    return ResponseUtil.streaming(data=role_export_result)
 
 
 @role_controller.put(
@@ -1,16 +1,20 @@
-from fastapi import Request, Response
+from typing import Annotated
+
+from fastapi import Depends, Path, Request, Response
 
 from common.annotation.rate_limit_annotation import ApiRateLimit, ApiRateLimitPreset
 from common.aspect.interface_auth import UserInterfaceAuthDependency
 from common.aspect.pre_auth import PreAuthDependency
 from common.constant import ApiNamespace
 from common.router import APIRouterPro
-from common.vo import DataResponseModel
+from common.vo import DataResponseModel, ResponseBaseModel
 from module_admin.entity.vo.transport_crypto_vo import (
     TransportCryptoFrontendConfigModel,
     TransportCryptoMonitorModel,
     TransportCryptoPublicKeyModel,
+    TransportCryptoSessionModel,
 )
+from module_admin.service.login_service import oauth2_scheme
 from module_admin.service.transport_crypto_service import TransportCryptoService
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
@@ -76,3 +80,49 @@ async def get_transport_crypto_monitor_info(request: Request) -> Response:
     logger.info('获取成功')
 
     return ResponseUtil.success(data=transport_crypto_monitor_info)
+
+
+@transport_crypto_controller.post(
+    '/session',
+    summary='协商传输会话接口',
+    description='用于以RSA加密请求协商绑定当前登录令牌的传输会话，后续请求仅携带会话编号与AES-GCM密文',
+    response_model=DataResponseModel[TransportCryptoSessionModel],
+    dependencies=[PreAuthDependency()],
+)
+async def create_transport_session(request: Request, token: Annotated[str, Depends(oauth2_scheme)]) -> Response:
+    """
+    协商传输会话
+
+    :param request: 当前请求对象
+    :param token: 当前登录令牌
+    :return: 传输会话协商响应
+    """
+    transport_session = await TransportCryptoService.create_transport_session_services(request, token)
+    logger.info('协商成功')
+
+    return ResponseUtil.success(data=transport_session)
+
+
+@transport_crypto_controller.delete(
+    '/session/{session_id}',
+    summary='撤销传输会话接口',
+    description='用于撤销当前登录令牌绑定的指定传输会话',
+    response_model=ResponseBaseModel,
+    dependencies=[PreAuthDependency()],
+)
+async def delete_transport_session(
+    request: Request, session_id: Annotated[str, Path(description='传输会话编号')]
+) -> Response:
+    """
+    撤销传输会话
+
+    :param request: 当前请求对象
+    :param session_id: 传输会话编号
+    :return: 撤销传输会话响应
+    """
+    delete_transport_session_result = await TransportCryptoService.delete_transport_session_services(
+        request, session_id
+    )
+    logger.info(delete_transport_session_result.message)
+
+    return ResponseUtil.success(msg=delete_transport_session_result.message)
@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
 from typing import Annotated, Literal
+from uuid import UUID
 
 import aiofiles
 from fastapi import File, Form, Path, Query, Request, Response, UploadFile
@@ -24,6 +25,7 @@ from config.env import UploadConfig
 from module_admin.entity.do.dept_do import SysDept
 from module_admin.entity.do.user_do import SysUser
 from module_admin.entity.vo.dept_vo import DeptModel, DeptTreeModel
+from module_admin.entity.vo.export_job_vo import ExportOptionModel
 from module_admin.entity.vo.user_vo import (
     AddUserModel,
     AvatarModel,
@@ -35,6 +37,7 @@ from module_admin.entity.vo.user_vo import (
     ResetUserModel,
     UpdateUserProfileModel,
     UserDetailModel,
+    UserImportResultModel,
     UserModel,
     UserPageQueryModel,
     UserProfileModel,
@@ -43,6 +46,7 @@ from module_admin.entity.vo.user_vo import (
     UserRowModel,
 )
 from module_admin.service.dept_service import DeptService
+from module_admin.service.export_job_service import ExportJobService
 from module_admin.service.role_service import RoleService
 from module_admin.service.user_service import UserService
 from utils.common_util import bytes2file_response
@@ -122,7 +126,7 @@ async def add_system_user(
             query_db, ','.join([str(item) for item in add_user.role_ids]), role_data_scope_sql
         )
     await UserService.validate_password_services(request.app.state.redis, add_user.password)
-    add_user.password = PwdUtil.get_password_hash(add_user.password)
+    add_user.password = await PwdUtil.get_password_hash_async(add_user.password)
     add_user.create_by = current_user.user.user_name
     add_user.update_by = current_user.user.user_name
     add_user_result = await UserService.add_user_services(query_db, add_user)
@@ -221,7 +225,7 @@ async def reset_system_user_pwd(
     )
     edit_user = EditUserModel(
         userId=reset_user.user_id,
-        password=PwdUtil.get_password_hash(reset_user.password),
+        password=await PwdUtil.get_password_hash_async(reset_user.password),
         pwdUpdateDate=datetime.now(),
         updateBy=current_user.user.user_name,
         type='pwd',
@@ -416,8 +420,8 @@ async def reset_system_user_password(
 @user_controller.post(
     '/importData',
     summary='批量导入用户接口',
-    description='用于批量导入用户数据',
-    response_model=ResponseBaseModel,
+    description='用于批量导入用户数据，校验失败的行可通过导入错误报告下载',
+    response_model=DataResponseModel[UserImportResultModel],
     dependencies=[UserInterfaceAuthDependency('system:user:import')],
 )
 @ApiRateLimit(
@@ -441,7 +445,35 @@ async def batch_import_system_user(
     )
     logger.info(batch_import_result.message)
 
-    return ResponseUtil.success(msg=batch_import_result.message)
+    return ResponseUtil.success(msg=batch_import_result.message, data=batch_import_result.result)
+
+
+@user_controller.get(
+    '/importErrorReport/{report_id}',
+    summary='下载用户导入错误报告接口',
+    description='用于下载当前用户批量导入用户时生成的错误报告csv文件',
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            'description': '流式返回用户导入错误报告csv文件',
+            'content': {
+                'application/octet-stream': {},
+            },
+        }
+    },
+    dependencies=[UserInterfaceAuthDependency('system:user:import')],
+)
+async def export_system_user_import_error_report(
+    request: Request,
+    report_id: Annotated[UUID, Path(description='导入错误报告ID')],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
+) -> Response:
+    error_report = await UserService.get_import_error_report_services(
+        request.app.state.redis, current_user.user.user_id, report_id.hex
+    )
+    logger.info('获取成功')
+
+    return ResponseUtil.streaming(data=bytes2file_response(error_report))
 
 
 @user_controller.post(
@@ -475,9 +507,10 @@ async def export_system_user_template(
     response_class=StreamingResponse,
     responses={
         200: {
-            'description': '流式返回用户列表excel文件',
+            'description': '流式返回用户列表excel文件，异步导出时返回导出任务',
             'content': {
                 'application/octet-stream': {},
+                'application/json': {},
             },
         }
     },
@@ -488,17 +521,33 @@ async def export_system_user_template(
 async def export_system_user_list(
     request: Request,
     user_page_query: Annotated[UserPageQueryModel, Form()],
+    export_option: Annotated[ExportOptionModel, Query()],
     query_db: Annotated[AsyncSession, DBSessionDependency()],
     data_scope_sql: Annotated[ColumnElement, DataScopeDependency(SysUser)],
+    current_user: Annotated[CurrentUserModel, CurrentUserDependency()],
 ) -> Response:
-    # 获取全量数据
-    user_query_result = await UserService.get_user_list_services(
-        query_db, user_page_query, data_scope_sql, is_page=False
+    if export_option.async_export:
+        export_job = await ExportJobService.submit_export_job_services(
+            query_db,
+            current_user,
+            'system:user',
+            '用户数据',
+            export_option.export_format,
+            user_page_query,
+            lambda export_db, on_progress: UserService.export_user_list_services(
+                export_db, user_page_query, data_scope_sql, export_option.export_format, on_progress
+            ),
+        )
+        logger.info(f'用户数据异步导出任务{export_job.job_id}创建成功')
+
+        return ResponseUtil.success(data=export_job)
+    # 通过服务端游标流式导出全量数据
+    user_export_result = await UserService.export_user_list_services(
+        query_db, user_page_query, data_scope_sql, export_option.export_format
     )
-    user_export_result = await UserService.export_user_list_services(user_query_result)
     logger.info('导出成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(user_export_result))
+    return ResponseUtil.streaming(data=user_export_result)
 
 
 @user_controller.get(
@@ -1,12 +1,15 @@
 from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import ColumnElement, bindparam, func, select, update
+from sqlalchemy import ColumnElement, Select, bindparam, delete, func, insert, literal, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlalchemy.util import immutabledict
 
-from module_admin.entity.do.dept_do import SysDept
+from module_admin.entity.do.dept_do import SysDept, SysDeptClosure
 from module_admin.entity.do.user_do import SysUser
 from module_admin.entity.vo.dept_vo import DeptModel
+from utils.common_util import SqlalchemyUtil
 
 
 class DeptDao:
@@ -88,7 +91,7 @@ class DeptDao:
                     .where(
                         SysDept.dept_id != dept_info.dept_id,
                         ~SysDept.dept_id.in_(
-                            select(SysDept.dept_id).where(func.find_in_set(dept_info.dept_id, SysDept.ancestors))
+                            select(SysDeptClosure.descendant_id).where(SysDeptClosure.ancestor_id == dept_info.dept_id)
                         ),
                         SysDept.del_flag == '0',
                         SysDept.status == '0',
@@ -114,7 +117,15 @@ class DeptDao:
         :return: 子部门信息列表
         """
         dept_result = (
-            (await db.execute(select(SysDept).where(func.find_in_set(dept_id, SysDept.ancestors)))).scalars().all()
+            (
+                await db.execute(
+                    select(SysDept)
+                    .join(SysDeptClosure, SysDeptClosure.descendant_id == SysDept.dept_id)
+                    .where(SysDeptClosure.ancestor_id == dept_id, SysDeptClosure.depth > 0)
+                )
+            )
+            .scalars()
+            .all()
         )
 
         return dept_result
@@ -184,6 +195,32 @@ class DeptDao:
 
         return dept_result
 
+    @classmethod
+    async def get_dept_ids_in_data_scope(
+        cls, db: AsyncSession, dept_ids: Sequence[int], data_scope_sql: ColumnElement
+    ) -> set[int]:
+        """
+        批量筛选存在且当前用户有数据权限的部门ID
+
+        :param db: orm对象
+        :param dept_ids: 部门ID列表
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :return: 有数据权限的部门ID集合
+        """
+        if not dept_ids:
+            return set()
+        return set(
+            (
+                await db.execute(
+                    select(SysDept.dept_id).where(
+                        SysDept.del_flag == '0', SysDept.dept_id.in_(dept_ids), data_scope_sql
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
     @classmethod
     async def add_dept_dao(cls, db: AsyncSession, dept: DeptModel) -> SysDept:
         """
@@ -288,7 +325,13 @@ class DeptDao:
             await db.execute(
                 select(func.count('*'))
                 .select_from(SysDept)
-                .where(SysDept.status == '0', SysDept.del_flag == '0', func.find_in_set(dept_id, SysDept.ancestors))
+                .join(SysDeptClosure, SysDeptClosure.descendant_id == SysDept.dept_id)
+                .where(
+                    SysDeptClosure.ancestor_id == dept_id,
+                    SysDeptClosure.depth > 0,
+                    SysDept.status == '0',
+                    SysDept.del_flag == '0',
+                )
             )
         ).scalar()
 
@@ -330,3 +373,182 @@ class DeptDao:
         ).scalar()
 
         return dept_user_count
+
+    @classmethod
+    def get_dept_subtree_ids_sql(cls, dept_id: int) -> Select:
+        """
+        构建查询部门及其所有子部门id的子查询
+
+        :param dept_id: 部门id
+        :return: 部门及其所有子部门id的子查询
+        """
+        return select(SysDeptClosure.descendant_id).where(SysDeptClosure.ancestor_id == dept_id)
+
+    @classmethod
+    async def get_dept_subtree_ids_dao(cls, db: AsyncSession, dept_id: int) -> list[int]:
+        """
+        获取部门及其所有子部门id列表
+
+        :param db: orm对象
+        :param dept_id: 部门id
+        :return: 部门及其所有子部门id列表
+        """
+        dept_ids = (await db.execute(cls.get_dept_subtree_ids_sql(dept_id))).scalars().all()
+
+        return list(dept_ids)
+
+    @classmethod
+    async def check_dept_is_descendant_dao(cls, db: AsyncSession, dept_id: int, ancestor_id: int) -> bool:
+        """
+        校验部门是否为指定部门自身或其子部门
+
+        :param db: orm对象
+        :param dept_id: 需要校验的部门id
+        :param ancestor_id: 祖先部门id
+        :return: 校验结果
+        """
+        closure = (
+            await db.execute(
+                select(SysDeptClosure.depth).where(
+                    SysDeptClosure.ancestor_id == ancestor_id, SysDeptClosure.descendant_id == dept_id
+                )
+            )
+        ).first()
+
+        return closure is not None
+
+    @classmethod
+    async def add_dept_closure_dao(cls, db: AsyncSession, dept_id: int, parent_id: int) -> None:
+        """
+        新增部门对应的层级闭包关系
+
+        :param db: orm对象
+        :param dept_id: 新增的部门id
+        :param parent_id: 父部门id
+        :return:
+        """
+        closure_table = SysDeptClosure.__table__
+        await db.execute(insert(closure_table).values(ancestor_id=dept_id, descendant_id=dept_id, depth=0))
+        await db.execute(
+            insert(closure_table).from_select(
+                ['ancestor_id', 'descendant_id', 'depth'],
+                select(SysDeptClosure.ancestor_id, literal(dept_id), SysDeptClosure.depth + 1).where(
+                    SysDeptClosure.descendant_id == parent_id
+                ),
+            )
+        )
+
+    @classmethod
+    async def move_dept_closure_dao(
+        cls, db: AsyncSession, dept_id: int, new_parent_id: int, chunk_size: int = 1000
+    ) -> None:
+        """
+        将部门子树移动到新的父部门下，并维护层级闭包关系
+
+        :param db: orm对象
+        :param dept_id: 需要移动的部门id
+        :param new_parent_id: 新的父部门id
+        :param chunk_size: 单次删除最多包含的子部门数量
+        :return:
+        """
+        closure_table = SysDeptClosure.__table__
+        old_ancestor_ids = (
+            (
+                await db.execute(
+                    select(SysDeptClosure.ancestor_id).where(
+                        SysDeptClosure.descendant_id == dept_id, SysDeptClosure.depth > 0
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if old_ancestor_ids:
+            # MySQL不允许DELETE的子查询引用目标表，先取出子树部门id再分批删除
+            subtree_ids = (await db.execute(cls.get_dept_subtree_ids_sql(dept_id))).scalars().all()
+            for index in range(0, len(subtree_ids), chunk_size):
+                await db.execute(
+                    delete(closure_table).where(
+                        closure_table.c.ancestor_id.in_(old_ancestor_ids),
+                        closure_table.c.descendant_id.in_(subtree_ids[index : index + chunk_size]),
+                    )
+                )
+        parent_closure = aliased(SysDeptClosure)
+        subtree_closure = aliased(SysDeptClosure)
+        await db.execute(
+            insert(closure_table).from_select(
+                ['ancestor_id', 'descendant_id', 'depth'],
+                select(
+                    parent_closure.ancestor_id,
+                    subtree_closure.descendant_id,
+                    parent_closure.depth + subtree_closure.depth + 1,
+                )
+                .select_from(parent_closure)
+                .join(subtree_closure, true())
+                .where(parent_closure.descendant_id == new_parent_id, subtree_closure.ancestor_id == dept_id),
+            )
+        )
+
+    @classmethod
+    async def delete_dept_closure_dao(cls, db: AsyncSession, dept_id: int) -> None:
+        """
+        删除部门对应的层级闭包关系
+
+        :param db: orm对象
+        :param dept_id: 部门id
+        :return:
+        """
+        await db.execute(delete(SysDeptClosure.__table__).where(SysDeptClosure.descendant_id == dept_id))
+
+    @classmethod
+    async def get_dept_ancestors_list_dao(cls, db: AsyncSession) -> Sequence[Any]:
+        """
+        获取所有未删除部门的id与祖级列表
+
+        :param db: orm对象
+        :return: 部门id与祖级列表
+        """
+        dept_ancestors_list = (
+            await db.execute(select(SysDept.dept_id, SysDept.ancestors).where(SysDept.del_flag == '0'))
+        ).all()
+
+        return dept_ancestors_list
+
+    @classmethod
+    async def check_dept_closure_missing_dao(cls, db: AsyncSession) -> bool:
+        """
+        校验部门层级闭包表是否缺失数据，即存在未删除部门但闭包表为空
+
+        :param db: orm对象
+        :return: 校验结果
+        """
+        has_closure = (await db.execute(select(SysDeptClosure.ancestor_id).limit(1))).first() is not None
+        if has_closure:
+            return False
+        has_dept = (await db.execute(select(SysDept.dept_id).where(SysDept.del_flag == '0').limit(1))).first()
+
+        return has_dept is not None
+
+    @classmethod
+    async def clear_dept_closure_dao(cls, db: AsyncSession) -> None:
+        """
+        清空部门层级闭包关系
+
+        :param db: orm对象
+        :return:
+        """
+        await db.execute(delete(SysDeptClosure.__table__))
+
+    @classmethod
+    async def add_dept_closure_batch_dao(
+        cls, db: AsyncSession, closure_list: list[dict[str, int]], chunk_size: int = 1000
+    ) -> int:
+        """
+        批量新增部门层级闭包关系
+
+        :param db: orm对象
+        :param closure_list: 层级闭包关系列表
+        :param chunk_size: 单次批量写入最多包含的行数
+        :return: 批量写入执行次数
+        """
+        return await SqlalchemyUtil.bulk_insert(db, SysDeptClosure, closure_list, chunk_size)
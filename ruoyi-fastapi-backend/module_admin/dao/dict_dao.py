@@ -2,7 +2,7 @@ from collections.abc import Sequence
 from datetime import datetime, time
 from typing import Any
 
-from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy import Row, and_, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.vo import PageModel
@@ -244,6 +244,30 @@ class DictDataDao:
 
         return dict_data_list
 
+    @classmethod
+    async def query_all_dict_data_list(cls, db: AsyncSession) -> Sequence[Row[tuple[str, SysDictData | None]]]:
+        """
+        一次查询获取所有启用字典类型及其启用的字典数据
+
+        :param db: orm对象
+        :return: 字典类型与字典数据组成的行列表，字典类型下无字典数据时字典数据为None
+        """
+        dict_data_rows = (
+            await db.execute(
+                select(SysDictType.dict_type, SysDictData)
+                .select_from(SysDictType)
+                .where(SysDictType.status == '0')
+                .join(
+                    SysDictData,
+                    and_(SysDictType.dict_type == SysDictData.dict_type, SysDictData.status == '0'),
+                    isouter=True,
+                )
+                .order_by(SysDictData.dict_sort)
+            )
+        ).all()
+
+        return dict_data_rows
+
     @classmethod
     async def add_dict_data_dao(cls, db: AsyncSession, dict_data: DictDataModel) -> SysDictData:
         """
@@ -0,0 +1,182 @@
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.vo import PageModel
+from module_admin.entity.do.export_job_do import SysExportJob
+from module_admin.entity.do.user_do import SysUser
+from module_admin.entity.vo.export_job_vo import ExportJobPageQueryModel
+from utils.page_util import PageUtil
+
+
+class ExportJobDao:
+    """
+    异步导出任务数据操作层
+    """
+
+    ACTIVE_STATUSES = ('pending', 'running')
+
+    @classmethod
+    async def add_export_job(cls, db: AsyncSession, export_job: SysExportJob) -> SysExportJob:
+        """
+        新增异步导出任务
+
+        :param db: orm对象
+        :param export_job: 导出任务数据库对象
+        :return: 导出任务数据库对象
+        """
+        db.add(export_job)
+        await db.flush()
+        return export_job
+
+    @classmethod
+    async def get_export_job_by_id(
+        cls, db: AsyncSession, job_id: str, user_id: int | None = None
+    ) -> SysExportJob | None:
+        """
+        根据任务ID获取异步导出任务
+
+        :param db: orm对象
+        :param job_id: 任务ID
+        :param user_id: 发起用户ID，为空时不限制发起人
+        :return: 导出任务数据库对象
+        """
+        return (
+            await db.execute(
+                select(SysExportJob).where(
+                    SysExportJob.job_id == job_id,
+                    SysExportJob.user_id == user_id if user_id is not None else True,
+                )
+            )
+        ).scalar_one_or_none()
+
+    @classmethod
+    async def lock_export_job_user(cls, db: AsyncSession, user_id: int) -> None:
+        """
+        锁定任务发起用户，串行化同一用户的并发提交，锁在事务提交或回滚时释放
+
+        :param db: orm对象
+        :param user_id: 发起用户ID
+        :return: None
+        """
+        await db.execute(select(SysUser.user_id).where(SysUser.user_id == user_id).with_for_update())
+
+    @classmethod
+    async def count_active_export_jobs(cls, db: AsyncSession, user_id: int) -> int:
+        """
+        统计用户排队中或执行中的异步导出任务数量，使用加锁读取以读到其他事务已提交的最新任务
+
+        :param db: orm对象
+        :param user_id: 发起用户ID
+        :return: 任务数量
+        """
+        active_job_ids = (
+            await db.execute(
+                select(SysExportJob.job_id)
+                .where(
+                    SysExportJob.user_id == user_id,
+                    SysExportJob.status.in_(cls.ACTIVE_STATUSES),
+                )
+                .with_for_update()
+            )
+        ).scalars()
+
+        return len(active_job_ids.all())
+
+    @classmethod
+    async def get_export_job_list(
+        cls,
+        db: AsyncSession,
+        query_object: ExportJobPageQueryModel,
+        user_id: int,
+        is_page: bool = True,
+    ) -> PageModel | list[dict[str, Any]]:
+        """
+        获取用户的异步导出任务列表
+
+        :param db: orm对象
+        :param query_object: 查询参数
+        :param user_id: 发起用户ID
+        :param is_page: 是否分页
+        :return: 导出任务列表
+        """
+        query = (
+            select(SysExportJob)
+            .where(
+                SysExportJob.user_id == user_id,
+                SysExportJob.status == query_object.status if query_object.status else True,
+                SysExportJob.export_type == query_object.export_type if query_object.export_type else True,
+            )
+            .order_by(SysExportJob.create_time.desc(), SysExportJob.job_id.desc())
+        )
+        return await PageUtil.paginate(db, query, query_object.page_num, query_object.page_size, is_page)
+
+    @classmethod
+    async def transition_export_job(
+        cls,
+        db: AsyncSession,
+        job_id: str,
+        from_statuses: Iterable[str],
+        **values: Any,
+    ) -> bool:
+        """
+        在任务处于指定状态时更新任务，用于状态流转与进度上报，任务已被取消或标记失败时不做修改
+
+        :param db: orm对象
+        :param job_id: 任务ID
+        :param from_statuses: 允许更新的当前状态
+        :param values: 更新字段
+        :return: 是否更新成功
+        """
+        result = await db.execute(
+            update(SysExportJob)
+            .where(SysExportJob.job_id == job_id, SysExportJob.status.in_(list(from_statuses)))
+            .values(**values)
+        )
+        return result.rowcount > 0
+
+    @classmethod
+    async def get_expired_export_jobs_for_update(
+        cls, db: AsyncSession, current_time: datetime, batch_size: int
+    ) -> list[SysExportJob]:
+        """
+        锁定导出文件已过期的已完成任务
+
+        :param db: orm对象
+        :param current_time: 当前时间
+        :param batch_size: 单批处理数量
+        :return: 导出任务数据库对象列表
+        """
+        return list(
+            (
+                await db.execute(
+                    select(SysExportJob)
+                    .where(SysExportJob.status == 'completed', SysExportJob.expire_time <= current_time)
+                    .order_by(SysExportJob.expire_time, SysExportJob.job_id)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+    @classmethod
+    async def fail_stale_export_jobs(cls, db: AsyncSession, stale_time: datetime, current_time: datetime) -> int:
+        """
+        将长时间未更新的排队中或执行中任务标记为失败，执行中任务通过进度上报、排队中任务通过等待期间的定期刷新更新时间
+
+        :param db: orm对象
+        :param stale_time: 最后更新时间早于该时间的任务视为中断
+        :param current_time: 当前时间
+        :return: 标记数量
+        """
+        result = await db.execute(
+            update(SysExportJob)
+            .where(SysExportJob.status.in_(cls.ACTIVE_STATUSES), SysExportJob.update_time < stale_time)
+            .values(status='failed', finished_time=current_time, error_message='导出任务长时间未更新进度，已中断')
+        )
+        return result.rowcount
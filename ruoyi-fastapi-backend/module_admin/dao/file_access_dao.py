@@ -13,6 +13,7 @@ from module_admin.entity.vo.file_vo import (
     FileAccessLogModel,
     FileAccessLogPageQueryModel,
 )
+from utils.common_util import SqlalchemyUtil
 from utils.page_util import PageUtil
 
 
@@ -316,6 +317,8 @@ class FileAccessLogDao:
     文件访问审计数据操作层
     """
 
+    FILE_ACCESS_LOG_ORDER_BY = (SysFileAccessLog.access_time.desc(), SysFileAccessLog.audit_id.desc())
+
     @classmethod
     async def add_file_access_log_dao(cls, db: AsyncSession, file_access_log: FileAccessLogModel) -> SysFileAccessLog:
         """
@@ -330,6 +333,28 @@ class FileAccessLogDao:
         await db.flush()
         return db_file_access_log
 
+    @classmethod
+    async def add_file_access_log_batch_dao(
+        cls, db: AsyncSession, file_access_log_list: list[FileAccessLogModel], chunk_size: int = 1000
+    ) -> int:
+        """
+        批量新增文件访问审计记录
+
+        :param db: orm对象
+        :param file_access_log_list: 文件访问审计对象列表
+        :param chunk_size: 单次批量写入最多包含的行数
+        :return: 批量写入执行次数
+        """
+        return await SqlalchemyUtil.bulk_insert(
+            db,
+            SysFileAccessLog,
+            [
+                file_access_log.model_dump(exclude={'audit_id'}, exclude_none=True)
+                for file_access_log in file_access_log_list
+            ],
+            chunk_size,
+        )
+
     @classmethod
     async def get_file_access_log_list(
         cls,
@@ -361,6 +386,14 @@ class FileAccessLogDao:
                 if query_object.begin_time and query_object.end_time
                 else True,
             )
-            .order_by(SysFileAccessLog.access_time.desc(), SysFileAccessLog.audit_id.desc())
+            .order_by(*cls.FILE_ACCESS_LOG_ORDER_BY)
+        )
+        return await PageUtil.paginate(
+            db,
+            query,
+            query_object.page_num,
+            query_object.page_size,
+            is_page,
+            keyset=cls.FILE_ACCESS_LOG_ORDER_BY if query_object.page_mode == 'cursor' else None,
+            cursor=query_object.cursor,
         )
-        return await PageUtil.paginate(db, query, query_object.page_num, query_object.page_size, is_page)
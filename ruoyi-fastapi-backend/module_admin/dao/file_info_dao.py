@@ -32,6 +32,7 @@ class FileInfoDao:
 
     FILE_EXPIRING_DAYS = 7
     ACL_EXPIRING_DAYS = 7
+    FILE_INFO_ORDER_BY = (SysFileInfo.create_time.desc(), SysFileInfo.file_id.desc())
 
     @classmethod
     async def add_file_info_dao(cls, db: AsyncSession, file_info: FileInfoModel) -> SysFileInfo:
@@ -774,9 +775,17 @@ class FileInfoDao:
                 file_data_scope_sql,
                 *cls._get_file_info_query_conditions(query_object, current_time),
             )
-            .order_by(SysFileInfo.create_time.desc(), SysFileInfo.file_id.desc())
+            .order_by(*cls.FILE_INFO_ORDER_BY)
+        )
+        return await PageUtil.paginate(
+            db,
+            query,
+            query_object.page_num,
+            query_object.page_size,
+            is_page,
+            keyset=cls.FILE_INFO_ORDER_BY if query_object.page_mode == 'cursor' else None,
+            cursor=query_object.cursor,
         )
-        return await PageUtil.paginate(db, query, query_object.page_num, query_object.page_size, is_page)
 
     @classmethod
     async def get_file_management_detail_by_id(
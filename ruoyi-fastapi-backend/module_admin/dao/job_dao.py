@@ -57,6 +57,23 @@ class JobDao:
 
         return job_info
 
+    @classmethod
+    async def get_job_detail_by_invoke_target(cls, db: AsyncSession, invoke_target: str) -> SysJob | None:
+        """
+        根据调用目标字符串获取定时任务信息
+
+        :param db: orm对象
+        :param invoke_target: 调用目标字符串
+        :return: 定时任务信息对象
+        """
+        job_info = (
+            (await db.execute(select(SysJob).where(SysJob.invoke_target == invoke_target).order_by(SysJob.job_id)))
+            .scalars()
+            .first()
+        )
+
+        return job_info
+
     @classmethod
     async def get_job_list(
         cls, db: AsyncSession, query_object: JobPageQueryModel, is_page: bool = False
@@ -1,13 +1,15 @@
+from collections.abc import AsyncIterator
 from datetime import datetime, time
 from typing import Any
 
-from sqlalchemy import delete, desc, select
+from sqlalchemy import Select, delete, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from common.vo import PageModel
 from module_admin.entity.do.job_do import SysJobLog
 from module_admin.entity.vo.job_vo import JobLogModel, JobLogPageQueryModel
+from utils.common_util import SqlalchemyUtil
 from utils.page_util import PageUtil
 
 
@@ -16,17 +18,15 @@ class JobLogDao:
     定时任务日志管理模块数据库操作层
     """
 
+    JOB_LOG_ORDER_BY = (desc(SysJobLog.create_time), desc(SysJobLog.job_log_id))
+
     @classmethod
-    async def get_job_log_list(
-        cls, db: AsyncSession, query_object: JobLogPageQueryModel, is_page: bool = False
-    ) -> PageModel | list[dict[str, Any]]:
+    def _get_job_log_list_query(cls, query_object: JobLogPageQueryModel) -> Select:
         """
-        根据查询参数获取定时任务日志列表信息
+        根据查询参数构建定时任务日志列表查询语句
 
-        :param db: orm对象
         :param query_object: 查询参数对象
-        :param is_page: 是否开启分页
-        :return: 定时任务日志列表信息对象
+        :return: 定时任务日志列表查询语句
         """
         query = (
             select(SysJobLog)
@@ -41,15 +41,47 @@ class JobLogDao:
                 if query_object.begin_time and query_object.end_time
                 else True,
             )
-            .order_by(desc(SysJobLog.create_time))
-            .distinct()
+            .order_by(*cls.JOB_LOG_ORDER_BY)
         )
+
+        return query
+
+    @classmethod
+    async def get_job_log_list(
+        cls, db: AsyncSession, query_object: JobLogPageQueryModel, is_page: bool = False
+    ) -> PageModel | list[dict[str, Any]]:
+        """
+        根据查询参数获取定时任务日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param is_page: 是否开启分页
+        :return: 定时任务日志列表信息对象
+        """
+        query = cls._get_job_log_list_query(query_object)
         job_log_list: PageModel | list[dict[str, Any]] = await PageUtil.paginate(
-            db, query, query_object.page_num, query_object.page_size, is_page
+            db,
+            query,
+            query_object.page_num,
+            query_object.page_size,
+            is_page,
+            keyset=cls.JOB_LOG_ORDER_BY if query_object.page_mode == 'cursor' else None,
+            cursor=query_object.cursor,
         )
 
         return job_log_list
 
+    @classmethod
+    def stream_job_log_list(cls, db: AsyncSession, query_object: JobLogPageQueryModel) -> AsyncIterator[dict[str, Any]]:
+        """
+        根据查询参数通过服务端游标流式获取定时任务日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :return: 定时任务日志列表信息迭代器
+        """
+        return PageUtil.stream(db, cls._get_job_log_list_query(query_object))
+
     @classmethod
     def add_job_log_dao(cls, db: Session, job_log: JobLogModel) -> SysJobLog:
         """
@@ -65,6 +97,25 @@ class JobLogDao:
 
         return db_job_log
 
+    @classmethod
+    async def add_job_log_batch_dao(
+        cls, db: AsyncSession, job_log_list: list[JobLogModel], chunk_size: int = 1000
+    ) -> int:
+        """
+        批量新增定时任务日志数据库操作
+
+        :param db: orm对象
+        :param job_log_list: 定时任务日志对象列表
+        :param chunk_size: 单次批量写入最多包含的行数
+        :return: 批量写入执行次数
+        """
+        return await SqlalchemyUtil.bulk_insert(
+            db,
+            SysJobLog,
+            [job_log.model_dump(exclude={'job_log_id'}, exclude_none=True) for job_log in job_log_list],
+            chunk_size,
+        )
+
     @classmethod
     async def delete_job_log_dao(cls, db: AsyncSession, job_log: JobLogModel) -> None:
         """
@@ -1,13 +1,15 @@
+from collections.abc import AsyncIterator
 from datetime import datetime, time
 from typing import Any
 
-from sqlalchemy import asc, delete, desc, select
+from sqlalchemy import Select, asc, delete, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import UnaryExpression
 
 from common.vo import PageModel
 from module_admin.entity.do.log_do import SysLogininfor, SysOperLog
 from module_admin.entity.vo.log_vo import LogininforModel, LoginLogPageQueryModel, OperLogModel, OperLogPageQueryModel
-from utils.common_util import SnakeCaseUtil
+from utils.common_util import SnakeCaseUtil, SqlalchemyUtil
 from utils.page_util import PageUtil
 from utils.time_format_util import TimeFormatUtil
 
@@ -18,25 +20,34 @@ class OperationLogDao:
     """
 
     @classmethod
-    async def get_operation_log_list(
-        cls, db: AsyncSession, query_object: OperLogPageQueryModel, is_page: bool = False
-    ) -> PageModel | list[dict[str, Any]]:
+    def _get_operation_log_order_by(
+        cls, query_object: OperLogPageQueryModel
+    ) -> tuple[UnaryExpression, UnaryExpression]:
         """
-        根据查询参数获取操作日志列表信息
+        根据查询参数获取操作日志列表排序键，排序字段相同时按日志主键排序
 
-        :param db: orm对象
         :param query_object: 查询参数对象
-        :param is_page: 是否开启分页
-        :return: 操作日志列表信息对象
+        :return: 操作日志列表排序键
+        """
+        order_by_column = (
+            getattr(SysOperLog, SnakeCaseUtil.camel_to_snake(query_object.order_by_column), None)
+            if query_object.order_by_column
+            else None
+        )
+        if order_by_column is not None and query_object.is_asc == 'ascending':
+            return asc(order_by_column), asc(SysOperLog.oper_id)
+        if order_by_column is not None and query_object.is_asc == 'descending':
+            return desc(order_by_column), desc(SysOperLog.oper_id)
+        return desc(SysOperLog.oper_time), desc(SysOperLog.oper_id)
+
+    @classmethod
+    def _get_operation_log_list_query(cls, query_object: OperLogPageQueryModel) -> Select:
+        """
+        根据查询参数构建操作日志列表查询语句
+
+        :param query_object: 查询参数对象
+        :return: 操作日志列表查询语句
         """
-        if query_object.is_asc == 'ascending':
-            order_by_column = asc(getattr(SysOperLog, SnakeCaseUtil.camel_to_snake(query_object.order_by_column), None))
-        elif query_object.is_asc == 'descending':
-            order_by_column = desc(
-                getattr(SysOperLog, SnakeCaseUtil.camel_to_snake(query_object.order_by_column), None)
-            )
-        else:
-            order_by_column = desc(SysOperLog.oper_time)
         query = (
             select(SysOperLog)
             .where(
@@ -51,15 +62,49 @@ class OperationLogDao:
                 if query_object.begin_time and query_object.end_time
                 else True,
             )
-            .distinct()
-            .order_by(order_by_column)
+            .order_by(*cls._get_operation_log_order_by(query_object))
         )
+
+        return query
+
+    @classmethod
+    async def get_operation_log_list(
+        cls, db: AsyncSession, query_object: OperLogPageQueryModel, is_page: bool = False
+    ) -> PageModel | list[dict[str, Any]]:
+        """
+        根据查询参数获取操作日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param is_page: 是否开启分页
+        :return: 操作日志列表信息对象
+        """
+        query = cls._get_operation_log_list_query(query_object)
         operation_log_list: PageModel | list[dict[str, Any]] = await PageUtil.paginate(
-            db, query, query_object.page_num, query_object.page_size, is_page
+            db,
+            query,
+            query_object.page_num,
+            query_object.page_size,
+            is_page,
+            keyset=cls._get_operation_log_order_by(query_object) if query_object.page_mode == 'cursor' else None,
+            cursor=query_object.cursor,
         )
 
         return operation_log_list
 
+    @classmethod
+    def stream_operation_log_list(
+        cls, db: AsyncSession, query_object: OperLogPageQueryModel
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        根据查询参数通过服务端游标流式获取操作日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :return: 操作日志列表信息迭代器
+        """
+        return PageUtil.stream(db, cls._get_operation_log_list_query(query_object))
+
     @classmethod
     async def add_operation_log_dao(cls, db: AsyncSession, operation_log: OperLogModel) -> SysOperLog:
         """
@@ -75,6 +120,25 @@ class OperationLogDao:
 
         return db_operation_log
 
+    @classmethod
+    async def add_operation_log_batch_dao(
+        cls, db: AsyncSession, operation_log_list: list[OperLogModel], chunk_size: int = 1000
+    ) -> int:
+        """
+        批量新增操作日志数据库操作
+
+        :param db: orm对象
+        :param operation_log_list: 操作日志对象列表
+        :param chunk_size: 单次批量写入最多包含的行数
+        :return: 批量写入执行次数
+        """
+        return await SqlalchemyUtil.bulk_insert(
+            db,
+            SysOperLog,
+            [operation_log.model_dump(exclude={'oper_id'}, exclude_none=True) for operation_log in operation_log_list],
+            chunk_size,
+        )
+
     @classmethod
     async def delete_operation_log_dao(cls, db: AsyncSession, operation_log: OperLogModel) -> None:
         """
@@ -103,27 +167,32 @@ class LoginLogDao:
     """
 
     @classmethod
-    async def get_login_log_list(
-        cls, db: AsyncSession, query_object: LoginLogPageQueryModel, is_page: bool = False
-    ) -> PageModel | list[dict[str, Any]]:
+    def _get_login_log_order_by(cls, query_object: LoginLogPageQueryModel) -> tuple[UnaryExpression, UnaryExpression]:
         """
-        根据查询参数获取登录日志列表信息
+        根据查询参数获取登录日志列表排序键，排序字段相同时按日志主键排序
 
-        :param db: orm对象
         :param query_object: 查询参数对象
-        :param is_page: 是否开启分页
-        :return: 登录日志列表信息对象
+        :return: 登录日志列表排序键
+        """
+        order_by_column = (
+            getattr(SysLogininfor, SnakeCaseUtil.camel_to_snake(query_object.order_by_column), None)
+            if query_object.order_by_column
+            else None
+        )
+        if order_by_column is not None and query_object.is_asc == 'ascending':
+            return asc(order_by_column), asc(SysLogininfor.info_id)
+        if order_by_column is not None and query_object.is_asc == 'descending':
+            return desc(order_by_column), desc(SysLogininfor.info_id)
+        return desc(SysLogininfor.login_time), desc(SysLogininfor.info_id)
+
+    @classmethod
+    def _get_login_log_list_query(cls, query_object: LoginLogPageQueryModel) -> Select:
+        """
+        根据查询参数构建登录日志列表查询语句
+
+        :param query_object: 查询参数对象
+        :return: 登录日志列表查询语句
         """
-        if query_object.is_asc == 'ascending':
-            order_by_column = asc(
-                getattr(SysLogininfor, SnakeCaseUtil.camel_to_snake(query_object.order_by_column), None)
-            )
-        elif query_object.is_asc == 'descending':
-            order_by_column = desc(
-                getattr(SysLogininfor, SnakeCaseUtil.camel_to_snake(query_object.order_by_column), None)
-            )
-        else:
-            order_by_column = desc(SysLogininfor.login_time)
         query = (
             select(SysLogininfor)
             .where(
@@ -137,15 +206,49 @@ class LoginLogDao:
                 if query_object.begin_time and query_object.end_time
                 else True,
             )
-            .distinct()
-            .order_by(order_by_column)
+            .order_by(*cls._get_login_log_order_by(query_object))
         )
+
+        return query
+
+    @classmethod
+    async def get_login_log_list(
+        cls, db: AsyncSession, query_object: LoginLogPageQueryModel, is_page: bool = False
+    ) -> PageModel | list[dict[str, Any]]:
+        """
+        根据查询参数获取登录日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param is_page: 是否开启分页
+        :return: 登录日志列表信息对象
+        """
+        query = cls._get_login_log_list_query(query_object)
         login_log_list: PageModel | list[dict[str, Any]] = await PageUtil.paginate(
-            db, query, query_object.page_num, query_object.page_size, is_page
+            db,
+            query,
+            query_object.page_num,
+            query_object.page_size,
+            is_page,
+            keyset=cls._get_login_log_order_by(query_object) if query_object.page_mode == 'cursor' else None,
+            cursor=query_object.cursor,
         )
 
         return login_log_list
 
+    @classmethod
+    def stream_login_log_list(
+        cls, db: AsyncSession, query_object: LoginLogPageQueryModel
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        根据查询参数通过服务端游标流式获取登录日志列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :return: 登录日志列表信息迭代器
+        """
+        return PageUtil.stream(db, cls._get_login_log_list_query(query_object))
+
     @classmethod
     async def add_login_log_dao(cls, db: AsyncSession, login_log: LogininforModel) -> SysLogininfor:
         """
@@ -161,6 +264,25 @@ class LoginLogDao:
 
         return db_login_log
 
+    @classmethod
+    async def add_login_log_batch_dao(
+        cls, db: AsyncSession, login_log_list: list[LogininforModel], chunk_size: int = 1000
+    ) -> int:
+        """
+        批量新增登录日志数据库操作
+
+        :param db: orm对象
+        :param login_log_list: 登录日志对象列表
+        :param chunk_size: 单次批量写入最多包含的行数
+        :return: 批量写入执行次数
+        """
+        return await SqlalchemyUtil.bulk_insert(
+            db,
+            SysLogininfor,
+            [login_log.model_dump(exclude={'info_id'}, exclude_none=True) for login_log in login_log_list],
+            chunk_size,
+        )
+
     @classmethod
     async def delete_login_log_dao(cls, db: AsyncSession, login_log: LogininforModel) -> None:
         """
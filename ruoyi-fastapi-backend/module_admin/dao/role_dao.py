@@ -307,6 +307,23 @@ class RoleDao:
 
         return role_dept_query_all
 
+    @classmethod
+    async def get_role_dept_ids_dao(cls, db: AsyncSession, role_ids: list[int]) -> list[int]:
+        """
+        根据角色id列表获取自定数据权限关联的部门id列表
+
+        :param db: orm对象
+        :param role_ids: 角色id列表
+        :return: 去重后的部门id列表
+        """
+        dept_ids = (
+            (await db.execute(select(SysRoleDept.dept_id).where(SysRoleDept.role_id.in_(role_ids)).distinct()))
+            .scalars()
+            .all()
+        )
+
+        return list(dept_ids)
+
     @classmethod
     async def add_role_dept_dao(cls, db: AsyncSession, role_dept: RoleDeptModel) -> None:
         """
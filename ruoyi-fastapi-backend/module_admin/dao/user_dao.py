@@ -1,12 +1,26 @@
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime, time
 from typing import Any
 
-from sqlalchemy import ColumnElement, and_, delete, desc, func, or_, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    String,
+    and_,
+    cast,
+    delete,
+    desc,
+    literal,
+    or_,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from common.constant import MenuConstant
 from common.vo import PageModel
-from module_admin.entity.do.dept_do import SysDept
+from module_admin.entity.do.dept_do import SysDept, SysDeptClosure
 from module_admin.entity.do.menu_do import SysMenu
 from module_admin.entity.do.post_do import SysPost
 from module_admin.entity.do.role_do import SysRole, SysRoleMenu
@@ -19,6 +33,7 @@ from module_admin.entity.vo.user_vo import (
     UserRolePageQueryModel,
     UserRoleQueryModel,
 )
+from utils.common_util import SqlalchemyUtil
 from utils.page_util import PageUtil
 
 
@@ -81,111 +96,161 @@ class UserDao:
         return query_user_info
 
     @classmethod
-    async def get_user_by_id(cls, db: AsyncSession, user_id: int) -> dict[str, Any]:
+    async def get_user_ids_by_user_names(cls, db: AsyncSession, user_names: Sequence[str]) -> dict[str, int]:
         """
-        根据user_id获取用户信息
+        根据用户账号批量获取用户ID，同一账号存在多个用户时取最新创建的用户
 
         :param db: orm对象
-        :param user_id: 用户id
-        :return: 当前user_id的用户信息对象
+        :param user_names: 用户账号列表
+        :return: 用户账号与用户ID的映射
         """
-        query_user_basic_info = (
+        if not user_names:
+            return {}
+        user_rows = (
             (
                 await db.execute(
-                    select(SysUser)
-                    .where(SysUser.status == '0', SysUser.del_flag == '0', SysUser.user_id == user_id)
-                    .distinct()
+                    select(SysUser.user_name, SysUser.user_id)
+                    .where(SysUser.del_flag == '0', SysUser.user_name.in_(user_names))
+                    .order_by(SysUser.create_time, SysUser.user_id)
                 )
             )
-            .scalars()
-            .first()
+            .tuples()
+            .all()
         )
-        query_user_dept_info = (
+
+        return dict(user_rows)
+
+    @classmethod
+    async def get_user_ids_in_data_scope(
+        cls, db: AsyncSession, user_ids: Sequence[int], data_scope_sql: ColumnElement
+    ) -> set[int]:
+        """
+        批量筛选当前用户有数据权限的用户ID
+
+        :param db: orm对象
+        :param user_ids: 用户ID列表
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :return: 有数据权限的用户ID集合
+        """
+        if not user_ids:
+            return set()
+        return set(
             (
                 await db.execute(
-                    select(SysDept)
-                    .select_from(SysUser)
-                    .where(SysUser.status == '0', SysUser.del_flag == '0', SysUser.user_id == user_id)
-                    .join(
-                        SysDept,
-                        and_(SysUser.dept_id == SysDept.dept_id, SysDept.status == '0', SysDept.del_flag == '0'),
+                    select(SysUser.user_id).where(
+                        SysUser.del_flag == '0', SysUser.user_id.in_(user_ids), data_scope_sql
                     )
-                    .distinct()
                 )
             )
             .scalars()
-            .first()
+            .all()
         )
-        query_user_role_info = (
-            (
-                await db.execute(
-                    select(SysRole)
-                    .select_from(SysUser)
-                    .where(SysUser.status == '0', SysUser.del_flag == '0', SysUser.user_id == user_id)
-                    .join(SysUserRole, SysUser.user_id == SysUserRole.user_id, isouter=True)
-                    .join(
-                        SysRole,
-                        and_(SysUserRole.role_id == SysRole.role_id, SysRole.status == '0', SysRole.del_flag == '0'),
-                    )
-                    .distinct()
+
+    @classmethod
+    async def get_user_auth_info_by_id(cls, db: AsyncSession, user_id: int) -> dict[str, Any]:
+        """
+        根据user_id获取用户鉴权信息，共两次查询：用户、部门与角色联表查询一次，岗位与权限标识合并查询一次
+
+        :param db: orm对象
+        :param user_id: 用户id
+        :return: 当前user_id的用户基本信息、部门信息、角色信息、岗位id列表与权限标识列表
+        """
+        user_role_rows = (
+            await db.execute(
+                select(SysUser, SysDept, SysRole)
+                .where(SysUser.status == '0', SysUser.del_flag == '0', SysUser.user_id == user_id)
+                .join(
+                    SysDept,
+                    and_(SysUser.dept_id == SysDept.dept_id, SysDept.status == '0', SysDept.del_flag == '0'),
+                    isouter=True,
+                )
+                .join(SysUserRole, SysUser.user_id == SysUserRole.user_id, isouter=True)
+                .join(
+                    SysRole,
+                    and_(SysUserRole.role_id == SysRole.role_id, SysRole.status == '0', SysRole.del_flag == '0'),
+                    isouter=True,
                 )
+                .order_by(SysRole.role_sort)
             )
-            .scalars()
-            .all()
+        ).all()
+        if not user_role_rows:
+            return {
+                'user_basic_info': None,
+                'user_dept_info': None,
+                'user_role_info': [],
+                'user_post_ids': [],
+                'user_perms': [],
+            }
+        user_role_info = list({row[2].role_id: row[2] for row in user_role_rows if row[2] is not None}.values())
+        is_admin = any(role.role_id == 1 for role in user_role_info)
+        post_query = (
+            select(literal('post').label('item_type'), cast(SysPost.post_id, String).label('item_value'))
+            .select_from(SysUserPost)
+            .join(SysPost, and_(SysUserPost.post_id == SysPost.post_id, SysPost.status == '0'))
+            .where(SysUserPost.user_id == user_id)
         )
-        query_user_post_info = (
+        # 超级管理员拥有全部权限，无需查询菜单权限标识
+        if is_admin:
+            item_rows = (await db.execute(post_query)).all()
+        else:
+            perms_query = (
+                select(literal('perms').label('item_type'), SysMenu.perms.label('item_value'))
+                .select_from(SysUserRole)
+                .join(
+                    SysRole,
+                    and_(SysUserRole.role_id == SysRole.role_id, SysRole.status == '0', SysRole.del_flag == '0'),
+                )
+                .join(SysRoleMenu, SysRole.role_id == SysRoleMenu.role_id)
+                .join(SysMenu, and_(SysRoleMenu.menu_id == SysMenu.menu_id, SysMenu.status == '0'))
+                .where(SysUserRole.user_id == user_id)
+                .distinct()
+            )
+            item_rows = (await db.execute(union_all(post_query, perms_query))).all()
+
+        return {
+            'user_basic_info': user_role_rows[0][0],
+            'user_dept_info': user_role_rows[0][1],
+            'user_role_info': user_role_info,
+            'user_post_ids': [row.item_value for row in item_rows if row.item_type == 'post'],
+            'user_perms': [row.item_value for row in item_rows if row.item_type == 'perms'],
+        }
+
+    @classmethod
+    async def get_user_router_menus_by_id(cls, db: AsyncSession, user_id: int) -> Sequence[SysMenu]:
+        """
+        根据user_id获取用户可访问的目录与菜单，超级管理员返回全部可用目录与菜单
+
+        :param db: orm对象
+        :param user_id: 用户id
+        :return: 按显示顺序排列的目录与菜单列表
+        """
+        active_user_role_ids = (
+            select(SysUserRole.role_id)
+            .join(
+                SysRole,
+                and_(SysUserRole.role_id == SysRole.role_id, SysRole.status == '0', SysRole.del_flag == '0'),
+            )
+            .where(SysUserRole.user_id == user_id)
+        )
+        user_menu_ids = select(SysRoleMenu.menu_id).where(SysRoleMenu.role_id.in_(active_user_role_ids))
+        is_admin = active_user_role_ids.where(SysUserRole.role_id == 1).exists()
+        query_menu_list = (
             (
                 await db.execute(
-                    select(SysPost)
-                    .select_from(SysUser)
-                    .where(SysUser.status == '0', SysUser.del_flag == '0', SysUser.user_id == user_id)
-                    .join(SysUserPost, SysUser.user_id == SysUserPost.user_id, isouter=True)
-                    .join(SysPost, and_(SysUserPost.post_id == SysPost.post_id, SysPost.status == '0'))
-                    .distinct()
+                    select(SysMenu)
+                    .where(
+                        SysMenu.status == '0',
+                        SysMenu.menu_type.in_([MenuConstant.TYPE_DIR, MenuConstant.TYPE_MENU]),
+                        or_(is_admin, SysMenu.menu_id.in_(user_menu_ids)),
+                    )
+                    .order_by(SysMenu.order_num)
                 )
             )
             .scalars()
             .all()
         )
-        role_id_list = [item.role_id for item in query_user_role_info]
-        if 1 in role_id_list:
-            query_user_menu_info = (
-                (await db.execute(select(SysMenu).where(SysMenu.status == '0').distinct())).scalars().all()
-            )
-        else:
-            query_user_menu_info = (
-                (
-                    await db.execute(
-                        select(SysMenu)
-                        .select_from(SysUser)
-                        .where(SysUser.status == '0', SysUser.del_flag == '0', SysUser.user_id == user_id)
-                        .join(SysUserRole, SysUser.user_id == SysUserRole.user_id, isouter=True)
-                        .join(
-                            SysRole,
-                            and_(
-                                SysUserRole.role_id == SysRole.role_id, SysRole.status == '0', SysRole.del_flag == '0'
-                            ),
-                            isouter=True,
-                        )
-                        .join(SysRoleMenu, SysRole.role_id == SysRoleMenu.role_id, isouter=True)
-                        .join(SysMenu, and_(SysRoleMenu.menu_id == SysMenu.menu_id, SysMenu.status == '0'))
-                        .order_by(SysMenu.order_num)
-                        .distinct()
-                    )
-                )
-                .scalars()
-                .all()
-            )
-
-        results = {
-            'user_basic_info': query_user_basic_info,
-            'user_dept_info': query_user_dept_info,
-            'user_role_info': query_user_role_info,
-            'user_post_info': query_user_post_info,
-            'user_menu_info': query_user_menu_info,
-        }
 
-        return results
+        return query_menu_list
 
     @classmethod
     async def get_user_detail_by_id(cls, db: AsyncSession, user_id: int) -> dict[str, Any]:
@@ -279,27 +344,20 @@ class UserDao:
         return results
 
     @classmethod
-    async def get_user_list(
-        cls, db: AsyncSession, query_object: UserPageQueryModel, data_scope_sql: ColumnElement, is_page: bool = False
-    ) -> PageModel | list[list[dict[str, Any]]]:
+    def _get_user_list_query(cls, query_object: UserPageQueryModel, data_scope_sql: ColumnElement) -> Select:
         """
-        根据查询参数获取用户列表信息
+        根据查询参数构建用户列表查询语句
 
-        :param db: orm对象
         :param query_object: 查询参数对象
         :param data_scope_sql: 数据权限对应的查询sql语句
-        :param is_page: 是否开启分页
-        :return: 用户列表信息对象
+        :return: 用户列表查询语句
         """
         query = (
             select(SysUser, SysDept)
             .where(
                 SysUser.del_flag == '0',
-                or_(
-                    SysUser.dept_id == query_object.dept_id,
-                    SysUser.dept_id.in_(
-                        select(SysDept.dept_id).where(func.find_in_set(query_object.dept_id, SysDept.ancestors))
-                    ),
+                SysUser.dept_id.in_(
+                    select(SysDeptClosure.descendant_id).where(SysDeptClosure.ancestor_id == query_object.dept_id)
                 )
                 if query_object.dept_id
                 else True,
@@ -326,12 +384,43 @@ class UserDao:
             .order_by(SysUser.user_id)
             .distinct()
         )
+
+        return query
+
+    @classmethod
+    async def get_user_list(
+        cls, db: AsyncSession, query_object: UserPageQueryModel, data_scope_sql: ColumnElement, is_page: bool = False
+    ) -> PageModel | list[list[dict[str, Any]]]:
+        """
+        根据查询参数获取用户列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :param is_page: 是否开启分页
+        :return: 用户列表信息对象
+        """
+        query = cls._get_user_list_query(query_object, data_scope_sql)
         user_list: PageModel | list[list[dict[str, Any]]] = await PageUtil.paginate(
             db, query, query_object.page_num, query_object.page_size, is_page
         )
 
         return user_list
 
+    @classmethod
+    def stream_user_list(
+        cls, db: AsyncSession, query_object: UserPageQueryModel, data_scope_sql: ColumnElement
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        根据查询参数通过服务端游标流式获取用户列表信息
+
+        :param db: orm对象
+        :param query_object: 查询参数对象
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :return: 用户列表信息迭代器
+        """
+        return PageUtil.stream(db, cls._get_user_list_query(query_object, data_scope_sql))
+
     @classmethod
     async def add_user_dao(cls, db: AsyncSession, user: UserModel) -> SysUser:
         """
@@ -361,6 +450,30 @@ class UserDao:
             [{key: value for key, value in user.items() if key not in {'create_time', 'update_time'}}],
         )
 
+    @classmethod
+    async def bulk_add_user_dao(cls, db: AsyncSession, users: list[dict[str, Any]], chunk_size: int = 1000) -> int:
+        """
+        批量新增用户数据库操作
+
+        :param db: orm对象
+        :param users: 用户字典列表
+        :param chunk_size: 单次批量写入最多包含的行数
+        :return: 批量写入执行次数
+        """
+        return await SqlalchemyUtil.bulk_insert(db, SysUser, users, chunk_size)
+
+    @classmethod
+    async def bulk_edit_user_dao(cls, db: AsyncSession, users: list[dict[str, Any]]) -> None:
+        """
+        按主键批量编辑用户数据库操作
+
+        :param db: orm对象
+        :param users: 包含用户ID的用户字典列表
+        :return:
+        """
+        if users:
+            await db.execute(update(SysUser), users)
+
     @classmethod
     async def delete_user_dao(cls, db: AsyncSession, user: UserModel) -> None:
         """
@@ -1,4 +1,4 @@
-from sqlalchemy import CHAR, BigInteger, Column, Integer, String
+from sqlalchemy import CHAR, BigInteger, Column, Index, Integer, String
 
 from common.mixin import AuditTimeMixin
 from config.database import Base
@@ -41,3 +41,19 @@ class SysDept(AuditTimeMixin, Base):
     del_flag = Column(CHAR(1), nullable=True, server_default='0', comment='删除标志（0代表存在 2代表删除）')
     create_by = Column(String(64), nullable=True, server_default="''", comment='创建者')
     update_by = Column(String(64), nullable=True, server_default="''", comment='更新者')
+
+
+class SysDeptClosure(Base):
+    """
+    部门层级闭包表
+    """
+
+    __tablename__ = 'sys_dept_closure'
+    __table_args__ = (
+        Index('idx_sys_dept_closure_descendant', 'descendant_id', 'depth'),
+        {'comment': '部门层级闭包表'},
+    )
+
+    ancestor_id = Column(BigInteger, primary_key=True, nullable=False, comment='祖先部门id')
+    descendant_id = Column(BigInteger, primary_key=True, nullable=False, comment='后代部门id（包含自身）')
+    depth = Column(Integer, nullable=False, server_default='0', comment='层级距离（自身为0）')
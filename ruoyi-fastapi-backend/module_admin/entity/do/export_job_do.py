@@ -0,0 +1,35 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, Text
+
+from common.mixin import AuditTimeMixin
+from config.database import Base
+
+
+class SysExportJob(AuditTimeMixin, Base):
+    """
+    异步导出任务表
+    """
+
+    __tablename__ = 'sys_export_job'
+    __create_time_nullable__ = False
+    __update_time_nullable__ = False
+    __table_args__ = (
+        Index('idx_sys_export_job_user_status', 'user_id', 'status'),
+        Index('idx_sys_export_job_status_expire_time', 'status', 'expire_time'),
+        {'comment': '异步导出任务表'},
+    )
+
+    job_id = Column(String(36), primary_key=True, nullable=False, comment='任务ID')
+    export_type = Column(String(64), nullable=False, comment='导出业务类型')
+    export_name = Column(String(100), nullable=False, comment='导出名称')
+    export_format = Column(String(10), nullable=False, server_default='xlsx', comment='导出格式')
+    status = Column(String(20), nullable=False, server_default='pending', comment='任务状态')
+    query_params = Column(Text, nullable=True, comment='导出查询参数JSON')
+    processed_rows = Column(BigInteger, nullable=False, server_default='0', comment='已处理行数')
+    file_id = Column(String(36), nullable=True, comment='导出文件ID')
+    file_size = Column(BigInteger, nullable=False, server_default='0', comment='导出文件大小')
+    user_id = Column(BigInteger, nullable=False, comment='发起用户ID')
+    create_by = Column(String(64), nullable=True, server_default="''", comment='创建者')
+    started_time = Column(DateTime, nullable=True, comment='开始执行时间')
+    finished_time = Column(DateTime, nullable=True, comment='结束时间')
+    expire_time = Column(DateTime, nullable=True, comment='导出文件过期时间')
+    error_message = Column(Text, nullable=True, comment='失败原因')
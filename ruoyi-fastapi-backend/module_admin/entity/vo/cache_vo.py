@@ -14,6 +14,8 @@ class CacheMonitorModel(BaseModel):
     command_stats: list | None = Field(default=[], description='命令统计')
     db_size: int | None = Field(default=None, description='Key数量')
     info: dict | None = Field(default={}, description='Redis信息')
+    api_cache_stats: dict | None = Field(default={}, description='接口缓存命中统计')
+    near_cache_stats: dict | None = Field(default={}, description='当前worker参数配置与数据字典近端缓存命中统计')
 
 
 class CacheInfoModel(BaseModel):
@@ -27,3 +29,14 @@ class CacheInfoModel(BaseModel):
     cache_name: str | None = Field(default=None, description='缓存名称')
     cache_value: Any | None = Field(default=None, description='缓存内容')
     remark: str | None = Field(default=None, description='备注')
+
+
+class CacheKeyPageModel(BaseModel):
+    """
+    缓存键名游标分页对应pydantic模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    keys: list[str] = Field(default=[], description='缓存键名列表')
+    cursor: int = Field(default=0, description='下一页游标，为0时表示遍历结束')
@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+ExportJobStatus = Literal['pending', 'running', 'completed', 'failed', 'cancelled', 'expired']
+AsyncExportFormat = Literal['xlsx', 'csv']
+
+
+class ExportOptionModel(BaseModel):
+    """
+    导出选项模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    async_export: bool = Field(default=False, description='是否创建异步导出任务')
+    export_format: AsyncExportFormat = Field(default='xlsx', description='导出格式')
+
+
+class ExportJobModel(BaseModel):
+    """
+    异步导出任务展示模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel, from_attributes=True)
+
+    job_id: str = Field(description='任务ID')
+    export_type: str = Field(description='导出业务类型')
+    export_name: str = Field(description='导出名称')
+    export_format: AsyncExportFormat = Field(description='导出格式')
+    status: ExportJobStatus = Field(description='任务状态')
+    processed_rows: int = Field(default=0, ge=0, description='已处理行数')
+    file_id: str | None = Field(default=None, description='导出文件ID')
+    file_size: int = Field(default=0, ge=0, description='导出文件大小')
+    download_url: str | None = Field(default=None, description='导出文件下载路径')
+    create_by: str | None = Field(default=None, description='创建者')
+    create_time: datetime | None = Field(default=None, description='创建时间')
+    update_time: datetime | None = Field(default=None, description='更新时间')
+    started_time: datetime | None = Field(default=None, description='开始执行时间')
+    finished_time: datetime | None = Field(default=None, description='结束时间')
+    expire_time: datetime | None = Field(default=None, description='导出文件过期时间')
+    error_message: str | None = Field(default=None, description='失败原因')
+
+
+class ExportJobPageQueryModel(BaseModel):
+    """
+    异步导出任务分页查询模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    status: ExportJobStatus | None = Field(default=None, description='任务状态')
+    export_type: str | None = Field(default=None, description='导出业务类型')
+    page_num: int = Field(default=1, ge=1, description='当前页码')
+    page_size: int = Field(default=10, ge=1, le=100, description='每页记录数')
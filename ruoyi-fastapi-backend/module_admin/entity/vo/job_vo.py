@@ -122,6 +122,10 @@ class JobLogPageQueryModel(JobLogQueryModel):
 
     page_num: int = Field(default=1, description='当前页码')
     page_size: int = Field(default=10, description='每页记录数')
+    page_mode: Literal['offset', 'cursor'] = Field(
+        default='offset', description='分页方式（offset页码分页 cursor游标分页）'
+    )
+    cursor: str | None = Field(default=None, description='游标分页的续页令牌')
 
 
 class DeleteJobLogModel(BaseModel):
@@ -28,6 +28,8 @@ class OnlineQueryModel(OnlineModel):
 
     begin_time: str | None = Field(default=None, description='开始时间')
     end_time: str | None = Field(default=None, description='结束时间')
+    page_num: int | None = Field(default=None, ge=1, description='当前页码，为空时返回全部在线用户')
+    page_size: int | None = Field(default=None, ge=1, description='每页记录数，为空时返回全部在线用户')
 
 
 class OnlinePageResponseModel(BaseModel):
@@ -18,10 +18,17 @@ class TransportCryptoFrontendConfigModel(BaseModel):
     public_key_url: str = Field(description='传输层公钥接口路径')
     request_envelope_algorithm: str = Field(description='前端请求信封算法标识')
     response_envelope_algorithm: str = Field(description='前端响应信封算法标识')
+    chunked_response_envelope_algorithm: str = Field(
+        default='AES_256_GCM_CHUNKED', description='分段流式响应信封算法标识'
+    )
     enabled_paths: list[str] = Field(description='启用传输层加解密的路径列表')
     required_paths: list[str] = Field(description='强制要求加密传输的路径列表')
     exclude_paths: list[str] = Field(description='排除传输层加解密的路径列表')
     max_encrypted_get_url_length: int = Field(description='前端执行加密GET/DELETE请求时允许的最大URL长度')
+    session_enabled: bool = Field(default=False, description='是否启用传输会话模式')
+    session_url: str = Field(default='/transport/crypto/session', description='传输会话协商接口路径')
+    session_envelope_algorithm: str = Field(default='SESSION_AES_256_GCM', description='会话模式请求信封算法标识')
+    session_ttl_seconds: int = Field(default=0, description='传输会话有效期（秒）')
     config_expire_at: int = Field(description='前端配置建议刷新时间戳')
 
 
@@ -40,6 +47,18 @@ class TransportCryptoPublicKeyModel(BaseModel):
     expire_at: int = Field(description='当前公钥建议刷新时间戳')
 
 
+class TransportCryptoSessionModel(BaseModel):
+    """
+    传输会话协商结果模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    session_id: str = Field(description='传输会话编号')
+    kid: str = Field(description='协商会话时使用的密钥版本标识')
+    expire_at: int = Field(description='传输会话过期时间戳')
+
+
 class TransportCryptoKidStatModel(BaseModel):
     """
     传输层加解密按密钥版本统计模型
@@ -264,6 +264,19 @@ class DeleteUserModel(BaseModel):
     update_time: datetime | None = Field(default=None, description='更新时间')
 
 
+class UserImportResultModel(BaseModel):
+    """
+    批量导入用户结果模型
+    """
+
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    add_count: int = Field(default=0, description='新增用户数量')
+    update_count: int = Field(default=0, description='更新用户数量')
+    error_count: int = Field(default=0, description='导入失败行数')
+    error_report_id: str | None = Field(default=None, description='导入错误报告ID')
+
+
 class UserRoleQueryModel(UserModel):
     """
     用户角色关联管理不分页查询模型
@@ -1,9 +1,13 @@
 from fastapi import Request
+from redis import asyncio as aioredis
 
+from common.annotation.cache_annotation import ApiCacheStats
 from common.enums import RedisInitKeyConfig
 from common.vo import CrudResponseModel
 from config.get_redis import RedisUtil
-from module_admin.entity.vo.cache_vo import CacheInfoModel, CacheMonitorModel
+from module_admin.entity.vo.cache_vo import CacheInfoModel, CacheKeyPageModel, CacheMonitorModel
+from module_admin.service.near_cache_service import SysNearCacheService
+from module_admin.service.online_service import OnlineService
 
 
 class CacheService:
@@ -11,6 +15,9 @@ class CacheService:
     缓存监控模块服务层
     """
 
+    _SCAN_COUNT = 1000
+    _DELETE_BATCH_SIZE = 500
+
     @classmethod
     async def get_cache_monitor_statistical_info_services(cls, request: Request) -> CacheMonitorModel:
         """
@@ -25,7 +32,14 @@ class CacheService:
         command_stats = [
             {'name': key.split('_')[1], 'value': str(value.get('calls'))} for key, value in command_stats_dict.items()
         ]
-        result = CacheMonitorModel(commandStats=command_stats, dbSize=db_size, info=info)
+        api_cache_stats = await ApiCacheStats.get_stats(request.app.state.redis)
+        result = CacheMonitorModel(
+            commandStats=command_stats,
+            dbSize=db_size,
+            info=info,
+            apiCacheStats=api_cache_stats,
+            nearCacheStats=SysNearCacheService.get_stats(),
+        )
 
         return result
 
@@ -57,11 +71,37 @@ class CacheService:
         :param cache_name: 缓存名称
         :return: 缓存键名列表信息
         """
-        cache_keys: list[str] = await request.app.state.redis.keys(f'{cache_name}*')
-        cache_key_list = [key.split(':', 1)[1] for key in cache_keys if key.startswith(f'{cache_name}:')]
+        cache_key_list = [
+            key.split(':', 1)[1]
+            async for key in request.app.state.redis.scan_iter(match=f'{cache_name}:*', count=cls._SCAN_COUNT)
+        ]
 
         return cache_key_list
 
+    @classmethod
+    async def get_cache_monitor_cache_key_page_services(
+        cls, request: Request, cache_name: str, cursor: int, page_size: int
+    ) -> CacheKeyPageModel:
+        """
+        基于SCAN游标分页获取缓存键名列表信息service
+
+        :param request: Request对象
+        :param cache_name: 缓存名称
+        :param cursor: 本页起始游标，首页传0
+        :param page_size: 每页期望返回的缓存键名数量
+        :return: 缓存键名列表与下一页游标，SCAN语义下单页数量可能略多于每页记录数，游标为0时表示遍历结束
+        """
+        cache_key_list: list[str] = []
+        while True:
+            cursor, cache_keys = await request.app.state.redis.scan(
+                cursor=cursor, match=f'{cache_name}:*', count=page_size
+            )
+            cache_key_list.extend(key.split(':', 1)[1] for key in cache_keys)
+            if cursor == 0 or len(cache_key_list) >= page_size:
+                break
+
+        return CacheKeyPageModel(keys=cache_key_list, cursor=cursor)
+
     @classmethod
     async def get_cache_monitor_cache_value_services(
         cls, request: Request, cache_name: str, cache_key: str
@@ -87,9 +127,11 @@ class CacheService:
         :param cache_name: 缓存名称
         :return: 操作缓存响应信息
         """
-        cache_keys = await request.app.state.redis.keys(f'{cache_name}*')
-        if cache_keys:
-            await request.app.state.redis.delete(*cache_keys)
+        await cls._delete_matched_keys(request.app.state.redis, f'{cache_name}*')
+        if f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:'.startswith(cache_name):
+            # 登录令牌已全部清除，在线会话索引需同步清除，避免在线用户列表残留已失效的会话
+            await OnlineService.clear_online_session_index(request.app.state.redis)
+        await SysNearCacheService.publish_invalidation(request.app.state.redis)
 
         return CrudResponseModel(is_success=True, message=f'{cache_name}对应键值清除成功')
 
@@ -102,9 +144,17 @@ class CacheService:
         :param cache_key: 缓存键名
         :return: 操作缓存响应信息
         """
-        cache_keys = await request.app.state.redis.keys(f'*{cache_key}')
-        if cache_keys:
-            await request.app.state.redis.delete(*cache_keys)
+        token_prefix = f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:'
+        token_ids = [
+            token_key.removeprefix(token_prefix)
+            async for token_key in request.app.state.redis.scan_iter(
+                match=f'{token_prefix}*{cache_key}', count=cls._SCAN_COUNT
+            )
+        ]
+        await cls._delete_matched_keys(request.app.state.redis, f'*{cache_key}')
+        # 被清除的登录令牌同步移除在线会话索引
+        await OnlineService.remove_online_session_index(request.app.state.redis, token_ids)
+        await SysNearCacheService.publish_invalidation(request.app.state.redis)
 
         return CrudResponseModel(is_success=True, message=f'{cache_key}清除成功')
 
@@ -116,11 +166,29 @@ class CacheService:
         :param request: Request对象
         :return: 操作缓存响应信息
         """
-        cache_keys = await request.app.state.redis.keys()
-        if cache_keys:
-            await request.app.state.redis.delete(*cache_keys)
+        await cls._delete_matched_keys(request.app.state.redis, '*')
 
-        await RedisUtil.init_sys_dict(request.app.state.redis)
-        await RedisUtil.init_sys_config(request.app.state.redis)
+        await RedisUtil.warmup_sys_cache(request.app.state.redis)
 
         return CrudResponseModel(is_success=True, message='所有缓存清除成功')
+
+    @classmethod
+    async def _delete_matched_keys(cls, redis: aioredis.Redis, pattern: str) -> int:
+        """
+        基于SCAN游标遍历匹配的键并分批删除，避免KEYS命令长时间阻塞Redis
+
+        :param redis: Redis连接对象
+        :param pattern: 键名匹配模式
+        :return: 删除的键数量
+        """
+        deleted_count = 0
+        cache_keys: list[str] = []
+        async for key in redis.scan_iter(match=pattern, count=cls._SCAN_COUNT):
+            cache_keys.append(key)
+            if len(cache_keys) >= cls._DELETE_BATCH_SIZE:
+                deleted_count += await redis.delete(*cache_keys)
+                cache_keys = []
+        if cache_keys:
+            deleted_count += await redis.delete(*cache_keys)
+
+        return deleted_count
@@ -3,6 +3,7 @@ import hashlib
 import uuid
 from collections.abc import AsyncGenerator
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Literal
 
@@ -12,7 +13,7 @@ from sqlalchemy import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.vo import CrudResponseModel
-from config.env import UploadConfig
+from config.env import AppConfig, UploadConfig
 from exceptions.exception import FileRangeNotSatisfiableException, ServiceException
 from module_admin.dao.file_access_dao import FileAclDao
 from module_admin.dao.file_info_dao import FileInfoDao
@@ -188,6 +189,8 @@ class CommonService:
         enforce_owner_permission: bool = True,
         file_data_scope_sql: ColumnElement | None = None,
         range_header: str | None = None,
+        if_none_match: str | None = None,
+        if_range: str | None = None,
     ) -> FileDownloadResult:
         """
         下载已登记文件service
@@ -199,6 +202,8 @@ class CommonService:
         :param enforce_owner_permission: 是否校验文件所有者权限
         :param file_data_scope_sql: 文件数据权限对应的查询sql语句
         :param range_header: Range请求头
+        :param if_none_match: If-None-Match请求头
+        :param if_range: If-Range请求头
         :return: 文件下载结果
         """
         file_info = await FileInfoDao.get_file_info_by_id(query_db, file_id, file_data_scope_sql)
@@ -266,8 +271,36 @@ class CommonService:
                 error_message='文件不存在或存储路径异常',
             )
             raise ServiceException(message='文件不存在或无权访问') from exc
+        # 权限校验通过后才比较缓存校验值，避免未授权请求探测文件版本
+        stat_result = filepath.stat()
+        etag = FileUtil.build_file_etag(getattr(file_info, 'file_hash', None), stat_result)
+        cache_control = (
+            AppConfig.app_file_public_cache_control
+            if file_info.access_type == 'public'
+            else AppConfig.app_file_private_cache_control
+        )
+        original_name = file_info.original_name
+        if FileUtil.is_not_modified(if_none_match, etag):
+            await query_db.rollback()
+            await cls._enqueue_file_access_log(
+                request,
+                current_user,
+                file_id,
+                action='download',
+                result='allowed',
+                operation_detail={'notModified': True},
+            )
+            return FileDownloadResult(
+                filename=original_name,
+                byte_range=FileUtil.parse_byte_range(None, stat_result.st_size),
+                etag=etag,
+                last_modified=stat_result.st_mtime,
+                cache_control=cache_control,
+                not_modified=True,
+            )
+        range_header = FileUtil.resolve_if_range(range_header, if_range, etag, stat_result.st_mtime)
         try:
-            byte_range = FileUtil.parse_byte_range(range_header, filepath.stat().st_size)
+            byte_range = FileUtil.parse_byte_range(range_header, stat_result.st_size)
         except FileRangeNotSatisfiableException:
             await cls._enqueue_file_access_log(
                 request,
@@ -280,7 +313,6 @@ class CommonService:
             )
             raise
 
-        original_name = file_info.original_name
         await query_db.rollback()
         await cls._enqueue_file_access_log(
             request,
@@ -295,6 +327,11 @@ class CommonService:
             data=stream,
             filename=original_name,
             byte_range=byte_range,
+            filepath=filepath,
+            on_sent=partial(cls._complete_download_audit, request, current_user, file_id, byte_range),
+            etag=etag,
+            last_modified=stat_result.st_mtime,
+            cache_control=cache_control,
         )
 
     @classmethod
@@ -400,7 +437,6 @@ class CommonService:
         :yield: 文件二进制数据
         """
         bytes_sent = 0
-        audit_result: Literal['completed', 'failed'] = 'failed'
         error_message = 'StreamClosed'
         try:
             async for chunk in UploadUtil.generate_file(
@@ -419,19 +455,41 @@ class CommonService:
             error_message = exc.__class__.__name__
             raise
         else:
-            audit_result = 'completed'
             error_message = ''
         finally:
-            await cls._enqueue_file_access_log(
-                request,
-                current_user,
-                file_id,
-                action='download',
-                result=audit_result,
-                bytes_sent=bytes_sent,
-                error_message=error_message,
-                operation_detail=cls._build_download_operation_detail(byte_range),
-            )
+            await cls._complete_download_audit(request, current_user, file_id, byte_range, bytes_sent, error_message)
+
+    @classmethod
+    async def _complete_download_audit(
+        cls,
+        request: Request,
+        current_user: CurrentUserModel,
+        file_id: str,
+        byte_range: FileByteRange,
+        bytes_sent: int,
+        error_message: str,
+    ) -> None:
+        """
+        记录文件下载完成或失败审计，流式读取与零拷贝发送共用
+
+        :param request: Request对象
+        :param current_user: 当前用户对象
+        :param file_id: 文件ID
+        :param byte_range: 文件字节范围
+        :param bytes_sent: 已发送字节数
+        :param error_message: 失败原因，为空时表示下载完成
+        :return: None
+        """
+        await cls._enqueue_file_access_log(
+            request,
+            current_user,
+            file_id,
+            action='download',
+            result='failed' if error_message else 'completed',
+            bytes_sent=bytes_sent,
+            error_message=error_message,
+            operation_detail=cls._build_download_operation_detail(byte_range),
+        )
 
     @classmethod
     async def _enqueue_file_access_log(
@@ -519,6 +577,7 @@ class CommonService:
             filename=file_name,
             byte_range=byte_range,
             accept_ranges=accept_ranges,
+            filepath=filepath,
         )
 
     @classmethod
@@ -560,4 +619,5 @@ class CommonService:
             ),
             filename=filename,
             byte_range=byte_range,
+            filepath=filepath,
         )
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import Request
@@ -10,6 +11,7 @@ from common.vo import CrudResponseModel, PageModel
 from exceptions.exception import ServiceException
 from module_admin.dao.config_dao import ConfigDao
 from module_admin.entity.vo.config_vo import ConfigModel, ConfigPageQueryModel, DeleteConfigModel
+from module_admin.service.near_cache_service import SysNearCacheService
 from utils.common_util import CamelCaseUtil
 from utils.excel_util import ExcelUtil
 
@@ -44,17 +46,15 @@ class ConfigService:
         :param redis: redis对象
         :return:
         """
-        # 获取以sys_config:开头的键列表
-        keys = await redis.keys(f'{RedisInitKeyConfig.SYS_CONFIG.key}:*')
-        # 删除匹配的键
-        if keys:
-            await redis.delete(*keys)
         config_all = await ConfigDao.get_config_list(query_db, ConfigPageQueryModel(), is_page=False)
-        for config_obj in config_all:
-            await redis.set(
-                f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_obj.get("configKey")}',
-                config_obj.get('configValue'),
-            )
+        await SysNearCacheService.replace_namespace(
+            redis,
+            RedisInitKeyConfig.SYS_CONFIG.key,
+            {
+                cls.get_config_cache_key(config_obj.get('configKey')): config_obj.get('configValue') or ''
+                for config_obj in config_all
+            },
+        )
 
     @classmethod
     async def query_config_list_from_cache_services(cls, redis: aioredis.Redis, config_key: str) -> Any:
@@ -65,10 +65,34 @@ class ConfigService:
         :param config_key: 参数键名
         :return: 参数键名对应值
         """
-        result = await redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_key}')
+        result = await SysNearCacheService.get(redis, cls.get_config_cache_key(config_key))
 
         return result
 
+    @classmethod
+    async def set_config_cache_services(cls, redis: aioredis.Redis, config_key: str, config_value: str | None) -> None:
+        """
+        写入参数键名对应值缓存并通知各worker失效近端缓存service
+
+        :param redis: redis对象
+        :param config_key: 参数键名
+        :param config_value: 参数键值
+        :return: None
+        """
+        cache_key = cls.get_config_cache_key(config_key)
+        await redis.set(cache_key, config_value)
+        await SysNearCacheService.publish_invalidation(redis, [cache_key])
+
+    @staticmethod
+    def get_config_cache_key(config_key: str) -> str:
+        """
+        获取参数键名对应的缓存键
+
+        :param config_key: 参数键名
+        :return: 缓存键
+        """
+        return f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_key}'
+
     @classmethod
     async def check_config_key_unique_services(cls, query_db: AsyncSession, page_object: ConfigModel) -> bool:
         """
@@ -101,8 +125,8 @@ class ConfigService:
         try:
             await ConfigDao.add_config_dao(query_db, page_object)
             await query_db.commit()
-            await request.app.state.redis.set(
-                f'{RedisInitKeyConfig.SYS_CONFIG.key}:{page_object.config_key}', page_object.config_value
+            await cls.set_config_cache_services(
+                request.app.state.redis, page_object.config_key, page_object.config_value
             )
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
@@ -130,11 +154,11 @@ class ConfigService:
                 await ConfigDao.edit_config_dao(query_db, edit_config)
                 await query_db.commit()
                 if config_info.config_key != page_object.config_key:
-                    await request.app.state.redis.delete(
-                        f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_info.config_key}'
-                    )
-                await request.app.state.redis.set(
-                    f'{RedisInitKeyConfig.SYS_CONFIG.key}:{page_object.config_key}', page_object.config_value
+                    old_cache_key = cls.get_config_cache_key(config_info.config_key)
+                    await request.app.state.redis.delete(old_cache_key)
+                    await SysNearCacheService.publish_invalidation(request.app.state.redis, [old_cache_key])
+                await cls.set_config_cache_services(
+                    request.app.state.redis, page_object.config_key, page_object.config_value
                 )
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
@@ -164,10 +188,11 @@ class ConfigService:
                     if config_info.config_type == CommonConstant.YES:
                         raise ServiceException(message=f'内置参数{config_info.config_key}不能删除')
                     await ConfigDao.delete_config_dao(query_db, ConfigModel(configId=int(config_id)))
-                    delete_config_key_list.append(f'{RedisInitKeyConfig.SYS_CONFIG.key}:{config_info.config_key}')
+                    delete_config_key_list.append(cls.get_config_cache_key(config_info.config_key))
                 await query_db.commit()
                 if delete_config_key_list:
                     await request.app.state.redis.delete(*delete_config_key_list)
+                    await SysNearCacheService.publish_invalidation(request.app.state.redis, delete_config_key_list)
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -190,12 +215,12 @@ class ConfigService:
         return result
 
     @staticmethod
-    async def export_config_list_services(config_list: list) -> bytes:
+    async def export_config_list_services(config_list: list) -> AsyncIterator[bytes]:
         """
         导出参数配置信息service
 
         :param config_list: 参数配置信息列表
-        :return: 参数配置信息对应excel的二进制数据
+        :return: 参数配置信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -211,14 +236,9 @@ class ConfigService:
             'remark': '备注',
         }
 
-        for item in config_list:
-            if item.get('configType') == 'Y':
-                item['configType'] = '是'
-            else:
-                item['configType'] = '否'
-        binary_data = ExcelUtil.export_list2excel(config_list, mapping_dict)
+        formatters = {'configType': ExcelUtil.choice_formatter({'Y': '是'}, default='否')}
 
-        return binary_data
+        return ExcelUtil.stream_export(config_list, mapping_dict, formatters)
 
     @classmethod
     async def refresh_sys_config_services(cls, request: Request, query_db: AsyncSession) -> CrudResponseModel:
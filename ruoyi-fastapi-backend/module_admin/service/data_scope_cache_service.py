@@ -0,0 +1,144 @@
+import json
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from redis import asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.enums import RedisInitKeyConfig
+from config.env import AppConfig
+from module_admin.dao.dept_dao import DeptDao
+from module_admin.dao.role_dao import RoleDao
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
+from utils.log_util import logger
+
+RoleDataScopes = tuple[tuple[int, str], ...]
+
+
+class DataScopeCacheService:
+    """
+    数据权限解析缓存服务
+
+    将自定、本部门、本部门及以下数据范围解析为可访问部门id列表，按全局权限版本号、角色数据范围组合与用户部门
+    缓存于Redis与进程内LRU中，角色数据权限或部门层级变更时递增全局权限版本号，旧版本解析结果随即失效
+    """
+
+    DATA_SCOPE_CUSTOM = '2'
+    DATA_SCOPE_DEPT = '3'
+    DATA_SCOPE_DEPT_AND_CHILD = '4'
+    DEPT_DATA_SCOPES = (DATA_SCOPE_CUSTOM, DATA_SCOPE_DEPT, DATA_SCOPE_DEPT_AND_CHILD)
+
+    _local_cache: OrderedDict[str, tuple[int, ...]] = OrderedDict()
+
+    @classmethod
+    def _normalize_role_scopes(cls, role_scopes: Iterable[tuple[int, str]]) -> RoleDataScopes:
+        """
+        过滤出按部门限制数据范围的角色并排序，使相同角色组合得到相同缓存Key
+
+        :param role_scopes: 角色id与数据范围列表
+        :return: 排序去重后的角色id与数据范围
+        """
+        return tuple(
+            sorted({(role_id, data_scope) for role_id, data_scope in role_scopes if data_scope in cls.DEPT_DATA_SCOPES})
+        )
+
+    @classmethod
+    def _get_cache_key(cls, epoch: int, role_scopes: RoleDataScopes, dept_id: int | None) -> str:
+        """
+        获取数据权限解析结果Key
+
+        :param epoch: 全局权限版本号
+        :param role_scopes: 排序去重后的角色id与数据范围
+        :param dept_id: 用户部门id，仅含自定数据权限时为None
+        :return: 数据权限解析结果Key
+        """
+        role_part = ','.join(f'{role_id}-{data_scope}' for role_id, data_scope in role_scopes)
+        return f'{RedisInitKeyConfig.DATA_SCOPE.key}:{epoch}:{dept_id if dept_id is not None else ""}:{role_part}'
+
+    @classmethod
+    async def get_data_scope_dept_ids(
+        cls,
+        redis: aioredis.Redis | None,
+        query_db: AsyncSession,
+        role_scopes: Iterable[tuple[int, str]],
+        dept_id: int | None,
+    ) -> tuple[int, ...]:
+        """
+        获取角色组合可访问的部门id列表，优先读取进程内缓存，其次读取Redis缓存，均未命中时查询数据库
+
+        :param redis: Redis连接对象，为空时直接查询数据库
+        :param query_db: orm对象
+        :param role_scopes: 角色id与数据范围列表
+        :param dept_id: 用户部门id
+        :return: 升序排列的可访问部门id
+        """
+        normalized_role_scopes = cls._normalize_role_scopes(role_scopes)
+        if not normalized_role_scopes:
+            return ()
+        if all(data_scope == cls.DATA_SCOPE_CUSTOM for _, data_scope in normalized_role_scopes):
+            # 自定数据权限与用户部门无关，不同部门的用户可共享同一解析结果
+            dept_id = None
+        if redis is None:
+            return await cls._load_data_scope_dept_ids(query_db, normalized_role_scopes, dept_id)
+
+        # 先读取版本号再加载数据，加载期间发生变更时写入的解析结果版本已过期，不会被后续请求命中
+        epoch = await UserAuthCacheService.get_global_permission_epoch(redis)
+        cache_key = cls._get_cache_key(epoch, normalized_role_scopes, dept_id)
+        dept_ids = cls._local_cache.get(cache_key)
+        if dept_ids is not None:
+            cls._local_cache.move_to_end(cache_key)
+            return dept_ids
+        dept_ids_json = await redis.get(cache_key)
+        if dept_ids_json:
+            try:
+                dept_ids = tuple(int(item) for item in json.loads(dept_ids_json))
+            except (TypeError, ValueError) as e:
+                logger.warning(f'数据权限解析结果解析失败，将重新加载：{e}')
+            else:
+                cls._set_local_dept_ids(cache_key, dept_ids)
+                return dept_ids
+
+        dept_ids = await cls._load_data_scope_dept_ids(query_db, normalized_role_scopes, dept_id)
+        await redis.set(cache_key, json.dumps(dept_ids), ex=AppConfig.app_data_scope_cache_expire_seconds)
+        cls._set_local_dept_ids(cache_key, dept_ids)
+        return dept_ids
+
+    @classmethod
+    async def _load_data_scope_dept_ids(
+        cls, query_db: AsyncSession, role_scopes: RoleDataScopes, dept_id: int | None
+    ) -> tuple[int, ...]:
+        """
+        查询数据库解析角色组合可访问的部门id列表
+
+        :param query_db: orm对象
+        :param role_scopes: 排序去重后的角色id与数据范围
+        :param dept_id: 用户部门id
+        :return: 升序排列的可访问部门id
+        """
+        data_scopes = {data_scope for _, data_scope in role_scopes}
+        dept_id_set: set[int] = set()
+        custom_role_ids = [role_id for role_id, data_scope in role_scopes if data_scope == cls.DATA_SCOPE_CUSTOM]
+        if custom_role_ids:
+            dept_id_set.update(await RoleDao.get_role_dept_ids_dao(query_db, custom_role_ids))
+        if dept_id is not None:
+            if cls.DATA_SCOPE_DEPT_AND_CHILD in data_scopes:
+                dept_id_set.update(await DeptDao.get_dept_subtree_ids_dao(query_db, dept_id))
+            elif cls.DATA_SCOPE_DEPT in data_scopes:
+                dept_id_set.add(dept_id)
+        return tuple(sorted(dept_id_set))
+
+    @classmethod
+    def _set_local_dept_ids(cls, cache_key: str, dept_ids: tuple[int, ...]) -> None:
+        """
+        写入进程内LRU缓存
+
+        :param cache_key: 数据权限解析结果Key
+        :param dept_ids: 可访问部门id
+        :return: None
+        """
+        if AppConfig.app_data_scope_local_cache_size <= 0:
+            return
+        cls._local_cache[cache_key] = dept_ids
+        cls._local_cache.move_to_end(cache_key)
+        while len(cls._local_cache) > AppConfig.app_data_scope_local_cache_size:
+            cls._local_cache.popitem(last=False)
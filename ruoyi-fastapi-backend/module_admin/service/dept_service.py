@@ -1,4 +1,4 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from sqlalchemy import ColumnElement
@@ -10,6 +10,7 @@ from exceptions.exception import ServiceException, ServiceWarning
 from module_admin.dao.dept_dao import DeptDao
 from module_admin.entity.do.dept_do import SysDept
 from module_admin.entity.vo.dept_vo import DeleteDeptModel, DeptModel, DeptSortModel, DeptTreeModel
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
 from utils.common_util import CamelCaseUtil
 
 
@@ -118,8 +119,10 @@ class DeptService:
             raise ServiceException(message=f'部门{parent_info.dept_name}停用，不允许新增')
         page_object.ancestors = f'{parent_info.ancestors},{page_object.parent_id}'
         try:
-            await DeptDao.add_dept_dao(query_db, page_object)
+            add_dept = await DeptDao.add_dept_dao(query_db, page_object)
+            await DeptDao.add_dept_closure_dao(query_db, add_dept.dept_id, page_object.parent_id)
             await query_db.commit()
+            await UserAuthCacheService.bump_permission_epoch()
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
             await query_db.rollback()
@@ -145,12 +148,19 @@ class DeptService:
             raise ServiceException(message=f'修改部门{page_object.dept_name}失败，该部门包含未停用的子部门')
         new_parent_dept = await DeptDao.get_dept_by_id(query_db, page_object.parent_id)
         old_dept = await DeptDao.get_dept_by_id(query_db, page_object.dept_id)
+        parent_changed = bool(new_parent_dept and old_dept and old_dept.parent_id != new_parent_dept.dept_id)
+        if parent_changed and await DeptDao.check_dept_is_descendant_dao(
+            query_db, new_parent_dept.dept_id, page_object.dept_id
+        ):
+            raise ServiceException(message=f'修改部门{page_object.dept_name}失败，上级部门不能是自己的子部门')
         try:
             if new_parent_dept and old_dept:
                 new_ancestors = f'{new_parent_dept.ancestors},{new_parent_dept.dept_id}'
                 old_ancestors = old_dept.ancestors
                 page_object.ancestors = new_ancestors
                 await cls.update_dept_children(query_db, page_object.dept_id, new_ancestors, old_ancestors)
+            if parent_changed:
+                await DeptDao.move_dept_closure_dao(query_db, page_object.dept_id, new_parent_dept.dept_id)
             edit_dept = page_object.model_dump(exclude_unset=True, exclude={'create_time', 'update_time'})
             await DeptDao.edit_dept_dao(query_db, edit_dept)
             if (
@@ -160,6 +170,7 @@ class DeptService:
             ):
                 await cls.update_parent_dept_status_normal(query_db, page_object)
             await query_db.commit()
+            await UserAuthCacheService.bump_permission_epoch()
             return CrudResponseModel(is_success=True, message='更新成功')
         except Exception as e:
             await query_db.rollback()
@@ -187,6 +198,7 @@ class DeptService:
                     await cls.check_dept_data_scope_services(query_db, item['dept_id'], data_scope_sql)
             await DeptDao.update_dept_sort_dao(query_db, dept_sort_list)
             await query_db.commit()
+            await UserAuthCacheService.bump_permission_epoch()
             return CrudResponseModel(is_success=True, message='保存成功')
         except ServiceException:
             await query_db.rollback()
@@ -241,7 +253,9 @@ class DeptService:
                         raise ServiceWarning(message='部门存在用户,不允许删除')
 
                     await DeptDao.delete_dept_dao(query_db, DeptModel(deptId=dept_id))
+                    await DeptDao.delete_dept_closure_dao(query_db, int(dept_id))
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -263,6 +277,65 @@ class DeptService:
 
         return result
 
+    @classmethod
+    async def rebuild_dept_closure_services(cls, query_db: AsyncSession, batch_size: int = 1000) -> int:
+        """
+        根据部门祖级列表重建部门层级闭包表service，调用方负责提交事务
+
+        :param query_db: orm对象
+        :param batch_size: 单次批量写入最多包含的行数
+        :return: 层级闭包关系数量
+        """
+        closure_rows = cls.build_dept_closure_rows(await DeptDao.get_dept_ancestors_list_dao(query_db))
+        await DeptDao.clear_dept_closure_dao(query_db)
+        await DeptDao.add_dept_closure_batch_dao(query_db, closure_rows, batch_size)
+
+        return len(closure_rows)
+
+    @classmethod
+    async def init_dept_closure_services(cls, query_db: AsyncSession) -> int:
+        """
+        部门层级闭包表缺失数据时自动重建service，用于升级后首次启动
+
+        :param query_db: orm对象
+        :return: 重建的层级闭包关系数量，无需重建时为0
+        """
+        if not await DeptDao.check_dept_closure_missing_dao(query_db):
+            return 0
+        closure_count = await cls.rebuild_dept_closure_services(query_db)
+        await query_db.commit()
+
+        return closure_count
+
+    @classmethod
+    def parse_ancestor_ids(cls, ancestors: str | None) -> list[int]:
+        """
+        工具方法：解析祖级列表中的祖先部门id，忽略虚拟根节点0
+
+        :param ancestors: 祖级列表，如'0,100,101'
+        :return: 由根到父的祖先部门id列表
+        """
+        return [
+            int(ancestor_id)
+            for ancestor_id in (ancestors or '').split(',')
+            if ancestor_id.strip().isdigit() and int(ancestor_id) != 0
+        ]
+
+    @classmethod
+    def build_dept_closure_rows(cls, dept_ancestors_list: Iterable[tuple[int, str | None]]) -> list[dict[str, int]]:
+        """
+        工具方法：根据部门祖级列表构建层级闭包关系
+
+        :param dept_ancestors_list: 部门id与祖级列表
+        :return: 层级闭包关系列表
+        """
+        closure_rows = []
+        for dept_id, ancestors in dept_ancestors_list:
+            closure_rows.append({'ancestor_id': dept_id, 'descendant_id': dept_id, 'depth': 0})
+            for depth, ancestor_id in enumerate(reversed(cls.parse_ancestor_ids(ancestors)), start=1):
+                closure_rows.append({'ancestor_id': ancestor_id, 'descendant_id': dept_id, 'depth': depth})
+        return closure_rows
+
     @classmethod
     def list_to_tree(cls, permission_list: Sequence[SysDept]) -> list[DeptTreeModel]:
         """
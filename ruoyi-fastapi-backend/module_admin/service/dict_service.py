@@ -1,5 +1,5 @@
 import json
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from fastapi import Request
@@ -20,6 +20,7 @@ from module_admin.entity.vo.dict_vo import (
     DictTypeModel,
     DictTypePageQueryModel,
 )
+from module_admin.service.near_cache_service import SysNearCacheService
 from utils.common_util import CamelCaseUtil
 from utils.excel_util import ExcelUtil
 
@@ -79,7 +80,7 @@ class DictTypeService:
         try:
             await DictTypeDao.add_dict_type_dao(query_db, page_object)
             await query_db.commit()
-            await request.app.state.redis.set(f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}', '')
+            await DictDataService.set_dict_cache_services(request.app.state.redis, page_object.dict_type, [])
             result = {'is_success': True, 'message': '新增成功'}
         except Exception as e:
             await query_db.rollback()
@@ -120,9 +121,11 @@ class DictTypeService:
                 await query_db.commit()
                 if dict_type_info.dict_type != page_object.dict_type:
                     dict_data = [CamelCaseUtil.transform_result(row) for row in dict_data_list if row]
-                    await request.app.state.redis.set(
-                        f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}',
-                        json.dumps(dict_data, ensure_ascii=False, default=str),
+                    await DictDataService.set_dict_cache_services(
+                        request.app.state.redis, page_object.dict_type, dict_data
+                    )
+                    await SysNearCacheService.publish_invalidation(
+                        request.app.state.redis, [DictDataService.get_dict_cache_key(dict_type_info.dict_type)]
                     )
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
@@ -152,10 +155,11 @@ class DictTypeService:
                     if (await DictDataDao.count_dict_data_dao(query_db, dict_type_into.dict_type)) > 0:
                         raise ServiceException(message=f'{dict_type_into.dict_name}已分配，不能删除')
                     await DictTypeDao.delete_dict_type_dao(query_db, DictTypeModel(dictId=int(dict_id)))
-                    delete_dict_type_list.append(f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type_into.dict_type}')
+                    delete_dict_type_list.append(DictDataService.get_dict_cache_key(dict_type_into.dict_type))
                 await query_db.commit()
                 if delete_dict_type_list:
                     await request.app.state.redis.delete(*delete_dict_type_list)
+                    await SysNearCacheService.publish_invalidation(request.app.state.redis, delete_dict_type_list)
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -178,12 +182,12 @@ class DictTypeService:
         return result
 
     @staticmethod
-    async def export_dict_type_list_services(dict_type_list: list) -> bytes:
+    async def export_dict_type_list_services(dict_type_list: list) -> AsyncIterator[bytes]:
         """
         导出字典类型信息service
 
         :param dict_type_list: 字典信息列表
-        :return: 字典信息对应excel的二进制数据
+        :return: 字典信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -198,14 +202,9 @@ class DictTypeService:
             'remark': '备注',
         }
 
-        for item in dict_type_list:
-            if item.get('status') == '0':
-                item['status'] = '正常'
-            else:
-                item['status'] = '停用'
-        binary_data = ExcelUtil.export_list2excel(dict_type_list, mapping_dict)
+        formatters = {'status': ExcelUtil.choice_formatter({'0': '正常'}, default='停用')}
 
-        return binary_data
+        return ExcelUtil.stream_export(dict_type_list, mapping_dict, formatters)
 
     @classmethod
     async def refresh_sys_dict_services(cls, request: Request, query_db: AsyncSession) -> CrudResponseModel:
@@ -265,20 +264,20 @@ class DictDataService:
         :param redis: redis对象
         :return:
         """
-        # 获取以sys_dict:开头的键列表
-        keys = await redis.keys(f'{RedisInitKeyConfig.SYS_DICT.key}:*')
-        # 删除匹配的键
-        if keys:
-            await redis.delete(*keys)
-        dict_type_all = await DictTypeDao.get_all_dict_type(query_db)
-        for dict_type_obj in [item for item in dict_type_all if item.status == '0']:
-            dict_type = dict_type_obj.dict_type
-            dict_data_list = await DictDataDao.query_dict_data_list(query_db, dict_type)
-            dict_data = [CamelCaseUtil.transform_result(row) for row in dict_data_list if row]
-            await redis.set(
-                f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}',
-                json.dumps(dict_data, ensure_ascii=False, default=str),
-            )
+        # 一次查询加载所有启用的字典数据并在内存中按字典类型分组
+        dict_data_group: dict[str, list[dict[str, Any]]] = {}
+        for dict_type, dict_data in await DictDataDao.query_all_dict_data_list(query_db):
+            dict_type_data = dict_data_group.setdefault(dict_type, [])
+            if dict_data:
+                dict_type_data.append(CamelCaseUtil.transform_result(dict_data))
+        await SysNearCacheService.replace_namespace(
+            redis,
+            RedisInitKeyConfig.SYS_DICT.key,
+            {
+                cls.get_dict_cache_key(dict_type): json.dumps(dict_data, ensure_ascii=False, default=str)
+                for dict_type, dict_data in dict_data_group.items()
+            },
+        )
 
     @classmethod
     async def query_dict_data_list_from_cache_services(
@@ -291,12 +290,49 @@ class DictDataService:
         :param dict_type: 字典类型
         :return: 字典数据列表信息对象
         """
-        result = []
-        dict_data_list_result = await redis.get(f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}')
-        if dict_data_list_result:
-            result = json.loads(dict_data_list_result)
+        result = await SysNearCacheService.get(redis, cls.get_dict_cache_key(dict_type), cls._decode_dict_data_list)
+
+        # 近端缓存中的列表在各请求间共享，返回逐项复制的列表避免调用方修改缓存内容
+        return [dict(item) for item in result]
+
+    @classmethod
+    async def set_dict_cache_services(cls, redis: aioredis.Redis, dict_type: str, dict_data: list) -> None:
+        """
+        写入字典类型对应的字典数据缓存并通知各worker失效近端缓存service
+
+        :param redis: redis对象
+        :param dict_type: 字典类型
+        :param dict_data: 字典数据列表
+        :return: None
+        """
+        cache_key = cls.get_dict_cache_key(dict_type)
+        await redis.set(
+            cache_key, json.dumps(CamelCaseUtil.transform_result(dict_data), ensure_ascii=False, default=str)
+        )
+        await SysNearCacheService.publish_invalidation(redis, [cache_key])
+
+    @staticmethod
+    def get_dict_cache_key(dict_type: str) -> str:
+        """
+        获取字典类型对应的缓存键
+
+        :param dict_type: 字典类型
+        :return: 缓存键
+        """
+        return f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}'
+
+    @staticmethod
+    def _decode_dict_data_list(dict_data_list_result: str | None) -> list[dict[str, Any]]:
+        """
+        解码缓存中的字典数据列表
 
-        return CamelCaseUtil.transform_result(result)
+        :param dict_data_list_result: 缓存中的字典数据JSON字符串
+        :return: 字典数据列表
+        """
+        if not dict_data_list_result:
+            return []
+
+        return CamelCaseUtil.transform_result(json.loads(dict_data_list_result))
 
     @classmethod
     async def check_dict_data_unique_services(cls, query_db: AsyncSession, page_object: DictDataModel) -> bool:
@@ -333,10 +369,7 @@ class DictDataService:
             await DictDataDao.add_dict_data_dao(query_db, page_object)
             await query_db.commit()
             dict_data_list = await cls.query_dict_data_list_services(query_db, page_object.dict_type)
-            await request.app.state.redis.set(
-                f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}',
-                json.dumps(CamelCaseUtil.transform_result(dict_data_list), ensure_ascii=False, default=str),
-            )
+            await cls.set_dict_cache_services(request.app.state.redis, page_object.dict_type, dict_data_list)
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
             await query_db.rollback()
@@ -365,10 +398,7 @@ class DictDataService:
                 await DictDataDao.edit_dict_data_dao(query_db, edit_data_type)
                 await query_db.commit()
                 dict_data_list = await cls.query_dict_data_list_services(query_db, page_object.dict_type)
-                await request.app.state.redis.set(
-                    f'{RedisInitKeyConfig.SYS_DICT.key}:{page_object.dict_type}',
-                    json.dumps(CamelCaseUtil.transform_result(dict_data_list), ensure_ascii=False, default=str),
-                )
+                await cls.set_dict_cache_services(request.app.state.redis, page_object.dict_type, dict_data_list)
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -399,10 +429,7 @@ class DictDataService:
                 await query_db.commit()
                 for dict_type in list(set(delete_dict_type_list)):
                     dict_data_list = await cls.query_dict_data_list_services(query_db, dict_type)
-                    await request.app.state.redis.set(
-                        f'{RedisInitKeyConfig.SYS_DICT.key}:{dict_type}',
-                        json.dumps(CamelCaseUtil.transform_result(dict_data_list), ensure_ascii=False, default=str),
-                    )
+                    await cls.set_dict_cache_services(request.app.state.redis, dict_type, dict_data_list)
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -425,12 +452,12 @@ class DictDataService:
         return result
 
     @staticmethod
-    async def export_dict_data_list_services(dict_data_list: list) -> bytes:
+    async def export_dict_data_list_services(dict_data_list: list) -> AsyncIterator[bytes]:
         """
         导出字典数据信息service
 
         :param dict_data_list: 字典数据信息列表
-        :return: 字典数据信息对应excel的二进制数据
+        :return: 字典数据信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -450,15 +477,9 @@ class DictDataService:
             'remark': '备注',
         }
 
-        for item in dict_data_list:
-            if item.get('status') == '0':
-                item['status'] = '正常'
-            else:
-                item['status'] = '停用'
-            if item.get('isDefault') == 'Y':
-                item['isDefault'] = '是'
-            else:
-                item['isDefault'] = '否'
-        binary_data = ExcelUtil.export_list2excel(dict_data_list, mapping_dict)
-
-        return binary_data
+        formatters = {
+            'status': ExcelUtil.choice_formatter({'0': '正常'}, default='停用'),
+            'isDefault': ExcelUtil.choice_formatter({'Y': '是'}, default='否'),
+        }
+
+        return ExcelUtil.stream_export(dict_data_list, mapping_dict, formatters)
@@ -0,0 +1,580 @@
+import asyncio
+import hashlib
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote
+
+import aiofiles
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.vo import PageModel
+from config.database import DataSourceRegistry
+from config.env import AppConfig, UploadConfig
+from exceptions.exception import ServiceException
+from module_admin.dao.export_job_dao import ExportJobDao
+from module_admin.dao.file_info_dao import FileInfoDao
+from module_admin.dao.job_dao import JobDao
+from module_admin.entity.do.export_job_do import SysExportJob
+from module_admin.entity.vo.export_job_vo import AsyncExportFormat, ExportJobModel, ExportJobPageQueryModel
+from module_admin.entity.vo.file_vo import FileInfoModel
+from module_admin.entity.vo.job_vo import JobModel
+from module_admin.entity.vo.user_vo import CurrentUserModel
+from module_admin.service.file_business_service import FileRetentionPolicyService
+from utils.common_util import CamelCaseUtil
+from utils.excel_util import ExportProgressCallback
+from utils.file_util import FileUtil
+from utils.log_util import logger
+from utils.upload_util import UploadUtil
+
+ExportFactory = Callable[[AsyncSession, ExportProgressCallback], Awaitable[AsyncIterator[bytes]]]
+
+
+class ExportJobCancelledError(Exception):
+    """
+    导出任务已被取消或中断
+    """
+
+
+@dataclass(frozen=True)
+class ExportJobOwner:
+    user_id: int
+    user_name: str
+    dept_id: int | None
+
+
+@dataclass(frozen=True)
+class ExportFileResult:
+    filepath: Path
+    stored_name: str
+    storage_key: str
+    file_size: int
+    file_hash: str
+
+
+class ExportJobService:
+    """
+    异步导出任务服务
+
+    导出任务在进程内asyncio工作池中执行，全局信号量限制并发执行数量，导出文件写入受保护文件存储并登记为文件信息，
+    通过已登记文件下载接口分段下载；到期后由定时任务移入回收站
+    """
+
+    EXPORT_BUSINESS_TYPE = 'export_job'
+    EXPORT_STORAGE_DIR = 'export'
+    EXPIRE_JOB_INVOKE_TARGET = 'module_task.file_task.expire_export_files'
+    CONTENT_TYPES: dict[str, str] = {
+        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'csv': 'text/csv',
+    }
+
+    _semaphore: asyncio.Semaphore | None = None
+    _running_tasks: dict[str, asyncio.Task] = {}
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        """
+        获取限制导出任务并发执行数量的信号量
+
+        :return: 信号量
+        """
+        if cls._semaphore is None:
+            cls._semaphore = asyncio.Semaphore(max(AppConfig.app_export_job_max_workers, 1))
+        return cls._semaphore
+
+    @classmethod
+    def _get_slot_heartbeat_seconds(cls) -> float:
+        """
+        获取排队任务刷新更新时间的间隔，取中断判定时长的三分之一
+
+        :return: 刷新间隔秒数
+        """
+        return max(AppConfig.app_export_job_stale_minutes * 60 / 3, 1)
+
+    @classmethod
+    @asynccontextmanager
+    async def _worker_slot(cls, job_id: str) -> AsyncIterator[None]:
+        """
+        等待并占用导出工作池名额，等待期间定期刷新任务更新时间，避免排队中的任务被判定为中断
+
+        :param job_id: 任务ID
+        :return: None
+        """
+        semaphore = cls._get_semaphore()
+        while True:
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=cls._get_slot_heartbeat_seconds())
+                break
+            except TimeoutError:
+                await cls._touch_pending_export_job(job_id)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    @classmethod
+    async def _touch_pending_export_job(cls, job_id: str) -> None:
+        """
+        在独立会话中刷新排队中任务的更新时间
+
+        :param job_id: 任务ID
+        :return: None
+        """
+        async with DataSourceRegistry.session() as query_db:
+            try:
+                await ExportJobDao.transition_export_job(query_db, job_id, ['pending'], update_time=datetime.now())
+                await query_db.commit()
+            except Exception:
+                await query_db.rollback()
+                logger.exception(f'异步导出任务{job_id}排队状态刷新失败')
+
+    @classmethod
+    async def submit_export_job_services(
+        cls,
+        query_db: AsyncSession,
+        current_user: CurrentUserModel,
+        export_type: str,
+        export_title: str,
+        export_format: AsyncExportFormat,
+        query_object: BaseModel,
+        export_factory: ExportFactory,
+    ) -> ExportJobModel:
+        """
+        创建异步导出任务并提交至后台工作池
+
+        :param query_db: orm对象
+        :param current_user: 当前用户对象
+        :param export_type: 导出业务类型
+        :param export_title: 导出标题，与创建时间组成导出文件名
+        :param export_format: 导出格式
+        :param query_object: 导出查询参数对象
+        :param export_factory: 导出数据流工厂，接收独立会话与进度回调并返回导出文件二进制数据流
+        :return: 导出任务
+        """
+        user = current_user.user
+        if user is None or not user.user_name:
+            raise ServiceException(message='无法获取当前用户信息')
+        max_active = AppConfig.app_export_job_user_max_active
+        export_job = SysExportJob(
+            job_id=str(uuid.uuid4()),
+            export_type=export_type,
+            export_name=f'{export_title}_{datetime.now().strftime("%Y%m%d%H%M%S")}',
+            export_format=export_format,
+            status='pending',
+            query_params=query_object.model_dump_json(by_alias=True, exclude_none=True),
+            processed_rows=0,
+            file_size=0,
+            user_id=user.user_id,
+            create_by=user.user_name,
+        )
+        try:
+            # 锁定发起用户后再统计并新增任务，避免并发提交同时通过数量校验
+            await ExportJobDao.lock_export_job_user(query_db, user.user_id)
+            if await ExportJobDao.count_active_export_jobs(query_db, user.user_id) >= max_active:
+                raise ServiceException(message=f'最多同时执行{max_active}个导出任务，请等待已有任务完成后再试')
+            await ExportJobDao.add_export_job(query_db, export_job)
+            await query_db.commit()
+        except Exception:
+            await query_db.rollback()
+            raise
+
+        owner = ExportJobOwner(user_id=user.user_id, user_name=user.user_name, dept_id=user.dept_id)
+        task = asyncio.create_task(cls._run_export_job(export_job.job_id, owner, export_factory))
+        cls._running_tasks[export_job.job_id] = task
+        task.add_done_callback(lambda _: cls._running_tasks.pop(export_job.job_id, None))
+        logger.info(f'异步导出任务{export_job.job_id}已提交，导出类型：{export_type}')
+
+        return cls._build_export_job_model(CamelCaseUtil.transform_result(export_job))
+
+    @classmethod
+    async def cancel_export_job_services(
+        cls, query_db: AsyncSession, current_user: CurrentUserModel, job_id: str
+    ) -> ExportJobModel:
+        """
+        取消排队中或执行中的异步导出任务
+
+        :param query_db: orm对象
+        :param current_user: 当前用户对象
+        :param job_id: 任务ID
+        :return: 导出任务
+        """
+        export_job = await cls._get_own_export_job(query_db, current_user, job_id)
+        try:
+            cancelled = await ExportJobDao.transition_export_job(
+                query_db,
+                job_id,
+                ExportJobDao.ACTIVE_STATUSES,
+                status='cancelled',
+                finished_time=datetime.now(),
+            )
+            await query_db.commit()
+        except Exception:
+            await query_db.rollback()
+            raise
+        if not cancelled:
+            raise ServiceException(message='导出任务已结束，无法取消')
+        # 任务在其他进程执行时由进度上报发现取消状态后自行中止
+        task = cls._running_tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+        await query_db.refresh(export_job)
+        logger.info(f'异步导出任务{job_id}已取消')
+
+        return cls._build_export_job_model(CamelCaseUtil.transform_result(export_job))
+
+    @classmethod
+    async def get_export_job_detail_services(
+        cls, query_db: AsyncSession, current_user: CurrentUserModel, job_id: str
+    ) -> ExportJobModel:
+        """
+        获取异步导出任务详情
+
+        :param query_db: orm对象
+        :param current_user: 当前用户对象
+        :param job_id: 任务ID
+        :return: 导出任务
+        """
+        export_job = await cls._get_own_export_job(query_db, current_user, job_id)
+
+        return cls._build_export_job_model(CamelCaseUtil.transform_result(export_job))
+
+    @classmethod
+    async def get_export_job_list_services(
+        cls,
+        query_db: AsyncSession,
+        current_user: CurrentUserModel,
+        query_object: ExportJobPageQueryModel,
+        is_page: bool = True,
+    ) -> PageModel | list[ExportJobModel]:
+        """
+        获取当前用户的异步导出任务列表
+
+        :param query_db: orm对象
+        :param current_user: 当前用户对象
+        :param query_object: 查询参数对象
+        :param is_page: 是否分页
+        :return: 导出任务列表
+        """
+        user = current_user.user
+        if user is None:
+            raise ServiceException(message='无法获取当前用户信息')
+        export_job_list = await ExportJobDao.get_export_job_list(query_db, query_object, user.user_id, is_page)
+        if isinstance(export_job_list, PageModel):
+            export_job_list.rows = [cls._build_export_job_model(row) for row in export_job_list.rows]
+            return export_job_list
+
+        return [cls._build_export_job_model(row) for row in export_job_list]
+
+    @classmethod
+    async def expire_export_jobs_services(cls, query_db: AsyncSession, batch_size: int = 100) -> int:
+        """
+        中断长时间未更新的任务，并将导出文件已过期的任务文件移入回收站
+
+        :param query_db: orm对象
+        :param batch_size: 单批处理数量
+        :return: 本批过期任务数量
+        """
+        current_time = datetime.now()
+        stale_time = current_time - timedelta(minutes=AppConfig.app_export_job_stale_minutes)
+        try:
+            stale_count = await ExportJobDao.fail_stale_export_jobs(query_db, stale_time, current_time)
+            await query_db.commit()
+        except Exception:
+            await query_db.rollback()
+            raise
+        if stale_count:
+            logger.warning(f'{stale_count}个异步导出任务长时间未更新进度，已标记为失败')
+
+        export_jobs = await ExportJobDao.get_expired_export_jobs_for_update(query_db, current_time, batch_size)
+        if not export_jobs:
+            await query_db.rollback()
+            return 0
+        file_ids = [export_job.file_id for export_job in export_jobs if export_job.file_id]
+        file_infos = await FileInfoDao.get_file_infos_by_ids_for_update(query_db, file_ids) if file_ids else []
+        try:
+            staged_files = await asyncio.to_thread(FileUtil.stage_file_deletions, file_infos)
+        except (OSError, ValueError):
+            await query_db.rollback()
+            raise
+
+        try:
+            if file_infos:
+                await FileInfoDao.soft_delete_file_infos(
+                    query_db,
+                    [file_info.file_id for file_info in file_infos],
+                    'system',
+                    current_time,
+                )
+            for export_job in export_jobs:
+                export_job.status = 'expired'
+            await query_db.commit()
+        except Exception:
+            await query_db.rollback()
+            await asyncio.to_thread(FileUtil.restore_staged_files, staged_files)
+            raise
+
+        return len(export_jobs)
+
+    @classmethod
+    async def init_expire_export_job_services(cls, query_db: AsyncSession) -> bool:
+        """
+        定时任务表中缺少异步导出文件过期清理任务时补充登记，避免升级安装的导出文件无人清理
+
+        :param query_db: orm对象
+        :return: 是否新增了过期清理任务
+        """
+        if await JobDao.get_job_detail_by_invoke_target(query_db, cls.EXPIRE_JOB_INVOKE_TARGET):
+            return False
+        expire_job = JobModel(
+            jobName='异步导出文件过期清理',
+            jobGroup='default',
+            jobExecutor='default',
+            invokeTarget=cls.EXPIRE_JOB_INVOKE_TARGET,
+            jobKwargs='{"batch_size": 100}',
+            cronExpression='0 0/30 * * * ?',
+            misfirePolicy='3',
+            concurrent='1',
+            status='0',
+            createBy='admin',
+            createTime=datetime.now(),
+            updateBy='',
+            remark='将到期的异步导出文件移入回收站，并中断长时间未更新进度的导出任务',
+        )
+        try:
+            await JobDao.add_job_dao(query_db, expire_job)
+            await query_db.commit()
+        except Exception:
+            await query_db.rollback()
+            raise
+
+        return True
+
+    @classmethod
+    async def _run_export_job(cls, job_id: str, owner: ExportJobOwner, export_factory: ExportFactory) -> None:
+        """
+        在工作池中执行导出任务，导出数据与任务状态分别使用独立会话，避免进度提交中断服务端游标
+
+        :param job_id: 任务ID
+        :param owner: 任务发起用户
+        :param export_factory: 导出数据流工厂
+        :return: None
+        """
+        export_file: ExportFileResult | None = None
+        try:
+            async with cls._worker_slot(job_id), DataSourceRegistry.session() as job_db:
+                export_job = await ExportJobDao.get_export_job_by_id(job_db, job_id)
+                started = export_job is not None and await ExportJobDao.transition_export_job(
+                    job_db, job_id, ['pending'], status='running', started_time=datetime.now()
+                )
+                await job_db.commit()
+                if not started:
+                    return
+
+                async def on_progress(processed_rows: int) -> None:
+                    updated = await ExportJobDao.transition_export_job(
+                        job_db, job_id, ['running'], processed_rows=processed_rows
+                    )
+                    await job_db.commit()
+                    if not updated:
+                        raise ExportJobCancelledError
+
+                async with DataSourceRegistry.session() as export_db:
+                    chunks = await export_factory(export_db, on_progress)
+                    export_file = await cls._write_export_file(chunks, export_job.export_name, export_job.export_format)
+
+                current_time = datetime.now()
+                file_id = str(uuid.uuid4())
+                await FileInfoDao.add_file_info_dao(
+                    job_db,
+                    FileInfoModel(
+                        fileId=file_id,
+                        originalName=f'{export_job.export_name}.{export_job.export_format}',
+                        storedName=export_file.stored_name,
+                        storageKey=export_file.storage_key,
+                        accessType='private',
+                        uploadUserId=owner.user_id,
+                        ownerUserId=owner.user_id,
+                        deptId=owner.dept_id,
+                        extension=export_job.export_format,
+                        contentType=cls.CONTENT_TYPES.get(export_job.export_format),
+                        fileSize=export_file.file_size,
+                        fileHash=export_file.file_hash,
+                        createBy=owner.user_name,
+                        createTime=current_time,
+                        updateBy=owner.user_name,
+                        updateTime=current_time,
+                    ),
+                )
+                completed = await ExportJobDao.transition_export_job(
+                    job_db,
+                    job_id,
+                    ['running'],
+                    status='completed',
+                    file_id=file_id,
+                    file_size=export_file.file_size,
+                    finished_time=current_time,
+                    expire_time=current_time + await cls._get_file_retention(job_db),
+                )
+                if not completed:
+                    await job_db.rollback()
+                    raise ExportJobCancelledError
+                await job_db.commit()
+                logger.info(f'异步导出任务{job_id}完成，导出文件大小{export_file.file_size}字节')
+        except ExportJobCancelledError:
+            logger.info(f'异步导出任务{job_id}已取消，停止导出')
+            await cls._discard_export_file(export_file)
+        except asyncio.CancelledError:
+            logger.info(f'异步导出任务{job_id}已中止')
+            await cls._discard_export_file(export_file)
+            raise
+        except Exception as exc:
+            logger.exception(f'异步导出任务{job_id}执行失败')
+            await cls._discard_export_file(export_file)
+            await cls._mark_export_job_failed(job_id, f'{exc.__class__.__name__}：导出任务执行失败')
+
+    @classmethod
+    async def shutdown(cls) -> None:
+        """
+        应用关闭时中止本进程执行中与排队中的导出任务，并将任务标记为失败
+
+        :return: None
+        """
+        running_tasks = dict(cls._running_tasks)
+        for task in running_tasks.values():
+            task.cancel()
+        await asyncio.gather(*running_tasks.values(), return_exceptions=True)
+        for job_id in running_tasks:
+            await cls._mark_export_job_failed(job_id, '服务关闭，导出任务已中断')
+        if running_tasks:
+            logger.warning(f'服务关闭，已中断{len(running_tasks)}个异步导出任务')
+
+    @classmethod
+    async def _write_export_file(
+        cls, chunks: AsyncIterator[bytes], export_name: str, export_format: str
+    ) -> ExportFileResult:
+        """
+        将导出数据流写入受保护文件存储并计算摘要
+
+        :param chunks: 导出文件二进制数据流
+        :param export_name: 导出名称
+        :param export_format: 导出格式
+        :return: 导出文件写入结果
+        """
+        now = datetime.now()
+        relative_path = Path(cls.EXPORT_STORAGE_DIR, now.strftime('%Y'), now.strftime('%m'), now.strftime('%d'))
+        dir_path = Path(UploadConfig.PRIVATE_UPLOAD_PATH, relative_path)
+        await asyncio.to_thread(UploadUtil.ensure_directory, dir_path)
+        file_stem = UploadUtil.get_safe_file_stem(export_name)
+        # 导出名称已包含创建时间，追加机器码与随机串避免同一秒内的导出文件重名
+        stored_name = f'{file_stem}_{UploadConfig.UPLOAD_MACHINE}{uuid.uuid4().hex[:8]}.{export_format}'
+        filepath = dir_path / stored_name
+        file_size = 0
+        file_hasher = hashlib.sha256()
+        try:
+            async with aiofiles.open(filepath, 'xb') as target_file:
+                async for chunk in chunks:
+                    file_size += len(chunk)
+                    file_hasher.update(chunk)
+                    await target_file.write(chunk)
+        except BaseException:
+            if await asyncio.to_thread(UploadUtil.check_file_exists, filepath):
+                await asyncio.to_thread(UploadUtil.delete_file, filepath)
+            raise
+
+        return ExportFileResult(
+            filepath=filepath,
+            stored_name=stored_name,
+            storage_key=f'{relative_path.as_posix()}/{stored_name}',
+            file_size=file_size,
+            file_hash=file_hasher.hexdigest(),
+        )
+
+    @classmethod
+    async def _get_file_retention(cls, query_db: AsyncSession) -> timedelta:
+        """
+        获取导出文件保留时长，已启用export_job业务保留策略时以策略为准
+
+        :param query_db: orm对象
+        :return: 保留时长
+        """
+        policy = await FileRetentionPolicyService.get_enabled_file_retention_policy_services(
+            query_db, cls.EXPORT_BUSINESS_TYPE
+        )
+        if policy is not None:
+            return timedelta(days=policy.retention_days)
+
+        return timedelta(hours=AppConfig.app_export_job_file_retention_hours)
+
+    @classmethod
+    async def _get_own_export_job(cls, query_db: AsyncSession, current_user: CurrentUserModel, job_id: str) -> Any:
+        """
+        获取当前用户发起的导出任务
+
+        :param query_db: orm对象
+        :param current_user: 当前用户对象
+        :param job_id: 任务ID
+        :return: 导出任务数据库对象
+        """
+        user = current_user.user
+        if user is None:
+            raise ServiceException(message='无法获取当前用户信息')
+        export_job = await ExportJobDao.get_export_job_by_id(query_db, job_id, user.user_id)
+        if export_job is None:
+            raise ServiceException(message='导出任务不存在')
+
+        return export_job
+
+    @staticmethod
+    def _build_export_job_model(export_job: dict[str, Any]) -> ExportJobModel:
+        """
+        构建导出任务展示模型，已完成的任务附带导出文件下载路径
+
+        :param export_job: 驼峰命名的导出任务数据
+        :return: 导出任务展示模型
+        """
+        export_job_model = ExportJobModel.model_validate(export_job)
+        if export_job_model.status == 'completed' and export_job_model.file_id:
+            file_name = quote(f'{export_job_model.export_name}.{export_job_model.export_format}')
+            export_job_model.download_url = f'/common/files/{export_job_model.file_id}/download/{file_name}'
+
+        return export_job_model
+
+    @staticmethod
+    async def _discard_export_file(export_file: ExportFileResult | None) -> None:
+        """
+        删除未登记的导出文件
+
+        :param export_file: 导出文件写入结果
+        :return: None
+        """
+        if export_file is not None and await asyncio.to_thread(UploadUtil.check_file_exists, export_file.filepath):
+            await asyncio.to_thread(UploadUtil.delete_file, export_file.filepath)
+
+    @classmethod
+    async def _mark_export_job_failed(cls, job_id: str, error_message: str) -> None:
+        """
+        在独立会话中将导出任务标记为失败
+
+        :param job_id: 任务ID
+        :param error_message: 失败原因
+        :return: None
+        """
+        async with DataSourceRegistry.session() as query_db:
+            try:
+                await ExportJobDao.transition_export_job(
+                    query_db,
+                    job_id,
+                    ExportJobDao.ACTIVE_STATUSES,
+                    status='failed',
+                    finished_time=datetime.now(),
+                    error_message=error_message,
+                )
+                await query_db.commit()
+            except Exception:
+                await query_db.rollback()
+                logger.exception(f'异步导出任务{job_id}失败状态更新失败')
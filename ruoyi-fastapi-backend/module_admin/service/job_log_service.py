@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import Request
@@ -8,7 +9,7 @@ from common.vo import CrudResponseModel, PageModel
 from module_admin.dao.job_log_dao import JobLogDao
 from module_admin.entity.vo.job_vo import DeleteJobLogModel, JobLogModel, JobLogPageQueryModel
 from module_admin.service.dict_service import DictDataService
-from utils.excel_util import ExcelUtil
+from utils.excel_util import ExcelUtil, ExportFormat, ExportProgressCallback
 
 
 class JobLogService:
@@ -51,6 +52,27 @@ class JobLogService:
 
         return CrudResponseModel(**result)
 
+    @classmethod
+    async def add_job_log_batch_services(
+        cls, query_db: AsyncSession, job_log_list: list[JobLogModel], chunk_size: int = 1000
+    ) -> int:
+        """
+        批量新增定时任务日志信息service
+
+        :param query_db: orm对象
+        :param job_log_list: 定时任务日志对象列表
+        :param chunk_size: 单次批量写入最多包含的行数
+        :return: 批量写入执行次数
+        """
+        try:
+            statement_count = await JobLogDao.add_job_log_batch_dao(query_db, job_log_list, chunk_size)
+            await query_db.commit()
+        except Exception as e:
+            await query_db.rollback()
+            raise e
+
+        return statement_count
+
     @classmethod
     async def delete_job_log_services(cls, query_db: AsyncSession, page_object: DeleteJobLogModel) -> CrudResponseModel:
         """
@@ -93,13 +115,22 @@ class JobLogService:
         return CrudResponseModel(**result)
 
     @staticmethod
-    async def export_job_log_list_services(request: Request, job_log_list: list) -> bytes:
+    async def export_job_log_list_services(
+        request: Request,
+        query_db: AsyncSession,
+        query_object: JobLogPageQueryModel,
+        export_format: ExportFormat = 'xlsx',
+        on_progress: ExportProgressCallback | None = None,
+    ) -> AsyncIterator[bytes]:
         """
         导出定时任务日志信息service
 
         :param request: Request对象
-        :param job_log_list: 定时任务日志信息列表
-        :return: 定时任务日志信息对应excel的二进制数据
+        :param query_db: orm对象
+        :param query_object: 查询参数对象
+        :param export_format: 导出格式
+        :param on_progress: 导出进度回调
+        :return: 定时任务日志信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -122,25 +153,19 @@ class JobLogService:
         job_group_list = await DictDataService.query_dict_data_list_from_cache_services(
             request.app.state.redis, dict_type='sys_job_group'
         )
-        job_group_option = [{'label': item.get('dictLabel'), 'value': item.get('dictValue')} for item in job_group_list]
-        job_group_option_dict = {item.get('value'): item for item in job_group_option}
         job_executor_list = await DictDataService.query_dict_data_list_from_cache_services(
             request.app.state.redis, dict_type='sys_job_executor'
         )
-        job_executor_option = [
-            {'label': item.get('dictLabel'), 'value': item.get('dictValue')} for item in job_executor_list
-        ]
-        job_executor_option_dict = {item.get('value'): item for item in job_executor_option}
-
-        for item in job_log_list:
-            if item.get('status') == '0':
-                item['status'] = '正常'
-            else:
-                item['status'] = '暂停'
-            if str(item.get('jobGroup')) in job_group_option_dict:
-                item['jobGroup'] = job_group_option_dict.get(str(item.get('jobGroup'))).get('label')
-            if str(item.get('jobExecutor')) in job_executor_option_dict:
-                item['jobExecutor'] = job_executor_option_dict.get(str(item.get('jobExecutor'))).get('label')
-        binary_data = ExcelUtil.export_list2excel(job_log_list, mapping_dict)
-
-        return binary_data
+        formatters = {
+            'status': ExcelUtil.choice_formatter({'0': '正常'}, default='暂停'),
+            'jobGroup': ExcelUtil.dict_label_formatter(job_group_list),
+            'jobExecutor': ExcelUtil.dict_label_formatter(job_executor_list),
+        }
+
+        return ExcelUtil.stream_export(
+            JobLogDao.stream_job_log_list(query_db, query_object),
+            mapping_dict,
+            formatters,
+            export_format=export_format,
+            on_progress=on_progress,
+        )
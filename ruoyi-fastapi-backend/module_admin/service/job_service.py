@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 from fastapi import Request
@@ -208,13 +209,13 @@ class JobService:
         return result
 
     @staticmethod
-    async def export_job_list_services(request: Request, job_list: list) -> bytes:
+    async def export_job_list_services(request: Request, job_list: list) -> AsyncIterator[bytes]:
         """
         导出定时任务信息service
 
         :param request: Request对象
         :param job_list: 定时任务信息列表
-        :return: 定时任务信息对应excel的二进制数据
+        :return: 定时任务信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -239,35 +240,15 @@ class JobService:
         job_group_list = await DictDataService.query_dict_data_list_from_cache_services(
             request.app.state.redis, dict_type='sys_job_group'
         )
-        job_group_option = [{'label': item.get('dictLabel'), 'value': item.get('dictValue')} for item in job_group_list]
-        job_group_option_dict = {item.get('value'): item for item in job_group_option}
         job_executor_list = await DictDataService.query_dict_data_list_from_cache_services(
             request.app.state.redis, dict_type='sys_job_executor'
         )
-        job_executor_option = [
-            {'label': item.get('dictLabel'), 'value': item.get('dictValue')} for item in job_executor_list
-        ]
-        job_executor_option_dict = {item.get('value'): item for item in job_executor_option}
-
-        for item in job_list:
-            if item.get('status') == '0':
-                item['status'] = '正常'
-            else:
-                item['status'] = '暂停'
-            if str(item.get('jobGroup')) in job_group_option_dict:
-                item['jobGroup'] = job_group_option_dict.get(str(item.get('jobGroup'))).get('label')
-            if str(item.get('jobExecutor')) in job_executor_option_dict:
-                item['jobExecutor'] = job_executor_option_dict.get(str(item.get('jobExecutor'))).get('label')
-            if item.get('misfirePolicy') == '1':
-                item['misfirePolicy'] = '立即执行'
-            elif item.get('misfirePolicy') == '2':
-                item['misfirePolicy'] = '执行一次'
-            else:
-                item['misfirePolicy'] = '放弃执行'
-            if item.get('concurrent') == '0':
-                item['concurrent'] = '允许'
-            else:
-                item['concurrent'] = '禁止'
-        binary_data = ExcelUtil.export_list2excel(job_list, mapping_dict)
+        formatters = {
+            'status': ExcelUtil.choice_formatter({'0': '正常'}, default='暂停'),
+            'jobGroup': ExcelUtil.dict_label_formatter(job_group_list),
+            'jobExecutor': ExcelUtil.dict_label_formatter(job_executor_list),
+            'misfirePolicy': ExcelUtil.choice_formatter({'1': '立即执行', '2': '执行一次'}, default='放弃执行'),
+            'concurrent': ExcelUtil.choice_formatter({'0': '允许'}, default='禁止'),
+        }
 
-        return binary_data
+        return ExcelUtil.stream_export(job_list, mapping_dict, formatters)
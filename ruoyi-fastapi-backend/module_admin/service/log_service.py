@@ -3,6 +3,7 @@ import hashlib
 import json
 import os
 import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import Any
 
 from fastapi import Request
@@ -27,7 +28,7 @@ from module_admin.entity.vo.log_vo import (
     UnlockUser,
 )
 from module_admin.service.dict_service import DictDataService
-from utils.excel_util import ExcelUtil
+from utils.excel_util import ExcelUtil, ExportFormat, ExportProgressCallback
 from utils.log_util import LogSanitizer, logger
 
 
@@ -110,13 +111,23 @@ class OperationLogService:
             raise e
 
     @classmethod
-    async def export_operation_log_list_services(cls, request: Request, operation_log_list: list) -> bytes:
+    async def export_operation_log_list_services(
+        cls,
+        request: Request,
+        query_db: AsyncSession,
+        query_object: OperLogPageQueryModel,
+        export_format: ExportFormat = 'xlsx',
+        on_progress: ExportProgressCallback | None = None,
+    ) -> AsyncIterator[bytes]:
         """
         导出操作日志信息service
 
         :param request: Request对象
-        :param operation_log_list: 操作日志信息列表
-        :return: 操作日志信息对应excel的二进制数据
+        :param query_db: orm对象
+        :param query_object: 查询参数对象
+        :param export_format: 导出格式
+        :param on_progress: 导出进度回调
+        :return: 操作日志信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -141,21 +152,18 @@ class OperationLogService:
         operation_type_list = await DictDataService.query_dict_data_list_from_cache_services(
             request.app.state.redis, dict_type='sys_oper_type'
         )
-        operation_type_option = [
-            {'label': item.get('dictLabel'), 'value': item.get('dictValue')} for item in operation_type_list
-        ]
-        operation_type_option_dict = {item.get('value'): item for item in operation_type_option}
-
-        for item in operation_log_list:
-            if item.get('status') == 0:
-                item['status'] = '成功'
-            else:
-                item['status'] = '失败'
-            if str(item.get('businessType')) in operation_type_option_dict:
-                item['businessType'] = operation_type_option_dict.get(str(item.get('businessType'))).get('label')
-        binary_data = ExcelUtil.export_list2excel(operation_log_list, mapping_dict)
+        formatters = {
+            'status': ExcelUtil.choice_formatter({0: '成功'}, default='失败'),
+            'businessType': ExcelUtil.dict_label_formatter(operation_type_list),
+        }
 
-        return binary_data
+        return ExcelUtil.stream_export(
+            OperationLogDao.stream_operation_log_list(query_db, query_object),
+            mapping_dict,
+            formatters,
+            export_format=export_format,
+            on_progress=on_progress,
+        )
 
 
 class LoginLogService:
@@ -245,12 +253,20 @@ class LoginLogService:
         raise ServiceException(message='该用户未锁定')
 
     @staticmethod
-    async def export_login_log_list_services(login_log_list: list) -> bytes:
+    async def export_login_log_list_services(
+        query_db: AsyncSession,
+        query_object: LoginLogPageQueryModel,
+        export_format: ExportFormat = 'xlsx',
+        on_progress: ExportProgressCallback | None = None,
+    ) -> AsyncIterator[bytes]:
         """
         导出登录日志信息service
 
-        :param login_log_list: 登录日志信息列表
-        :return: 登录日志信息对应excel的二进制数据
+        :param query_db: orm对象
+        :param query_object: 查询参数对象
+        :param export_format: 导出格式
+        :param on_progress: 导出进度回调
+        :return: 登录日志信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -264,15 +280,15 @@ class LoginLogService:
             'msg': '操作信息',
             'loginTime': '登录日期',
         }
-
-        for item in login_log_list:
-            if item.get('status') == '0':
-                item['status'] = '成功'
-            else:
-                item['status'] = '失败'
-        binary_data = ExcelUtil.export_list2excel(login_log_list, mapping_dict)
-
-        return binary_data
+        formatters = {'status': ExcelUtil.choice_formatter({'0': '成功'}, default='失败')}
+
+        return ExcelUtil.stream_export(
+            LoginLogDao.stream_login_log_list(query_db, query_object),
+            mapping_dict,
+            formatters,
+            export_format=export_format,
+            on_progress=on_progress,
+        )
 
 
 class LogQueueService:
@@ -350,6 +366,18 @@ class LogQueueService:
         payload = LogSanitizer.sanitize_data(operation_log.model_dump(by_alias=True, exclude_none=True))
         await cls._xadd_event(request.app.state.redis, 'operation', payload, source)
 
+    @classmethod
+    async def enqueue_raw_operation_log(cls, request: Request, raw_event: dict[str, Any], source: str) -> None:
+        """
+        操作日志原始事件入队，脱敏与富化由日志消费者完成
+
+        :param request: Request对象
+        :param raw_event: 操作日志原始采集数据
+        :param source: 日志来源
+        :return: None
+        """
+        await cls._xadd_event(request.app.state.redis, 'operation_raw', raw_event, source)
+
     @classmethod
     async def enqueue_file_access_log(cls, request: Request, file_access_log: FileAccessLogModel, source: str) -> None:
         """
@@ -364,11 +392,42 @@ class LogQueueService:
         await cls._xadd_event(request.app.state.redis, 'file_access', payload, source)
 
 
+RawOperationLogBuilder = Callable[[aioredis.Redis, list[dict[str, Any]]], Awaitable[list[OperLogModel]]]
+
+
 class LogAggregatorService:
     """
     日志聚合消费服务
     """
 
+    _EVENT_TYPES = ('login', 'operation', 'operation_raw', 'file_access')
+    _raw_operation_log_builder: RawOperationLogBuilder | None = None
+
+    @classmethod
+    def register_raw_operation_log_builder(cls, builder: RawOperationLogBuilder) -> None:
+        """
+        注册操作日志原始事件富化方法，由Log装饰器所在模块在导入时注册
+
+        :param builder: 原始事件富化方法，接收Redis连接与原始事件列表，返回操作日志模型列表
+        :return: None
+        """
+        cls._raw_operation_log_builder = builder
+
+    @classmethod
+    async def _build_raw_operation_logs(
+        cls, redis: aioredis.Redis, raw_events: list[dict[str, Any]]
+    ) -> list[OperLogModel]:
+        """
+        批量富化操作日志原始事件
+
+        :param redis: Redis连接对象
+        :param raw_events: 原始事件列表
+        :return: 操作日志模型列表
+        """
+        if cls._raw_operation_log_builder is None:
+            raise RuntimeError('操作日志原始事件富化方法未注册')
+        return await cls._raw_operation_log_builder(redis, raw_events)
+
     @classmethod
     async def _ensure_group(cls, redis: aioredis.Redis) -> None:
         """
@@ -389,31 +448,44 @@ class LogAggregatorService:
                 raise
 
     @classmethod
-    async def _acquire_dedup(cls, redis: aioredis.Redis, event_id: str) -> bool:
+    def _get_dedup_key(cls, event_id: str) -> str:
         """
-        获取去重锁
+        获取事件去重Key
 
-        :param redis: Redis连接对象
         :param event_id: 事件唯一标识
-        :return: 是否获取成功
+        :return: 去重Key
         """
-        if not event_id:
-            return False
-        key = f'{LogConfig.log_stream_dedup_prefix}:{event_id}'
-        return await redis.set(key, '1', nx=True, ex=LogConfig.log_stream_dedup_ttl)
+        return f'{LogConfig.log_stream_dedup_prefix}:{event_id}'
 
     @classmethod
-    async def _release_dedup(cls, redis: aioredis.Redis, event_id: str) -> None:
+    async def _acquire_dedup_batch(cls, redis: aioredis.Redis, event_ids: list[str]) -> list[bool]:
         """
-        释放去重锁
+        通过一次管道往返批量获取去重锁
 
         :param redis: Redis连接对象
-        :param event_id: 事件唯一标识
+        :param event_ids: 事件唯一标识列表
+        :return: 与事件唯一标识一一对应的获取结果
+        """
+        if not event_ids:
+            return []
+        async with redis.pipeline(transaction=False) as pipe:
+            for event_id in event_ids:
+                pipe.set(cls._get_dedup_key(event_id), '1', nx=True, ex=LogConfig.log_stream_dedup_ttl)
+            results = await pipe.execute()
+        return [bool(result) for result in results]
+
+    @classmethod
+    async def _release_dedup_batch(cls, redis: aioredis.Redis, event_ids: list[str]) -> None:
+        """
+        批量释放去重锁
+
+        :param redis: Redis连接对象
+        :param event_ids: 事件唯一标识列表
         :return: None
         """
-        if not event_id:
+        if not event_ids:
             return
-        await redis.delete(f'{LogConfig.log_stream_dedup_prefix}:{event_id}')
+        await redis.delete(*(cls._get_dedup_key(event_id) for event_id in event_ids))
 
     @classmethod
     async def _claim_pending(cls, redis: aioredis.Redis, consumer_name: str) -> None:
@@ -479,11 +551,40 @@ class LogAggregatorService:
                 logger.error(f'日志聚合消费异常: {exc}')
                 await asyncio.sleep(1)
 
+    @classmethod
+    async def _add_event_logs(
+        cls, redis: aioredis.Redis, session: AsyncSession, event_payloads: dict[str, list[dict[str, Any]]]
+    ) -> None:
+        """
+        按事件类型分组，每组使用多行INSERT批量写入对应日志表
+
+        :param redis: Redis连接对象
+        :param session: 数据库会话
+        :param event_payloads: 按事件类型分组的事件载荷
+        :return: None
+        """
+        chunk_size = LogConfig.log_stream_insert_chunk_size
+        operation_logs = [OperLogModel(**payload) for payload in event_payloads['operation']]
+        if event_payloads['operation_raw']:
+            operation_logs.extend(await cls._build_raw_operation_logs(redis, event_payloads['operation_raw']))
+        if event_payloads['login']:
+            await LoginLogDao.add_login_log_batch_dao(
+                session, [LogininforModel(**payload) for payload in event_payloads['login']], chunk_size
+            )
+        if operation_logs:
+            await OperationLogDao.add_operation_log_batch_dao(session, operation_logs, chunk_size)
+        if event_payloads['file_access']:
+            await FileAccessLogDao.add_file_access_log_batch_dao(
+                session, [FileAccessLogModel(**payload) for payload in event_payloads['file_access']], chunk_size
+            )
+
     @classmethod
     async def _process_messages(cls, redis: aioredis.Redis, stream_name: str, messages: list[tuple[str, dict]]) -> None:
         """
         处理消息并落库
 
+        整批消息的去重锁通过一次管道往返获取，事件按类型分组批量写入，提交后一次性确认整批消息
+
         :param redis: Redis连接对象
         :param stream_name: Stream名称
         :param messages: 消息列表
@@ -491,35 +592,36 @@ class LogAggregatorService:
         """
         if not messages:
             return
-        async with DataSourceRegistry.session() as session:
-            ack_ids: list[str] = []
-            dedup_event_ids: list[str] = []
-            try:
-                for message_id, data in messages:
-                    event_type = data.get('event_type')
-                    event_id = data.get('event_id')
-                    payload_raw = data.get('payload') or '{}'
-                    if event_type not in {'login', 'operation', 'file_access'}:
-                        ack_ids.append(message_id)
-                        continue
-                    acquired = await cls._acquire_dedup(redis, event_id)
-                    if not acquired:
-                        ack_ids.append(message_id)
-                        continue
+        ack_ids: list[str] = []
+        candidates: list[tuple[str, str, str, str]] = []
+        for message_id, data in messages:
+            event_type = data.get('event_type')
+            event_id = data.get('event_id')
+            if event_type not in cls._EVENT_TYPES or not event_id:
+                ack_ids.append(message_id)
+                continue
+            candidates.append((message_id, event_type, event_id, data.get('payload') or '{}'))
+        dedup_event_ids: list[str] = []
+        event_payloads: dict[str, list[dict[str, Any]]] = {event_type: [] for event_type in cls._EVENT_TYPES}
+        try:
+            acquired_list = await cls._acquire_dedup_batch(redis, [candidate[2] for candidate in candidates])
+            for (message_id, event_type, event_id, payload_raw), acquired in zip(
+                candidates, acquired_list, strict=True
+            ):
+                ack_ids.append(message_id)
+                if acquired:
                     dedup_event_ids.append(event_id)
-                    payload = json.loads(payload_raw)
-                    if event_type == 'login':
-                        await LoginLogDao.add_login_log_dao(session, LogininforModel(**payload))
-                    elif event_type == 'operation':
-                        await OperationLogDao.add_operation_log_dao(session, OperLogModel(**payload))
-                    elif event_type == 'file_access':
-                        await FileAccessLogDao.add_file_access_log_dao(session, FileAccessLogModel(**payload))
-                    ack_ids.append(message_id)
-                if ack_ids:
-                    await session.commit()
-                    await redis.xack(stream_name, LogConfig.log_stream_group, *ack_ids)
-            except Exception:
-                await session.rollback()
-                for event_id in dedup_event_ids:
-                    await cls._release_dedup(redis, event_id)
-                raise
+                    event_payloads[event_type].append(json.loads(payload_raw))
+            if dedup_event_ids:
+                async with DataSourceRegistry.session() as session:
+                    try:
+                        await cls._add_event_logs(redis, session, event_payloads)
+                        await session.commit()
+                    except Exception:
+                        await session.rollback()
+                        raise
+            if ack_ids:
+                await redis.xack(stream_name, LogConfig.log_stream_group, *ack_ids)
+        except Exception:
+            await cls._release_dedup_batch(redis, dedup_event_ids)
+            raise
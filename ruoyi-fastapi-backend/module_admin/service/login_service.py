@@ -13,7 +13,7 @@ from common.constant import CommonConstant, MenuConstant
 from common.context import RequestContext
 from common.enums import PasswordCharacterType, RedisInitKeyConfig
 from common.vo import CrudResponseModel
-from config.env import AppConfig, JwtConfig
+from config.env import AppConfig
 from exceptions.exception import AuthException, LoginException, ServiceException
 from module_admin.dao.login_dao import login_by_account
 from module_admin.dao.user_dao import UserDao
@@ -22,6 +22,10 @@ from module_admin.entity.do.menu_do import SysMenu
 from module_admin.entity.do.user_do import SysUser
 from module_admin.entity.vo.login_vo import MenuTreeModel, MetaModel, RouterModel, SmsCode, UserLogin, UserRegister
 from module_admin.entity.vo.user_vo import AddUserModel, CurrentUserModel, ResetUserModel, TokenData, UserInfoModel
+from module_admin.service.config_service import ConfigService
+from module_admin.service.near_cache_service import SysNearCacheService
+from module_admin.service.online_service import OnlineService
+from module_admin.service.user_auth_cache_service import PermissionEpochs, UserAuthCacheService
 from module_admin.service.user_service import UserService
 from utils.client_ip_util import ClientIPUtil
 from utils.common_util import CamelCaseUtil
@@ -68,6 +72,10 @@ class LoginService:
     登录模块服务层
     """
 
+    _INIT_PASSWORD_MODIFY_KEY = 'sys.account.initPasswordModify'
+    _PASSWORD_VALIDATE_DAYS_KEY = 'sys.account.passwordValidateDays'
+    _ACCOUNT_CHRTYPE_KEY = 'sys.account.chrtype'
+
     @classmethod
     async def authenticate_user(
         cls, request: Request, query_db: AsyncSession, login_user: UserLogin
@@ -105,7 +113,7 @@ class LoginService:
         if not user:
             logger.warning('用户不存在')
             raise LoginException(data='', message='用户不存在')
-        if not PwdUtil.verify_password(login_user.password, user[0].password):
+        if not await PwdUtil.verify_password_async(login_user.password, user[0].password):
             cache_password_error_count = await request.app.state.redis.get(
                 f'{RedisInitKeyConfig.PASSWORD_ERROR_COUNT.key}:{login_user.user_name}'
             )
@@ -154,7 +162,7 @@ class LoginService:
         user = await UserDao.get_user_by_name(query_db, current_user.user.user_name)
         if not user:
             raise ServiceException(message='服务器超时，请重新登录')
-        if not PwdUtil.verify_password(password, user.password):
+        if not await PwdUtil.verify_password_async(password, user.password):
             raise ServiceException(message='密码错误，请重新输入')
 
         return True
@@ -167,7 +175,9 @@ class LoginService:
         :param request: Request对象
         :return: 校验结果
         """
-        black_ip_value = await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.login.blackIPList')
+        black_ip_value = await ConfigService.query_config_list_from_cache_services(
+            request.app.state.redis, 'sys.login.blackIPList'
+        )
         black_ip_list = black_ip_value.split(',') if black_ip_value else []
         if ClientIPUtil.get_client_ip(request) in black_ip_list:
             logger.warning('当前IP禁止登录')
@@ -241,66 +251,106 @@ class LoginService:
         except (TypeError, ValueError) as e:
             logger.warning('用户token已失效，请重新登录')
             raise AuthException(data='', message='用户token已失效，请重新登录') from e
-        query_user = await UserDao.get_user_by_id(query_db, user_id=token_data.user_id)
+        redis = request.app.state.redis
+        # app_same_time_login为False时同一账号同一时间只能登录一次，令牌按用户id存储
+        token_key = (
+            f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}'
+            if AppConfig.app_same_time_login
+            else f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_data.user_id}'
+        )
+        # 令牌校验与续期、权限版本号及进程内未缓存的参数配置在一次往返中读取
+        epoch_keys = (
+            UserAuthCacheService.get_permission_epoch_keys(token_data.user_id)
+            if AppConfig.app_user_auth_cache_enabled
+            else []
+        )
+        config_values, missing_config_keys, config_version = SysNearCacheService.get_local_many(
+            [
+                ConfigService.get_config_cache_key(config_key)
+                for config_key in (
+                    cls._INIT_PASSWORD_MODIFY_KEY,
+                    cls._PASSWORD_VALIDATE_DAYS_KEY,
+                    cls._ACCOUNT_CHRTYPE_KEY,
+                )
+            ]
+        )
+        extra_values = await OnlineService.validate_online_session(
+            redis,
+            token_key,
+            token,
+            session_id if AppConfig.app_same_time_login else str(token_data.user_id),
+            [*epoch_keys, *missing_config_keys],
+        )
+        if extra_values is None:
+            logger.warning('用户token已失效，请重新登录')
+            raise AuthException(data='', message='用户token已失效，请重新登录')
+        loaded_config_values = dict(zip(missing_config_keys, extra_values[len(epoch_keys) :], strict=True))
+        SysNearCacheService.set_loaded_many(config_version, loaded_config_values)
+        config_values.update(loaded_config_values)
+        epochs = UserAuthCacheService.parse_permission_epochs(extra_values[: len(epoch_keys)]) if epoch_keys else None
+
+        current_user = await cls._get_current_user_snapshot(redis, token_data.user_id, query_db, epochs)
+        current_user.is_default_modify_pwd = cls.__init_password_is_modify(
+            config_values[ConfigService.get_config_cache_key(cls._INIT_PASSWORD_MODIFY_KEY)],
+            current_user.user.pwd_update_date,
+        )
+        current_user.is_password_expired = cls.__password_is_expired(
+            config_values[ConfigService.get_config_cache_key(cls._PASSWORD_VALIDATE_DAYS_KEY)],
+            current_user.user.pwd_update_date,
+        )
+        current_user.pwd_chrtype = config_values[ConfigService.get_config_cache_key(cls._ACCOUNT_CHRTYPE_KEY)] or '0'
+        # 设置当前用户信息到上下文
+        RequestContext.set_current_user(current_user)
+        return current_user
+
+    @classmethod
+    async def _get_current_user_snapshot(
+        cls, redis: Any, user_id: int, query_db: AsyncSession, epochs: PermissionEpochs | None
+    ) -> CurrentUserModel:
+        """
+        获取用户权限快照，命中缓存时不访问数据库
+
+        :param redis: Redis连接对象
+        :param user_id: 用户id
+        :param query_db: orm对象
+        :param epochs: 加载数据前读取的权限版本号，未启用权限快照缓存时为None
+        :return: 不含请求级提醒信息的当前用户信息对象
+        :raise: 令牌异常AuthException
+        """
+        if epochs is not None:
+            # 版本号在加载数据前读取，加载期间发生变更时写入的快照版本已过期，不会被后续请求命中
+            current_user = await UserAuthCacheService.get_user_snapshot(redis, user_id, epochs)
+            if current_user is not None:
+                return current_user
+        query_user = await UserDao.get_user_auth_info_by_id(query_db, user_id=user_id)
         if query_user.get('user_basic_info') is None:
             logger.warning('用户token不合法')
             raise AuthException(data='', message='用户token不合法')
-        if AppConfig.app_same_time_login:
-            redis_token = await request.app.state.redis.get(f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}')
+        role_id_list = [item.role_id for item in query_user.get('user_role_info')]
+        if 1 in role_id_list:  # noqa: SIM108
+            permissions = ['*:*:*']
         else:
-            # 此方法可实现同一账号同一时间只能登录一次
-            redis_token = await request.app.state.redis.get(
-                f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{query_user.get("user_basic_info").user_id}'
-            )
-        if token == redis_token:
-            if AppConfig.app_same_time_login:
-                await request.app.state.redis.set(
-                    f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{session_id}',
-                    redis_token,
-                    ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes),
-                )
-            else:
-                await request.app.state.redis.set(
-                    f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{query_user.get("user_basic_info").user_id}',
-                    redis_token,
-                    ex=timedelta(minutes=JwtConfig.jwt_redis_expire_minutes),
-                )
+            permissions = query_user.get('user_perms')
+        post_ids = ','.join(query_user.get('user_post_ids'))
+        role_ids = ','.join([str(row.role_id) for row in query_user.get('user_role_info')])
+        roles = [row.role_key for row in query_user.get('user_role_info')]
+        current_user = CurrentUserModel(
+            permissions=permissions,
+            roles=roles,
+            user=UserInfoModel(
+                **CamelCaseUtil.transform_result(query_user.get('user_basic_info')),
+                postIds=post_ids,
+                roleIds=role_ids,
+                dept=CamelCaseUtil.transform_result(query_user.get('user_dept_info')),
+                role=CamelCaseUtil.transform_result(query_user.get('user_role_info')),
+            ),
+        )
+        # 当前用户信息不携带密码，保证缓存命中与未命中时返回一致
+        current_user.user.password = None
+        if epochs is not None:
+            await UserAuthCacheService.set_user_snapshot(redis, user_id, epochs, current_user)
 
-            role_id_list = [item.role_id for item in query_user.get('user_role_info')]
-            if 1 in role_id_list:  # noqa: SIM108
-                permissions = ['*:*:*']
-            else:
-                permissions = [row.perms for row in query_user.get('user_menu_info')]
-            post_ids = ','.join([str(row.post_id) for row in query_user.get('user_post_info')])
-            role_ids = ','.join([str(row.role_id) for row in query_user.get('user_role_info')])
-            roles = [row.role_key for row in query_user.get('user_role_info')]
-            is_default_modify_pwd = await cls.__init_password_is_modify(
-                request, query_user.get('user_basic_info').pwd_update_date
-            )
-            is_password_expired = await cls.__password_is_expired(
-                request, query_user.get('user_basic_info').pwd_update_date
-            )
-            pwd_chrtype = await cls.get_sys_account_chrtype(request)
-
-            current_user = CurrentUserModel(
-                permissions=permissions,
-                roles=roles,
-                user=UserInfoModel(
-                    **CamelCaseUtil.transform_result(query_user.get('user_basic_info')),
-                    postIds=post_ids,
-                    roleIds=role_ids,
-                    dept=CamelCaseUtil.transform_result(query_user.get('user_dept_info')),
-                    role=CamelCaseUtil.transform_result(query_user.get('user_role_info')),
-                ),
-                pwdChrtype=pwd_chrtype,
-                isDefaultModifyPwd=is_default_modify_pwd,
-                isPasswordExpired=is_password_expired,
-            )
-            # 设置当前用户信息到上下文
-            RequestContext.set_current_user(current_user)
-            return current_user
-        logger.warning('用户token已失效，请重新登录')
-        raise AuthException(data='', message='用户token已失效，请重新登录')
+        return current_user
 
     @classmethod
     async def get_sys_account_chrtype(cls, request: Request) -> str:
@@ -310,36 +360,32 @@ class LoginService:
         :param request: Request对象
         :return: 密码字符范围配置
         """
-        pwd_chrtype = await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.chrtype')
+        pwd_chrtype = await ConfigService.query_config_list_from_cache_services(
+            request.app.state.redis, cls._ACCOUNT_CHRTYPE_KEY
+        )
 
         return pwd_chrtype or '0'
 
     @classmethod
-    async def __init_password_is_modify(cls, request: Request, pwd_update_date: datetime) -> bool:
+    def __init_password_is_modify(cls, init_password_is_modify: str | None, pwd_update_date: datetime) -> bool:
         """
         判断当前用户是否初始密码登录
 
-        :param request: Request对象
+        :param init_password_is_modify: 初始密码修改策略配置
         :param pwd_update_date: 密码最后更新时间
         :return: 是否初始密码登录
         """
-        init_password_is_modify = await request.app.state.redis.get(
-            f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.initPasswordModify'
-        )
         return init_password_is_modify == '1' and pwd_update_date is None
 
     @classmethod
-    async def __password_is_expired(cls, request: Request, pwd_update_date: datetime) -> bool:
+    def __password_is_expired(cls, password_validate_days: str | None, pwd_update_date: datetime) -> bool:
         """
         判断当前用户密码是否过期
 
-        :param request: Request对象
+        :param password_validate_days: 密码有效天数配置
         :param pwd_update_date: 密码最后更新时间
         :return: 密码是否过期
         """
-        password_validate_days = await request.app.state.redis.get(
-            f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.passwordValidateDays'
-        )
         if password_validate_days and int(password_validate_days) > 0:
             if pwd_update_date is None:
                 return True
@@ -357,15 +403,7 @@ class LoginService:
         :param query_db: orm对象
         :return: 当前用户路由信息对象
         """
-        query_user = await UserDao.get_user_by_id(query_db, user_id=user_id)
-        user_router_menu = sorted(
-            [
-                row
-                for row in query_user.get('user_menu_info')
-                if row.menu_type in [MenuConstant.TYPE_DIR, MenuConstant.TYPE_MENU]
-            ],
-            key=lambda x: x.order_num,
-        )
+        user_router_menu = await UserDao.get_user_router_menus_by_id(query_db, user_id=user_id)
         menus = cls.__generate_menus(MenuConstant.ROOT_ID, user_router_menu)
         user_router = cls.__generate_user_router_menu(menus)
         return [router.model_dump(exclude_unset=True, by_alias=True) for router in user_router]
@@ -470,10 +508,15 @@ class LoginService:
         :return: 注册结果
         """
         register_enabled = (
-            await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.registerUser') == 'true'
+            await ConfigService.query_config_list_from_cache_services(
+                request.app.state.redis, 'sys.account.registerUser'
+            )
+            == 'true'
         )
         captcha_enabled = (
-            await request.app.state.redis.get(f'{RedisInitKeyConfig.SYS_CONFIG.key}:sys.account.captchaEnabled')
+            await ConfigService.query_config_list_from_cache_services(
+                request.app.state.redis, 'sys.account.captchaEnabled'
+            )
             == 'true'
         )
         if user_register.password == user_register.confirm_password:
@@ -492,7 +535,7 @@ class LoginService:
                 add_user = AddUserModel(
                     userName=user_register.username,
                     nickName=user_register.username,
-                    password=PwdUtil.get_password_hash(user_register.password),
+                    password=await PwdUtil.get_password_hash_async(user_register.password),
                     pwdUpdateDate=datetime.now(),
                 )
                 result = await UserService.add_user_services(query_db, add_user)
@@ -546,7 +589,7 @@ class LoginService:
             await UserService.validate_password_services(
                 request.app.state.redis, forget_user.password, PasswordCharacterType.DEFAULT
             )
-            forget_user.password = PwdUtil.get_password_hash(forget_user.password)
+            forget_user.password = await PwdUtil.get_password_hash_async(forget_user.password)
             forget_user.user_id = (await UserDao.get_user_by_name(query_db, forget_user.user_name)).user_id
             edit_result = await UserService.reset_user_services(query_db, forget_user)
             result = edit_result.dict()
@@ -567,7 +610,7 @@ class LoginService:
         :param token_id: 令牌编号
         :return: 退出登录结果
         """
-        await request.app.state.redis.delete(f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_id}')
+        await OnlineService.remove_online_sessions(request.app.state.redis, [token_id])
         # await request.app.state.redis.delete(f'{current_user.user.user_id}_access_token')
         # await request.app.state.redis.delete(f'{current_user.user.user_id}_session_id')
 
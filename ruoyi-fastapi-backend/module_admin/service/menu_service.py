@@ -12,6 +12,7 @@ from module_admin.entity.do.menu_do import SysMenu
 from module_admin.entity.vo.menu_vo import DeleteMenuModel, MenuModel, MenuQueryModel, MenuSortModel, MenuTreeModel
 from module_admin.entity.vo.role_vo import RoleMenuQueryModel
 from module_admin.entity.vo.user_vo import CurrentUserModel
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
 from utils.common_util import CamelCaseUtil
 from utils.log_util import logger
 from utils.string_util import StringUtil
@@ -152,6 +153,7 @@ class MenuService:
         try:
             await MenuDao.add_menu_dao(query_db, page_object)
             await query_db.commit()
+            await UserAuthCacheService.bump_permission_epoch()
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
             await query_db.rollback()
@@ -180,6 +182,7 @@ class MenuService:
             try:
                 await MenuDao.edit_menu_dao(query_db, edit_menu)
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -204,6 +207,7 @@ class MenuService:
         try:
             await MenuDao.update_menu_sort_dao(query_db, menu_sort_list)
             await query_db.commit()
+            await UserAuthCacheService.bump_permission_epoch()
             return CrudResponseModel(is_success=True, message='保存成功')
         except Exception as exc:
             await query_db.rollback()
@@ -255,6 +259,7 @@ class MenuService:
                         raise ServiceWarning(message='菜单已分配,不允许删除')
                     await MenuDao.delete_menu_dao(query_db, MenuModel(menuId=menu_id))
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
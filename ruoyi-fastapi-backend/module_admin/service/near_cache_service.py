@@ -0,0 +1,229 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from config.env import AppConfig
+from utils.log_util import logger
+
+
+class SysNearCacheService:
+    """
+    参数配置与数据字典进程内近端缓存服务
+
+    缓存从Redis读取并解码后的值，参数配置或数据字典变更、刷新时通过Redis发布订阅通知所有worker失效。
+    仅在订阅连接正常时使用本地缓存，订阅断开期间直接读取Redis，避免错过失效通知后持续返回旧值
+    """
+
+    CHANNEL = 'near_cache:invalidate'
+    _INVALIDATE_ALL = '*'
+    _RECONNECT_DELAY = 5
+    _entries: OrderedDict[str, tuple[int, float, Any]] = OrderedDict()
+    _stats: OrderedDict[str, list[int]] = OrderedDict()
+    _version = 0
+    _listening = False
+
+    @classmethod
+    async def get(
+        cls, redis: aioredis.Redis, cache_key: str, decoder: Callable[[str | None], Any] | None = None
+    ) -> Any:
+        """
+        读取缓存键对应的值，优先使用进程内缓存
+
+        :param redis: Redis连接对象
+        :param cache_key: Redis缓存键
+        :param decoder: Redis原始值解码函数，为None时直接返回原始值
+        :return: 解码后的缓存值，调用方不应修改返回的可变对象
+        """
+        local_values, missing_keys, version = cls.get_local_many([cache_key])
+        if not missing_keys:
+            return local_values[cache_key]
+
+        raw_value = await redis.get(cache_key)
+        value = decoder(raw_value) if decoder is not None else raw_value
+        cls.set_loaded_many(version, {cache_key: value})
+
+        return value
+
+    @classmethod
+    def get_local_many(cls, cache_keys: Sequence[str]) -> tuple[dict[str, Any], list[str], int]:
+        """
+        批量读取进程内缓存，未命中的键由调用方从Redis读取后通过set_loaded_many回填
+
+        :param cache_keys: Redis缓存键列表
+        :return: 命中的缓存值、未命中的缓存键与读取前的失效版本号
+        """
+        # 记录读取前的版本号，读取期间收到失效通知时不写入本地缓存，避免旧值覆盖失效结果
+        version = cls._version
+        local_values: dict[str, Any] = {}
+        missing_keys: list[str] = []
+        now = time.monotonic()
+        for cache_key in cache_keys:
+            entry = cls._entries.get(cache_key) if cls._listening else None
+            if entry is not None and entry[1] > now:
+                cls._entries.move_to_end(cache_key)
+                cls._record(cache_key, hit=True)
+                local_values[cache_key] = entry[2]
+            else:
+                missing_keys.append(cache_key)
+
+        return local_values, missing_keys, version
+
+    @classmethod
+    def set_loaded_many(cls, version: int, values: dict[str, Any]) -> None:
+        """
+        回填从Redis读取的缓存值
+
+        :param version: get_local_many返回的失效版本号
+        :param values: 以缓存键为键的解码后缓存值
+        :return: None
+        """
+        for cache_key, value in values.items():
+            cls._record(cache_key, hit=False)
+            if cls._listening and version == cls._version:
+                cls._set_local(cache_key, version, value)
+
+    @classmethod
+    def _set_local(cls, cache_key: str, version: int, value: Any) -> None:
+        """
+        写入进程内LRU缓存
+
+        :param cache_key: Redis缓存键
+        :param version: 读取时的失效版本号
+        :param value: 解码后的缓存值
+        :return: None
+        """
+        if AppConfig.app_sys_near_cache_size <= 0:
+            return
+        cls._entries[cache_key] = (version, time.monotonic() + AppConfig.app_sys_near_cache_ttl, value)
+        cls._entries.move_to_end(cache_key)
+        while len(cls._entries) > AppConfig.app_sys_near_cache_size:
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    def _record(cls, cache_key: str, hit: bool) -> None:
+        """
+        记录缓存键的命中情况
+
+        :param cache_key: Redis缓存键
+        :param hit: 是否命中进程内缓存
+        :return: None
+        """
+        counters = cls._stats.setdefault(cache_key, [0, 0])
+        counters[0 if hit else 1] += 1
+        cls._stats.move_to_end(cache_key)
+        while len(cls._stats) > max(AppConfig.app_sys_near_cache_size, 1):
+            cls._stats.popitem(last=False)
+
+    @classmethod
+    def get_stats(cls) -> dict[str, dict[str, Any]]:
+        """
+        获取当前worker各缓存键的命中统计
+
+        :return: 以缓存键为键的命中次数、未命中次数与命中率
+        """
+        return {
+            cache_key: {'hits': hits, 'misses': misses, 'hitRatio': round(hits / (hits + misses), 4)}
+            for cache_key, (hits, misses) in sorted(cls._stats.items())
+        }
+
+    @classmethod
+    def invalidate_local(cls, cache_keys: Sequence[str] | None = None) -> None:
+        """
+        失效当前worker的进程内缓存
+
+        :param cache_keys: 需要失效的Redis缓存键，为None时失效全部
+        :return: None
+        """
+        cls._version += 1
+        if cache_keys is None:
+            cls._entries.clear()
+            return
+        for cache_key in cache_keys:
+            cls._entries.pop(cache_key, None)
+
+    @classmethod
+    async def publish_invalidation(cls, redis: aioredis.Redis, cache_keys: Sequence[str] | None = None) -> None:
+        """
+        失效本worker进程内缓存并通知其他worker失效
+
+        :param redis: Redis连接对象
+        :param cache_keys: 需要失效的Redis缓存键，为None时失效全部
+        :return: None
+        """
+        cls.invalidate_local(cache_keys)
+        message = cls._INVALIDATE_ALL if cache_keys is None else json.dumps(list(cache_keys), ensure_ascii=False)
+        try:
+            await redis.publish(cls.CHANNEL, message)
+        except RedisError as e:
+            logger.error(f'发布近端缓存失效通知失败，其他worker将在本地缓存过期后刷新：{e}')
+
+    @classmethod
+    async def replace_namespace(cls, redis: aioredis.Redis, namespace: str, values: dict[str, str]) -> None:
+        """
+        在一个事务管道中全量替换缓存命名空间并通知各worker失效
+
+        新值整体写入并删除已不存在的键，读取方在任意时刻只会看到替换前或替换后的完整缓存，不会读到空缓存
+
+        :param redis: Redis连接对象
+        :param namespace: 缓存命名空间
+        :param values: 替换后的缓存键值
+        :return: None
+        """
+        stale_keys = [key async for key in redis.scan_iter(match=f'{namespace}:*') if key not in values]
+        async with redis.pipeline(transaction=True) as pipe:
+            if values:
+                pipe.mset(values)
+            if stale_keys:
+                pipe.delete(*stale_keys)
+            await pipe.execute()
+        await cls.publish_invalidation(redis)
+
+    @classmethod
+    def _handle_message(cls, message: dict[str, Any]) -> None:
+        """
+        处理订阅通道消息
+
+        :param message: 订阅消息
+        :return: None
+        """
+        message_type = message.get('type')
+        if message_type == 'subscribe':
+            # 订阅建立前可能已错过失效通知，清空后再启用本地缓存
+            cls.invalidate_local()
+            cls._listening = AppConfig.app_sys_near_cache_size > 0
+        elif message_type == 'message':
+            data = message.get('data')
+            cls.invalidate_local(None if data == cls._INVALIDATE_ALL else json.loads(data))
+
+    @classmethod
+    async def listen_invalidation(cls, redis: aioredis.Redis) -> None:
+        """
+        监听近端缓存失效通道，连接异常时停用本地缓存并自动重连
+
+        :param redis: Redis连接对象
+        :return: None
+        """
+        while True:
+            pubsub = redis.pubsub()
+            try:
+                await pubsub.subscribe(cls.CHANNEL)
+                async for message in pubsub.listen():
+                    cls._handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f'❌ 近端缓存失效通知监听异常: {e}，{cls._RECONNECT_DELAY}秒后重试...')
+            finally:
+                cls._listening = False
+                cls.invalidate_local()
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+            await asyncio.sleep(cls._RECONNECT_DELAY)
@@ -1,69 +1,413 @@
+import time
+from collections.abc import Sequence
 from typing import Any
 
 from fastapi import Request
+from pydantic import ValidationError
+from redis import asyncio as aioredis
+from redis.commands.core import AsyncScript
 
 from common.enums import RedisInitKeyConfig
 from common.vo import CrudResponseModel
-from config.env import AppConfig
+from config.env import AppConfig, JwtConfig, TransportCryptoConfig
 from exceptions.exception import AuthException, ServiceException
-from module_admin.entity.vo.online_vo import DeleteOnlineModel, OnlineQueryModel
-from utils.common_util import CamelCaseUtil
+from module_admin.entity.vo.online_vo import DeleteOnlineModel, OnlineModel, OnlineQueryModel
 from utils.jwt_util import JwtUtil
+from utils.log_util import logger
+from utils.transport_crypto_util import TransportSessionUtil
 
 
 class OnlineService:
     """
     在线用户管理模块服务层
+
+    在线会话索引由登录、鉴权续期与退出登录维护：
+    有序集合按令牌过期时间戳记录会话编号，哈希表保存登录时提取的会话信息，
+    并按登录名称与登录IP维护集合索引，查询在线用户时无需遍历令牌键或解码令牌
+    """
+
+    _PRUNE_BATCH_SIZE = 1000
+    # 校验令牌，剩余过期时间低于阈值时续期令牌与在线会话索引，并读取附加缓存键，均在一次往返中完成
+    _VALIDATE_SESSION_SCRIPT = """
+    if redis.call("get", KEYS[1]) ~= ARGV[1] then
+        return {0}
+    end
+    if redis.call("ttl", KEYS[1]) < tonumber(ARGV[3]) then
+        redis.call("expire", KEYS[1], ARGV[2])
+        redis.call("zadd", KEYS[2], "XX", ARGV[4], ARGV[5])
+    end
+    local result = {1}
+    for index = 3, #KEYS do
+        result[#result + 1] = redis.call("get", KEYS[index])
+    end
+    return result
     """
+    _validate_session_script: AsyncScript | None = None
+
+    @classmethod
+    def _get_validate_session_script(cls, redis: aioredis.Redis) -> AsyncScript:
+        """
+        获取会话校验脚本，按SHA1通过EVALSHA执行而不是每次发送脚本全文，Redis中不存在该脚本时自动加载后重试
+
+        :param redis: Redis连接对象
+        :return: 会话校验脚本
+        """
+        if cls._validate_session_script is None:
+            cls._validate_session_script = redis.register_script(cls._VALIDATE_SESSION_SCRIPT)
+        return cls._validate_session_script
+
+    @classmethod
+    def _get_index_key(cls) -> str:
+        """
+        获取在线会话有序集合Key
+
+        :return: 在线会话有序集合Key
+        """
+        return f'{RedisInitKeyConfig.ONLINE_SESSION.key}:index'
+
+    @classmethod
+    def _get_info_key(cls) -> str:
+        """
+        获取在线会话信息哈希表Key
+
+        :return: 在线会话信息哈希表Key
+        """
+        return f'{RedisInitKeyConfig.ONLINE_SESSION.key}:info'
+
+    @classmethod
+    def _get_user_name_key(cls, user_name: str) -> str:
+        """
+        获取登录名称会话集合Key
+
+        :param user_name: 登录名称
+        :return: 登录名称会话集合Key
+        """
+        return f'{RedisInitKeyConfig.ONLINE_SESSION.key}:user:{user_name}'
+
+    @classmethod
+    def _get_ipaddr_key(cls, ipaddr: str) -> str:
+        """
+        获取登录IP会话集合Key
+
+        :param ipaddr: 登录IP
+        :return: 登录IP会话集合Key
+        """
+        return f'{RedisInitKeyConfig.ONLINE_SESSION.key}:ip:{ipaddr}'
+
+    @classmethod
+    def _get_expire_at(cls) -> float:
+        """
+        获取会话过期时间戳
+
+        :return: 会话过期时间戳
+        """
+        return time.time() + JwtConfig.jwt_redis_expire_minutes * 60
+
+    @classmethod
+    async def register_online_session(cls, redis: aioredis.Redis, token_id: str, online_session: OnlineModel) -> None:
+        """
+        登录成功后写入在线会话索引
+
+        :param redis: Redis连接对象
+        :param token_id: 会话编号
+        :param online_session: 在线会话信息
+        :return: None
+        """
+        online_session.token_id = token_id
+        # 不允许同时登录时会话编号为用户id，需先移除同一会话编号旧登录信息对应的集合索引
+        previous_sessions = [] if AppConfig.app_same_time_login else await cls._get_online_sessions(redis, [token_id])
+        async with redis.pipeline(transaction=False) as pipe:
+            if any(previous_sessions):
+                cls._remove_session_index(pipe, [token_id], previous_sessions)
+            pipe.zadd(cls._get_index_key(), {token_id: cls._get_expire_at()})
+            pipe.hset(cls._get_info_key(), token_id, online_session.model_dump_json(by_alias=True))
+            if online_session.user_name:
+                pipe.sadd(cls._get_user_name_key(online_session.user_name), token_id)
+            if online_session.ipaddr:
+                pipe.sadd(cls._get_ipaddr_key(online_session.ipaddr), token_id)
+            await pipe.execute()
+
+    @classmethod
+    async def init_online_session_index(cls, redis: aioredis.Redis) -> None:
+        """
+        应用启动时为尚未建立索引的存量登录令牌补建在线会话索引，索引已存在时直接跳过
+
+        :param redis: Redis连接对象
+        :return: None
+        """
+        if await redis.exists(cls._get_index_key()):
+            return
+        async for token_key in redis.scan_iter(
+            match=f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:*', count=cls._PRUNE_BATCH_SIZE
+        ):
+            online_session = cls._build_online_session_from_token(await redis.get(token_key))
+            if online_session is not None:
+                await cls.register_online_session(redis, token_key.split(':', 1)[1], online_session)
+
+    @classmethod
+    def _build_online_session_from_token(cls, token: str | None) -> OnlineModel | None:
+        """
+        从登录令牌中提取在线会话信息
+
+        :param token: 登录令牌
+        :return: 在线会话信息，令牌无效时返回None
+        """
+        if not token:
+            return None
+        try:
+            payload = JwtUtil.decode(token)
+        except AuthException:
+            return None
+        return cls.build_online_session(payload.get('user_name'), payload.get('dept_name'), payload.get('login_info'))
+
+    @classmethod
+    def build_online_session(
+        cls, user_name: str | None, dept_name: str | None, login_info: dict[str, Any] | None
+    ) -> OnlineModel:
+        """
+        根据登录用户与登录信息构建在线会话信息
+
+        :param user_name: 登录名称
+        :param dept_name: 所属部门
+        :param login_info: 登录信息
+        :return: 在线会话信息
+        """
+        login_info = login_info or {}
+        return OnlineModel(
+            userName=user_name,
+            deptName=dept_name,
+            ipaddr=login_info.get('ipaddr'),
+            loginLocation=login_info.get('loginLocation'),
+            browser=login_info.get('browser'),
+            os=login_info.get('os'),
+            loginTime=login_info.get('loginTime'),
+        )
+
+    @classmethod
+    async def validate_online_session(
+        cls, redis: aioredis.Redis, token_key: str, token: str, token_id: str, extra_keys: Sequence[str] = ()
+    ) -> list[str | None] | None:
+        """
+        校验登录令牌并按需续期，同时读取附加缓存键，全部在一次往返中完成
+
+        令牌剩余过期时间低于续期阈值时才续期令牌并同步刷新在线会话过期时间
+
+        :param redis: Redis连接对象
+        :param token_key: 登录令牌Key
+        :param token: 登录令牌
+        :param token_id: 会话编号
+        :param extra_keys: 需要一并读取的缓存键
+        :return: 令牌有效时返回与附加缓存键一一对应的值，令牌无效时返回None
+        """
+        result = await cls._get_validate_session_script(redis)(
+            keys=[token_key, cls._get_index_key(), *extra_keys],
+            args=[
+                token,
+                JwtConfig.jwt_redis_expire_minutes * 60,
+                JwtConfig.jwt_redis_refresh_threshold_minutes * 60,
+                cls._get_expire_at(),
+                token_id,
+            ],
+            client=redis,
+        )
+        if not result or int(result[0]) != 1:
+            return None
+        return list(result[1:])
+
+    @classmethod
+    async def remove_online_sessions(cls, redis: aioredis.Redis, token_ids: list[str]) -> None:
+        """
+        删除登录令牌及对应在线会话索引，启用传输会话模式时同时撤销令牌绑定的传输会话
+
+        :param redis: Redis连接对象
+        :param token_ids: 会话编号列表
+        :return: None
+        """
+        if not token_ids:
+            return
+        token_keys = [f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_id}' for token_id in token_ids]
+        if TransportCryptoConfig.transport_crypto_session_enabled:
+            # 传输会话绑定登录令牌，令牌删除前一并撤销
+            await TransportSessionUtil.revoke_token_sessions(redis, await redis.mget(token_keys))
+        online_sessions = await cls._get_online_sessions(redis, token_ids)
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.delete(*token_keys)
+            cls._remove_session_index(pipe, token_ids, online_sessions)
+            await pipe.execute()
+
+    @classmethod
+    async def remove_online_session_index(cls, redis: aioredis.Redis, token_ids: list[str]) -> None:
+        """
+        登录令牌已被删除时（如缓存监控清除令牌键）移除对应在线会话索引
+
+        :param redis: Redis连接对象
+        :param token_ids: 会话编号列表
+        :return: None
+        """
+        if not token_ids:
+            return
+        online_sessions = await cls._get_online_sessions(redis, token_ids)
+        async with redis.pipeline(transaction=False) as pipe:
+            cls._remove_session_index(pipe, token_ids, online_sessions)
+            await pipe.execute()
 
     @classmethod
-    async def get_online_list_services(cls, request: Request, query_object: OnlineQueryModel) -> list[dict[str, Any]]:
+    async def clear_online_session_index(cls, redis: aioredis.Redis) -> None:
+        """
+        登录令牌命名空间被整体清除时删除全部在线会话索引
+
+        :param redis: Redis连接对象
+        :return: None
+        """
+        index_keys: list[str] = []
+        async for index_key in redis.scan_iter(
+            match=f'{RedisInitKeyConfig.ONLINE_SESSION.key}:*', count=cls._PRUNE_BATCH_SIZE
+        ):
+            index_keys.append(index_key)
+            if len(index_keys) >= cls._PRUNE_BATCH_SIZE:
+                await redis.delete(*index_keys)
+                index_keys = []
+        if index_keys:
+            await redis.delete(*index_keys)
+
+    @classmethod
+    def _remove_session_index(cls, pipe: Any, token_ids: list[str], online_sessions: list[OnlineModel | None]) -> None:
+        """
+        向管道中追加删除在线会话索引的命令
+
+        :param pipe: Redis管道对象
+        :param token_ids: 会话编号列表
+        :param online_sessions: 与会话编号一一对应的在线会话信息
+        :return: None
+        """
+        pipe.zrem(cls._get_index_key(), *token_ids)
+        pipe.hdel(cls._get_info_key(), *token_ids)
+        for token_id, online_session in zip(token_ids, online_sessions, strict=True):
+            if online_session is None:
+                continue
+            if online_session.user_name:
+                pipe.srem(cls._get_user_name_key(online_session.user_name), token_id)
+            if online_session.ipaddr:
+                pipe.srem(cls._get_ipaddr_key(online_session.ipaddr), token_id)
+
+    @classmethod
+    async def _get_online_sessions(cls, redis: aioredis.Redis, token_ids: list[str]) -> list[OnlineModel | None]:
+        """
+        批量获取在线会话信息
+
+        :param redis: Redis连接对象
+        :param token_ids: 会话编号列表
+        :return: 与会话编号一一对应的在线会话信息，不存在或无法解析时为None
+        """
+        if not token_ids:
+            return []
+        online_session_values = await redis.hmget(cls._get_info_key(), token_ids)
+        return [cls._parse_online_session(value) for value in online_session_values]
+
+    @classmethod
+    def _parse_online_session(cls, value: str | None) -> OnlineModel | None:
+        """
+        解析在线会话信息
+
+        :param value: 在线会话信息JSON
+        :return: 在线会话信息，无法解析时返回None
+        """
+        if not value:
+            return None
+        try:
+            return OnlineModel.model_validate_json(value)
+        except ValidationError:
+            # 单个损坏的会话不应影响在线用户列表中的其他会话
+            logger.warning('在线会话信息解析失败，已跳过')
+            return None
+
+    @classmethod
+    async def _prune_expired_sessions(cls, redis: aioredis.Redis) -> None:
+        """
+        清理已过期的在线会话索引
+
+        :param redis: Redis连接对象
+        :return: None
+        """
+        expired_token_ids = await redis.zrangebyscore(
+            cls._get_index_key(), '-inf', time.time(), start=0, num=cls._PRUNE_BATCH_SIZE
+        )
+        if not expired_token_ids:
+            return
+        online_sessions = await cls._get_online_sessions(redis, expired_token_ids)
+        async with redis.pipeline(transaction=False) as pipe:
+            cls._remove_session_index(pipe, expired_token_ids, online_sessions)
+            await pipe.execute()
+
+    @classmethod
+    async def _get_filtered_token_ids(cls, redis: aioredis.Redis, query_object: OnlineQueryModel) -> list[str]:
+        """
+        根据登录名称与登录IP从集合索引中获取会话编号
+
+        :param redis: Redis连接对象
+        :param query_object: 查询参数对象
+        :return: 会话编号列表
+        """
+        filter_keys = []
+        if query_object.user_name:
+            filter_keys.append(cls._get_user_name_key(query_object.user_name))
+        if query_object.ipaddr:
+            filter_keys.append(cls._get_ipaddr_key(query_object.ipaddr))
+        return sorted(await redis.sinter(filter_keys))
+
+    @classmethod
+    def _match_query(cls, online_session: OnlineModel, query_object: OnlineQueryModel) -> bool:
+        """
+        校验在线会话是否符合查询条件，用于剔除集合索引中的过时成员
+
+        :param online_session: 在线会话信息
+        :param query_object: 查询参数对象
+        :return: 校验结果
+        """
+        if query_object.user_name and online_session.user_name != query_object.user_name:
+            return False
+        return not (query_object.ipaddr and online_session.ipaddr != query_object.ipaddr)
+
+    @classmethod
+    async def get_online_list_services(
+        cls, request: Request, query_object: OnlineQueryModel
+    ) -> tuple[list[OnlineModel], int]:
         """
         获取在线用户表信息service
 
         :param request: Request对象
         :param query_object: 查询参数对象
-        :return: 在线用户列表信息
-        """
-        access_token_keys = await request.app.state.redis.keys(f'{RedisInitKeyConfig.ACCESS_TOKEN.key}*')
-        if not access_token_keys:
-            access_token_keys = []
-        access_token_values_list = [await request.app.state.redis.get(key) for key in access_token_keys]
-        online_info_list = []
-        for item in access_token_values_list:
-            try:
-                payload = JwtUtil.decode(item)
-            except AuthException:
-                # 单个过期或损坏的会话不应影响在线用户列表中的其他会话
-                continue
-            online_dict = {
-                'token_id': payload.get('session_id') if AppConfig.app_same_time_login else payload.get('user_id'),
-                'user_name': payload.get('user_name'),
-                'dept_name': payload.get('dept_name'),
-                'ipaddr': payload.get('login_info').get('ipaddr'),
-                'login_location': payload.get('login_info').get('loginLocation'),
-                'browser': payload.get('login_info').get('browser'),
-                'os': payload.get('login_info').get('os'),
-                'login_time': payload.get('login_info').get('loginTime'),
-            }
-            if query_object.user_name and not query_object.ipaddr:
-                if query_object.user_name == payload.get('user_name'):
-                    online_info_list = [online_dict]
-                    break
-            elif not query_object.user_name and query_object.ipaddr:
-                if query_object.ipaddr == payload.get('login_info').get('ipaddr'):
-                    online_info_list = [online_dict]
-                    break
-            elif query_object.user_name and query_object.ipaddr:
-                if query_object.user_name == payload.get('user_name') and query_object.ipaddr == payload.get(
-                    'login_info'
-                ).get('ipaddr'):
-                    online_info_list = [online_dict]
-                    break
-            else:
-                online_info_list.append(online_dict)
-
-        return CamelCaseUtil.transform_result(online_info_list)
+        :return: 在线用户列表信息与总数，传入分页参数时仅返回当前页
+        """
+        redis = request.app.state.redis
+        await cls._prune_expired_sessions(redis)
+        paginated = query_object.page_num is not None and query_object.page_size is not None
+        if query_object.user_name or query_object.ipaddr:
+            token_ids = await cls._get_filtered_token_ids(redis, query_object)
+            online_sessions = await cls._get_online_sessions(redis, token_ids)
+            online_sessions = [
+                online_session
+                for online_session in online_sessions
+                if online_session is not None and cls._match_query(online_session, query_object)
+            ]
+            total = len(online_sessions)
+            if paginated:
+                start = (query_object.page_num - 1) * query_object.page_size
+                online_sessions = online_sessions[start : start + query_object.page_size]
+        else:
+            total = await redis.zcard(cls._get_index_key())
+            start, end = 0, -1
+            if paginated:
+                start = (query_object.page_num - 1) * query_object.page_size
+                end = start + query_object.page_size - 1
+            token_ids = await redis.zrevrange(cls._get_index_key(), start, end)
+            online_sessions = [
+                online_session
+                for online_session in await cls._get_online_sessions(redis, token_ids)
+                if online_session is not None
+            ]
+
+        return online_sessions, total
 
     @classmethod
     async def delete_online_services(cls, request: Request, page_object: DeleteOnlineModel) -> CrudResponseModel:
@@ -76,7 +420,6 @@ class OnlineService:
         """
         if page_object.token_ids:
             token_id_list = page_object.token_ids.split(',')
-            for token_id in token_id_list:
-                await request.app.state.redis.delete(f'{RedisInitKeyConfig.ACCESS_TOKEN.key}:{token_id}')
+            await cls.remove_online_sessions(request.app.state.redis, token_id_list)
             return CrudResponseModel(is_success=True, message='强退成功')
         raise ServiceException(message='传入session_id为空')
@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,6 +8,7 @@ from common.vo import CrudResponseModel, PageModel
 from exceptions.exception import ServiceException
 from module_admin.dao.post_dao import PostDao
 from module_admin.entity.vo.post_vo import DeletePostModel, PostModel, PostPageQueryModel
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
 from utils.common_util import CamelCaseUtil
 from utils.excel_util import ExcelUtil
 
@@ -78,6 +80,7 @@ class PostService:
         try:
             await PostDao.add_post_dao(query_db, page_object)
             await query_db.commit()
+            await UserAuthCacheService.bump_permission_epoch()
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
             await query_db.rollback()
@@ -102,6 +105,7 @@ class PostService:
             try:
                 await PostDao.edit_post_dao(query_db, edit_post)
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -127,6 +131,7 @@ class PostService:
                         raise ServiceException(message=f'{post.post_name}已分配，不能删除')
                     await PostDao.delete_post_dao(query_db, PostModel(postId=post_id))
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -149,12 +154,12 @@ class PostService:
         return result
 
     @staticmethod
-    async def export_post_list_services(post_list: list) -> bytes:
+    async def export_post_list_services(post_list: list) -> AsyncIterator[bytes]:
         """
         导出岗位信息service
 
         :param post_list: 岗位信息列表
-        :return: 岗位信息对应excel的二进制数据
+        :return: 岗位信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -170,11 +175,6 @@ class PostService:
             'remark': '备注',
         }
 
-        for item in post_list:
-            if item.get('status') == '0':
-                item['status'] = '正常'
-            else:
-                item['status'] = '停用'
-        binary_data = ExcelUtil.export_list2excel(post_list, mapping_dict)
+        formatters = {'status': ExcelUtil.choice_formatter({'0': '正常'}, default='停用')}
 
-        return binary_data
+        return ExcelUtil.stream_export(post_list, mapping_dict, formatters)
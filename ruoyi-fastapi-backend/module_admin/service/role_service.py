@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any
 
 from sqlalchemy import ColumnElement
@@ -18,6 +19,7 @@ from module_admin.entity.vo.role_vo import (
     RolePageQueryModel,
 )
 from module_admin.entity.vo.user_vo import UserInfoModel, UserRolePageQueryModel
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
 from utils.common_util import CamelCaseUtil
 from utils.excel_util import ExcelUtil
 
@@ -161,6 +163,7 @@ class RoleService:
                 for menu in page_object.menu_ids:
                     await RoleDao.add_role_menu_dao(query_db, RoleMenuModel(roleId=role_id, menuId=menu))
             await query_db.commit()
+            await UserAuthCacheService.bump_permission_epoch()
             return CrudResponseModel(is_success=True, message='新增成功')
         except Exception as e:
             await query_db.rollback()
@@ -200,6 +203,7 @@ class RoleService:
                                 query_db, RoleMenuModel(roleId=page_object.role_id, menuId=menu)
                             )
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -231,6 +235,7 @@ class RoleService:
                             query_db, RoleDeptModel(roleId=page_object.role_id, deptId=dept)
                         )
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='分配成功')
             except Exception as e:
                 await query_db.rollback()
@@ -263,6 +268,7 @@ class RoleService:
                     await RoleDao.delete_role_dept_dao(query_db, RoleDeptModel(**role_id_dict))
                     await RoleDao.delete_role_dao(query_db, RoleModel(**role_id_dict))
                 await query_db.commit()
+                await UserAuthCacheService.bump_permission_epoch()
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -285,12 +291,12 @@ class RoleService:
         return result
 
     @staticmethod
-    async def export_role_list_services(role_list: list) -> bytes:
+    async def export_role_list_services(role_list: list) -> AsyncIterator[bytes]:
         """
         导出角色列表信息service
 
         :param role_list: 角色信息列表
-        :return: 角色列表信息对象
+        :return: 角色列表信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -306,14 +312,9 @@ class RoleService:
             'remark': '备注',
         }
 
-        for item in role_list:
-            if item.get('status') == '0':
-                item['status'] = '正常'
-            else:
-                item['status'] = '停用'
-        binary_data = ExcelUtil.export_list2excel(role_list, mapping_dict)
+        formatters = {'status': ExcelUtil.choice_formatter({'0': '正常'}, default='停用')}
 
-        return binary_data
+        return ExcelUtil.stream_export(role_list, mapping_dict, formatters)
 
     @classmethod
     async def get_role_user_allocated_list_services(
@@ -1,11 +1,14 @@
 from fastapi import Request
 
+from common.vo import CrudResponseModel
+from exceptions.exception import ServiceException
 from module_admin.entity.vo.transport_crypto_vo import (
     TransportCryptoFrontendConfigModel,
     TransportCryptoMonitorModel,
     TransportCryptoPublicKeyModel,
+    TransportCryptoSessionModel,
 )
-from utils.transport_crypto_util import TransportCryptoMonitorUtil, TransportCryptoUtil
+from utils.transport_crypto_util import TransportCryptoMonitorUtil, TransportCryptoUtil, TransportSessionUtil
 
 
 class TransportCryptoService:
@@ -42,3 +45,43 @@ class TransportCryptoService:
         transport_crypto_monitor_info = await TransportCryptoMonitorUtil.get_snapshot(request.app)
 
         return TransportCryptoMonitorModel.model_validate(transport_crypto_monitor_info)
+
+    @classmethod
+    async def create_transport_session_services(cls, request: Request, token: str) -> TransportCryptoSessionModel:
+        """
+        协商传输会话service
+
+        协商请求本身需使用RSA加密信封发送，中间件解出的AES密钥即作为会话密钥，
+        响应同样由该密钥加密，会话编号不会以明文形式下发
+
+        :param request: Request对象
+        :param token: 当前登录令牌
+        :return: 传输会话信息
+        """
+        if not TransportSessionUtil.is_enabled():
+            raise ServiceException(message='传输会话模式未启用')
+        crypto_context = getattr(request.state, 'transport_crypto_context', None)
+        if not crypto_context or crypto_context.get('session_id'):
+            raise ServiceException(message='请使用RSA加密请求协商传输会话')
+        transport_session = await TransportSessionUtil.create_session(
+            request.app.state.redis, str(crypto_context['kid']), crypto_context['aes_key'], token
+        )
+
+        return TransportCryptoSessionModel.model_validate(transport_session)
+
+    @classmethod
+    async def delete_transport_session_services(cls, request: Request, session_id: str) -> CrudResponseModel:
+        """
+        撤销传输会话service
+
+        :param request: Request对象
+        :param session_id: 传输会话编号
+        :return: 撤销传输会话校验结果
+        """
+        try:
+            transport_session = await TransportSessionUtil.get_session(request, session_id)
+        except ValueError as exc:
+            raise ServiceException(message=str(exc)) from exc
+        await TransportSessionUtil.revoke_session(request.app.state.redis, transport_session)
+
+        return CrudResponseModel(is_success=True, message='撤销成功')
@@ -0,0 +1,211 @@
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from redis import asyncio as aioredis
+
+from common.enums import RedisInitKeyConfig
+from config.env import AppConfig
+from module_admin.entity.vo.user_vo import CurrentUserModel
+from utils.log_util import logger
+
+PermissionEpochs = tuple[int, int]
+
+
+class UserAuthCacheService:
+    """
+    用户权限快照缓存服务
+
+    快照按用户ID与权限版本号（全局版本号、用户版本号）缓存于Redis与进程内LRU中，
+    用户、角色、菜单、部门、岗位变更时递增版本号，旧版本快照随即失效
+    """
+
+    _redis: aioredis.Redis | None = None
+    _local_cache: OrderedDict[int, tuple[PermissionEpochs, float, CurrentUserModel]] = OrderedDict()
+
+    @classmethod
+    def initialize(cls, redis: aioredis.Redis | None) -> None:
+        """
+        应用启动时绑定Redis连接，供各业务服务在变更后递增权限版本号
+
+        :param redis: Redis连接对象
+        :return: None
+        """
+        cls._redis = redis
+        cls._local_cache.clear()
+
+    @classmethod
+    def _get_global_epoch_key(cls) -> str:
+        """
+        获取全局权限版本号Key
+
+        :return: 全局权限版本号Key
+        """
+        return f'{RedisInitKeyConfig.PERMISSION_EPOCH.key}:global'
+
+    @classmethod
+    def _get_user_epoch_key(cls, user_id: int) -> str:
+        """
+        获取用户权限版本号Key
+
+        :param user_id: 用户ID
+        :return: 用户权限版本号Key
+        """
+        return f'{RedisInitKeyConfig.PERMISSION_EPOCH.key}:user:{user_id}'
+
+    @classmethod
+    def _get_snapshot_key(cls, user_id: int, epochs: PermissionEpochs) -> str:
+        """
+        获取用户权限快照Key
+
+        :param user_id: 用户ID
+        :param epochs: 权限版本号
+        :return: 用户权限快照Key
+        """
+        return f'{RedisInitKeyConfig.USER_AUTH_SNAPSHOT.key}:{user_id}:{epochs[0]}:{epochs[1]}'
+
+    @classmethod
+    async def get_permission_epochs(cls, redis: aioredis.Redis, user_id: int) -> PermissionEpochs:
+        """
+        一次往返获取全局与用户权限版本号
+
+        :param redis: Redis连接对象
+        :param user_id: 用户ID
+        :return: 全局权限版本号与用户权限版本号
+        """
+        return cls.parse_permission_epochs(await redis.mget(*cls.get_permission_epoch_keys(user_id)))
+
+    @classmethod
+    def get_permission_epoch_keys(cls, user_id: int) -> list[str]:
+        """
+        获取全局与用户权限版本号Key，供调用方合并到其他Redis往返中读取
+
+        :param user_id: 用户ID
+        :return: 全局权限版本号Key与用户权限版本号Key
+        """
+        return [cls._get_global_epoch_key(), cls._get_user_epoch_key(user_id)]
+
+    @classmethod
+    def parse_permission_epochs(cls, values: Sequence[str | None]) -> PermissionEpochs:
+        """
+        解析按get_permission_epoch_keys顺序读取的权限版本号
+
+        :param values: 全局权限版本号与用户权限版本号原始值
+        :return: 全局权限版本号与用户权限版本号
+        """
+        global_epoch, user_epoch = values
+        return int(global_epoch or 0), int(user_epoch or 0)
+
+    @classmethod
+    async def get_global_permission_epoch(cls, redis: aioredis.Redis) -> int:
+        """
+        获取全局权限版本号
+
+        :param redis: Redis连接对象
+        :return: 全局权限版本号
+        """
+        return int(await redis.get(cls._get_global_epoch_key()) or 0)
+
+    @classmethod
+    async def get_user_snapshot(
+        cls, redis: aioredis.Redis, user_id: int, epochs: PermissionEpochs
+    ) -> CurrentUserModel | None:
+        """
+        获取指定版本的用户权限快照，优先读取进程内缓存
+
+        :param redis: Redis连接对象
+        :param user_id: 用户ID
+        :param epochs: 权限版本号
+        :return: 用户权限快照副本，未命中时返回None
+        """
+        cached = cls._local_cache.get(user_id)
+        if cached is not None:
+            cached_epochs, expire_at, snapshot = cached
+            if cached_epochs == epochs and expire_at > time.monotonic():
+                cls._local_cache.move_to_end(user_id)
+                return snapshot.model_copy(deep=True)
+            cls._local_cache.pop(user_id, None)
+        snapshot_json = await redis.get(cls._get_snapshot_key(user_id, epochs))
+        if not snapshot_json:
+            return None
+        try:
+            snapshot = CurrentUserModel.model_validate_json(snapshot_json)
+        except ValueError as e:
+            logger.warning(f'用户权限快照解析失败，将重新加载：{e}')
+            return None
+        cls._set_local_snapshot(user_id, epochs, snapshot)
+        return snapshot.model_copy(deep=True)
+
+    @classmethod
+    async def set_user_snapshot(
+        cls, redis: aioredis.Redis, user_id: int, epochs: PermissionEpochs, snapshot: CurrentUserModel
+    ) -> None:
+        """
+        写入用户权限快照
+
+        :param redis: Redis连接对象
+        :param user_id: 用户ID
+        :param epochs: 加载快照前读取的权限版本号
+        :param snapshot: 用户权限快照
+        :return: None
+        """
+        snapshot = snapshot.model_copy(deep=True)
+        await redis.set(
+            cls._get_snapshot_key(user_id, epochs),
+            snapshot.model_dump_json(by_alias=True),
+            ex=AppConfig.app_user_auth_cache_expire_seconds,
+        )
+        cls._set_local_snapshot(user_id, epochs, snapshot)
+
+    @classmethod
+    def _set_local_snapshot(cls, user_id: int, epochs: PermissionEpochs, snapshot: CurrentUserModel) -> None:
+        """
+        写入进程内LRU缓存
+
+        :param user_id: 用户ID
+        :param epochs: 权限版本号
+        :param snapshot: 用户权限快照
+        :return: None
+        """
+        if AppConfig.app_user_auth_local_cache_size <= 0:
+            return
+        cls._local_cache[user_id] = (epochs, time.monotonic() + AppConfig.app_user_auth_local_cache_ttl, snapshot)
+        cls._local_cache.move_to_end(user_id)
+        while len(cls._local_cache) > AppConfig.app_user_auth_local_cache_size:
+            cls._local_cache.popitem(last=False)
+
+    @classmethod
+    async def bump_permission_epoch(cls) -> None:
+        """
+        递增全局权限版本号，使所有用户权限快照失效
+
+        :return: None
+        """
+        cls._local_cache.clear()
+        if cls._redis is None:
+            return
+        try:
+            await cls._redis.incr(cls._get_global_epoch_key())
+        except Exception as e:
+            logger.error(f'递增全局权限版本号失败，用户权限快照将在过期后刷新：{e}')
+
+    @classmethod
+    async def bump_user_permission_epoch(cls, user_ids: list[int | str]) -> None:
+        """
+        递增指定用户的权限版本号，使对应用户权限快照失效
+
+        :param user_ids: 用户ID列表
+        :return: None
+        """
+        user_id_set = {int(user_id) for user_id in user_ids if user_id}
+        for user_id in user_id_set:
+            cls._local_cache.pop(user_id, None)
+        if cls._redis is None or not user_id_set:
+            return
+        try:
+            async with cls._redis.pipeline(transaction=False) as pipe:
+                for user_id in user_id_set:
+                    pipe.incr(cls._get_user_epoch_key(user_id))
+                await pipe.execute()
+        except Exception as e:
+            logger.error(f'递增用户权限版本号失败，用户权限快照将在过期后刷新：{e}')
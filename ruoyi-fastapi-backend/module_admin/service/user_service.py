@@ -1,17 +1,26 @@
+import csv
 import io
 import re
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
 from typing import Any
+from zipfile import BadZipFile
 
 import pandas as pd
 from fastapi import Request, UploadFile
+from openpyxl.utils.exceptions import InvalidFileException
+from pydantic_validation_decorator import Xss
 from redis import asyncio as aioredis
-from sqlalchemy import ColumnElement
+from sqlalchemy import ColumnElement, true
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.constant import CommonConstant
-from common.enums import PasswordCharacterType
+from common.enums import PasswordCharacterType, RedisInitKeyConfig
 from common.vo import CrudResponseModel, PageModel
+from config.env import AppConfig
 from exceptions.exception import ServiceException
+from module_admin.dao.dept_dao import DeptDao
 from module_admin.dao.user_dao import UserDao
 from module_admin.entity.do.user_do import SysUserRole
 from module_admin.entity.vo.post_vo import PostPageQueryModel
@@ -24,6 +33,7 @@ from module_admin.entity.vo.user_vo import (
     ResetUserModel,
     SelectedRoleModel,
     UserDetailModel,
+    UserImportResultModel,
     UserInfoModel,
     UserModel,
     UserPageQueryModel,
@@ -35,11 +45,11 @@ from module_admin.entity.vo.user_vo import (
     UserRowModel,
 )
 from module_admin.service.config_service import ConfigService
-from module_admin.service.dept_service import DeptService
 from module_admin.service.post_service import PostService
 from module_admin.service.role_service import RoleService
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
 from utils.common_util import CamelCaseUtil
-from utils.excel_util import ExcelUtil
+from utils.excel_util import ExcelUtil, ExportFormat, ExportProgressCallback
 from utils.pwd_util import PwdUtil
 
 
@@ -50,6 +60,25 @@ class UserService:
 
     PASSWORD_MIN_LENGTH = 6
     PASSWORD_MAX_LENGTH = 20
+    USER_NAME_MAX_LENGTH = 30
+    NICK_NAME_MAX_LENGTH = 30
+    EMAIL_MAX_LENGTH = 50
+    PHONENUMBER_MAX_LENGTH = 11
+    IMPORT_HEADER_DICT = {
+        '部门编号': 'dept_id',
+        '登录名称': 'user_name',
+        '用户名称': 'nick_name',
+        '用户邮箱': 'email',
+        '手机号码': 'phonenumber',
+        '用户性别': 'sex',
+        '帐号状态': 'status',
+    }
+    IMPORT_SEX_DICT = {'男': '0', '女': '1', '未知': '2', '0': '0', '1': '1', '2': '2'}
+    IMPORT_STATUS_DICT = {'正常': '0', '停用': '1', '0': '0', '1': '1'}
+    # 与Xss字段校验规则一致，改为非捕获分组以便pandas整列匹配
+    IMPORT_XSS_PATTERN = Xss.HTML_PATTERN.replace('(', '(?:')
+    IMPORT_EMAIL_PATTERN = r'[^@\s]+@[^@\s]+\.[^@\s]+'
+    IMPORT_ERROR_MESSAGE_LIMIT = 10
 
     @classmethod
     async def validate_password_services(
@@ -274,6 +303,7 @@ class UserService:
                                 query_db, UserPostModel(userId=page_object.user_id, postId=post)
                             )
                 await query_db.commit()
+                await UserAuthCacheService.bump_user_permission_epoch([page_object.user_id])
                 return CrudResponseModel(is_success=True, message='更新成功')
             except Exception as e:
                 await query_db.rollback()
@@ -303,6 +333,7 @@ class UserService:
                     await UserDao.delete_user_post_dao(query_db, UserPostModel(**user_id_dict))
                     await UserDao.delete_user_dao(query_db, UserModel(**user_id_dict))
                 await query_db.commit()
+                await UserAuthCacheService.bump_user_permission_epoch(user_id_list)
                 return CrudResponseModel(is_success=True, message='删除成功')
             except Exception as e:
                 await query_db.rollback()
@@ -386,51 +417,24 @@ class UserService:
         )
         if page_object.old_password:
             user = (await UserDao.get_user_detail_by_id(query_db, user_id=page_object.user_id)).get('user_basic_info')
-            if not PwdUtil.verify_password(page_object.old_password, user.password):
+            if not await PwdUtil.verify_password_async(page_object.old_password, user.password):
                 raise ServiceException(message='修改密码失败，旧密码错误')
-            if PwdUtil.verify_password(page_object.password, user.password):
+            if await PwdUtil.verify_password_async(page_object.password, user.password):
                 raise ServiceException(message='新密码不能与旧密码相同')
             del reset_user['old_password']
         if page_object.sms_code and page_object.session_id:
             del reset_user['sms_code']
             del reset_user['session_id']
         try:
-            reset_user['password'] = PwdUtil.get_password_hash(page_object.password)
+            reset_user['password'] = await PwdUtil.get_password_hash_async(page_object.password)
             await UserDao.edit_user_dao(query_db, reset_user)
             await query_db.commit()
+            await UserAuthCacheService.bump_user_permission_epoch([page_object.user_id])
             return CrudResponseModel(is_success=True, message='重置成功')
         except Exception as e:
             await query_db.rollback()
             raise e
 
-    @classmethod
-    def _set_row_sex_value(cls, row: pd.Series) -> None:
-        """
-        设置行性别值
-
-        :param row: 行数据
-        :return: None
-        """
-        if row['sex'] == '男':
-            row['sex'] = '0'
-        if row['sex'] == '女':
-            row['sex'] = '1'
-        if row['sex'] == '未知':
-            row['sex'] = '2'
-
-    @classmethod
-    def _set_row_status_value(cls, row: pd.Series) -> None:
-        """
-        设置行状态值
-
-        :param row: 行数据
-        :return: None
-        """
-        if row['status'] == '正常':
-            row['status'] = '0'
-        if row['status'] == '停用':
-            row['status'] = '1'
-
     @classmethod
     async def batch_import_user_services(
         cls,
@@ -445,6 +449,9 @@ class UserService:
         """
         批量导入用户service
 
+        流式解析导入文件，每批数据先整体校验字段，再以一次IN查询获取已存在用户、一次查询校验部门数据权限，
+        校验通过的行批量写入，校验失败的行记录为导入错误报告
+
         :param request: Request对象
         :param query_db: orm对象
         :param file: 用户导入文件对象
@@ -454,84 +461,229 @@ class UserService:
         :param dept_data_scope_sql: 部门数据权限sql
         :return: 批量导入用户结果
         """
-        header_dict = {
-            '部门编号': 'dept_id',
-            '登录名称': 'user_name',
-            '用户名称': 'nick_name',
-            '用户邮箱': 'email',
-            '手机号码': 'phonenumber',
-            '用户性别': 'sex',
-            '帐号状态': 'status',
-        }
-        contents = await file.read()
-        df = pd.read_excel(io.BytesIO(contents))
-        await file.close()
-        df.rename(columns=header_dict, inplace=True)
-        add_error_result = []
-        count = 0
-        init_password = await ConfigService.query_config_list_from_cache_services(
-            request.app.state.redis, 'sys.user.initPassword'
-        )
-        await cls.validate_password_services(request.app.state.redis, init_password)
+        redis = request.app.state.redis
+        init_password = await ConfigService.query_config_list_from_cache_services(redis, 'sys.user.initPassword')
+        await cls.validate_password_services(redis, init_password)
+        # 同一批次导入的用户初始密码相同，仅加密一次
+        init_password_hash = await PwdUtil.get_password_hash_async(init_password)
+        import_result = UserImportResultModel()
+        error_rows: list[tuple[int, str | None, str]] = []
+        imported_user_names: set[str] = set()
         try:
-            for _index, row in df.iterrows():
-                count = count + 1
-                cls._set_row_sex_value(row)
-                cls._set_row_status_value(row)
-                add_user = UserModel(
-                    deptId=row['dept_id'],
-                    userName=row['user_name'],
-                    password=PwdUtil.get_password_hash(init_password),
-                    nickName=row['nick_name'],
-                    email=row['email'],
-                    phonenumber=str(row['phonenumber']),
-                    sex=row['sex'],
-                    status=row['status'],
-                    createBy=current_user.user.user_name,
-                    updateBy=current_user.user.user_name,
+            async for chunk in ExcelUtil.iter_import_chunks(
+                file.file, cls.IMPORT_HEADER_DICT, AppConfig.app_user_import_chunk_size
+            ):
+                checked_chunk = await cls._check_import_user_chunk(
+                    query_db,
+                    cls._validate_import_user_chunk(chunk, imported_user_names),
+                    update_support,
+                    current_user,
+                    user_data_scope_sql,
+                    dept_data_scope_sql,
                 )
-                user_info = await UserDao.get_user_by_info(query_db, UserModel(userName=row['user_name']))
-                if user_info:
-                    if update_support:
-                        edit_user_model = UserModel(
-                            userId=user_info.user_id,
-                            deptId=row['dept_id'],
-                            userName=row['user_name'],
-                            nickName=row['nick_name'],
-                            email=row['email'],
-                            phonenumber=str(row['phonenumber']),
-                            sex=row['sex'],
-                            status=row['status'],
-                            updateBy=current_user.user.user_name,
-                        )
-                        edit_user_model.validate_fields()
-                        await cls.check_user_allowed_services(edit_user_model)
-                        if not current_user.user.admin:
-                            await cls.check_user_data_scope_services(
-                                query_db, edit_user_model.user_id, user_data_scope_sql
-                            )
-                            await DeptService.check_dept_data_scope_services(
-                                query_db, edit_user_model.dept_id, dept_data_scope_sql
-                            )
-                        edit_user = edit_user_model.model_dump(
-                            exclude_unset=True,
-                            exclude={'create_time', 'update_time'},
-                        )
-                        await UserDao.edit_user_dao(query_db, edit_user)
-                    else:
-                        add_error_result.append(f'{count}.用户账号{row["user_name"]}已存在')
-                else:
-                    add_user.validate_fields()
-                    if not current_user.user.admin:
-                        await DeptService.check_dept_data_scope_services(
-                            query_db, add_user.dept_id, dept_data_scope_sql
-                        )
-                    await UserDao.add_user_dao(query_db, add_user)
+                error_chunk = checked_chunk[checked_chunk['error'].notna()]
+                error_rows.extend(zip(error_chunk.index, error_chunk['user_name'], error_chunk['error'], strict=True))
+                add_users, edit_users = cls._build_import_user_rows(
+                    checked_chunk[checked_chunk['error'].isna()], init_password_hash, current_user.user.user_name
+                )
+                await UserDao.bulk_add_user_dao(query_db, add_users)
+                await UserDao.bulk_edit_user_dao(query_db, edit_users)
+                import_result.add_count += len(add_users)
+                import_result.update_count += len(edit_users)
             await query_db.commit()
-            return CrudResponseModel(is_success=True, message='\n'.join(add_error_result))
+        except (BadZipFile, InvalidFileException, UnicodeDecodeError, csv.Error) as e:
+            await query_db.rollback()
+            raise ServiceException(message='导入文件解析失败，请使用导入模板填写后上传') from e
         except Exception as e:
             await query_db.rollback()
             raise e
+        finally:
+            await file.close()
+        if import_result.add_count or import_result.update_count:
+            await UserAuthCacheService.bump_permission_epoch()
+        import_result.error_count = len(error_rows)
+        message = (
+            f'导入完成，新增{import_result.add_count}条，更新{import_result.update_count}条，'
+            f'失败{import_result.error_count}条'
+        )
+        if error_rows:
+            import_result.error_report_id = await cls._save_import_error_report(
+                redis, current_user.user.user_id, error_rows
+            )
+            error_messages = [
+                f'第{row_number}行：{error}' for row_number, _, error in error_rows[: cls.IMPORT_ERROR_MESSAGE_LIMIT]
+            ]
+            message = '\n'.join([message, *error_messages, '完整错误信息请下载导入错误报告'])
+
+        return CrudResponseModel(is_success=True, message=message, result=import_result)
+
+    @classmethod
+    def _validate_import_user_chunk(cls, chunk: pd.DataFrame, imported_user_names: set[str]) -> pd.DataFrame:
+        """
+        整批校验导入用户字段并转换性别、状态与部门编号，每行仅记录首个校验错误
+
+        :param chunk: 导入数据批次
+        :param imported_user_names: 已解析的用户账号集合，用于识别跨批次重复的账号
+        :return: 转换后的数据批次，error列为校验错误信息
+        """
+        user_name = chunk['user_name']
+        nick_name = chunk['nick_name']
+        email = chunk['email']
+        phonenumber = chunk['phonenumber']
+        dept_id = chunk['dept_id']
+        sex = chunk['sex'].map(cls.IMPORT_SEX_DICT)
+        status = chunk['status'].map(cls.IMPORT_STATUS_DICT)
+        rules = [
+            (user_name.isna(), '用户账号不能为空'),
+            (user_name.str.len() > cls.USER_NAME_MAX_LENGTH, '用户账号长度不能超过30个字符'),
+            (user_name.str.contains(cls.IMPORT_XSS_PATTERN, na=False), '用户账号不能包含脚本字符'),
+            (
+                user_name.notna() & (user_name.duplicated() | user_name.isin(imported_user_names)),
+                '用户账号在导入文件中重复',
+            ),
+            (nick_name.isna(), '用户昵称不能为空'),
+            (nick_name.str.len() > cls.NICK_NAME_MAX_LENGTH, '用户昵称长度不能超过30个字符'),
+            (nick_name.str.contains(cls.IMPORT_XSS_PATTERN, na=False), '用户昵称不能包含脚本字符'),
+            (email.str.len() > cls.EMAIL_MAX_LENGTH, '邮箱长度不能超过50个字符'),
+            (email.notna() & ~email.str.fullmatch(cls.IMPORT_EMAIL_PATTERN, na=False), '邮箱格式不正确'),
+            (phonenumber.str.len() > cls.PHONENUMBER_MAX_LENGTH, '手机号码长度不能超过11个字符'),
+            (dept_id.notna() & ~dept_id.str.fullmatch(r'\d{1,18}', na=False), '部门编号格式不正确'),
+            (chunk['sex'].notna() & sex.isna(), '用户性别只能为男、女或未知'),
+            (chunk['status'].notna() & status.isna(), '帐号状态只能为正常或停用'),
+        ]
+        errors = pd.Series(None, index=chunk.index, dtype=object)
+        for invalid, message in rules:
+            errors = errors.mask(errors.isna() & invalid, message)
+        imported_user_names.update(user_name.dropna())
+        valid_dept_id = pd.to_numeric(dept_id.where(errors.isna()), errors='coerce').astype('Int64').astype(object)
+
+        return chunk.assign(
+            dept_id=valid_dept_id.where(valid_dept_id.notna(), None),
+            email=email.where(email.notna(), ''),
+            phonenumber=phonenumber.where(phonenumber.notna(), ''),
+            sex=sex.where(sex.notna(), '2'),
+            status=status.where(status.notna(), '0'),
+            error=errors,
+        )
+
+    @classmethod
+    async def _check_import_user_chunk(
+        cls,
+        query_db: AsyncSession,
+        chunk: pd.DataFrame,
+        update_support: bool,
+        current_user: CurrentUserModel,
+        user_data_scope_sql: ColumnElement,
+        dept_data_scope_sql: ColumnElement,
+    ) -> pd.DataFrame:
+        """
+        批量校验导入用户是否已存在以及用户、部门数据权限，每类校验仅执行一次查询
+
+        :param query_db: orm对象
+        :param chunk: 字段校验后的导入数据批次
+        :param update_support: 用户存在时是否更新
+        :param current_user: 当前用户对象
+        :param user_data_scope_sql: 用户数据权限sql
+        :param dept_data_scope_sql: 部门数据权限sql
+        :return: 数据批次，user_id列为已存在用户的用户ID
+        """
+        errors = chunk['error']
+        user_name = chunk['user_name']
+        existing_user_ids = await UserDao.get_user_ids_by_user_names(query_db, user_name[errors.isna()].tolist())
+        user_ids = user_name.map(existing_user_ids).astype('Int64')
+        exists = user_ids.notna()
+        if update_support:
+            errors = errors.mask(errors.isna() & exists & (user_ids == 1), '不允许操作超级管理员用户')
+        else:
+            errors = errors.mask(errors.isna() & exists, '用户账号' + user_name + '已存在')
+        is_admin = current_user.user.admin
+        if not is_admin:
+            edit_rows = errors.isna() & exists
+            allowed_user_ids = await UserDao.get_user_ids_in_data_scope(
+                query_db, user_ids[edit_rows].tolist(), user_data_scope_sql
+            )
+            errors = errors.mask(edit_rows & ~user_ids.isin(allowed_user_ids), '没有权限访问用户数据')
+        dept_rows = errors.isna() & chunk['dept_id'].notna()
+        allowed_dept_ids = await DeptDao.get_dept_ids_in_data_scope(
+            query_db, chunk['dept_id'][dept_rows].unique().tolist(), true() if is_admin else dept_data_scope_sql
+        )
+        errors = errors.mask(dept_rows & ~chunk['dept_id'].isin(allowed_dept_ids), '部门不存在或没有权限访问部门数据')
+
+        return chunk.assign(user_id=user_ids.astype(object).where(exists, None), error=errors)
+
+    @classmethod
+    def _build_import_user_rows(
+        cls, chunk: pd.DataFrame, init_password_hash: str, operator: str
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        构建批量新增与批量更新的用户字典
+
+        :param chunk: 校验通过的导入数据批次
+        :param init_password_hash: 初始密码哈希
+        :param operator: 操作人
+        :return: 新增用户字典列表与更新用户字典列表
+        """
+        now = datetime.now()
+        columns = list(cls.IMPORT_HEADER_DICT.values())
+        exists = chunk['user_id'].notna()
+        add_users = [
+            {
+                **user,
+                'password': init_password_hash,
+                'create_by': operator,
+                'create_time': now,
+                'update_by': operator,
+                'update_time': now,
+            }
+            for user in chunk.loc[~exists, columns].to_dict('records')
+        ]
+        edit_users = [
+            {**user, 'update_by': operator, 'update_time': now}
+            for user in chunk.loc[exists, ['user_id', *columns]].to_dict('records')
+        ]
+
+        return add_users, edit_users
+
+    @classmethod
+    async def _save_import_error_report(
+        cls, redis: aioredis.Redis, user_id: int, error_rows: list[tuple[int, str | None, str]]
+    ) -> str:
+        """
+        将导入错误行写入csv格式的错误报告并缓存至redis
+
+        :param redis: redis对象
+        :param user_id: 导入用户ID
+        :param error_rows: 导入错误行，依次为行号、用户账号与错误信息
+        :return: 导入错误报告ID
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['行号', '登录名称', '错误信息'])
+        writer.writerows(error_rows)
+        report_id = uuid.uuid4().hex
+        await redis.set(
+            f'{RedisInitKeyConfig.USER_IMPORT_ERROR_REPORT.key}:{user_id}:{report_id}',
+            buffer.getvalue(),
+            ex=timedelta(minutes=AppConfig.app_user_import_error_report_expire_minutes),
+        )
+
+        return report_id
+
+    @classmethod
+    async def get_import_error_report_services(cls, redis: aioredis.Redis, user_id: int, report_id: str) -> bytes:
+        """
+        获取用户导入错误报告service
+
+        :param redis: redis对象
+        :param user_id: 当前用户ID，仅可获取本人生成的错误报告
+        :param report_id: 导入错误报告ID
+        :return: 导入错误报告csv的二进制数据
+        """
+        error_report = await redis.get(f'{RedisInitKeyConfig.USER_IMPORT_ERROR_REPORT.key}:{user_id}:{report_id}')
+        if error_report is None:
+            raise ServiceException(message='导入错误报告不存在或已过期')
+
+        return error_report.encode('utf-8-sig')
 
     @staticmethod
     async def get_user_import_template_services() -> bytes:
@@ -540,7 +692,7 @@ class UserService:
 
         :return: 用户导入模板excel的二进制数据
         """
-        header_list = ['部门编号', '登录名称', '用户名称', '用户邮箱', '手机号码', '用户性别', '帐号状态']
+        header_list = list(UserService.IMPORT_HEADER_DICT)
         selector_header_list = ['用户性别', '帐号状态']
         option_list = [{'用户性别': ['男', '女', '未知']}, {'帐号状态': ['正常', '停用']}]
         binary_data = ExcelUtil.get_excel_template(
@@ -550,12 +702,22 @@ class UserService:
         return binary_data
 
     @staticmethod
-    async def export_user_list_services(user_list: list) -> bytes:
+    async def export_user_list_services(
+        query_db: AsyncSession,
+        query_object: UserPageQueryModel,
+        data_scope_sql: ColumnElement,
+        export_format: ExportFormat = 'xlsx',
+        on_progress: ExportProgressCallback | None = None,
+    ) -> AsyncIterator[bytes]:
         """
         导出用户信息service
 
-        :param user_list: 用户信息列表
-        :return: 用户信息对应excel的二进制数据
+        :param query_db: orm对象
+        :param query_object: 查询参数对象
+        :param data_scope_sql: 数据权限对应的查询sql语句
+        :param export_format: 导出格式
+        :param on_progress: 导出进度回调
+        :return: 用户信息对应excel的二进制数据流
         """
         # 创建一个映射字典，将英文键映射到中文键
         mapping_dict = {
@@ -573,22 +735,18 @@ class UserService:
             'updateTime': '更新时间',
             'remark': '备注',
         }
+        formatters = {
+            'status': ExcelUtil.choice_formatter({'0': '正常'}, default='停用'),
+            'sex': ExcelUtil.choice_formatter({'0': '男', '1': '女'}, default='未知'),
+        }
 
-        for item in user_list:
-            item['deptName'] = item.get('dept').get('deptName')
-            if item.get('status') == '0':
-                item['status'] = '正常'
-            else:
-                item['status'] = '停用'
-            if item.get('sex') == '0':
-                item['sex'] = '男'
-            elif item.get('sex') == '1':
-                item['sex'] = '女'
-            else:
-                item['sex'] = '未知'
-        binary_data = ExcelUtil.export_list2excel(user_list, mapping_dict)
+        async def user_rows() -> AsyncIterator[dict[str, Any]]:
+            async for user, dept in UserDao.stream_user_list(query_db, query_object, data_scope_sql):
+                yield {**user, 'deptName': dept.get('deptName') if dept else None}
 
-        return binary_data
+        return ExcelUtil.stream_export(
+            user_rows(), mapping_dict, formatters, export_format=export_format, on_progress=on_progress
+        )
 
     @classmethod
     async def get_user_role_allocated_list_services(
@@ -638,6 +796,7 @@ class UserService:
                 for role_id in role_id_list:
                     await UserDao.add_user_role_dao(query_db, UserRoleModel(userId=page_object.user_id, roleId=role_id))
                 await query_db.commit()
+                await UserAuthCacheService.bump_user_permission_epoch([page_object.user_id])
                 return CrudResponseModel(is_success=True, message='分配成功')
             except Exception as e:
                 await query_db.rollback()
@@ -646,6 +805,7 @@ class UserService:
             try:
                 await UserDao.delete_user_role_by_user_and_role_dao(query_db, UserRoleModel(userId=page_object.user_id))
                 await query_db.commit()
+                await UserAuthCacheService.bump_user_permission_epoch([page_object.user_id])
                 return CrudResponseModel(is_success=True, message='分配成功')
             except Exception as e:
                 await query_db.rollback()
@@ -661,6 +821,7 @@ class UserService:
                         continue
                     await UserDao.add_user_role_dao(query_db, UserRoleModel(userId=user_id, roleId=page_object.role_id))
                 await query_db.commit()
+                await UserAuthCacheService.bump_user_permission_epoch(user_id_list)
                 return CrudResponseModel(is_success=True, message='新增成功')
             except Exception as e:
                 await query_db.rollback()
@@ -686,6 +847,7 @@ class UserService:
                         query_db, UserRoleModel(userId=page_object.user_id, roleId=page_object.role_id)
                     )
                     await query_db.commit()
+                    await UserAuthCacheService.bump_user_permission_epoch([page_object.user_id])
                     return CrudResponseModel(is_success=True, message='删除成功')
                 except Exception as e:
                     await query_db.rollback()
@@ -698,6 +860,7 @@ class UserService:
                             query_db, UserRoleModel(userId=user_id, roleId=page_object.role_id)
                         )
                     await query_db.commit()
+                    await UserAuthCacheService.bump_user_permission_epoch(user_id_list)
                     return CrudResponseModel(is_success=True, message='删除成功')
                 except Exception as e:
                     await query_db.rollback()
@@ -27,7 +27,6 @@ from module_generator.entity.vo.gen_vo import (
     GenTableRowModel,
 )
 from module_generator.service.gen_service import GenTableColumnService, GenTableService
-from utils.common_util import bytes2file_response
 from utils.log_util import logger
 from utils.response_util import ResponseUtil
 
@@ -218,7 +217,7 @@ async def batch_gen_code(
     batch_gen_code_result = await GenTableService.batch_gen_code_services(query_db, table_names, source_name)
     logger.info('生成代码成功')
 
-    return ResponseUtil.streaming(data=bytes2file_response(batch_gen_code_result))
+    return ResponseUtil.streaming(data=batch_gen_code_result)
 
 
 @gen_controller.get(
@@ -185,6 +185,37 @@ class GenTableDao:
 
         return gen_table_info
 
+    @classmethod
+    async def get_gen_tables_by_names(
+        cls, db: AsyncSession, table_names: list[str], source_name: str
+    ) -> Sequence[GenTable]:
+        """
+        根据业务表名称批量获取需要生成的业务表信息
+
+        :param db: orm对象
+        :param table_names: 业务表名称列表
+        :param source_name: 数据源名称
+        :return: 需要生成的业务表信息对象列表
+        """
+        if not table_names:
+            return []
+        gen_table_list = (
+            (
+                await db.execute(
+                    select(GenTable)
+                    .options(selectinload(GenTable.columns))
+                    .where(
+                        GenTable.table_name.in_(table_names),
+                        GenTable.data_source_name == source_name,
+                    )
+                )
+            )
+            .scalars()
+            .all()
+        )
+
+        return gen_table_list
+
     @classmethod
     async def get_gen_table_all(cls, db: AsyncSession, source_name: str | None = None) -> Sequence[GenTable]:
         """
@@ -1,10 +1,13 @@
+import asyncio
 import io
 import json
 import os
 import zipfile
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiofiles
+from jinja2 import Environment
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlglot import parse as sqlglot_parse
 from sqlglot.expressions import Add, Alter, Create, Delete, Drop, Expression, Insert, Table, TruncateTable, Update
@@ -29,6 +32,33 @@ from utils.gen_util import GenUtils
 from utils.template_util import TemplateInitializer, TemplateUtils
 
 
+class _ZipChunkWriter(io.RawIOBase):
+    """
+    压缩包数据块写入器，不支持定位，zipfile以数据描述符方式顺序写入
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        """
+        取出已写入的数据
+
+        :return: 已写入的数据
+        """
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
 class GenTableService:
     """
     代码生成业务表服务层
@@ -336,14 +366,11 @@ class GenTableService:
         )
         await cls.set_sub_table(query_db, gen_table)
         await cls.set_pk_column(gen_table)
-        env = TemplateInitializer.init_jinja2()
-        context = TemplateUtils.prepare_context(gen_table)
-        template_list = TemplateUtils.get_template_list(gen_table)
-        preview_code_result = {}
-        for template in template_list:
-            render_content = env.get_template(template).render(**context)
-            preview_code_result[template] = render_content
-        return preview_code_result
+        template_list, _, context, _ = cls.__build_render_info(gen_table)
+        render_contents = await asyncio.to_thread(
+            cls.__render_templates, TemplateInitializer.init_jinja2(), template_list, context
+        )
+        return dict(zip(template_list, render_contents, strict=True))
 
     @classmethod
     async def generate_code_services(
@@ -361,8 +388,8 @@ class GenTableService:
         env = TemplateInitializer.init_jinja2()
         render_info = await cls.__get_gen_render_info(query_db, table_name, source_name)
         try:
-            for template in render_info[0]:
-                render_content = env.get_template(template).render(**render_info[2])
+            render_contents = await asyncio.to_thread(cls.__render_templates, env, render_info[0], render_info[2])
+            for template, render_content in zip(render_info[0], render_contents, strict=True):
                 gen_path = cls.__get_gen_path(render_info[3], template)
                 os.makedirs(os.path.dirname(gen_path), exist_ok=True)
                 async with aiofiles.open(gen_path, 'w', encoding='utf-8') as f:
@@ -375,35 +402,76 @@ class GenTableService:
     @classmethod
     async def batch_gen_code_services(
         cls, query_db: AsyncSession, table_names: list[str], source_name: str | None = None
-    ) -> bytes:
+    ) -> AsyncIterator[bytes]:
         """
-        批量生成代码service
+        批量生成代码service，一次查询全部业务表信息，各业务表模板在线程池中并发渲染，压缩包逐个文件流式输出
 
         :param query_db: orm对象
         :param table_names: 业务表名称组
         :param source_name: 数据源名称
-        :return: 下载代码结果
+        :return: 代码压缩包的二进制数据块
         """
         source_name = cls._source_name(source_name)
-        configured_table_names = await GenTableDao.get_gen_table_names(query_db, source_name)
-        invalid_table_names = list(dict.fromkeys(name for name in table_names if name not in configured_table_names))
+        gen_tables = await cls.__get_gen_tables_by_names(query_db, list(dict.fromkeys(table_names)), source_name)
+        env = TemplateInitializer.init_jinja2()
+        render_infos = [cls.__build_render_info(gen_table) for gen_table in gen_tables]
+        render_contents_list = await asyncio.gather(
+            *(asyncio.to_thread(cls.__render_gen_table, env, render_info) for render_info in render_infos)
+        )
+
+        return cls.__stream_zip(
+            [
+                (output_file, render_content)
+                for render_info, render_contents in zip(render_infos, render_contents_list, strict=True)
+                for output_file, render_content in zip(render_info[1], render_contents, strict=True)
+            ]
+        )
+
+    @classmethod
+    async def __get_gen_tables_by_names(
+        cls, query_db: AsyncSession, table_names: list[str], source_name: str
+    ) -> list[GenTableModel]:
+        """
+        批量获取业务表信息，业务表及其子表各通过一次查询获取
+
+        :param query_db: orm对象
+        :param table_names: 业务表名称列表
+        :param source_name: 数据源名称
+        :return: 按请求顺序排列的业务表信息列表
+        """
+        gen_table_map = {
+            gen_table.table_name: gen_table
+            for gen_table in await GenTableDao.get_gen_tables_by_names(query_db, table_names, source_name)
+        }
+        invalid_table_names = [table_name for table_name in table_names if table_name not in gen_table_map]
         if invalid_table_names:
             raise ServiceException(
                 message=f'业务表不存在或不属于数据源 {source_name}：{", ".join(invalid_table_names)}'
             )
-
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for table_name in table_names:
-                env = TemplateInitializer.init_jinja2()
-                render_info = await cls.__get_gen_render_info(query_db, table_name, source_name)
-                for template_file, output_file in zip(render_info[0], render_info[1], strict=False):
-                    render_content = env.get_template(template_file).render(**render_info[2])
-                    zip_file.writestr(output_file, render_content)
-
-        zip_data = zip_buffer.getvalue()
-        zip_buffer.close()
-        return zip_data
+        sub_table_names = list(
+            dict.fromkeys(
+                gen_table.sub_table_name
+                for gen_table in gen_table_map.values()
+                if gen_table.sub_table_name and gen_table.sub_table_name not in gen_table_map
+            )
+        )
+        gen_table_map.update(
+            {
+                gen_table.table_name: gen_table
+                for gen_table in await GenTableDao.get_gen_tables_by_names(query_db, sub_table_names, source_name)
+            }
+        )
+        gen_tables = []
+        for table_name in table_names:
+            gen_table = GenTableModel(**CamelCaseUtil.transform_result(gen_table_map[table_name]))
+            if gen_table.sub_table_name and gen_table.sub_table_name in gen_table_map:
+                gen_table.sub_table = GenTableModel(
+                    **CamelCaseUtil.transform_result(gen_table_map[gen_table.sub_table_name])
+                )
+            await cls.set_pk_column(gen_table)
+            gen_tables.append(gen_table)
+
+        return gen_tables
 
     @classmethod
     async def __get_gen_render_info(
@@ -423,12 +491,64 @@ class GenTableService:
         gen_table = GenTableModel(**CamelCaseUtil.transform_result(gen_table_info))
         await cls.set_sub_table(query_db, gen_table)
         await cls.set_pk_column(gen_table)
+
+        return cls.__build_render_info(gen_table)
+
+    @classmethod
+    def __build_render_info(cls, gen_table: GenTableModel) -> list:
+        """
+        根据业务表信息构建生成代码渲染模板相关信息
+
+        :param gen_table: 业务表信息
+        :return: 模板列表、输出文件列表、模板上下文及业务表信息
+        """
         context = TemplateUtils.prepare_context(gen_table)
         template_list = TemplateUtils.get_template_list(gen_table)
         output_files = [TemplateUtils.get_file_name(template, gen_table) for template in template_list]
 
         return [template_list, output_files, context, gen_table]
 
+    @classmethod
+    def __render_templates(cls, env: Environment, template_list: list[str], context: dict[str, Any]) -> list[str]:
+        """
+        渲染模板列表，模板已在模板引擎中预编译，可在多个线程中并发调用
+
+        :param env: Jinja2环境对象
+        :param template_list: 模板列表
+        :param context: 模板上下文
+        :return: 渲染结果列表
+        """
+        return [env.get_template(template).render(**context) for template in template_list]
+
+    @classmethod
+    def __render_gen_table(cls, env: Environment, render_info: list) -> list[str]:
+        """
+        渲染业务表的全部模板
+
+        :param env: Jinja2环境对象
+        :param render_info: 生成代码渲染模板相关信息
+        :return: 渲染结果列表
+        """
+        try:
+            return cls.__render_templates(env, render_info[0], render_info[2])
+        except Exception as e:
+            raise ServiceException(message=f'渲染模板失败，表名：{render_info[3].table_name}，详细错误信息：{e}') from e
+
+    @classmethod
+    async def __stream_zip(cls, files: list[tuple[str, str]]) -> AsyncIterator[bytes]:
+        """
+        将渲染结果逐个写入压缩包并输出已压缩的数据块，无需在内存中保留完整压缩包
+
+        :param files: 压缩包内文件路径及文件内容列表
+        :return: 压缩包的二进制数据块
+        """
+        writer = _ZipChunkWriter()
+        with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            for output_file, render_content in files:
+                zip_file.writestr(output_file, render_content)
+                yield writer.drain()
+        yield writer.drain()
+
     @classmethod
     def __get_gen_path(cls, gen_table: GenTableModel, template: str) -> str:
         """
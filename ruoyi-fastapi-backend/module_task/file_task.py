@@ -1,4 +1,5 @@
 from config.database import DataSourceRegistry
+from module_admin.service.export_job_service import ExportJobService
 from module_admin.service.file_business_service import FileRetentionNoticeService
 from module_admin.service.file_service import FileLifecycleService, FileReconcileService
 from utils.log_util import logger
@@ -56,6 +57,25 @@ async def purge_recycle_bin(retention_days: int = 30, batch_size: int = 100) ->
     logger.info(f'回收站永久清理完成，共清理{purge_count}个文件')
 
 
+async def expire_export_files(batch_size: int = 100) -> None:
+    """
+    将到期的异步导出文件移入回收站，并中断长时间未更新进度的导出任务
+
+    :param batch_size: 单批处理数量
+    :return: None
+    """
+    expired_count = 0
+    async with DataSourceRegistry.session() as query_db:
+        for _ in range(MAX_TASK_BATCHES):
+            current_count = await ExportJobService.expire_export_jobs_services(query_db, batch_size=batch_size)
+            expired_count += current_count
+            if current_count < batch_size:
+                break
+        else:
+            logger.warning('异步导出文件过期清理达到最大批次数，请检查待处理任务数量')
+    logger.info(f'异步导出文件过期清理完成，共{expired_count}个导出文件移入回收站')
+
+
 async def reconcile_file_storage(check_hash: bool = False) -> None:
     """
     执行数据库和本地文件系统双向对账
@@ -0,0 +1,59 @@
+import argparse
+import asyncio
+from typing import Any
+
+from config.database import DataSourceRegistry
+from module_admin.dao.dept_dao import DeptDao
+from module_admin.entity.do.dept_do import SysDeptClosure
+from module_admin.service.dept_service import DeptService
+from utils.log_util import logger
+
+
+def _create_dept_closure_table(connection: Any) -> None:
+    """
+    部门层级闭包表不存在时创建
+
+    :param connection: 同步数据库连接
+    :return: None
+    """
+    SysDeptClosure.__table__.create(connection, checkfirst=True)
+
+
+async def backfill_dept_closure(dry_run: bool = False, batch_size: int = 1000) -> int:
+    """
+    根据sys_dept.ancestors重建部门层级闭包表
+
+    :param dry_run: 是否仅统计不写入数据库
+    :param batch_size: 单次批量写入最多包含的行数
+    :return: 层级闭包关系数量
+    """
+    if batch_size < 1:
+        raise ValueError('每批写入数量必须大于0')
+
+    async with DataSourceRegistry.session() as session:
+        if dry_run:
+            return len(DeptService.build_dept_closure_rows(await DeptDao.get_dept_ancestors_list_dao(session)))
+        connection = await session.connection()
+        await connection.run_sync(_create_dept_closure_table)
+        closure_count = await DeptService.rebuild_dept_closure_services(session, batch_size)
+        await session.commit()
+    return closure_count
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    解析命令行参数
+
+    :return: 命令行参数
+    """
+    parser = argparse.ArgumentParser(description='根据部门祖级列表重建部门层级闭包表')
+    parser.add_argument('--env', type=str, default='', help='运行环境')
+    parser.add_argument('--dry-run', action='store_true', help='仅统计层级闭包关系数量，不写入数据库')
+    parser.add_argument('--batch-size', type=int, default=1000, help='每批写入数量')
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    closure_count = asyncio.run(backfill_dept_closure(dry_run=args.dry_run, batch_size=args.batch_size))
+    logger.info(f'部门层级闭包表重建完成，共{closure_count}条层级关系')
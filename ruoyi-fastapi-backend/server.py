@@ -10,14 +10,21 @@ from config.database import DataSourceRegistry
 from config.env import AppConfig
 from config.get_redis import RedisUtil
 from config.get_scheduler import SchedulerUtil
-from config.lifecycle import init_create_table
+from config.lifecycle import init_create_table, init_dept_closure, init_expire_export_job
 from exceptions.handle import handle_exception
 from middlewares.handle import handle_middleware
+from module_admin.service.export_job_service import ExportJobService
 from module_admin.service.log_service import LogAggregatorService
+from module_admin.service.near_cache_service import SysNearCacheService
+from module_admin.service.online_service import OnlineService
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
 from plugins.core.runtime.application import get_plugin_application_runtime
 from sub_applications.handle import handle_sub_applications
 from utils.common_util import worship
+from utils.ip_location_util import IpLocationUtil
 from utils.log_util import logger
+from utils.page_util import PageCountCache
+from utils.pwd_util import PwdUtil
 from utils.server_util import APIDocsUtil, IPUtil, StartupUtil
 from utils.transport_crypto_util import TransportKeyProvider
 
@@ -31,6 +38,8 @@ async def _start_background_tasks(app: FastAPI) -> None:
     """
     await SchedulerUtil.init_system_scheduler(app.state.redis)
     app.state.log_aggregator_task = asyncio.create_task(LogAggregatorService.consume_stream(app.state.redis))
+    app.state.near_cache_listener_task = asyncio.create_task(SysNearCacheService.listen_invalidation(app.state.redis))
+    app.state.page_count_cache_listener_task = asyncio.create_task(PageCountCache.listen_invalidation(app.state.redis))
 
 
 async def _stop_background_tasks(app: FastAPI) -> None:
@@ -41,13 +50,16 @@ async def _stop_background_tasks(app: FastAPI) -> None:
     :return: None
     """
     try:
-        log_task = getattr(app.state, 'log_aggregator_task', None)
-        if log_task:
-            log_task.cancel()
-            try:
-                await log_task
-            except asyncio.CancelledError:
-                pass
+        for task_name in ('log_aggregator_task', 'near_cache_listener_task', 'page_count_cache_listener_task'):
+            task = getattr(app.state, task_name, None)
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        # 导出任务状态需写入数据库，必须先于数据库连接池释放
+        await ExportJobService.shutdown()
     finally:
         try:
             redis = getattr(app.state, 'redis', None)
@@ -58,7 +70,11 @@ async def _stop_background_tasks(app: FastAPI) -> None:
                 finally:
                     await RedisUtil.close_redis_pool(app)
         finally:
-            await DataSourceRegistry.dispose_all()
+            try:
+                await IpLocationUtil.close()
+            finally:
+                PwdUtil.shutdown()
+                await DataSourceRegistry.dispose_all()
 
 
 async def _initialize_application_runtime(app: FastAPI, application_leader: bool) -> None:
@@ -78,6 +94,11 @@ async def _initialize_application_runtime(app: FastAPI, application_leader: bool
         stage='platform',
         log_success_enabled=application_leader,
     )
+    if application_leader:
+        # 闭包表由leader在启动锁内补齐，其余worker不重复重建
+        await init_dept_closure()
+        # 升级安装的定时任务表不含导出过期清理任务，需在调度器加载任务前补齐
+        await init_expire_export_job()
 
     async def create_plugin_entity_tables() -> None:
         """在插件 writer 导入实体后同步插件表。"""
@@ -96,8 +117,12 @@ async def _initialize_application_runtime(app: FastAPI, application_leader: bool
         log_enabled=application_leader,
         log_error_enabled=True,
     )
-    await RedisUtil.init_sys_dict(app.state.redis)
-    await RedisUtil.init_sys_config(app.state.redis)
+    if application_leader:
+        # 缓存按部署整体替换，其余worker直接读取leader预热的缓存
+        await RedisUtil.warmup_sys_cache(app.state.redis)
+    await OnlineService.init_online_session_index(app.state.redis)
+    IpLocationUtil.initialize()
+    UserAuthCacheService.initialize(app.state.redis)
     await _start_background_tasks(app)
 
 
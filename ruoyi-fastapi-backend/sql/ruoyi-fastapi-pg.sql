@@ -50,6 +50,53 @@ insert into sys_dept values(107,  101, '0,100,101',  '运维部门',   5, '年
 insert into sys_dept values(108,  102, '0,100,102',  '市场部门',   1, '年糕', '15888888888', 'niangao@qq.com', '0', '0', 'admin', current_timestamp, '', null);
 insert into sys_dept values(109,  102, '0,100,102',  '财务部门',   2, '年糕', '15888888888', 'niangao@qq.com', '0', '0', 'admin', current_timestamp, '', null);
 
+
+-- ----------------------------
+-- 1.1、部门层级闭包表
+-- ----------------------------
+drop table if exists sys_dept_closure;
+create table sys_dept_closure (
+    ancestor_id bigint not null,
+    descendant_id bigint not null,
+    depth int4 not null default 0,
+    primary key (ancestor_id, descendant_id)
+);
+create index idx_sys_dept_closure_descendant on sys_dept_closure(descendant_id, depth);
+comment on column sys_dept_closure.ancestor_id is '祖先部门id';
+comment on column sys_dept_closure.descendant_id is '后代部门id（包含自身）';
+comment on column sys_dept_closure.depth is '层级距离（自身为0）';
+comment on table sys_dept_closure is '部门层级闭包表';
+
+-- ----------------------------
+-- 初始化-部门层级闭包表数据
+-- ----------------------------
+insert into sys_dept_closure values(100, 100, 0);
+insert into sys_dept_closure values(101, 101, 0);
+insert into sys_dept_closure values(102, 102, 0);
+insert into sys_dept_closure values(103, 103, 0);
+insert into sys_dept_closure values(104, 104, 0);
+insert into sys_dept_closure values(105, 105, 0);
+insert into sys_dept_closure values(106, 106, 0);
+insert into sys_dept_closure values(107, 107, 0);
+insert into sys_dept_closure values(108, 108, 0);
+insert into sys_dept_closure values(109, 109, 0);
+insert into sys_dept_closure values(100, 101, 1);
+insert into sys_dept_closure values(100, 102, 1);
+insert into sys_dept_closure values(101, 103, 1);
+insert into sys_dept_closure values(100, 103, 2);
+insert into sys_dept_closure values(101, 104, 1);
+insert into sys_dept_closure values(100, 104, 2);
+insert into sys_dept_closure values(101, 105, 1);
+insert into sys_dept_closure values(100, 105, 2);
+insert into sys_dept_closure values(101, 106, 1);
+insert into sys_dept_closure values(100, 106, 2);
+insert into sys_dept_closure values(101, 107, 1);
+insert into sys_dept_closure values(100, 107, 2);
+insert into sys_dept_closure values(102, 108, 1);
+insert into sys_dept_closure values(100, 108, 2);
+insert into sys_dept_closure values(102, 109, 1);
+insert into sys_dept_closure values(100, 109, 2);
+
 -- ----------------------------
 -- 2、用户信息表
 -- ----------------------------
@@ -839,6 +886,7 @@ insert into sys_job values(3, '系统默认（多参）', 'default', 'default',
 insert into sys_job values(4, '文件保留期限提醒', 'default', 'default', 'module_task.file_task.scan_retention_reminders', null, '{"remind_days": 7, "batch_size": 500}', '0 0 1 * * ?', '3', '1', '0', 'admin', current_timestamp, '', null, '每天扫描即将到期和已到期的受保护文件');
 insert into sys_job values(5, '回收站永久清理', 'default', 'default', 'module_task.file_task.purge_recycle_bin', null, '{"retention_days": 30, "batch_size": 100}', '0 0 2 * * ?', '3', '1', '1', 'admin', current_timestamp, '', null, '永久清理超过保留期限的回收站文件，默认暂停');
 insert into sys_job values(6, '文件存储对账', 'default', 'default', 'module_task.file_task.reconcile_file_storage', null, '{"check_hash": false}', '0 0 3 * * ?', '3', '1', '1', 'admin', current_timestamp, '', null, '校验文件信息表和本地存储一致性，默认暂停');
+insert into sys_job values(7, '异步导出文件过期清理', 'default', 'default', 'module_task.file_task.expire_export_files', null, '{"batch_size": 100}', '0 0/30 * * * ?', '3', '1', '0', 'admin', current_timestamp, '', null, '将到期的异步导出文件移入回收站，并中断长时间未更新进度的导出任务');
 
 -- ----------------------------
 -- 16、定时任务调度日志表
@@ -1520,6 +1568,51 @@ comment on column sys_plugin_operation_log.result is '完整执行结果JSON';
 comment on column sys_plugin_operation_log.create_time is '创建时间';
 comment on column sys_plugin_operation_log.remark is '备注';
 
+-- ----------------------------
+-- 34、异步导出任务表
+-- ----------------------------
+drop table if exists sys_export_job;
+create table sys_export_job (
+  job_id             varchar(36)    not null,
+  export_type        varchar(64)    not null,
+  export_name        varchar(100)   not null,
+  export_format      varchar(10)    not null default 'xlsx',
+  status             varchar(20)    not null default 'pending',
+  query_params       text,
+  processed_rows     bigint         not null default 0,
+  file_id            varchar(36)    default null,
+  file_size          bigint         not null default 0,
+  user_id            bigint         not null,
+  create_by          varchar(64)    default '',
+  create_time        timestamp(0)   not null,
+  update_time        timestamp(0)   not null,
+  started_time       timestamp(0),
+  finished_time      timestamp(0),
+  expire_time        timestamp(0),
+  error_message      text,
+  primary key (job_id)
+);
+create index idx_sys_export_job_user_status on sys_export_job(user_id, status);
+create index idx_sys_export_job_status_expire_time on sys_export_job(status, expire_time);
+comment on table sys_export_job is '异步导出任务表';
+comment on column sys_export_job.job_id is '任务ID';
+comment on column sys_export_job.export_type is '导出业务类型';
+comment on column sys_export_job.export_name is '导出名称';
+comment on column sys_export_job.export_format is '导出格式';
+comment on column sys_export_job.status is '任务状态';
+comment on column sys_export_job.query_params is '导出查询参数JSON';
+comment on column sys_export_job.processed_rows is '已处理行数';
+comment on column sys_export_job.file_id is '导出文件ID';
+comment on column sys_export_job.file_size is '导出文件大小';
+comment on column sys_export_job.user_id is '发起用户ID';
+comment on column sys_export_job.create_by is '创建者';
+comment on column sys_export_job.create_time is '创建时间';
+comment on column sys_export_job.update_time is '更新时间';
+comment on column sys_export_job.started_time is '开始执行时间';
+comment on column sys_export_job.finished_time is '结束时间';
+comment on column sys_export_job.expire_time is '导出文件过期时间';
+comment on column sys_export_job.error_message is '失败原因';
+
 CREATE OR REPLACE FUNCTION "find_in_set"(int8, varchar)
     RETURNS "pg_catalog"."bool" AS $BODY$
 DECLARE
@@ -35,6 +35,49 @@ insert into sys_dept values(108,  102, '0,100,102',  '市场部门',   1, '年
 insert into sys_dept values(109,  102, '0,100,102',  '财务部门',   2, '年糕', '15888888888', 'niangao@qq.com', '0', '0', 'admin', sysdate(), '', null);
 
 
+-- ----------------------------
+-- 1.1、部门层级闭包表
+-- ----------------------------
+drop table if exists sys_dept_closure;
+create table sys_dept_closure (
+  ancestor_id       bigint(20)      not null                   comment '祖先部门id',
+  descendant_id     bigint(20)      not null                   comment '后代部门id（包含自身）',
+  depth             int(4)          not null default 0         comment '层级距离（自身为0）',
+  primary key (ancestor_id, descendant_id),
+  key idx_sys_dept_closure_descendant (descendant_id, depth)
+) engine=innodb comment = '部门层级闭包表';
+
+-- ----------------------------
+-- 初始化-部门层级闭包表数据
+-- ----------------------------
+insert into sys_dept_closure values(100, 100, 0);
+insert into sys_dept_closure values(101, 101, 0);
+insert into sys_dept_closure values(102, 102, 0);
+insert into sys_dept_closure values(103, 103, 0);
+insert into sys_dept_closure values(104, 104, 0);
+insert into sys_dept_closure values(105, 105, 0);
+insert into sys_dept_closure values(106, 106, 0);
+insert into sys_dept_closure values(107, 107, 0);
+insert into sys_dept_closure values(108, 108, 0);
+insert into sys_dept_closure values(109, 109, 0);
+insert into sys_dept_closure values(100, 101, 1);
+insert into sys_dept_closure values(100, 102, 1);
+insert into sys_dept_closure values(101, 103, 1);
+insert into sys_dept_closure values(100, 103, 2);
+insert into sys_dept_closure values(101, 104, 1);
+insert into sys_dept_closure values(100, 104, 2);
+insert into sys_dept_closure values(101, 105, 1);
+insert into sys_dept_closure values(100, 105, 2);
+insert into sys_dept_closure values(101, 106, 1);
+insert into sys_dept_closure values(100, 106, 2);
+insert into sys_dept_closure values(101, 107, 1);
+insert into sys_dept_closure values(100, 107, 2);
+insert into sys_dept_closure values(102, 108, 1);
+insert into sys_dept_closure values(100, 108, 2);
+insert into sys_dept_closure values(102, 109, 1);
+insert into sys_dept_closure values(100, 109, 2);
+
+
 -- ----------------------------
 -- 2、用户信息表
 -- ----------------------------
@@ -658,6 +701,7 @@ insert into sys_job values(3, '系统默认（多参）', 'default', 'default',
 insert into sys_job values(4, '文件保留期限提醒', 'default', 'default', 'module_task.file_task.scan_retention_reminders', NULL, '{\"remind_days\": 7, \"batch_size\": 500}', '0 0 1 * * ?', '3', '1', '0', 'admin', sysdate(), '', null, '每天扫描即将到期和已到期的受保护文件');
 insert into sys_job values(5, '回收站永久清理', 'default', 'default', 'module_task.file_task.purge_recycle_bin', NULL, '{\"retention_days\": 30, \"batch_size\": 100}', '0 0 2 * * ?', '3', '1', '1', 'admin', sysdate(), '', null, '永久清理超过保留期限的回收站文件，默认暂停');
 insert into sys_job values(6, '文件存储对账', 'default', 'default', 'module_task.file_task.reconcile_file_storage', NULL, '{\"check_hash\": false}', '0 0 3 * * ?', '3', '1', '1', 'admin', sysdate(), '', null, '校验文件信息表和本地存储一致性，默认暂停');
+insert into sys_job values(7, '异步导出文件过期清理', 'default', 'default', 'module_task.file_task.expire_export_files', NULL, '{\"batch_size\": 100}', '0 0/30 * * * ?', '3', '1', '0', 'admin', sysdate(), '', null, '将到期的异步导出文件移入回收站，并中断长时间未更新进度的导出任务');
 
 
 -- ----------------------------
@@ -1088,3 +1132,30 @@ create table sys_plugin_operation_log (
   remark             varchar(500)    default null               comment '备注',
   primary key (operation_id)
 ) engine=innodb comment = '插件批量操作审计日志表';
+
+-- ----------------------------
+-- 34、异步导出任务表
+-- ----------------------------
+drop table if exists sys_export_job;
+create table sys_export_job (
+  job_id             varchar(36)     not null                   comment '任务ID',
+  export_type        varchar(64)     not null                   comment '导出业务类型',
+  export_name        varchar(100)    not null                   comment '导出名称',
+  export_format      varchar(10)     not null default 'xlsx'    comment '导出格式',
+  status             varchar(20)     not null default 'pending' comment '任务状态',
+  query_params       text                                       comment '导出查询参数JSON',
+  processed_rows     bigint(20)      not null default 0         comment '已处理行数',
+  file_id            varchar(36)     default null               comment '导出文件ID',
+  file_size          bigint(20)      not null default 0         comment '导出文件大小',
+  user_id            bigint(20)      not null                   comment '发起用户ID',
+  create_by          varchar(64)     default ''                 comment '创建者',
+  create_time        datetime        not null                   comment '创建时间',
+  update_time        datetime        not null                   comment '更新时间',
+  started_time       datetime                                   comment '开始执行时间',
+  finished_time      datetime                                   comment '结束时间',
+  expire_time        datetime                                   comment '导出文件过期时间',
+  error_message      text                                       comment '失败原因',
+  primary key (job_id),
+  key idx_sys_export_job_user_status (user_id, status),
+  key idx_sys_export_job_status_expire_time (status, expire_time)
+) engine=innodb comment = '异步导出任务表';
@@ -6,12 +6,14 @@ from fastapi.staticfiles import StaticFiles
 from starlette.responses import Response
 from starlette.types import Scope
 
-from config.env import UploadConfig
+from config.env import AppConfig, UploadConfig
 
 
 class SecureStaticFiles(StaticFiles):
     """
     安全静态文件服务类
+
+    ETag、Last-Modified、304与If-Range由StaticFiles根据文件状态信息处理，此处追加安全响应头与缓存策略
     """
 
     DOWNLOAD_ONLY_EXTENSIONS = {'.html', '.htm'}
@@ -26,6 +28,8 @@ class SecureStaticFiles(StaticFiles):
         """
         response = await super().get_response(path, scope)
         response.headers['X-Content-Type-Options'] = 'nosniff'
+        if AppConfig.app_file_static_cache_control:
+            response.headers['Cache-Control'] = AppConfig.app_file_static_cache_control
         if Path(path).suffix.lower() in self.DOWNLOAD_ONLY_EXTENSIONS:
             encoded_name = quote(Path(path).name)
             response.headers['Content-Type'] = 'application/octet-stream'
@@ -0,0 +1,255 @@
+import asyncio
+import fnmatch
+import json
+import time
+from collections import Counter
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi import Request, Response
+
+from common.annotation.cache_annotation import ApiCache, ApiCacheStats
+from config.env import AppConfig
+from utils.response_util import ResponseUtil
+
+NAMESPACE = 'test:list'
+CONCURRENT_REQUESTS = 10
+EXPIRE_SECONDS = 10
+STALE_SECONDS = 30
+EXPIRE_JITTER = 0.1
+
+
+class _FakePipeline:
+    def __init__(self, redis: '_FakeRedis') -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> '_FakePipeline':
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args: self.commands.append((name, args))
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.expire_ms: dict[str, int] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, nx: bool = False, ex: int | None = None, px: int | None = None) -> bool:
+        if nx and key in self.store:
+            return False
+        self.store[key] = value
+        self.expire_ms[key] = px if px is not None else ex * 1000
+        return True
+
+    async def exists(self, key: str) -> int:
+        return int(key in self.store)
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.store.get(key) != token:
+            return 0
+        del self.store[key]
+        return 1
+
+    async def hincrby(self, key: str, field: str, amount: int) -> int:
+        values = self.store.setdefault(key, {})
+        values[field] = str(int(values.get(field, 0)) + amount)
+        return int(values[field])
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self.store.get(key, {}))
+
+    async def scan_iter(self, match: str = '*') -> Any:
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+@pytest.fixture(autouse=True)
+def api_cache_state() -> Iterator[None]:
+    with (
+        patch.object(ApiCache, '_inflight', {}),
+        patch.object(ApiCache, '_LOCK_POLL_INTERVAL', 0.01),
+        patch.object(ApiCacheStats, '_pending', Counter()),
+        patch.object(ApiCacheStats, '_FLUSH_INTERVAL', 3600),
+        patch.object(ApiCacheStats, '_last_flush_at', time.monotonic()),
+        patch.object(AppConfig, 'app_api_cache_stale_seconds', STALE_SECONDS),
+        patch.object(AppConfig, 'app_api_cache_expire_jitter', EXPIRE_JITTER),
+        patch.object(AppConfig, 'app_api_cache_lock_seconds', 1),
+    ):
+        yield
+
+
+def _request(redis: _FakeRedis, path: str = '/test/list') -> Request:
+    async def receive() -> dict[str, Any]:
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    scope = {
+        'type': 'http',
+        'method': 'GET',
+        'path': path,
+        'query_string': b'',
+        'headers': [],
+        'path_params': {},
+        'app': SimpleNamespace(state=SimpleNamespace(redis=redis)),
+    }
+    return Request(scope, receive)
+
+
+def _endpoint(calls: list[int], gate: asyncio.Event | None = None) -> Any:
+    @ApiCache(namespace=NAMESPACE, expire_seconds=EXPIRE_SECONDS, vary_by_user=False)
+    async def endpoint(request: Request) -> Response:
+        calls.append(len(calls))
+        if gate is not None:
+            await gate.wait()
+        return ResponseUtil.success(data={'version': len(calls)})
+
+    return endpoint
+
+
+def _cache_status(request: Request, response: Response) -> str:
+    return response.headers.get('X-Api-Cache') or request.state.api_response_headers['X-Api-Cache']
+
+
+def _version(response: Response) -> int:
+    return json.loads(response.body)['data']['version']
+
+
+def _cache_key(redis: _FakeRedis) -> str:
+    return next(key for key in redis.store if key.startswith(f'api_cache:{NAMESPACE}:'))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_run_endpoint_once_and_coalesce() -> None:
+    redis = _FakeRedis()
+    calls: list[int] = []
+    gate = asyncio.Event()
+    endpoint = _endpoint(calls, gate)
+    requests = [_request(redis) for _ in range(CONCURRENT_REQUESTS)]
+
+    tasks = [asyncio.create_task(endpoint(request)) for request in requests]
+    await asyncio.sleep(0.01)
+    gate.set()
+    responses = await asyncio.gather(*tasks)
+    hit_response = await endpoint(_request(redis))
+
+    statuses = Counter(_cache_status(request, response) for request, response in zip(requests, responses, strict=True))
+    assert calls == [0]
+    assert statuses == {'MISS': 1, 'COALESCED': CONCURRENT_REQUESTS - 1}
+    assert {_version(response) for response in responses} == {1}
+    assert hit_response.headers['X-Api-Cache'] == 'HIT'
+    assert not ApiCache._inflight
+    assert not any(key.startswith('api_cache_lock:') for key in redis.store)
+    assert await ApiCacheStats.get_stats(redis) == {
+        NAMESPACE: {'hit': 1, 'miss': 1, 'stale': 0, 'coalesced': CONCURRENT_REQUESTS - 1}
+    }
+
+
+@pytest.mark.asyncio
+async def test_miss_waits_for_lock_holder_in_other_worker() -> None:
+    redis = _FakeRedis()
+    leader_calls: list[int] = []
+    follower_calls: list[int] = []
+    gate = asyncio.Event()
+    leader = asyncio.create_task(_endpoint(leader_calls, gate)(_request(redis)))
+    await asyncio.sleep(0.01)
+    # 模拟其他进程持有重新计算锁：清空本进程的合并状态后再发起请求
+    with patch.object(ApiCache, '_inflight', {}):
+        follower = asyncio.create_task(_endpoint(follower_calls)(_request(redis)))
+        await asyncio.sleep(0.03)
+        gate.set()
+        response = await follower
+    await leader
+
+    assert leader_calls == [0]
+    assert follower_calls == []
+    assert response.headers['X-Api-Cache'] == 'COALESCED'
+    assert _version(response) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_computation_lets_waiting_requests_run_endpoint() -> None:
+    redis = _FakeRedis()
+    gate = asyncio.Event()
+
+    @ApiCache(namespace=NAMESPACE, vary_by_user=False)
+    async def failing_endpoint(request: Request) -> Response:
+        await gate.wait()
+        return ResponseUtil.failure(msg='查询失败')
+
+    requests = [_request(redis) for _ in range(CONCURRENT_REQUESTS)]
+    tasks = [asyncio.create_task(failing_endpoint(request)) for request in requests]
+    await asyncio.sleep(0.01)
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    assert all(request.state.api_response_headers['X-Api-Cache'] == 'MISS' for request in requests)
+    assert not redis.store
+
+
+@pytest.mark.asyncio
+async def test_stale_content_is_served_while_one_request_refreshes() -> None:
+    redis = _FakeRedis()
+    calls: list[int] = []
+    gate = asyncio.Event()
+    endpoint = _endpoint(calls, gate)
+    gate.set()
+    await endpoint(_request(redis))
+    cache_key = _cache_key(redis)
+    payload = json.loads(redis.store[cache_key])
+    payload['fresh_until'] = time.time() - 1
+    redis.store[cache_key] = json.dumps(payload)
+
+    gate.clear()
+    refresh_request = _request(redis)
+    refresh = asyncio.create_task(endpoint(refresh_request))
+    await asyncio.sleep(0.01)
+    stale_responses = await asyncio.gather(*(endpoint(_request(redis)) for _ in range(CONCURRENT_REQUESTS)))
+    gate.set()
+    refreshed_response = await refresh
+    hit_response = await endpoint(_request(redis))
+
+    assert calls == [0, 1]
+    assert {response.headers['X-Api-Cache'] for response in stale_responses} == {'STALE'}
+    assert {_version(response) for response in stale_responses} == {1}
+    assert refresh_request.state.api_response_headers['X-Api-Cache'] == 'MISS'
+    assert _version(refreshed_response) == _version(hit_response) == len(calls)
+    assert hit_response.headers['X-Api-Cache'] == 'HIT'
+    assert (await ApiCacheStats.get_stats(redis))[NAMESPACE]['stale'] == CONCURRENT_REQUESTS
+
+
+@pytest.mark.asyncio
+async def test_cache_expiry_is_jittered_and_extended_by_stale_window() -> None:
+    redis = _FakeRedis()
+    endpoint = _endpoint([])
+    for index in range(CONCURRENT_REQUESTS):
+        await endpoint(_request(redis, path=f'/test/list/{index}'))
+
+    cache_keys = [key for key in redis.expire_ms if key.startswith('api_cache:')]
+    expire_ms = [redis.expire_ms[key] for key in cache_keys]
+    fresh_seconds = [json.loads(redis.store[key])['fresh_until'] - time.time() for key in cache_keys]
+    assert len(cache_keys) == CONCURRENT_REQUESTS
+    assert len(set(expire_ms)) > 1
+    assert all(
+        (EXPIRE_SECONDS * (1 - EXPIRE_JITTER) + STALE_SECONDS) * 1000 - 1
+        <= value
+        <= (EXPIRE_SECONDS + STALE_SECONDS) * 1000
+        for value in expire_ms
+    )
+    assert all(EXPIRE_SECONDS * (1 - EXPIRE_JITTER) - 1 < value <= EXPIRE_SECONDS for value in fresh_seconds)
@@ -0,0 +1,175 @@
+import asyncio
+import json
+import time
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from fastapi import Request
+
+from common.annotation.log_annotation import Log
+from common.context import RequestContext
+from common.enums import BusinessType
+from config.env import AppConfig, LogConfig
+from module_admin.service.log_service import LogAggregatorService, LogQueueService
+from utils.log_util import LogSanitizer
+from utils.response_util import ResponseUtil
+
+BENCHMARK_ROWS = 400
+BENCHMARK_ROUNDS = 60
+P99_QUANTILE = 0.99
+TEST_CLIENT_IP = '8.8.8.8'
+TEST_LOCATION = '美国-加州'
+
+
+class _RecordingQueue:
+    def __init__(self) -> None:
+        self.operation_logs: list[Any] = []
+        self.raw_events: list[dict[str, Any]] = []
+
+    async def enqueue_operation_log(self, request: Request, operation_log: Any, source: str) -> None:
+        self.operation_logs.append(operation_log)
+
+    async def enqueue_raw_operation_log(self, request: Request, raw_event: dict[str, Any], source: str) -> None:
+        # 模拟经Redis Stream传输后的载荷
+        self.raw_events.append(json.loads(json.dumps(raw_event, ensure_ascii=False)))
+
+
+def _build_request(body: bytes) -> Request:
+    async def receive() -> dict:
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    return Request(
+        {
+            'type': 'http',
+            'method': 'POST',
+            'path': '/system/user',
+            'headers': [(b'content-type', b'application/json'), (b'user-agent', b'Mozilla/5.0')],
+            'path_params': {},
+            'query_string': b'page=1',
+            'client': (TEST_CLIENT_IP, 50000),
+        },
+        receive=receive,
+    )
+
+
+def _build_endpoint(log_decorator: Log, rows: list[dict[str, Any]]) -> Any:
+    @log_decorator
+    async def endpoint(request: Request) -> Any:
+        return ResponseUtil.success(rows=rows)
+
+    return endpoint
+
+
+def _build_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {'userId': index, 'userName': f'user{index}', 'password': 'plain-password', 'phonenumber': '13812345678'}
+        for index in range(count)
+    ]
+
+
+@pytest.fixture
+def recording_queue() -> Iterator[_RecordingQueue]:
+    queue = _RecordingQueue()
+    current_user = SimpleNamespace(user=SimpleNamespace(user_name='admin', dept=SimpleNamespace(dept_name='研发部门')))
+
+    async def fake_get_ip_location(oper_ip: str, redis: Any = None) -> str:
+        return TEST_LOCATION
+
+    with (
+        patch.object(LogConfig, 'log_mask_enabled', True),
+        patch.object(AppConfig, 'app_ip_location_query', True),
+        patch.object(RequestContext, 'get_current_user', return_value=current_user),
+        patch('common.annotation.log_annotation.get_ip_location', side_effect=fake_get_ip_location),
+        patch.object(LogQueueService, 'enqueue_operation_log', side_effect=queue.enqueue_operation_log),
+        patch.object(LogQueueService, 'enqueue_raw_operation_log', side_effect=queue.enqueue_raw_operation_log),
+    ):
+        yield queue
+
+
+def _call(endpoint: Any, body: bytes) -> None:
+    asyncio.run(endpoint(_build_request(body)))
+
+
+def _comparable(operation_log: Any) -> dict[str, Any]:
+    return operation_log.model_dump(by_alias=True, exclude={'oper_time', 'cost_time'})
+
+
+def test_raw_event_mode_defers_enrichment_and_builds_same_log(recording_queue: _RecordingQueue) -> None:
+    log_decorator = Log(
+        title='用户管理',
+        business_type=BusinessType.INSERT,
+        request_log_mode='exclude',
+        request_exclude_fields=('json_body.remark',),
+        response_log_mode='exclude',
+        response_exclude_fields=('time',),
+    )
+    endpoint = _build_endpoint(log_decorator, _build_rows(2))
+    body = json.dumps({'userName': 'ry', 'password': 'plain-password', 'remark': '备注'}).encode()
+
+    with patch.object(LogConfig, 'log_raw_event_enabled', False):
+        _call(endpoint, body)
+    with (
+        patch.object(LogConfig, 'log_raw_event_enabled', True),
+        patch.object(LogSanitizer, 'sanitize_data', side_effect=AssertionError('请求链路内不应脱敏')),
+    ):
+        _call(endpoint, body)
+
+    assert len(recording_queue.operation_logs) == 1
+    assert len(recording_queue.raw_events) == 1
+    raw_event = recording_queue.raw_events[0]
+    assert 'operLocation' not in raw_event
+    assert raw_event['logOptions']['requestExcludeFields'] == ['json_body.remark']
+
+    built_logs = asyncio.run(LogAggregatorService._build_raw_operation_logs(None, recording_queue.raw_events))
+
+    assert len(built_logs) == 1
+    assert _comparable(built_logs[0]) == _comparable(recording_queue.operation_logs[0])
+    assert built_logs[0].oper_location == TEST_LOCATION
+    assert 'plain-password' not in built_logs[0].oper_param
+    assert 'plain-password' not in built_logs[0].json_result
+    assert '备注' not in built_logs[0].oper_param
+
+
+def test_raw_event_mode_falls_back_inline_when_payload_too_large(recording_queue: _RecordingQueue) -> None:
+    endpoint = _build_endpoint(Log(title='用户管理', business_type=BusinessType.OTHER), _build_rows(50))
+
+    with (
+        patch.object(LogConfig, 'log_raw_event_enabled', True),
+        patch.object(LogConfig, 'log_raw_event_max_payload_length', 64),
+    ):
+        _call(endpoint, b'{"userName": "ry"}')
+
+    assert recording_queue.raw_events == []
+    assert len(recording_queue.operation_logs) == 1
+    assert recording_queue.operation_logs[0].oper_location == TEST_LOCATION
+
+
+def _measure_p99(endpoint: Any, body: bytes) -> float:
+    latencies = []
+    for _ in range(BENCHMARK_ROUNDS):
+        start_time = time.perf_counter()
+        _call(endpoint, body)
+        latencies.append(time.perf_counter() - start_time)
+    latencies.sort()
+    return latencies[min(len(latencies) - 1, int(len(latencies) * P99_QUANTILE))]
+
+
+@pytest.mark.benchmark
+def test_raw_event_mode_reduces_request_path_p99_latency(recording_queue: _RecordingQueue) -> None:
+    rows = _build_rows(BENCHMARK_ROWS)
+    endpoint = _build_endpoint(Log(title='用户管理', business_type=BusinessType.OTHER), rows)
+    body = json.dumps({'users': rows}).encode()
+
+    with patch.object(LogConfig, 'log_raw_event_enabled', False):
+        inline_p99 = _measure_p99(endpoint, body)
+    with (
+        patch.object(LogConfig, 'log_raw_event_enabled', True),
+        patch.object(LogConfig, 'log_raw_event_max_payload_length', len(body) * 4),
+    ):
+        deferred_p99 = _measure_p99(endpoint, body)
+
+    assert len(recording_queue.raw_events) == BENCHMARK_ROUNDS
+    assert deferred_p99 < inline_p99
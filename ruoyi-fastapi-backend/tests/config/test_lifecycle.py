@@ -4,9 +4,15 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from config.database import Base
-from config.lifecycle import init_create_table
+from config.lifecycle import init_create_table, init_dept_closure, init_expire_export_job
+from module_admin.dao.job_dao import JobDao
+from module_admin.entity.do.dept_do import SysDept, SysDeptClosure
+from module_admin.entity.vo.job_vo import JobModel
+from module_admin.service.export_job_service import ExportJobService
 
 
 @pytest.mark.asyncio
@@ -23,3 +29,73 @@ async def test_init_create_table_uses_registry_connection(monkeypatch: pytest.Mo
     await init_create_table(log_success_enabled=False)
 
     connection.run_sync.assert_awaited_once_with(Base.metadata.create_all)
+
+
+@pytest.mark.asyncio
+async def test_init_dept_closure_backfills_only_empty_closure_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysDept.__table__, SysDeptClosure.__table__])
+    monkeypatch.setattr('config.lifecycle.DataSourceRegistry', SimpleNamespace(session=session_maker))
+    try:
+        # 升级前已有部门数据，闭包表刚创建为空
+        async with session_maker() as session:
+            session.add_all(
+                [
+                    SysDept(dept_id=100, parent_id=0, ancestors='0', dept_name='集团', del_flag='0'),
+                    SysDept(dept_id=101, parent_id=100, ancestors='0,100', dept_name='深圳', del_flag='0'),
+                ]
+            )
+            await session.commit()
+
+        await init_dept_closure()
+        async with session_maker() as session:
+            session.add(SysDept(dept_id=102, parent_id=100, ancestors='0,100', dept_name='长沙', del_flag='0'))
+            await session.commit()
+        # 闭包表已有数据时不再重建，保留在线维护的层级关系
+        await init_dept_closure()
+
+        async with session_maker() as session:
+            rows = (
+                await session.execute(
+                    select(SysDeptClosure.ancestor_id, SysDeptClosure.descendant_id, SysDeptClosure.depth)
+                )
+            ).all()
+    finally:
+        await engine.dispose()
+
+    assert {tuple(row) for row in rows} == {(100, 100, 0), (101, 101, 0), (100, 101, 1)}
+
+
+@pytest.mark.asyncio
+async def test_init_expire_export_job_registers_missing_job_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = SimpleNamespace(commit=AsyncMock(), rollback=AsyncMock())
+
+    @asynccontextmanager
+    async def session_context() -> AsyncGenerator[object, None]:
+        yield session
+
+    registered_jobs: list[JobModel] = []
+
+    async def get_job_detail_by_invoke_target(_db: object, invoke_target: str) -> JobModel | None:
+        return next((job for job in registered_jobs if job.invoke_target == invoke_target), None)
+
+    async def add_job_dao(_db: object, job: JobModel) -> JobModel:
+        registered_jobs.append(job)
+        return job
+
+    monkeypatch.setattr('config.lifecycle.DataSourceRegistry', SimpleNamespace(session=session_context))
+    monkeypatch.setattr(JobDao, 'get_job_detail_by_invoke_target', get_job_detail_by_invoke_target)
+    monkeypatch.setattr(JobDao, 'add_job_dao', add_job_dao)
+
+    # 升级安装的定时任务表缺少过期清理任务，首次启动补充登记，再次启动不重复新增
+    await init_expire_export_job()
+    await init_expire_export_job()
+
+    assert len(registered_jobs) == 1
+    assert registered_jobs[0].invoke_target == ExportJobService.EXPIRE_JOB_INVOKE_TARGET
+    assert registered_jobs[0].cron_expression == '0 0/30 * * * ?'
+    assert registered_jobs[0].job_kwargs == '{"batch_size": 100}'
+    assert registered_jobs[0].status == '0'
+    session.commit.assert_awaited_once()
@@ -0,0 +1,179 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from config.env import LogConfig
+from config.get_scheduler import SchedulerUtil
+from module_admin.entity.do.job_do import SysJobLog
+from module_admin.entity.vo.job_vo import JobLogModel, JobModel
+
+BATCH_SIZE = 50
+JOB_LOG_COUNT = 120
+EXPECTED_BATCHES = 3
+QUEUE_MAX_SIZE = 10
+OVERFLOW_COUNT = 5
+THREAD_JOB_LOG_COUNT = 4
+PARTIAL_BATCH_SIZE = 2
+
+
+def _job_log(index: int) -> JobLogModel:
+    return JobLogModel(
+        jobName=f'任务{index}',
+        jobGroup='default',
+        jobExecutor='default',
+        invokeTarget='module_task.scheduler_test.job',
+        jobArgs='',
+        jobKwargs='{}',
+        jobTrigger='',
+        jobMessage=f'事件类型: JobExecutionEvent, 任务ID: {index}',
+        status='0',
+        exceptionInfo='',
+        createTime=datetime.now(),
+    )
+
+
+@pytest_asyncio.fixture
+async def job_log_db() -> AsyncIterator[SimpleNamespace]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    table = SysJobLog.__table__
+    columns = ', '.join(
+        f'{column.name} integer primary key autoincrement' if column.name == 'job_log_id' else column.name
+        for column in table.columns
+    )
+    async with engine.begin() as connection:
+        await connection.execute(text(f'create table {table.name} ({columns})'))
+    statements: list[int] = []
+
+    def count_statement(*args: Any) -> None:
+        if args[2].lstrip().lower().startswith('insert'):
+            statements.append(1)
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', count_statement)
+
+    async def count_rows() -> int:
+        async with session_maker() as session:
+            return (await session.execute(select(func.count()).select_from(SysJobLog))).scalar()
+
+    registry = SimpleNamespace(session=lambda name=None: session_maker())
+    metrics = dict.fromkeys(SchedulerUtil._job_log_metrics, 0)
+    with (
+        patch('config.get_scheduler.DataSourceRegistry', registry),
+        patch.object(SchedulerUtil, '_job_log_metrics', metrics),
+        patch.object(SchedulerUtil, '_get_session_local', side_effect=AssertionError('不应使用同步会话')),
+        patch.object(LogConfig, 'log_job_batch_size', BATCH_SIZE),
+        patch.object(LogConfig, 'log_job_flush_interval_ms', 20),
+        patch.object(LogConfig, 'log_job_queue_max_size', 10000),
+    ):
+        yield SimpleNamespace(count_rows=count_rows, statements=statements)
+        await SchedulerUtil.stop_job_log_writer()
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_job_logs_are_flushed_in_size_bounded_batches(job_log_db: SimpleNamespace) -> None:
+    SchedulerUtil.start_job_log_writer()
+    for index in range(JOB_LOG_COUNT):
+        SchedulerUtil._enqueue_job_log(_job_log(index))
+    await SchedulerUtil.stop_job_log_writer()
+
+    metrics = SchedulerUtil.get_job_log_writer_metrics()
+    assert await job_log_db.count_rows() == JOB_LOG_COUNT
+    assert len(job_log_db.statements) == EXPECTED_BATCHES
+    assert metrics['enqueued'] == metrics['written'] == JOB_LOG_COUNT
+    assert metrics['batches'] == EXPECTED_BATCHES
+    assert metrics['high_watermark'] == JOB_LOG_COUNT
+    assert metrics['dropped'] == metrics['failed'] == metrics['queue_size'] == 0
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_flushed_after_interval(job_log_db: SimpleNamespace) -> None:
+    SchedulerUtil.start_job_log_writer()
+    for index in range(PARTIAL_BATCH_SIZE):
+        SchedulerUtil._enqueue_job_log(_job_log(index))
+
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if SchedulerUtil.get_job_log_writer_metrics()['written']:
+            break
+
+    assert await job_log_db.count_rows() == PARTIAL_BATCH_SIZE
+    assert SchedulerUtil.get_job_log_writer_metrics()['batches'] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_job_logs_and_counts_overflow(job_log_db: SimpleNamespace) -> None:
+    SchedulerUtil.start_job_log_writer()
+    with patch.object(LogConfig, 'log_job_queue_max_size', QUEUE_MAX_SIZE):
+        for index in range(QUEUE_MAX_SIZE + OVERFLOW_COUNT):
+            SchedulerUtil._enqueue_job_log(_job_log(index))
+    await SchedulerUtil.stop_job_log_writer()
+
+    metrics = SchedulerUtil.get_job_log_writer_metrics()
+    assert await job_log_db.count_rows() == QUEUE_MAX_SIZE
+    assert metrics['dropped'] == OVERFLOW_COUNT
+    assert metrics['written'] == QUEUE_MAX_SIZE
+
+
+@pytest.mark.asyncio
+async def test_job_logs_from_executor_threads_are_handed_to_event_loop(job_log_db: SimpleNamespace) -> None:
+    SchedulerUtil.start_job_log_writer()
+
+    def record_from_thread() -> None:
+        for index in range(THREAD_JOB_LOG_COUNT):
+            SchedulerUtil._enqueue_job_log(_job_log(index))
+
+    await asyncio.to_thread(record_from_thread)
+    await asyncio.sleep(0)
+    await SchedulerUtil.stop_job_log_writer()
+
+    assert await job_log_db.count_rows() == THREAD_JOB_LOG_COUNT
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_counted_without_stopping_writer(job_log_db: SimpleNamespace) -> None:
+    SchedulerUtil.start_job_log_writer()
+    with patch(
+        'config.get_scheduler.JobLogService.add_job_log_batch_services', side_effect=RuntimeError('数据库不可用')
+    ):
+        SchedulerUtil._enqueue_job_log(_job_log(0))
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if SchedulerUtil.get_job_log_writer_metrics()['failed']:
+                break
+    SchedulerUtil._enqueue_job_log(_job_log(1))
+    await SchedulerUtil.stop_job_log_writer()
+
+    metrics = SchedulerUtil.get_job_log_writer_metrics()
+    assert metrics['failed'] == 1
+    assert metrics['written'] == 1
+    assert await job_log_db.count_rows() == 1
+
+
+@pytest.mark.asyncio
+async def test_direct_execution_log_is_queued_instead_of_written_inline(job_log_db: SimpleNamespace) -> None:
+    job_info = JobModel(
+        jobId=1,
+        jobName='直接执行',
+        jobGroup='default',
+        jobExecutor='default',
+        invokeTarget='module_task.scheduler_test.job',
+        cronExpression='0/10 * * * * ?',
+    )
+    SchedulerUtil.start_job_log_writer()
+
+    now = datetime.now()
+    SchedulerUtil._record_job_execution_log(job_info, 'default', '0', '', now, now)
+
+    assert SchedulerUtil.get_job_log_writer_metrics()['queue_size'] == 1
+    assert await job_log_db.count_rows() == 0
+    await SchedulerUtil.stop_job_log_writer()
+    assert await job_log_db.count_rows() == 1
@@ -0,0 +1,489 @@
+import base64
+import json
+import os
+import time
+import tracemalloc
+import uuid
+from collections.abc import Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.types import Message, Receive, Scope, Send
+
+from config.env import TransportCryptoConfig
+from middlewares.transport_crypto_middleware import TransportCryptoMiddleware
+from module_admin.service.online_service import OnlineService
+from module_admin.service.transport_crypto_service import TransportCryptoService
+from utils.transport_crypto_util import TransportCryptoMonitorUtil, TransportCryptoUtil, TransportKeyProvider
+
+KID = 'bench'
+TOKEN = 'token-1'
+OTHER_TOKEN = 'token-2'
+BENCHMARK_REQUESTS = 40
+STATUS_OK = 200
+STATUS_BAD_REQUEST = 400
+CHUNKED_ALGORITHM = 'AES_256_GCM_CHUNKED'
+CHUNKED_HEADERS = [(b'x-transport-response-alg', CHUNKED_ALGORITHM.encode())]
+SMALL_CHUNK_SIZE = 16
+LARGE_RESPONSE_BYTES = 50 * 1024 * 1024
+LARGE_RESPONSE_PIECE_BYTES = 1024 * 1024
+OAEP_PADDING = padding.OAEP(mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None)
+
+
+class _FakePipeline:
+    def __init__(self, redis: '_FakeRedis') -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> '_FakePipeline':
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_value: BaseException | None, traceback: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def get(self, key: str) -> str | None:
+        return self.strings.get(key)
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [self.strings.get(key) for key in keys]
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.strings.pop(key, None) is not None or self.sets.pop(key, None) is not None for key in keys)
+
+    async def expire(self, key: str, seconds: int) -> None:
+        return None
+
+    async def sadd(self, key: str, member: str) -> None:
+        self.sets.setdefault(key, set()).add(member)
+
+    async def srem(self, key: str, member: str) -> None:
+        self.sets.get(key, set()).discard(member)
+
+    async def smembers(self, key: str) -> set[str]:
+        return set(self.sets.get(key, set()))
+
+    async def hmget(self, key: str, fields: list[str]) -> list[None]:
+        return [None for _ in fields]
+
+    async def zrem(self, key: str, *members: str) -> None:
+        return None
+
+    async def hdel(self, key: str, *fields: str) -> None:
+        return None
+
+    # 与内置set同名，放在最后避免遮蔽上方的类型注解
+    async def set(self, key: str, value: str, ex: Any = None, nx: bool = False) -> bool | None:
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        return True
+
+
+async def _echo_app(scope: Scope, receive: Receive, send: Send) -> None:
+    body = await Request(scope, receive).body()
+    await JSONResponse({'echo': json.loads(body)})(scope, receive, send)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode('utf-8').rstrip('=')
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(f'{data}{"=" * ((-len(data)) % 4)}')
+
+
+def _aad_bytes(aad: dict[str, str]) -> bytes:
+    return json.dumps(aad, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _encrypt_payload(aes_key: bytes, payload: dict[str, Any]) -> dict[str, Any]:
+    iv = os.urandom(12)
+    aad = {'method': 'POST', 'path': '/echo'}
+    ciphertext = AESGCM(aes_key).encrypt(iv, json.dumps(payload).encode('utf-8'), _aad_bytes(aad))
+    return {
+        'v': '1',
+        'ts': int(time.time()),
+        'nonce': uuid.uuid4().hex,
+        'aad': aad,
+        'iv': _b64encode(iv),
+        'ct': _b64encode(ciphertext),
+    }
+
+
+def _rsa_envelope(public_key: rsa.RSAPublicKey, aes_key: bytes, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        **_encrypt_payload(aes_key, payload),
+        'kid': KID,
+        'alg': TransportCryptoConfig.transport_crypto_algorithm,
+        'ek': _b64encode(public_key.encrypt(aes_key, OAEP_PADDING)),
+    }
+
+
+def _session_envelope(session_id: str, aes_key: bytes, payload: dict[str, Any]) -> dict[str, Any]:
+    return {**_encrypt_payload(aes_key, payload), 'sid': session_id, 'alg': 'SESSION_AES_256_GCM'}
+
+
+def _scope(redis: _FakeRedis, token: str, extra_headers: list[tuple[bytes, bytes]] | None = None) -> Scope:
+    return {
+        'type': 'http',
+        'method': 'POST',
+        'path': '/echo',
+        'query_string': b'',
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'x-transport-encrypt', b'1'),
+            (b'authorization', f'Bearer {token}'.encode()),
+            *(extra_headers or []),
+        ],
+        'app': SimpleNamespace(state=SimpleNamespace(redis=redis)),
+        'state': {},
+    }
+
+
+def _receive(envelope: dict[str, Any]) -> Receive:
+    body = json.dumps(envelope).encode('utf-8')
+
+    async def receive() -> Message:
+        return {'type': 'http.request', 'body': body, 'more_body': False}
+
+    return receive
+
+
+async def _call(
+    middleware: TransportCryptoMiddleware,
+    redis: _FakeRedis,
+    envelope: dict[str, Any],
+    token: str = TOKEN,
+    extra_headers: list[tuple[bytes, bytes]] | None = None,
+) -> tuple[int, dict[str, str], bytes]:
+    messages: list[Message] = []
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+
+    await middleware(_scope(redis, token, extra_headers), _receive(envelope), send)
+    headers = {key.decode(): value.decode() for key, value in messages[0]['headers']}
+    return messages[0]['status'], headers, b''.join(message.get('body', b'') for message in messages[1:])
+
+
+def _streaming_json_app(pieces: list[bytes], progress: dict[str, int] | None = None) -> Any:
+    progress = progress if progress is not None else {}
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {'type': 'http.response.start', 'status': STATUS_OK, 'headers': [(b'content-type', b'application/json')]}
+        )
+        for index, piece in enumerate(pieces):
+            progress['pieces'] = index + 1
+            await send({'type': 'http.response.body', 'body': piece, 'more_body': index < len(pieces) - 1})
+
+    return app
+
+
+def _decrypt_chunked_response(aes_key: bytes, body: bytes) -> bytes:
+    header, *frames = [json.loads(line) for line in body.splitlines()]
+    assert header['alg'] == CHUNKED_ALGORITHM
+    base_iv = _b64decode(header['iv'])
+    aesgcm = AESGCM(aes_key)
+    chunks = []
+    for sequence, frame in enumerate(frames):
+        final = frame.get('final', False)
+        counter = int.from_bytes(base_iv[4:], 'big') ^ sequence
+        iv = base_iv[:4] + counter.to_bytes(8, 'big')
+        chunk_aad = _aad_bytes({**header['aad'], 'seq': sequence, 'final': final})
+        plaintext = aesgcm.decrypt(iv, _b64decode(frame['ct']), chunk_aad)
+        if final:
+            trailer = json.loads(plaintext)
+            payload = b''.join(chunks)
+            assert trailer == {'chunks': len(chunks), 'length': len(payload)}
+            assert sequence == len(frames) - 1
+            return payload
+        chunks.append(plaintext)
+    raise AssertionError('分段流式响应缺少认证尾帧')
+
+
+def _decrypt_response(aes_key: bytes, body: bytes) -> dict[str, Any]:
+    envelope = json.loads(body)
+    plaintext = AESGCM(aes_key).decrypt(
+        _b64decode(envelope['iv']), _b64decode(envelope['ct']), _aad_bytes(envelope['aad'])
+    )
+    return json.loads(plaintext)
+
+
+async def _create_session(redis: _FakeRedis, aes_key: bytes, token: str = TOKEN) -> str:
+    request = SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(redis=redis)),
+        state=SimpleNamespace(transport_crypto_context={'active': True, 'kid': KID, 'aes_key': aes_key}),
+    )
+    transport_session = await TransportCryptoService.create_transport_session_services(request, token)
+    return transport_session.session_id
+
+
+@pytest.fixture(scope='module')
+def private_key() -> rsa.RSAPrivateKey:
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture(autouse=True)
+def transport_crypto_config(private_key: rsa.RSAPrivateKey) -> Iterator[None]:
+    private_key_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode('utf-8')
+    public_key_pem = (
+        private_key.public_key()
+        .public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        .decode('utf-8')
+    )
+    TransportKeyProvider._key_pairs = None
+    TransportKeyProvider._private_keys = {}
+    with (
+        patch.object(TransportCryptoConfig, 'transport_crypto_enabled', True),
+        patch.object(TransportCryptoConfig, 'transport_crypto_mode', 'optional'),
+        patch.object(TransportCryptoConfig, 'transport_crypto_kid', KID),
+        patch.object(TransportCryptoConfig, 'transport_crypto_private_key', private_key_pem),
+        patch.object(TransportCryptoConfig, 'transport_crypto_public_key', public_key_pem),
+        patch.object(TransportCryptoConfig, 'transport_crypto_legacy_key_pairs', '[]'),
+        patch.object(TransportCryptoConfig, 'transport_crypto_enabled_paths', ''),
+        patch.object(TransportCryptoConfig, 'transport_crypto_session_enabled', True),
+        # 监控统计仅写入进程内计数，避免依赖Redis哈希命令
+        patch.object(TransportCryptoMonitorUtil, '_get_redis_client', return_value=None),
+    ):
+        yield
+    TransportKeyProvider._key_pairs = None
+    TransportKeyProvider._private_keys = {}
+
+
+def test_private_key_is_parsed_once_per_kid() -> None:
+    with patch(
+        'utils.transport_crypto_util.serialization.load_pem_private_key',
+        side_effect=serialization.load_pem_private_key,
+    ) as load_pem_private_key:
+        first = TransportKeyProvider.get_private_key(KID)
+        second = TransportKeyProvider.get_private_key()
+
+    assert first is second
+    load_pem_private_key.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_session_envelope_is_decrypted_with_negotiated_key(private_key: rsa.RSAPrivateKey) -> None:
+    redis = _FakeRedis()
+    middleware = TransportCryptoMiddleware(_echo_app)
+    aes_key = AESGCM.generate_key(bit_length=256)
+
+    status, _, body = await _call(middleware, redis, _rsa_envelope(private_key.public_key(), aes_key, {'n': 0}))
+    assert status == STATUS_OK
+    assert _decrypt_response(aes_key, body) == {'echo': {'n': 0}}
+
+    session_id = await _create_session(redis, aes_key)
+    with patch.object(TransportKeyProvider, 'get_private_key', side_effect=AssertionError('会话模式不应执行RSA解密')):
+        status, headers, body = await _call(middleware, redis, _session_envelope(session_id, aes_key, {'n': 1}))
+
+    assert status == STATUS_OK
+    assert headers['x-key-id'] == KID
+    assert _decrypt_response(aes_key, body) == {'echo': {'n': 1}}
+    assert all(TOKEN not in value for value in redis.strings.values())
+
+
+@pytest.mark.asyncio
+async def test_session_is_bound_to_token_and_revoked_on_logout() -> None:
+    redis = _FakeRedis()
+    middleware = TransportCryptoMiddleware(_echo_app)
+    aes_key = AESGCM.generate_key(bit_length=256)
+    session_id = await _create_session(redis, aes_key)
+
+    status, headers, _ = await _call(middleware, redis, _session_envelope(session_id, aes_key, {}), OTHER_TOKEN)
+    assert status == STATUS_BAD_REQUEST
+    assert headers['x-transport-crypto-status'] == 'session_invalid'
+
+    redis.strings['access_token:session-1'] = TOKEN
+    await OnlineService.remove_online_sessions(redis, ['session-1'])
+
+    status, headers, _ = await _call(middleware, redis, _session_envelope(session_id, aes_key, {}))
+    assert status == STATUS_BAD_REQUEST
+    assert headers['x-transport-crypto-status'] == 'session_invalid'
+    assert redis.strings == {}
+
+
+@pytest.mark.asyncio
+async def test_session_replay_is_rejected() -> None:
+    redis = _FakeRedis()
+    middleware = TransportCryptoMiddleware(_echo_app)
+    aes_key = AESGCM.generate_key(bit_length=256)
+    envelope = _session_envelope(await _create_session(redis, aes_key), aes_key, {})
+
+    first_status, _, _ = await _call(middleware, redis, envelope)
+    replay_status, headers, _ = await _call(middleware, redis, envelope)
+
+    assert first_status == STATUS_OK
+    assert replay_status == STATUS_BAD_REQUEST
+    assert headers['x-transport-crypto-status'] == 'replay_detected'
+
+
+async def _measure_requests_per_second(
+    middleware: TransportCryptoMiddleware, redis: _FakeRedis, envelopes: list[dict[str, Any]]
+) -> float:
+    # 信封在计时前构造完成，仅统计服务端中间件解密、转发与响应加密的耗时
+    start_time = time.perf_counter()
+    for envelope in envelopes:
+        status, _, _ = await _call(middleware, redis, envelope)
+        assert status == STATUS_OK
+    return len(envelopes) / (time.perf_counter() - start_time)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_transport_crypto_requests_per_second_benchmark(private_key: rsa.RSAPrivateKey) -> None:
+    redis = _FakeRedis()
+    middleware = TransportCryptoMiddleware(_echo_app)
+    public_key = private_key.public_key()
+    aes_key = AESGCM.generate_key(bit_length=256)
+    session_id = await _create_session(redis, aes_key)
+
+    def build_rsa_envelopes() -> list[dict[str, Any]]:
+        return [
+            _rsa_envelope(public_key, AESGCM.generate_key(bit_length=256), {'n': index})
+            for index in range(BENCHMARK_REQUESTS)
+        ]
+
+    def reparse_private_key(kid: str | None = None) -> rsa.RSAPrivateKey:
+        private_key_pem = TransportKeyProvider.get_private_key_pem(kid)
+        return serialization.load_pem_private_key(private_key_pem.encode('utf-8'), password=None)
+
+    with patch.object(TransportKeyProvider, 'get_private_key', side_effect=reparse_private_key):
+        reparse_rps = await _measure_requests_per_second(middleware, redis, build_rsa_envelopes())
+    cached_rps = await _measure_requests_per_second(middleware, redis, build_rsa_envelopes())
+    session_rps = await _measure_requests_per_second(
+        middleware,
+        redis,
+        [_session_envelope(session_id, aes_key, {'n': index}) for index in range(BENCHMARK_REQUESTS)],
+    )
+
+    assert cached_rps > reparse_rps
+    assert session_rps > cached_rps
+
+
+def test_frontend_config_advertises_session_mode() -> None:
+    payload = TransportCryptoUtil.build_frontend_config_payload()
+
+    assert payload['sessionEnabled'] is True
+    assert payload['sessionUrl'] == '/transport/crypto/session'
+    assert payload['sessionTtlSeconds'] == TransportCryptoConfig.transport_crypto_session_ttl_seconds
+    assert payload['chunkedResponseEnvelopeAlgorithm'] == CHUNKED_ALGORITHM
+
+
+@pytest.mark.asyncio
+async def test_chunked_response_streams_authenticated_frames(private_key: rsa.RSAPrivateKey) -> None:
+    redis = _FakeRedis()
+    aes_key = AESGCM.generate_key(bit_length=256)
+    pieces = [b'{"rows":[', b'{"userId":1,"userName":"admin"},', b'{"userId":2,"userName":"ry"}', b']}']
+    middleware = TransportCryptoMiddleware(_streaming_json_app(pieces))
+
+    with patch.object(TransportCryptoConfig, 'transport_crypto_response_chunk_size', SMALL_CHUNK_SIZE):
+        status, headers, body = await _call(
+            middleware, redis, _rsa_envelope(private_key.public_key(), aes_key, {}), extra_headers=CHUNKED_HEADERS
+        )
+
+    assert status == STATUS_OK
+    assert headers['x-encrypt-alg'] == CHUNKED_ALGORITHM
+    assert headers['content-type'] == 'application/x-ndjson'
+    assert 'content-length' not in headers
+    assert _decrypt_chunked_response(aes_key, body) == b''.join(pieces)
+
+    lines = body.splitlines()
+    # 分段序号参与认证，截断尾帧或交换分段均无法通过校验
+    with pytest.raises(AssertionError):
+        _decrypt_chunked_response(aes_key, b'\n'.join(lines[:-1]))
+    with pytest.raises(InvalidTag):
+        _decrypt_chunked_response(aes_key, b'\n'.join([lines[0], lines[2], lines[1], *lines[3:]]))
+
+
+@pytest.mark.asyncio
+async def test_clients_without_chunked_negotiation_keep_single_envelope(private_key: rsa.RSAPrivateKey) -> None:
+    redis = _FakeRedis()
+    aes_key = AESGCM.generate_key(bit_length=256)
+    middleware = TransportCryptoMiddleware(_streaming_json_app([b'{"rows":', b'[]}']))
+
+    status, headers, body = await _call(middleware, redis, _rsa_envelope(private_key.public_key(), aes_key, {}))
+
+    assert status == STATUS_OK
+    assert headers['x-encrypt-alg'] == 'AES_256_GCM'
+    assert _decrypt_response(aes_key, body) == {'rows': []}
+
+
+async def _measure_streamed_response(
+    middleware: TransportCryptoMiddleware,
+    progress: dict[str, int],
+    envelope: dict[str, Any],
+    extra_headers: list[tuple[bytes, bytes]] | None = None,
+) -> tuple[int, int | None]:
+    # 下游只统计字节数不保留响应体，峰值内存即为中间件处理过程中的额外占用
+    sent_bytes = 0
+    pieces_before_first_byte: int | None = None
+    progress['pieces'] = 0
+
+    async def send(message: Message) -> None:
+        nonlocal sent_bytes, pieces_before_first_byte
+        if message['type'] == 'http.response.body':
+            sent_bytes += len(message.get('body', b''))
+            if pieces_before_first_byte is None:
+                pieces_before_first_byte = progress['pieces']
+
+    tracemalloc.start()
+    try:
+        await middleware(_scope(_FakeRedis(), TOKEN, extra_headers), _receive(envelope), send)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert sent_bytes > LARGE_RESPONSE_BYTES
+    return peak_bytes, pieces_before_first_byte
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_chunked_response_memory_benchmark(private_key: rsa.RSAPrivateKey) -> None:
+    row = b'{"userId":1,"userName":"admin","nickName":"\xe7\xae\xa1\xe7\x90\x86\xe5\x91\x98","status":"0"},'
+    piece = row * (LARGE_RESPONSE_PIECE_BYTES // len(row))
+    pieces = [b'{"rows":[', *[piece] * (LARGE_RESPONSE_BYTES // len(piece)), b'{}]}']
+    progress = {'pieces': 0}
+    middleware = TransportCryptoMiddleware(_streaming_json_app(pieces, progress))
+    public_key = private_key.public_key()
+
+    buffered_peak, buffered_first_byte = await _measure_streamed_response(
+        middleware, progress, _rsa_envelope(public_key, AESGCM.generate_key(bit_length=256), {})
+    )
+    chunked_peak, chunked_first_byte = await _measure_streamed_response(
+        middleware, progress, _rsa_envelope(public_key, AESGCM.generate_key(bit_length=256), {}), CHUNKED_HEADERS
+    )
+
+    assert chunked_peak * 20 < buffered_peak
+    # 整体加密需等待应用输出全部分片后才下发首字节，分段加密在首个分片输出后即开始下发
+    assert buffered_first_byte == len(pieces)
+    assert chunked_first_byte is not None
+    assert chunked_first_byte <= 1
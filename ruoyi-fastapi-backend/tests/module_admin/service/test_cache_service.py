@@ -0,0 +1,135 @@
+import fnmatch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from module_admin.service.cache_service import CacheService
+
+CACHE_KEY_COUNT = 25
+SCAN_COUNT = 4
+DELETE_BATCH_SIZE = 10
+
+
+class _FakeRedis:
+    def __init__(self, keys: list[str]) -> None:
+        self.store = dict.fromkeys(keys, 'value')
+        self.key_order = sorted(keys)
+        self.delete_calls: list[int] = []
+        self.published: list[tuple[str, str]] = []
+
+    async def keys(self, pattern: str = '*') -> list[str]:
+        raise AssertionError('不应使用KEYS命令')
+
+    async def scan(self, cursor: int = 0, match: str = '*', count: int = 10) -> tuple[int, list[str]]:
+        # 与Redis一致：遍历期间删除键不影响游标位置
+        keys = self.key_order
+        batch = [key for key in keys[cursor : cursor + count] if key in self.store and fnmatch.fnmatchcase(key, match)]
+        next_cursor = cursor + count
+        return (0 if next_cursor >= len(keys) else next_cursor), batch
+
+    async def scan_iter(self, match: str = '*', count: int = 10) -> Any:
+        cursor = 0
+        while True:
+            cursor, batch = await self.scan(cursor, match, count)
+            for key in batch:
+                yield key
+            if cursor == 0:
+                break
+
+    async def delete(self, *keys: str) -> int:
+        self.delete_calls.append(len(keys))
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append((channel, message))
+        return 1
+
+
+def _request(redis: _FakeRedis) -> SimpleNamespace:
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+
+
+def _redis() -> _FakeRedis:
+    return _FakeRedis(
+        [f'sys_dict:type_{index:02d}' for index in range(CACHE_KEY_COUNT)]
+        + ['sys_config:sys.index.skinName', 'sys_dict_extra:other']
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_key_page_walks_scan_cursor_until_exhausted() -> None:
+    redis = _redis()
+    cursor = 0
+    pages: list[list[str]] = []
+    while True:
+        page = await CacheService.get_cache_monitor_cache_key_page_services(_request(redis), 'sys_dict', cursor, 10)
+        pages.append(page.keys)
+        cursor = page.cursor
+        if cursor == 0:
+            break
+
+    cache_keys = [key for page in pages for key in page]
+    assert len(pages) > 1
+    assert sorted(cache_keys) == [f'type_{index:02d}' for index in range(CACHE_KEY_COUNT)]
+    assert await CacheService.get_cache_monitor_cache_key_services(_request(redis), 'sys_dict') == sorted(cache_keys)
+
+
+@pytest.mark.asyncio
+async def test_clear_cache_name_deletes_scanned_keys_in_batches() -> None:
+    redis = _redis()
+
+    with (
+        patch.object(CacheService, '_SCAN_COUNT', SCAN_COUNT),
+        patch.object(CacheService, '_DELETE_BATCH_SIZE', DELETE_BATCH_SIZE),
+    ):
+        await CacheService.clear_cache_monitor_cache_name_services(_request(redis), 'sys_dict:')
+        await CacheService.clear_cache_monitor_cache_key_services(_request(redis), 'skinName')
+
+    assert list(redis.store) == ['sys_dict_extra:other']
+    assert max(redis.delete_calls) <= DELETE_BATCH_SIZE
+    # 清理参数配置与数据字典缓存后需通知各worker失效近端缓存
+    assert {message for _, message in redis.published} == {'*'}
+
+
+@pytest.mark.asyncio
+async def test_clear_all_cache_rebuilds_dict_and_config() -> None:
+    redis = _redis()
+
+    with patch('module_admin.service.cache_service.RedisUtil.warmup_sys_cache', new=AsyncMock()) as warmup_sys_cache:
+        await CacheService.clear_cache_monitor_all_services(_request(redis))
+
+    assert redis.store == {}
+    warmup_sys_cache.assert_awaited_once_with(redis)
+
+
+@pytest.mark.asyncio
+async def test_clear_access_token_cache_removes_online_session_index() -> None:
+    redis = _FakeRedis(
+        [
+            'access_token:session-1',
+            'access_token:session-2',
+            'online_session:index',
+            'online_session:info',
+            'online_session:user:admin',
+            'sys_config:sys.index.skinName',
+        ]
+    )
+
+    await CacheService.clear_cache_monitor_cache_name_services(_request(redis), 'access_token')
+
+    assert list(redis.store) == ['sys_config:sys.index.skinName']
+
+
+@pytest.mark.asyncio
+async def test_clear_access_token_cache_key_removes_its_online_session() -> None:
+    redis = _FakeRedis(['access_token:session-1', 'access_token:session-2', 'sys_dict:session-1'])
+
+    with patch(
+        'module_admin.service.cache_service.OnlineService.remove_online_session_index', new=AsyncMock()
+    ) as remove_online_session_index:
+        await CacheService.clear_cache_monitor_cache_key_services(_request(redis), 'session-1')
+
+    assert list(redis.store) == ['access_token:session-2']
+    remove_online_session_index.assert_awaited_once_with(redis, ['session-1'])
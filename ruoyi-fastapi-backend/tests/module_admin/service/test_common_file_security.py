@@ -3,6 +3,7 @@ import io
 import re
 from collections.abc import AsyncGenerator
 from datetime import datetime, timedelta
+from email.utils import formatdate
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -12,20 +13,24 @@ from fastapi import BackgroundTasks, FastAPI, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import false
 
-from config.env import UploadConfig
+from common.constant import HttpStatusConstant
+from config.env import AppConfig, UploadConfig
 from exceptions.exception import FileRangeNotSatisfiableException, ServiceException
 from middlewares.cors_middleware import add_cors_middleware
 from module_admin.dao.file_access_dao import FileAclDao
 from module_admin.dao.file_info_dao import FileInfoDao
 from module_admin.service.common_service import CommonService
 from sub_applications.staticfiles import SecureStaticFiles
-from utils.file_util import FileUtil
+from utils.file_util import FileDownloadResult, FileUtil
+from utils.response_util import ResponseUtil
 from utils.upload_util import FilePathUtil, UploadUtil
 
 RANGE_TEST_FILE_SIZE = 10
 RANGE_TEST_START = 3
 RANGE_TEST_END = 6
 RANGE_TEST_LENGTH = RANGE_TEST_END - RANGE_TEST_START + 1
+FILE_HASH = 'a' * 64
+FILE_ETAG = f'"{FILE_HASH}"'
 
 
 async def collect_stream(stream: AsyncGenerator[bytes, None]) -> bytes:
@@ -578,6 +583,46 @@ def test_managed_download_records_interrupted_stream(tmp_path: Path) -> None:
     assert enqueue_audit.await_args.kwargs['error_message'] == 'StreamClosed'
 
 
+def test_managed_download_zero_copy_send_records_completion_audit(tmp_path: Path) -> None:
+    storage_root = tmp_path / 'private'
+    target = storage_root / 'upload' / '2026' / '07' / 'report_20260719120000A001.txt'
+    target.parent.mkdir(parents=True)
+    target.write_bytes(b'0123456789')
+    file_info = SimpleNamespace(
+        storage_type='local',
+        access_type='private',
+        upload_user_id=10,
+        owner_user_id=10,
+        expire_time=None,
+        storage_key='upload/2026/07/report_20260719120000A001.txt',
+        original_name='report.txt',
+    )
+    request = SimpleNamespace(base_url='https://example.test/prod-api/', headers={}, client=None)
+    sent_messages: list[dict[str, object]] = []
+
+    async def send(message: dict[str, object]) -> None:
+        sent_messages.append(message)
+
+    async def download() -> None:
+        download_result = await CommonService.download_managed_file_services(
+            request, make_query_db(), make_current_user(), 'file-id'
+        )
+        response = ResponseUtil.file_download(download_result=download_result)
+        scope = {'type': 'http', 'method': 'GET', 'headers': [], 'extensions': {'http.response.pathsend': {}}}
+        await response(scope, AsyncMock(), send)
+
+    with (
+        patch.object(UploadConfig, 'PRIVATE_UPLOAD_PATH', str(storage_root)),
+        patch.object(FileInfoDao, 'get_file_info_by_id', new=AsyncMock(return_value=file_info)),
+        patch.object(CommonService, '_enqueue_file_access_log', new_callable=AsyncMock) as enqueue_audit,
+    ):
+        asyncio.run(download())
+
+    assert sent_messages[-1] == {'type': 'http.response.pathsend', 'path': str(target.resolve())}
+    assert [call.kwargs['result'] for call in enqueue_audit.await_args_list] == ['allowed', 'completed']
+    assert enqueue_audit.await_args_list[1].kwargs['bytes_sent'] == RANGE_TEST_FILE_SIZE
+
+
 def test_managed_download_supports_range_and_records_partial_bytes(tmp_path: Path) -> None:
     storage_root = tmp_path / 'private'
     target = storage_root / 'upload' / '2026' / '07' / 'report_20260719120000A001.txt'
@@ -661,6 +706,119 @@ def test_managed_download_audits_unsatisfied_range_without_disclosing_before_per
     assert enqueue_audit.await_args.kwargs['error_message'] == 'RangeNotSatisfiable'
 
 
+def make_hashed_file_info(access_type: str = 'private') -> SimpleNamespace:
+    return SimpleNamespace(
+        storage_type='local',
+        access_type=access_type,
+        upload_user_id=10,
+        owner_user_id=10,
+        expire_time=None,
+        storage_key='upload/2026/07/report_20260719120000A001.txt',
+        original_name='report.txt',
+        file_hash=FILE_HASH,
+    )
+
+
+def run_conditional_download(
+    tmp_path: Path, file_info: SimpleNamespace, **kwargs: str
+) -> tuple[FileDownloadResult, bytes, AsyncMock, Path]:
+    storage_root = tmp_path / file_info.access_type
+    target = storage_root / file_info.storage_key
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(b'0123456789')
+    request = SimpleNamespace(base_url='https://example.test/prod-api/', headers={}, client=None)
+    storage_path_name = 'PRIVATE_UPLOAD_PATH' if file_info.access_type == 'private' else 'UPLOAD_PATH'
+
+    with (
+        patch.object(UploadConfig, storage_path_name, str(storage_root)),
+        patch.object(FileInfoDao, 'get_file_info_by_id', new=AsyncMock(return_value=file_info)),
+        patch.object(CommonService, '_enqueue_file_access_log', new_callable=AsyncMock) as enqueue_audit,
+    ):
+        download_result = asyncio.run(
+            CommonService.download_managed_file_services(
+                request, make_query_db(), make_current_user(), 'file-id', **kwargs
+            )
+        )
+        content = b'' if download_result.not_modified else asyncio.run(collect_stream(download_result.data))
+
+    return download_result, content, enqueue_audit, target
+
+
+@pytest.mark.parametrize(
+    ('access_type', 'cache_control'),
+    [
+        ('private', AppConfig.app_file_private_cache_control),
+        ('public', AppConfig.app_file_public_cache_control),
+    ],
+)
+def test_managed_download_emits_strong_etag_and_cache_policy(
+    tmp_path: Path, access_type: str, cache_control: str
+) -> None:
+    download_result, content, _, target = run_conditional_download(tmp_path, make_hashed_file_info(access_type))
+    headers = FileUtil.build_cache_headers(download_result)
+
+    assert content == b'0123456789'
+    assert headers['ETag'] == FILE_ETAG
+    assert headers['Cache-Control'] == cache_control
+    assert headers['Last-Modified'] == formatdate(target.stat().st_mtime, usegmt=True)
+
+
+@pytest.mark.parametrize('if_none_match', [FILE_ETAG, f'"stale", W/{FILE_ETAG}', '*'])
+def test_managed_download_returns_not_modified_for_matching_etag(tmp_path: Path, if_none_match: str) -> None:
+    download_result, _, enqueue_audit, _ = run_conditional_download(
+        tmp_path, make_hashed_file_info(), if_none_match=if_none_match, range_header='bytes=3-6'
+    )
+    response = ResponseUtil.file_download(download_result=download_result)
+
+    assert download_result.not_modified
+    assert download_result.data is None
+    assert response.status_code == HttpStatusConstant.NOT_MODIFIED
+    assert response.body == b''
+    assert response.headers['ETag'] == FILE_ETAG
+    assert 'Content-Length' not in response.headers
+    enqueue_audit.assert_awaited_once()
+    assert enqueue_audit.await_args.kwargs['result'] == 'allowed'
+    assert enqueue_audit.await_args.kwargs['operation_detail'] == {'notModified': True}
+
+
+def test_managed_download_etag_falls_back_to_file_stat_without_hash(tmp_path: Path) -> None:
+    file_info = make_hashed_file_info()
+    file_info.file_hash = None
+    download_result, _, _, target = run_conditional_download(tmp_path, file_info)
+    stat_result = target.stat()
+
+    assert download_result.etag == f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+@pytest.mark.parametrize(
+    ('if_range', 'expected'),
+    [
+        (FILE_ETAG, b'3456'),
+        (None, b'3456'),
+        ('"stale"', b'0123456789'),
+        (f'W/{FILE_ETAG}', b'0123456789'),
+        ('Tue, 01 Jan 2002 00:00:00 GMT', b'0123456789'),
+        ('not-a-date', b'0123456789'),
+    ],
+)
+def test_managed_download_honours_if_range(tmp_path: Path, if_range: str | None, expected: bytes) -> None:
+    kwargs = {'range_header': 'bytes=3-6'}
+    if if_range is not None:
+        kwargs['if_range'] = if_range
+    download_result, content, _, _ = run_conditional_download(tmp_path, make_hashed_file_info(), **kwargs)
+
+    assert content == expected
+    assert download_result.byte_range.is_partial == (expected == b'3456')
+
+
+def test_if_range_accepts_matching_last_modified_date() -> None:
+    last_modified = 1784462400.5
+
+    assert FileUtil.resolve_if_range('bytes=3-6', formatdate(last_modified, usegmt=True), '"etag"', last_modified) == (
+        'bytes=3-6'
+    )
+
+
 def test_download_headers_force_attachment_and_disable_sniffing() -> None:
     byte_range = FileUtil.parse_byte_range('bytes=2-5', 10)
     headers = UploadUtil.build_download_headers('../../report.html', byte_range)
@@ -701,6 +859,13 @@ def test_static_files_force_only_html_to_download(tmp_path: Path) -> None:
     assert pdf_response.headers['Content-Type'] == 'application/pdf'
     assert 'Content-Disposition' not in pdf_response.headers
     assert pdf_response.headers['X-Content-Type-Options'] == 'nosniff'
+    assert pdf_response.headers['Cache-Control'] == AppConfig.app_file_static_cache_control
+    assert pdf_response.headers['ETag']
+    not_modified_scope = {**scope, 'headers': [(b'if-none-match', pdf_response.headers['ETag'].encode())]}
+    assert (
+        asyncio.run(static_files.get_response('report.pdf', not_modified_scope)).status_code
+        == HttpStatusConstant.NOT_MODIFIED
+    )
 
 
 def test_cors_exposes_download_headers() -> None:
@@ -0,0 +1,165 @@
+from collections.abc import AsyncIterator, Iterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from common.aspect.data_scope import GetDataScope
+from config.database import Base
+from config.env import AppConfig
+from module_admin.entity.do.dept_do import SysDeptClosure
+from module_admin.entity.do.role_do import SysRoleDept
+from module_admin.entity.do.user_do import SysUser
+from module_admin.service.data_scope_cache_service import DataScopeCacheService
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
+
+USER_ID = 20
+DEPT_ID = 100
+OTHER_DEPT_ID = 200
+CUSTOM_ROLE_ID = 3
+CHILD_ROLE_ID = 4
+SUBTREE_DEPT_IDS = (100, 101, 102)
+CUSTOM_DEPT_IDS = (105, 300)
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+
+    async def get(self, key: str) -> Any:
+        return self.store.get(key)
+
+    async def incr(self, key: str) -> int:
+        self.store[key] = str(int(self.store.get(key) or 0) + 1)
+        return int(self.store[key])
+
+    async def set(self, key: str, value: Any, ex: Any = None) -> None:
+        self.store[key] = value
+
+
+@pytest_asyncio.fixture
+async def scope_db() -> AsyncIterator[SimpleNamespace]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysDeptClosure.__table__, SysRoleDept.__table__])
+    async with session_maker() as session:
+        session.add_all(
+            [SysDeptClosure(ancestor_id=DEPT_ID, descendant_id=dept_id, depth=1) for dept_id in SUBTREE_DEPT_IDS]
+            + [SysDeptClosure(ancestor_id=OTHER_DEPT_ID, descendant_id=OTHER_DEPT_ID, depth=0)]
+            + [SysRoleDept(role_id=CUSTOM_ROLE_ID, dept_id=dept_id) for dept_id in CUSTOM_DEPT_IDS]
+        )
+        await session.commit()
+    statements: list[str] = []
+    event.listen(engine.sync_engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    async with session_maker() as session:
+        yield SimpleNamespace(session=session, statements=statements)
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def fake_redis() -> Iterator[_FakeRedis]:
+    redis = _FakeRedis()
+    UserAuthCacheService.initialize(redis)
+    with (
+        patch.object(DataScopeCacheService, '_local_cache', type(DataScopeCacheService._local_cache)()),
+        patch.object(AppConfig, 'app_data_scope_cache_enabled', True),
+        patch('common.aspect.data_scope.DependencyUtil.check_exclude_routes'),
+    ):
+        yield redis
+    UserAuthCacheService.initialize(None)
+
+
+def _current_user(*roles: tuple[int, str], dept_id: int | None = DEPT_ID) -> SimpleNamespace:
+    return SimpleNamespace(
+        user=SimpleNamespace(
+            user_id=USER_ID,
+            dept_id=dept_id,
+            admin=False,
+            role=[SimpleNamespace(role_id=role_id, data_scope=data_scope) for role_id, data_scope in roles],
+        )
+    )
+
+
+async def _data_scope_sql(redis: _FakeRedis, query_db: AsyncSession, current_user: SimpleNamespace) -> str:
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+    with patch('common.aspect.data_scope.RequestContext.get_current_user', return_value=current_user):
+        param_sql = await GetDataScope(SysUser)(request, query_db)
+    return str(param_sql.compile(compile_kwargs={'literal_binds': True}))
+
+
+@pytest.mark.asyncio
+async def test_dept_scopes_resolve_to_flat_in_list_and_reuse_cache(
+    fake_redis: _FakeRedis, scope_db: SimpleNamespace
+) -> None:
+    current_user = _current_user((CHILD_ROLE_ID, '4'), (CUSTOM_ROLE_ID, '2'), (5, '5'))
+
+    sql = await _data_scope_sql(fake_redis, scope_db.session, current_user)
+    assert 'sys_dept_closure' not in sql
+    assert 'sys_role_dept' not in sql
+    assert 'sys_user.dept_id IN (100, 101, 102, 105, 300)' in sql
+    assert f'sys_user.user_id = {USER_ID}' in sql
+    loaded_statement_count = len(scope_db.statements)
+
+    # 进程内缓存命中
+    assert await _data_scope_sql(fake_redis, scope_db.session, current_user) == sql
+    # 清空进程内缓存后由Redis缓存命中
+    DataScopeCacheService._local_cache.clear()
+    assert await _data_scope_sql(fake_redis, scope_db.session, current_user) == sql
+    assert len(scope_db.statements) == loaded_statement_count
+
+
+@pytest.mark.asyncio
+async def test_permission_epoch_bump_invalidates_resolved_dept_ids(
+    fake_redis: _FakeRedis, scope_db: SimpleNamespace
+) -> None:
+    current_user = _current_user((CUSTOM_ROLE_ID, '2'))
+    assert 'IN (105, 300)' in await _data_scope_sql(fake_redis, scope_db.session, current_user)
+
+    scope_db.session.add(SysRoleDept(role_id=CUSTOM_ROLE_ID, dept_id=OTHER_DEPT_ID))
+    await scope_db.session.commit()
+    assert 'IN (105, 300)' in await _data_scope_sql(fake_redis, scope_db.session, current_user)
+
+    await UserAuthCacheService.bump_permission_epoch()
+    assert 'IN (105, 200, 300)' in await _data_scope_sql(fake_redis, scope_db.session, current_user)
+
+
+@pytest.mark.asyncio
+async def test_custom_scope_resolution_is_shared_across_departments(
+    fake_redis: _FakeRedis, scope_db: SimpleNamespace
+) -> None:
+    await _data_scope_sql(fake_redis, scope_db.session, _current_user((CUSTOM_ROLE_ID, '2')))
+    loaded_statement_count = len(scope_db.statements)
+
+    sql = await _data_scope_sql(
+        fake_redis, scope_db.session, _current_user((CUSTOM_ROLE_ID, '2'), dept_id=OTHER_DEPT_ID)
+    )
+
+    assert 'IN (105, 300)' in sql
+    assert len(scope_db.statements) == loaded_statement_count
+
+
+@pytest.mark.asyncio
+async def test_large_dept_sets_fall_back_to_subquery_predicates(
+    fake_redis: _FakeRedis, scope_db: SimpleNamespace
+) -> None:
+    with patch.object(AppConfig, 'app_data_scope_max_in_size', len(SUBTREE_DEPT_IDS) - 1):
+        sql = await _data_scope_sql(fake_redis, scope_db.session, _current_user((CHILD_ROLE_ID, '4')))
+
+    assert 'sys_dept_closure' in sql
+    assert 'IN (100, 101, 102)' not in sql
+
+
+@pytest.mark.asyncio
+async def test_all_scope_and_missing_department_skip_resolution(
+    fake_redis: _FakeRedis, scope_db: SimpleNamespace
+) -> None:
+    assert await _data_scope_sql(fake_redis, scope_db.session, _current_user((CHILD_ROLE_ID, '4'), (2, '1'))) == 'true'
+    assert await _data_scope_sql(fake_redis, scope_db.session, _current_user((CHILD_ROLE_ID, '4'), dept_id=None)) == (
+        'false'
+    )
+    assert not scope_db.statements
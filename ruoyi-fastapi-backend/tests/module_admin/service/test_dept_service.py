@@ -8,16 +8,19 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from config.database import Base
 from exceptions.exception import ServiceException
 from module_admin.dao.dept_dao import DeptDao
-from module_admin.entity.do.dept_do import SysDept
-from module_admin.entity.vo.dept_vo import DeptSortModel
+from module_admin.entity.do.dept_do import SysDept, SysDeptClosure
+from module_admin.entity.vo.dept_vo import DeleteDeptModel, DeptModel, DeptSortModel
 from module_admin.service.dept_service import DeptService
 
+SHENZHEN_DEPT_ID = 101
+PLATFORM_DEPT_ID = 104
+
 
 async def _create_dept_table() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
     engine = create_async_engine('sqlite+aiosqlite:///:memory:')
     session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
     async with engine.begin() as connection:
-        await connection.run_sync(Base.metadata.create_all, tables=[SysDept.__table__])
+        await connection.run_sync(Base.metadata.create_all, tables=[SysDept.__table__, SysDeptClosure.__table__])
     return engine, session_maker
 
 
@@ -88,3 +91,89 @@ async def test_update_dept_sort_rolls_back_and_wraps_database_error() -> None:
     assert exc_info.value.message == '保存排序异常，请联系管理员'
     query_db.commit.assert_not_awaited()
     query_db.rollback.assert_awaited_once()
+
+
+async def _closure_rows(session: AsyncSession) -> set[tuple[int, int, int]]:
+    rows = await session.execute(select(SysDeptClosure.ancestor_id, SysDeptClosure.descendant_id, SysDeptClosure.depth))
+    return {tuple(row) for row in rows.all()}
+
+
+async def _seed_dept_tree(session: AsyncSession) -> None:
+    session.add(SysDept(dept_id=100, parent_id=0, ancestors='0', dept_name='集团', status='0', del_flag='0'))
+    await DeptDao.add_dept_closure_dao(session, 100, 0)
+    for dept_id, parent_id, dept_name in (
+        (101, 100, '深圳'),
+        (102, 100, '长沙'),
+        (103, 101, '研发'),
+        (104, 103, '平台'),
+    ):
+        await DeptService.add_dept_services(
+            session, DeptModel(deptId=dept_id, parentId=parent_id, deptName=dept_name, status='0')
+        )
+
+
+@pytest.mark.asyncio
+async def test_dept_mutations_keep_closure_table_consistent() -> None:
+    engine, session_maker = await _create_dept_table()
+    try:
+        async with session_maker() as session:
+            await _seed_dept_tree(session)
+            assert await _closure_rows(session) == {
+                (100, 100, 0),
+                (101, 101, 0),
+                (102, 102, 0),
+                (103, 103, 0),
+                (104, 104, 0),
+                (100, 101, 1),
+                (100, 102, 1),
+                (101, 103, 1),
+                (100, 103, 2),
+                (103, 104, 1),
+                (101, 104, 2),
+                (100, 104, 3),
+            }
+
+            # 将103子树从深圳移动到长沙
+            await DeptService.edit_dept_services(
+                session, DeptModel(deptId=103, parentId=102, deptName='研发', status='0')
+            )
+            closure_rows = await _closure_rows(session)
+            assert {
+                (ancestor, depth) for ancestor, descendant, depth in closure_rows if descendant == PLATFORM_DEPT_ID
+            } == {
+                (104, 0),
+                (103, 1),
+                (102, 2),
+                (100, 3),
+            }
+            assert not any(
+                ancestor == SHENZHEN_DEPT_ID and descendant in {103, PLATFORM_DEPT_ID}
+                for ancestor, descendant, _ in closure_rows
+            )
+            children = await DeptDao.get_children_dept_dao(session, 102)
+            assert {dept.dept_id: dept.ancestors for dept in children} == {103: '0,100,102', 104: '0,100,102,103'}
+
+            with patch.object(DeptDao, 'count_dept_user_dao', AsyncMock(return_value=0)):
+                await DeptService.delete_dept_services(session, DeleteDeptModel(deptIds='104'))
+            assert not any(descendant == PLATFORM_DEPT_ID for _, descendant, _ in await _closure_rows(session))
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_edit_dept_rejects_moving_under_own_descendant() -> None:
+    engine, session_maker = await _create_dept_table()
+    try:
+        async with session_maker() as session:
+            await _seed_dept_tree(session)
+            before = await _closure_rows(session)
+
+            with pytest.raises(ServiceException) as exc_info:
+                await DeptService.edit_dept_services(
+                    session, DeptModel(deptId=101, parentId=104, deptName='深圳', status='0')
+                )
+
+            assert exc_info.value.message == '修改部门深圳失败，上级部门不能是自己的子部门'
+            assert await _closure_rows(session) == before
+    finally:
+        await engine.dispose()
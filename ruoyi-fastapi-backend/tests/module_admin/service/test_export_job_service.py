@@ -0,0 +1,312 @@
+import asyncio
+import csv
+import io
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from config.database import Base
+from config.env import AppConfig, UploadConfig
+from exceptions.exception import ServiceException
+from module_admin.entity.do.export_job_do import SysExportJob
+from module_admin.entity.do.file_do import SysFileInfo, SysFileRetentionPolicy
+from module_admin.entity.do.user_do import SysUser
+from module_admin.entity.vo.export_job_vo import ExportJobPageQueryModel
+from module_admin.entity.vo.log_vo import OperLogPageQueryModel
+from module_admin.service.export_job_service import ExportJobService
+from utils.excel_util import ExcelUtil, ExportProgressCallback
+
+USER_ID = 7
+DEPT_ID = 100
+ROW_COUNT = 2500
+BATCH_SIZE = 1000
+RETENTION_HOURS = 24
+SLOT_HEARTBEAT_SECONDS = 0.02
+MAPPING_DICT = {'operId': '日志编号', 'title': '系统模块'}
+
+
+@pytest_asyncio.fixture
+async def session_maker(tmp_path: Path) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    # 导出数据、任务状态与查询分别使用独立会话，使用文件数据库避免内存库共享同一连接
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "export.db"}')
+    maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(
+            Base.metadata.create_all,
+            tables=[
+                SysExportJob.__table__,
+                SysFileInfo.__table__,
+                SysFileRetentionPolicy.__table__,
+                SysUser.__table__,
+            ],
+        )
+    with (
+        patch('module_admin.service.export_job_service.DataSourceRegistry', SimpleNamespace(session=maker)),
+        patch.object(UploadConfig, 'PRIVATE_UPLOAD_PATH', str(tmp_path / 'private')),
+        patch.object(UploadConfig, 'FILE_TRASH_PATH', str(tmp_path / 'trash')),
+        patch.object(ExportJobService, '_semaphore', None),
+        patch.object(ExportJobService, '_running_tasks', {}),
+        patch.object(AppConfig, 'app_export_job_file_retention_hours', RETENTION_HOURS),
+    ):
+        yield maker
+    await engine.dispose()
+
+
+@pytest.fixture
+def current_user() -> Iterator[SimpleNamespace]:
+    yield SimpleNamespace(user=SimpleNamespace(user_id=USER_ID, user_name='admin', dept_id=DEPT_ID))
+
+
+def _stored_files(root: str) -> list[Path]:
+    return [path for path in Path(root).rglob('*') if path.is_file()]
+
+
+def _read_csv(path: Path) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(path.read_text(encoding='utf-8-sig'))))
+
+
+async def _oper_logs(count: int, gate: asyncio.Event | None = None) -> AsyncIterator[dict[str, Any]]:
+    for index in range(count):
+        if gate is not None and index == BATCH_SIZE:
+            await gate.wait()
+        yield {'operId': index, 'title': f'模块{index}'}
+
+
+async def _submit(
+    session_maker: async_sessionmaker[AsyncSession],
+    current_user: SimpleNamespace,
+    gate: asyncio.Event | None = None,
+    progress: list[int] | None = None,
+) -> str:
+    async def export_factory(export_db: AsyncSession, on_progress: ExportProgressCallback) -> AsyncIterator[bytes]:
+        async def report(processed_rows: int) -> None:
+            if progress is not None:
+                progress.append(processed_rows)
+            await on_progress(processed_rows)
+
+        return ExcelUtil.stream_export(
+            _oper_logs(ROW_COUNT, gate), MAPPING_DICT, export_format='csv', batch_size=BATCH_SIZE, on_progress=report
+        )
+
+    async with session_maker() as session:
+        export_job = await ExportJobService.submit_export_job_services(
+            session,
+            current_user,
+            'monitor:operlog',
+            '操作日志',
+            'csv',
+            OperLogPageQueryModel(title='模块'),
+            export_factory,
+        )
+    assert export_job.status == 'pending'
+    return export_job.job_id
+
+
+async def _wait_for_progress(session_maker: async_sessionmaker[AsyncSession], job_id: str, rows: int) -> None:
+    for _ in range(200):
+        async with session_maker() as session:
+            export_job = await session.get(SysExportJob, job_id)
+            if export_job.processed_rows >= rows:
+                return
+        await asyncio.sleep(0.01)
+    raise AssertionError('导出任务进度未更新')
+
+
+@pytest.mark.asyncio
+async def test_export_job_writes_private_file_and_reports_progress(
+    session_maker: async_sessionmaker[AsyncSession], current_user: SimpleNamespace
+) -> None:
+    progress: list[int] = []
+    job_id = await _submit(session_maker, current_user, progress=progress)
+    await ExportJobService._running_tasks[job_id]
+
+    async with session_maker() as session:
+        export_job = await ExportJobService.get_export_job_detail_services(session, current_user, job_id)
+        file_info = await session.get(SysFileInfo, export_job.file_id)
+        page = await ExportJobService.get_export_job_list_services(session, current_user, ExportJobPageQueryModel())
+
+    assert progress == [1000, 2000, 2500]
+    assert export_job.status == 'completed'
+    assert export_job.processed_rows == ROW_COUNT
+    assert export_job.download_url.startswith(f'/common/files/{export_job.file_id}/download/')
+    assert (
+        timedelta(hours=RETENTION_HOURS - 1)
+        < export_job.expire_time - datetime.now()
+        <= timedelta(hours=RETENTION_HOURS)
+    )
+    assert (file_info.access_type, file_info.owner_user_id, file_info.business_type) == ('private', USER_ID, None)
+    assert file_info.original_name == f'{export_job.export_name}.csv'
+    stored_files = _stored_files(UploadConfig.PRIVATE_UPLOAD_PATH)
+    assert stored_files == [Path(UploadConfig.PRIVATE_UPLOAD_PATH, file_info.storage_key)]
+    rows = _read_csv(stored_files[0])
+    assert file_info.file_size == export_job.file_size > 0
+    assert len(rows) == ROW_COUNT + 1
+    assert rows[1] == ['0', '模块0']
+    assert page.total == 1
+    assert page.rows[0].download_url == export_job.download_url
+    assert not ExportJobService._running_tasks
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('local_task', [True, False])
+async def test_cancelled_export_job_stops_and_discards_partial_file(
+    session_maker: async_sessionmaker[AsyncSession], current_user: SimpleNamespace, local_task: bool
+) -> None:
+    gate = asyncio.Event()
+    job_id = await _submit(session_maker, current_user, gate=gate)
+    task = ExportJobService._running_tasks[job_id]
+    await _wait_for_progress(session_maker, job_id, BATCH_SIZE)
+    if not local_task:
+        # 模拟任务在其他进程执行：取消时无法直接中止任务，由下一次进度上报发现取消状态
+        ExportJobService._running_tasks.pop(job_id)
+
+    async with session_maker() as session:
+        export_job = await ExportJobService.cancel_export_job_services(session, current_user, job_id)
+    gate.set()
+    await asyncio.gather(task, return_exceptions=True)
+
+    async with session_maker() as session:
+        file_count = len((await session.execute(select(SysFileInfo))).all())
+        with pytest.raises(ServiceException) as exc_info:
+            await ExportJobService.cancel_export_job_services(session, current_user, job_id)
+    assert exc_info.value.message == '导出任务已结束，无法取消'
+    assert export_job.status == 'cancelled'
+    assert export_job.download_url is None
+    assert file_count == 0
+    assert not _stored_files(UploadConfig.PRIVATE_UPLOAD_PATH)
+
+
+@pytest.mark.asyncio
+async def test_export_job_enforces_per_user_active_limit(
+    session_maker: async_sessionmaker[AsyncSession], current_user: SimpleNamespace
+) -> None:
+    gate = asyncio.Event()
+    with patch.object(AppConfig, 'app_export_job_user_max_active', 1):
+        job_id = await _submit(session_maker, current_user, gate=gate)
+        with pytest.raises(ServiceException) as exc_info:
+            await _submit(session_maker, current_user)
+        assert exc_info.value.message == '最多同时执行1个导出任务，请等待已有任务完成后再试'
+        gate.set()
+        await ExportJobService._running_tasks[job_id]
+        await _submit(session_maker, current_user)
+    await asyncio.gather(*ExportJobService._running_tasks.values())
+
+
+@pytest.mark.asyncio
+async def test_export_job_submission_locks_user_before_counting_active_jobs(
+    session_maker: async_sessionmaker[AsyncSession], current_user: SimpleNamespace
+) -> None:
+    statements: list[str] = []
+    event.listen(
+        session_maker.kw['bind'].sync_engine, 'before_cursor_execute', lambda *args: statements.append(args[2])
+    )
+
+    job_id = await _submit(session_maker, current_user)
+    await ExportJobService._running_tasks[job_id]
+
+    # 用户行锁在统计活跃任务之前获取，并持有至新增任务提交
+    assert 'FROM sys_user' in statements[0]
+    assert 'FROM sys_export_job' in statements[1]
+    assert statements[2].startswith('INSERT INTO sys_export_job')
+
+
+@pytest.mark.asyncio
+async def test_queued_export_job_is_kept_alive_while_waiting_for_worker_slot(
+    session_maker: async_sessionmaker[AsyncSession], current_user: SimpleNamespace
+) -> None:
+    gate = asyncio.Event()
+    with (
+        patch.object(AppConfig, 'app_export_job_max_workers', 1),
+        patch.object(ExportJobService, '_get_slot_heartbeat_seconds', return_value=SLOT_HEARTBEAT_SECONDS),
+    ):
+        running_job_id = await _submit(session_maker, current_user, gate=gate)
+        await _wait_for_progress(session_maker, running_job_id, BATCH_SIZE)
+        queued_job_id = await _submit(session_maker, current_user)
+        async with session_maker() as session:
+            queued_job = await session.get(SysExportJob, queued_job_id)
+            queued_job.update_time = datetime.now() - timedelta(hours=1)
+            await session.commit()
+        await asyncio.sleep(SLOT_HEARTBEAT_SECONDS * 5)
+
+        async with session_maker() as session:
+            await ExportJobService.expire_export_jobs_services(session)
+            queued_job = await session.get(SysExportJob, queued_job_id)
+            assert queued_job.status == 'pending'
+
+        gate.set()
+        await asyncio.gather(*ExportJobService._running_tasks.values())
+
+    async with session_maker() as session:
+        queued_job = await session.get(SysExportJob, queued_job_id)
+    assert queued_job.status == 'completed'
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancels_running_and_queued_jobs_and_marks_them_failed(
+    session_maker: async_sessionmaker[AsyncSession], current_user: SimpleNamespace
+) -> None:
+    gate = asyncio.Event()
+    with patch.object(AppConfig, 'app_export_job_max_workers', 1):
+        running_job_id = await _submit(session_maker, current_user, gate=gate)
+        await _wait_for_progress(session_maker, running_job_id, BATCH_SIZE)
+        queued_job_id = await _submit(session_maker, current_user)
+
+        await ExportJobService.shutdown()
+
+    async with session_maker() as session:
+        export_jobs = [await session.get(SysExportJob, job_id) for job_id in (running_job_id, queued_job_id)]
+    assert not ExportJobService._running_tasks
+    assert [(export_job.status, export_job.error_message) for export_job in export_jobs] == [
+        ('failed', '服务关闭，导出任务已中断')
+    ] * 2
+    assert not _stored_files(UploadConfig.PRIVATE_UPLOAD_PATH)
+
+
+@pytest.mark.asyncio
+async def test_expire_export_jobs_moves_files_to_recycle_bin_and_fails_stale_jobs(
+    session_maker: async_sessionmaker[AsyncSession], current_user: SimpleNamespace
+) -> None:
+    job_id = await _submit(session_maker, current_user)
+    await ExportJobService._running_tasks[job_id]
+    current_time = datetime.now()
+    async with session_maker() as session:
+        export_job = await session.get(SysExportJob, job_id)
+        export_job.expire_time = current_time - timedelta(minutes=1)
+        session.add(
+            SysExportJob(
+                job_id='stale-job',
+                export_type='monitor:operlog',
+                export_name='操作日志',
+                export_format='xlsx',
+                status='running',
+                user_id=USER_ID,
+                create_time=current_time - timedelta(hours=2),
+                update_time=current_time - timedelta(hours=1),
+            )
+        )
+        await session.commit()
+        file_id = export_job.file_id
+
+    async with session_maker() as session:
+        expired_count = await ExportJobService.expire_export_jobs_services(session)
+        assert await ExportJobService.expire_export_jobs_services(session) == 0
+        export_job = await session.get(SysExportJob, job_id)
+        stale_job = await session.get(SysExportJob, 'stale-job')
+        file_info = await session.get(SysFileInfo, file_id)
+
+    assert expired_count == 1
+    assert export_job.status == 'expired'
+    assert stale_job.status == 'failed'
+    assert (file_info.status, file_info.del_flag, file_info.update_by) == ('deleted', '1', 'system')
+    assert not _stored_files(UploadConfig.PRIVATE_UPLOAD_PATH)
+    assert _stored_files(UploadConfig.FILE_TRASH_PATH) == [
+        Path(UploadConfig.FILE_TRASH_PATH, file_info.file_id, file_info.stored_name)
+    ]
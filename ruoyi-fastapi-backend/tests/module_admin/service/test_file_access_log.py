@@ -31,6 +31,25 @@ class AsyncSessionContext:
         return None
 
 
+class FakePipeline:
+    """测试用Redis管道，所有去重锁均获取成功。"""
+
+    def __init__(self) -> None:
+        self.commands = 0
+
+    async def __aenter__(self) -> 'FakePipeline':
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_value: BaseException | None, traceback: object) -> None:
+        return None
+
+    def set(self, *args: object, **kwargs: object) -> None:
+        self.commands += 1
+
+    async def execute(self) -> list[bool]:
+        return [True] * self.commands
+
+
 def make_database_registry(session: SimpleNamespace) -> SimpleNamespace:
     """构造使用测试会话的数据库注册表。"""
     return SimpleNamespace(session=lambda: AsyncSessionContext(session))
@@ -84,7 +103,7 @@ def test_file_access_log_is_enqueued_to_redis_stream() -> None:
 
 def test_file_access_log_event_is_persisted_and_acknowledged() -> None:
     session = SimpleNamespace(commit=AsyncMock(), rollback=AsyncMock())
-    redis = SimpleNamespace(set=AsyncMock(return_value=True), xack=AsyncMock(), delete=AsyncMock())
+    redis = SimpleNamespace(pipeline=lambda transaction=False: FakePipeline(), xack=AsyncMock(), delete=AsyncMock())
     file_access_log = make_file_access_log()
     messages = [
         (
@@ -102,12 +121,14 @@ def test_file_access_log_event_is_persisted_and_acknowledged() -> None:
             'module_admin.service.log_service.DataSourceRegistry',
             make_database_registry(session),
         ),
-        patch.object(FileAccessLogDao, 'add_file_access_log_dao', new_callable=AsyncMock) as add_file_access_log,
+        patch.object(FileAccessLogDao, 'add_file_access_log_batch_dao', new_callable=AsyncMock) as add_file_access_log,
     ):
         asyncio.run(LogAggregatorService._process_messages(redis, LogConfig.log_stream_key, messages))
 
     add_file_access_log.assert_awaited_once()
-    saved_log = add_file_access_log.await_args.args[1]
+    saved_logs = add_file_access_log.await_args.args[1]
+    assert len(saved_logs) == 1
+    saved_log = saved_logs[0]
     assert saved_log.file_id == 'file-id'
     assert saved_log.result == 'completed'
     assert saved_log.operation_detail == '{"newStatus":"active"}'
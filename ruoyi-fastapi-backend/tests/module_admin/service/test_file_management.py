@@ -68,8 +68,9 @@ def mock_file_reference_count() -> Generator[None, None, None]:
         yield
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize('data_scope', [GetDataScope.DATA_SCOPE_DEPT, GetDataScope.DATA_SCOPE_DEPT_AND_CHILD])
-def test_file_data_scope_does_not_match_unowned_files_when_user_has_no_department(data_scope: str) -> None:
+async def test_file_data_scope_does_not_match_unowned_files_when_user_has_no_department(data_scope: str) -> None:
     current_user = SimpleNamespace(
         user=SimpleNamespace(
             user_id=20,
@@ -83,11 +84,11 @@ def test_file_data_scope_does_not_match_unowned_files_when_user_has_no_departmen
         patch('common.aspect.data_scope.DependencyUtil.check_exclude_routes'),
         patch('common.aspect.data_scope.RequestContext.get_current_user', return_value=current_user),
     ):
-        file_data_scope_sql = GetDataScope(
+        file_data_scope_sql = await GetDataScope(
             SysFileInfo,
             user_alias='owner_user_id',
             dept_alias='dept_id',
-        )(SimpleNamespace())
+        )(SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=None))), None)
 
     assert str(file_data_scope_sql).lower() == 'false'
 
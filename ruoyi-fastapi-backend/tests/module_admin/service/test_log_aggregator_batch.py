@@ -0,0 +1,228 @@
+import asyncio
+import json
+import time
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from config.env import LogConfig
+from module_admin.dao.log_dao import OperationLogDao
+from module_admin.entity.do.file_do import SysFileAccessLog
+from module_admin.entity.do.log_do import SysLogininfor, SysOperLog
+from module_admin.entity.vo.log_vo import OperLogModel
+from module_admin.service.log_service import LogAggregatorService
+
+BENCHMARK_EVENT_COUNT = 10000
+BENCHMARK_BATCH_SIZE = 1000
+MIXED_EVENT_COUNT = 3
+EXPECTED_INSERT_STATEMENTS = 3
+
+
+class _FakePipeline:
+    def __init__(self, redis: '_FakeRedis') -> None:
+        self.redis = redis
+        self.keys: list[str] = []
+
+    async def __aenter__(self) -> '_FakePipeline':
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_value: BaseException | None, traceback: object) -> None:
+        return None
+
+    def set(self, key: str, value: str, nx: bool = False, ex: int | None = None) -> None:
+        self.keys.append(key)
+
+    async def execute(self) -> list[bool]:
+        self.redis.round_trips += 1
+        results = []
+        for key in self.keys:
+            results.append(key not in self.redis.dedup_keys)
+            self.redis.dedup_keys.add(key)
+        return results
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.dedup_keys: set[str] = set()
+        self.round_trips = 0
+        self.acked_ids: list[str] = []
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def xack(self, stream_name: str, group_name: str, *message_ids: str) -> int:
+        self.round_trips += 1
+        self.acked_ids.extend(message_ids)
+        return len(message_ids)
+
+    async def delete(self, *keys: str) -> int:
+        self.round_trips += 1
+        self.dedup_keys.difference_update(keys)
+        return len(keys)
+
+
+async def _create_log_tables() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        for table in (SysOperLog.__table__, SysLogininfor.__table__, SysFileAccessLog.__table__):
+            primary_key = next(iter(table.primary_key.columns)).name
+            columns = ', '.join(
+                f'{column.name} integer primary key autoincrement' if column.name == primary_key else column.name
+                for column in table.columns
+            )
+            await connection.execute(text(f'create table {table.name} ({columns})'))
+    return engine, session_maker
+
+
+def _registry(session_maker: async_sessionmaker[AsyncSession]) -> SimpleNamespace:
+    return SimpleNamespace(session=session_maker)
+
+
+def _operation_payload(index: int) -> dict[str, Any]:
+    return OperLogModel(
+        title='用户管理',
+        businessType=1,
+        method='module_admin.controller.user_controller.add_system_user()',
+        requestMethod='POST',
+        operatorType=1,
+        operName='admin',
+        deptName='研发部门',
+        operUrl='/system/user',
+        operIp='127.0.0.1',
+        operLocation='内网IP',
+        operParam=json.dumps({'userName': f'user{index}'}),
+        jsonResult='{"code": 200}',
+        status=0,
+        errorMsg='',
+        operTime=datetime(2026, 10, 18, 12, 0, 0),
+        costTime=index % 100,
+    ).model_dump(by_alias=True, exclude_none=True, mode='json')
+
+
+def _message(index: int, event_type: str, payload: dict[str, Any], event_id: str | None = None) -> tuple[str, dict]:
+    return (
+        f'{index}-0',
+        {'event_type': event_type, 'event_id': event_id or f'event-{index}', 'payload': json.dumps(payload)},
+    )
+
+
+def _count_inserts(engine: AsyncEngine) -> list[str]:
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: Any) -> None:
+        if args[2].lstrip().upper().startswith('INSERT'):
+            statements.append(args[2])
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+def test_process_messages_groups_events_into_multi_row_inserts() -> None:
+    async def run() -> None:
+        engine, session_maker = await _create_log_tables()
+        insert_statements = _count_inserts(engine)
+        redis = _FakeRedis()
+        messages = [_message(index, 'operation', _operation_payload(index)) for index in range(MIXED_EVENT_COUNT)]
+        messages += [
+            _message(
+                index + MIXED_EVENT_COUNT,
+                'login',
+                {'userName': f'user{index}', 'ipaddr': '127.0.0.1', 'status': '0', 'msg': '登录成功'},
+            )
+            for index in range(MIXED_EVENT_COUNT)
+        ]
+        messages += [
+            _message(
+                index + MIXED_EVENT_COUNT * 2,
+                'file_access',
+                {'fileId': f'file-{index}', 'action': 'download', 'result': 'completed', 'bytesSent': index},
+            )
+            for index in range(MIXED_EVENT_COUNT)
+        ]
+        # 重复投递的事件与未知类型事件直接确认，不重复落库
+        messages.append(_message(100, 'operation', _operation_payload(0), event_id='event-0'))
+        messages.append(_message(101, 'unknown', {}))
+
+        with patch('module_admin.service.log_service.DataSourceRegistry', _registry(session_maker)):
+            await LogAggregatorService._process_messages(redis, LogConfig.log_stream_key, messages)
+        async with session_maker() as session:
+            counts = [
+                (await session.execute(select(func.count()).select_from(model))).scalar_one()
+                for model in (SysOperLog, SysLogininfor, SysFileAccessLog)
+            ]
+        await engine.dispose()
+
+        assert counts == [MIXED_EVENT_COUNT] * 3
+        assert len(insert_statements) == EXPECTED_INSERT_STATEMENTS
+        assert redis.round_trips == 2  # noqa: PLR2004
+        assert sorted(redis.acked_ids) == sorted(message_id for message_id, _ in messages)
+
+    asyncio.run(run())
+
+
+def test_process_messages_releases_dedup_keys_when_insert_fails() -> None:
+    async def run() -> None:
+        engine, session_maker = await _create_log_tables()
+        redis = _FakeRedis()
+        messages = [_message(index, 'operation', _operation_payload(index)) for index in range(MIXED_EVENT_COUNT)]
+
+        with (
+            patch('module_admin.service.log_service.DataSourceRegistry', _registry(session_maker)),
+            patch.object(OperationLogDao, 'add_operation_log_batch_dao', side_effect=RuntimeError('db down')),
+            pytest.raises(RuntimeError),
+        ):
+            await LogAggregatorService._process_messages(redis, LogConfig.log_stream_key, messages)
+        await engine.dispose()
+
+        assert redis.dedup_keys == set()
+        assert redis.acked_ids == []
+
+    asyncio.run(run())
+
+
+async def _persist_row_by_row(session_maker: async_sessionmaker[AsyncSession], payloads: list[dict]) -> None:
+    async with session_maker() as session:
+        for payload in payloads:
+            await OperationLogDao.add_operation_log_dao(session, OperLogModel(**payload))
+        await session.commit()
+
+
+@pytest.mark.benchmark
+def test_process_messages_throughput_benchmark() -> None:
+    async def run() -> tuple[float, float]:
+        engine, session_maker = await _create_log_tables()
+        redis = _FakeRedis()
+        messages = [_message(index, 'operation', _operation_payload(index)) for index in range(BENCHMARK_EVENT_COUNT)]
+
+        start_time = time.perf_counter()
+        with (
+            patch('module_admin.service.log_service.DataSourceRegistry', _registry(session_maker)),
+            patch.object(LogConfig, 'log_stream_insert_chunk_size', BENCHMARK_BATCH_SIZE // 2),
+        ):
+            for start in range(0, BENCHMARK_EVENT_COUNT, BENCHMARK_BATCH_SIZE):
+                await LogAggregatorService._process_messages(
+                    redis, LogConfig.log_stream_key, messages[start : start + BENCHMARK_BATCH_SIZE]
+                )
+        batched_rate = BENCHMARK_EVENT_COUNT / (time.perf_counter() - start_time)
+
+        baseline_payloads = [json.loads(data['payload']) for _, data in messages[:BENCHMARK_BATCH_SIZE]]
+        start_time = time.perf_counter()
+        await _persist_row_by_row(session_maker, baseline_payloads)
+        row_by_row_rate = BENCHMARK_BATCH_SIZE / (time.perf_counter() - start_time)
+
+        async with session_maker() as session:
+            total = (await session.execute(select(func.count()).select_from(SysOperLog))).scalar_one()
+        await engine.dispose()
+        assert total == BENCHMARK_EVENT_COUNT + BENCHMARK_BATCH_SIZE
+        assert redis.round_trips == (BENCHMARK_EVENT_COUNT // BENCHMARK_BATCH_SIZE) * 2
+        return batched_rate, row_by_row_rate
+
+    batched_rate, row_by_row_rate = asyncio.run(run())
+
+    assert batched_rate > row_by_row_rate
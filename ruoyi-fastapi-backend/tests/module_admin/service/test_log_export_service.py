@@ -0,0 +1,65 @@
+import io
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from openpyxl import load_workbook
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from config.database import Base
+from module_admin.entity.do.log_do import SysOperLog
+from module_admin.entity.vo.log_vo import OperLogPageQueryModel
+from module_admin.service.dict_service import DictDataService
+from module_admin.service.log_service import OperationLogService
+
+OPER_LOG_COUNT = 2500
+STREAM_BATCH_SIZE = 1000
+
+
+@pytest.mark.asyncio
+async def test_operation_log_export_streams_rows_from_server_side_cursor() -> None:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all, tables=[SysOperLog.__table__])
+            await connection.execute(
+                SysOperLog.__table__.insert(),
+                [
+                    {
+                        'oper_id': index,
+                        'title': '用户管理',
+                        'business_type': index % 3,
+                        'status': index % 2,
+                        'oper_time': datetime(2026, 10, 1, 12, 0, 0),
+                    }
+                    for index in range(1, OPER_LOG_COUNT + 1)
+                ],
+            )
+
+        request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=None)))
+        oper_type_list = [{'dictValue': '1', 'dictLabel': '新增'}, {'dictValue': '2', 'dictLabel': '修改'}]
+        async with session_maker() as session:
+            with (
+                patch.object(
+                    DictDataService, 'query_dict_data_list_from_cache_services', AsyncMock(return_value=oper_type_list)
+                ),
+                patch.object(session, 'execute', side_effect=AssertionError('导出不应一次性加载全量数据')),
+                patch.object(session, 'stream', wraps=session.stream) as stream,
+            ):
+                chunks = await OperationLogService.export_operation_log_list_services(
+                    request, session, OperLogPageQueryModel(isAsc='ascending', orderByColumn='operId')
+                )
+                content = b''.join([chunk async for chunk in chunks])
+
+        stream_query = stream.call_args.args[0]
+        assert stream_query.get_execution_options()['yield_per'] == STREAM_BATCH_SIZE
+        rows = list(load_workbook(io.BytesIO(content)).active.iter_rows(values_only=True))
+        assert len(rows) == OPER_LOG_COUNT + 1
+        assert rows[1][:3] == (1, '用户管理', '新增')
+        assert rows[1][12] == '失败'
+        assert rows[2][2:3] == ('修改',)
+        assert rows[2][12] == '成功'
+    finally:
+        await engine.dispose()
@@ -3,17 +3,26 @@ from unittest.mock import AsyncMock, patch
 
 import jwt
 import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from common.enums import PasswordCharacterType
 from config.env import JwtConfig
 from exceptions.exception import AuthException, ServiceException
 from module_admin.dao.user_dao import UserDao
+from module_admin.entity.do.dept_do import SysDept
+from module_admin.entity.do.menu_do import SysMenu
+from module_admin.entity.do.post_do import SysPost
+from module_admin.entity.do.role_do import SysRole, SysRoleMenu
+from module_admin.entity.do.user_do import SysUser, SysUserPost, SysUserRole
 from module_admin.entity.vo.login_vo import UserRegister
 from module_admin.entity.vo.user_vo import CurrentUserModel
 from module_admin.service.login_service import LoginService
 from module_admin.service.user_service import UserService
 from utils.pwd_util import PwdUtil
 
+EXPECTED_AUTH_LOADER_QUERIES = 2
+
 
 def _current_user(user_name: str = 'admin') -> SimpleNamespace:
     return SimpleNamespace(user=SimpleNamespace(user_name=user_name))
@@ -46,7 +55,7 @@ async def test_get_current_user_rejects_malformed_user_id_claim() -> None:
     )
 
     with (
-        patch.object(UserDao, 'get_user_by_id', new_callable=AsyncMock) as get_user,
+        patch.object(UserDao, 'get_user_auth_info_by_id', new_callable=AsyncMock) as get_user,
         pytest.raises(AuthException) as exc_info,
     ):
         await LoginService.get_current_user(SimpleNamespace(), token, object())
@@ -128,3 +137,104 @@ async def test_register_uses_front_end_default_password_rule() -> None:
 
     assert result is expected
     validate_password.assert_awaited_once_with(redis, 'abcdef', PasswordCharacterType.DEFAULT)
+
+
+async def _create_user_permission_tables() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        for model in (SysUser, SysDept, SysRole, SysUserRole, SysPost, SysUserPost, SysMenu, SysRoleMenu):
+            columns = ', '.join(column.name for column in model.__table__.columns)
+            await connection.execute(text(f'create table {model.__tablename__} ({columns})'))
+    async with session_maker() as session:
+        session.add_all(
+            [
+                SysDept(dept_id=100, parent_id=0, ancestors='0', dept_name='研发部门', status='0', del_flag='0'),
+                SysUser(user_id=1, dept_id=100, user_name='admin', nick_name='管理员', status='0', del_flag='0'),
+                SysUser(user_id=2, dept_id=100, user_name='ry', nick_name='若依', status='0', del_flag='0'),
+                SysRole(role_id=1, role_name='超级管理员', role_key='admin', role_sort=1, status='0', del_flag='0'),
+                SysRole(role_id=2, role_name='普通角色', role_key='common', role_sort=2, status='0', del_flag='0'),
+                SysRole(role_id=3, role_name='停用角色', role_key='disabled', role_sort=3, status='1', del_flag='0'),
+                SysUserRole(user_id=1, role_id=1),
+                SysUserRole(user_id=2, role_id=2),
+                SysUserRole(user_id=2, role_id=3),
+                SysPost(post_id=1, post_code='ceo', post_name='董事长', post_sort=1, status='0'),
+                SysPost(post_id=2, post_code='hr', post_name='人力资源', post_sort=2, status='1'),
+                SysUserPost(user_id=2, post_id=1),
+                SysUserPost(user_id=2, post_id=2),
+                SysMenu(menu_id=1, menu_name='系统管理', parent_id=0, order_num=2, menu_type='M', perms='', status='0'),
+                SysMenu(
+                    menu_id=2,
+                    menu_name='用户管理',
+                    parent_id=1,
+                    order_num=1,
+                    menu_type='C',
+                    perms='system:user:list',
+                    status='0',
+                ),
+                SysMenu(
+                    menu_id=3,
+                    menu_name='用户新增',
+                    parent_id=2,
+                    order_num=1,
+                    menu_type='F',
+                    perms='system:user:add',
+                    status='0',
+                ),
+                SysMenu(menu_id=4, menu_name='监控', parent_id=0, order_num=0, menu_type='M', perms='', status='0'),
+                SysRoleMenu(role_id=2, menu_id=1),
+                SysRoleMenu(role_id=2, menu_id=2),
+                SysRoleMenu(role_id=2, menu_id=3),
+                SysRoleMenu(role_id=3, menu_id=4),
+            ]
+        )
+        await session.commit()
+    return engine, session_maker
+
+
+def _count_select_statements(engine: AsyncEngine) -> list[str]:
+    statements: list[str] = []
+
+    def before_cursor_execute(*args: object) -> None:
+        statements.append(str(args[2]))
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    return statements
+
+
+@pytest.mark.asyncio
+async def test_user_auth_info_loader_uses_two_queries_and_perms_projection() -> None:
+    engine, session_maker = await _create_user_permission_tables()
+    statements = _count_select_statements(engine)
+    try:
+        async with session_maker() as session:
+            user_info = await UserDao.get_user_auth_info_by_id(session, 2)
+            load_statement_count = len(statements)
+            admin_info = await UserDao.get_user_auth_info_by_id(session, 1)
+            missing_info = await UserDao.get_user_auth_info_by_id(session, 99)
+    finally:
+        await engine.dispose()
+
+    assert load_statement_count == EXPECTED_AUTH_LOADER_QUERIES
+    assert user_info['user_basic_info'].user_name == 'ry'
+    assert user_info['user_dept_info'].dept_name == '研发部门'
+    assert [role.role_key for role in user_info['user_role_info']] == ['common']
+    assert user_info['user_post_ids'] == ['1']
+    assert sorted(user_info['user_perms']) == ['', 'system:user:add', 'system:user:list']
+    assert [role.role_key for role in admin_info['user_role_info']] == ['admin']
+    assert admin_info['user_perms'] == []
+    assert missing_info['user_basic_info'] is None
+
+
+@pytest.mark.asyncio
+async def test_user_router_menus_only_include_directories_and_menus() -> None:
+    engine, session_maker = await _create_user_permission_tables()
+    try:
+        async with session_maker() as session:
+            user_menus = await UserDao.get_user_router_menus_by_id(session, 2)
+            admin_menus = await UserDao.get_user_router_menus_by_id(session, 1)
+    finally:
+        await engine.dispose()
+
+    assert [menu.menu_id for menu in user_menus] == [2, 1]
+    assert [menu.menu_id for menu in admin_menus] == [4, 2, 1]
@@ -0,0 +1,258 @@
+import asyncio
+import fnmatch
+import json
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from config.database import Base
+from module_admin.entity.do.dict_do import SysDictData, SysDictType
+from module_admin.service.config_service import ConfigService
+from module_admin.service.dict_service import DictDataService
+from module_admin.service.near_cache_service import SysNearCacheService
+
+READ_COUNT = 5
+UNSUBSCRIBED_READS = 2
+DICT_DATA = [{'dict_label': '正常', 'dict_value': '0'}]
+
+
+class _FakePipeline:
+    def __init__(self, redis: '_FakeRedis', transaction: bool) -> None:
+        self.redis = redis
+        self.transaction = transaction
+        self.commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    async def __aenter__(self) -> '_FakePipeline':
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    def mset(self, mapping: dict[str, str]) -> None:
+        self.commands.append(('mset', (mapping,)))
+
+    def delete(self, *keys: str) -> None:
+        self.commands.append(('delete', keys))
+
+    async def execute(self) -> None:
+        # 事务管道的命令在EXEC时一次性生效
+        assert self.transaction
+        self.redis.executed.append(self.commands)
+        for name, args in self.commands:
+            if name == 'mset':
+                self.redis.values.update(args[0])
+            else:
+                for key in args:
+                    self.redis.values.pop(key, None)
+
+
+class _FakeRedis:
+    def __init__(self, values: dict[str, str]) -> None:
+        self.values = values
+        self.executed: list[list[tuple[str, tuple[Any, ...]]]] = []
+        self.get = AsyncMock(side_effect=self._get)
+        self.set = AsyncMock(side_effect=self._set)
+        self.publish = AsyncMock(return_value=1)
+
+    async def _get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    async def _set(self, key: str, value: str) -> None:
+        self.values[key] = value
+
+    async def scan_iter(self, match: str = '*') -> Any:
+        for key in list(self.values):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self, transaction)
+
+
+class _FakePubSub:
+    def __init__(self, messages: list[dict[str, Any]], gate: asyncio.Event) -> None:
+        self.messages = messages
+        self.gate = gate
+        self.closed = False
+
+    async def subscribe(self, channel: str) -> None:
+        assert channel == SysNearCacheService.CHANNEL
+
+    async def listen(self) -> Any:
+        for message in self.messages:
+            yield message
+        await self.gate.wait()
+        raise ConnectionError('connection lost')
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def near_cache_state() -> Iterator[None]:
+    with (
+        patch.object(SysNearCacheService, '_entries', OrderedDict()),
+        patch.object(SysNearCacheService, '_stats', OrderedDict()),
+        patch.object(SysNearCacheService, '_version', 0),
+        patch.object(SysNearCacheService, '_listening', False),
+    ):
+        yield
+
+
+def _subscribe() -> None:
+    SysNearCacheService._handle_message({'type': 'subscribe', 'data': 1})
+
+
+@pytest.mark.asyncio
+async def test_config_reads_become_memory_lookups_once_subscribed() -> None:
+    redis = _FakeRedis({'sys_config:sys.account.chrtype': '3'})
+
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.chrtype') == '3'
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.chrtype') == '3'
+    assert redis.get.await_count == UNSUBSCRIBED_READS
+
+    _subscribe()
+    for _ in range(READ_COUNT):
+        assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.chrtype') == '3'
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.missing') is None
+    await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.missing')
+
+    assert redis.get.await_count == UNSUBSCRIBED_READS + 2
+    assert SysNearCacheService.get_stats() == {
+        'sys_config:sys.account.chrtype': {'hits': READ_COUNT - 1, 'misses': 3, 'hitRatio': 0.5714},
+        'sys_config:sys.account.missing': {'hits': 1, 'misses': 1, 'hitRatio': 0.5},
+    }
+
+
+@pytest.mark.asyncio
+async def test_writes_and_invalidation_messages_drop_local_entries() -> None:
+    redis = _FakeRedis({'sys_config:sys.index.skinName': 'skin-blue'})
+    _subscribe()
+    await ConfigService.query_config_list_from_cache_services(redis, 'sys.index.skinName')
+
+    await ConfigService.set_config_cache_services(redis, 'sys.index.skinName', 'skin-green')
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.index.skinName') == 'skin-green'
+    redis.publish.assert_awaited_once_with(SysNearCacheService.CHANNEL, json.dumps(['sys_config:sys.index.skinName']))
+
+    # 模拟其他worker修改后发布的失效通知
+    redis.values['sys_config:sys.index.skinName'] = 'skin-red'
+    SysNearCacheService._handle_message({'type': 'message', 'data': json.dumps(['sys_config:sys.index.skinName'])})
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.index.skinName') == 'skin-red'
+
+    redis.values['sys_config:sys.index.skinName'] = 'skin-purple'
+    SysNearCacheService._handle_message({'type': 'message', 'data': '*'})
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.index.skinName') == 'skin-purple'
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_read_is_not_overwritten_by_old_value() -> None:
+    redis = _FakeRedis({'sys_config:sys.user.initPassword': 'old'})
+    _subscribe()
+
+    async def get_then_invalidate(key: str) -> str:
+        value = redis.values[key]
+        redis.values[key] = 'new'
+        SysNearCacheService._handle_message({'type': 'message', 'data': json.dumps([key])})
+        return value
+
+    redis.get.side_effect = get_then_invalidate
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.user.initPassword') == 'old'
+    redis.get.side_effect = redis._get
+    assert await ConfigService.query_config_list_from_cache_services(redis, 'sys.user.initPassword') == 'new'
+
+
+@pytest.mark.asyncio
+async def test_dict_data_is_decoded_once_and_returned_as_copies() -> None:
+    redis = _FakeRedis({})
+    _subscribe()
+    await DictDataService.set_dict_cache_services(redis, 'sys_normal_disable', DICT_DATA)
+
+    with patch('module_admin.service.dict_service.json.loads', wraps=json.loads) as loads:
+        first = await DictDataService.query_dict_data_list_from_cache_services(redis, 'sys_normal_disable')
+        first[0]['dictLabel'] = '已修改'
+        second = await DictDataService.query_dict_data_list_from_cache_services(redis, 'sys_normal_disable')
+
+    assert loads.call_count == 1
+    assert second == [{'dictLabel': '正常', 'dictValue': '0'}]
+    assert await DictDataService.query_dict_data_list_from_cache_services(redis, 'missing_type') == []
+
+
+@pytest.mark.asyncio
+async def test_listener_disables_local_cache_when_subscription_is_lost() -> None:
+    redis = _FakeRedis({'sys_config:sys.account.registerUser': 'true'})
+    gate = asyncio.Event()
+    pubsub = _FakePubSub([{'type': 'subscribe', 'data': 1}], gate)
+    redis.pubsub = lambda: pubsub
+
+    with patch.object(SysNearCacheService, '_RECONNECT_DELAY', 3600):
+        listener = asyncio.create_task(SysNearCacheService.listen_invalidation(redis))
+        await asyncio.sleep(0)
+        await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.registerUser')
+        await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.registerUser')
+        assert SysNearCacheService._listening
+        assert redis.get.await_count == 1
+
+        gate.set()
+        await asyncio.sleep(0)
+        await ConfigService.query_config_list_from_cache_services(redis, 'sys.account.registerUser')
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    assert not SysNearCacheService._listening
+    assert pubsub.closed
+    assert redis.get.await_count == UNSUBSCRIBED_READS
+
+
+@pytest.mark.asyncio
+async def test_dict_warmup_loads_in_one_query_and_replaces_namespace_atomically() -> None:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysDictType.__table__, SysDictData.__table__])
+    redis = _FakeRedis({'sys_dict:removed_type': '[]', 'sys_dict:sys_user_sex': '[]', 'sys_config:kept': 'v'})
+    _subscribe()
+    try:
+        async with session_maker() as session:
+            session.add_all(
+                [
+                    SysDictType(dict_id=1, dict_name='用户性别', dict_type='sys_user_sex', status='0'),
+                    SysDictType(dict_id=2, dict_name='空字典', dict_type='sys_empty', status='0'),
+                    SysDictType(dict_id=3, dict_name='停用字典', dict_type='sys_disabled', status='1'),
+                    SysDictData(dict_code=1, dict_sort=2, dict_label='女', dict_value='1', dict_type='sys_user_sex'),
+                    SysDictData(dict_code=2, dict_sort=1, dict_label='男', dict_value='0', dict_type='sys_user_sex'),
+                    SysDictData(
+                        dict_code=3,
+                        dict_sort=3,
+                        dict_label='停用',
+                        dict_value='2',
+                        dict_type='sys_user_sex',
+                        status='1',
+                    ),
+                    SysDictData(dict_code=4, dict_sort=1, dict_label='停用', dict_value='0', dict_type='sys_disabled'),
+                ]
+            )
+            await session.commit()
+            statements: list[str] = []
+            event.listen(
+                engine.sync_engine,
+                'before_cursor_execute',
+                lambda *args: statements.append(args[2]) if 'sys_dict_data' in args[2] else None,
+            )
+
+            await DictDataService.init_cache_sys_dict_services(session, redis)
+    finally:
+        await engine.dispose()
+
+    assert len(statements) == 1
+    assert len(redis.executed) == 1
+    assert set(redis.values) == {'sys_dict:sys_user_sex', 'sys_dict:sys_empty', 'sys_config:kept'}
+    assert [item['dictLabel'] for item in json.loads(redis.values['sys_dict:sys_user_sex'])] == ['男', '女']
+    assert json.loads(redis.values['sys_dict:sys_empty']) == []
+    redis.publish.assert_awaited_once_with(SysNearCacheService.CHANNEL, '*')
+    assert await DictDataService.query_dict_data_list_from_cache_services(redis, 'removed_type') == []
@@ -1,25 +1,337 @@
+import fnmatch
+import hashlib
+import time
+from collections.abc import AsyncIterator
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from typing import Any
+from unittest.mock import patch
 
+import jwt
 import pytest
+from redis.asyncio.connection import Encoder
+from redis.commands.core import AsyncScript
+from redis.exceptions import NoScriptError
 
-from exceptions.exception import AuthException
-from module_admin.entity.vo.online_vo import OnlineQueryModel
+from config.env import JwtConfig
+from module_admin.entity.vo.online_vo import DeleteOnlineModel, OnlineQueryModel
 from module_admin.service.online_service import OnlineService
+from utils.jwt_util import JwtUtil
+
+PAGE_SIZE = 2
+SESSION_COUNT = 3
+# EVALSHA返回NOSCRIPT、SCRIPT LOAD与重试EVALSHA
+NOSCRIPT_ROUND_TRIPS = 3
+_JWT_DECODE = JwtUtil.decode
+
+
+class _FakePipeline:
+    def __init__(self, redis: '_FakeRedis') -> None:
+        self.redis = redis
+        self.commands: list[tuple[str, tuple, dict]] = []
+
+    async def __aenter__(self) -> '_FakePipeline':
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_value: BaseException | None, traceback: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        def queue(*args: Any, **kwargs: Any) -> None:
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        self.redis.round_trips += 1
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.strings: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.ttls: dict[str, int] = {}
+        # 会话校验脚本已缓存在Redis中
+        self.scripts = {
+            hashlib.sha1(
+                OnlineService._VALIDATE_SESSION_SCRIPT.encode()
+            ).hexdigest(): OnlineService._VALIDATE_SESSION_SCRIPT
+        }
+        self.round_trips = 0
+        self.connection_pool = SimpleNamespace(get_encoder=lambda: Encoder('utf-8', 'strict', True))
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def get(self, key: str) -> str | None:
+        return self.strings.get(key)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.strings.pop(key, None) is not None for key in keys)
+
+    async def exists(self, key: str) -> int:
+        return int(bool(self.zsets.get(key)))
+
+    async def scan_iter(self, match: str, count: int) -> AsyncIterator[str]:
+        for key in list(self.strings):
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    async def zadd(self, key: str, mapping: dict[str, float], xx: bool = False) -> None:
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not xx or member in zset:
+                zset[member] = score
+
+    async def zrem(self, key: str, *members: str) -> None:
+        for member in members:
+            self.zsets.get(key, {}).pop(member, None)
+
+    async def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+    async def zrangebyscore(self, key: str, min_score: str, max_score: float, start: int, num: int) -> list[str]:
+        members = sorted(self.zsets.get(key, {}).items(), key=lambda item: item[1])
+        return [member for member, score in members if score <= max_score][start : start + num]
+
+    async def zrevrange(self, key: str, start: int, end: int) -> list[str]:
+        members = [member for member, _ in sorted(self.zsets.get(key, {}).items(), key=lambda item: -item[1])]
+        return members[start:] if end == -1 else members[start : end + 1]
+
+    async def hset(self, key: str, field: str, value: str) -> None:
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hmget(self, key: str, fields: list[str]) -> list[str | None]:
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    async def hdel(self, key: str, *fields: str) -> None:
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    async def sadd(self, key: str, member: str) -> None:
+        self.sets.setdefault(key, set()).add(member)
+
+    async def srem(self, key: str, member: str) -> None:
+        self.sets.get(key, set()).discard(member)
+
+    async def sinter(self, keys: list[str]) -> set[str]:
+        return set.intersection(*(self.sets.get(key, set()) for key in keys))
+
+    def register_script(self, script: str) -> AsyncScript:
+        return AsyncScript(self, script)
+
+    async def script_load(self, script: str) -> str:
+        self.round_trips += 1
+        sha = hashlib.sha1(script.encode()).hexdigest()
+        self.scripts[sha] = script
+        return sha
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
+        if sha not in self.scripts:
+            self.round_trips += 1
+            raise NoScriptError('NOSCRIPT No matching script.')
+        return await self.eval(self.scripts[sha], numkeys, *keys_and_args)
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
+        # 按续期脚本语义模拟：令牌匹配且剩余过期时间低于阈值时续期令牌与会话索引
+        self.round_trips += 1
+        keys, (token, expire_seconds, threshold_seconds, expire_at, token_id) = (
+            keys_and_args[:numkeys],
+            keys_and_args[numkeys:],
+        )
+        if self.strings.get(keys[0]) != token:
+            return [0]
+        if self.ttls.get(keys[0], -1) < threshold_seconds:
+            self.ttls[keys[0]] = expire_seconds
+            await self.zadd(keys[1], {token_id: expire_at}, xx=True)
+        return [1, *(self.strings.get(key) for key in keys[2:])]
+
+    # 与内置set同名，放在最后避免遮蔽上方的类型注解
+    async def set(self, key: str, value: str, ex: Any = None) -> None:
+        self.strings[key] = value
+
+
+def _request(redis: _FakeRedis) -> SimpleNamespace:
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+
+
+def _login_info(ipaddr: str) -> dict[str, str]:
+    return {
+        'ipaddr': ipaddr,
+        'loginLocation': '内网IP',
+        'browser': 'Chrome',
+        'os': 'Windows 10',
+        'loginTime': '2026-10-18 12:00:00',
+    }
+
+
+async def _login(redis: _FakeRedis, token_id: str, user_name: str, ipaddr: str) -> None:
+    redis.strings[f'access_token:{token_id}'] = f'token-{token_id}'
+    await OnlineService.register_online_session(
+        redis, token_id, OnlineService.build_online_session(user_name, '研发部门', _login_info(ipaddr))
+    )
+
+
+@pytest.fixture
+def redis() -> _FakeRedis:
+    return _FakeRedis()
+
+
+@pytest.fixture(autouse=True)
+def forbid_token_decoding() -> Any:
+    with patch('module_admin.service.online_service.JwtUtil.decode', side_effect=AssertionError('不应解码令牌')):
+        yield
+
+
+async def _seed_sessions(redis: _FakeRedis) -> None:
+    await _login(redis, 'session-1', 'admin', '10.0.0.1')
+    await _login(redis, 'session-2', 'ry', '10.0.0.2')
+    await _login(redis, 'session-3', 'admin', '10.0.0.2')
+    # 按最近活跃时间倒序展示
+    for index, token_id in enumerate(('session-1', 'session-2', 'session-3')):
+        redis.zsets['online_session:index'][token_id] = time.time() + 60 + index
+
+
+@pytest.mark.asyncio
+async def test_online_list_pages_session_index_without_decoding_tokens(redis: _FakeRedis) -> None:
+    await _seed_sessions(redis)
+
+    first_page, total = await OnlineService.get_online_list_services(
+        _request(redis), OnlineQueryModel(pageNum=1, pageSize=PAGE_SIZE)
+    )
+    second_page, _ = await OnlineService.get_online_list_services(
+        _request(redis), OnlineQueryModel(pageNum=2, pageSize=PAGE_SIZE)
+    )
+    all_sessions, all_total = await OnlineService.get_online_list_services(_request(redis), OnlineQueryModel())
+
+    assert total == all_total == SESSION_COUNT
+    assert [session.token_id for session in first_page] == ['session-3', 'session-2']
+    assert [session.token_id for session in second_page] == ['session-1']
+    assert len(all_sessions) == SESSION_COUNT
+    assert first_page[0].user_name == 'admin'
+    assert first_page[0].dept_name == '研发部门'
+    assert first_page[0].login_location == '内网IP'
+
+
+@pytest.mark.asyncio
+async def test_online_list_filters_by_user_name_and_ipaddr(redis: _FakeRedis) -> None:
+    await _seed_sessions(redis)
+
+    by_user, user_total = await OnlineService.get_online_list_services(
+        _request(redis), OnlineQueryModel(userName='admin')
+    )
+    by_ip, _ = await OnlineService.get_online_list_services(_request(redis), OnlineQueryModel(ipaddr='10.0.0.2'))
+    by_both, _ = await OnlineService.get_online_list_services(
+        _request(redis), OnlineQueryModel(userName='admin', ipaddr='10.0.0.2')
+    )
+
+    assert user_total == PAGE_SIZE
+    assert [session.token_id for session in by_user] == ['session-1', 'session-3']
+    assert [session.token_id for session in by_ip] == ['session-2', 'session-3']
+    assert [session.token_id for session in by_both] == ['session-3']
+
+
+@pytest.mark.asyncio
+async def test_online_list_prunes_expired_sessions(redis: _FakeRedis) -> None:
+    await _seed_sessions(redis)
+    redis.zsets['online_session:index']['session-1'] = time.time() - 1
+
+    sessions, total = await OnlineService.get_online_list_services(_request(redis), OnlineQueryModel())
+
+    assert total == SESSION_COUNT - 1
+    assert 'session-1' not in [session.token_id for session in sessions]
+    assert 'session-1' not in redis.hashes['online_session:info']
+    assert redis.sets['online_session:user:admin'] == {'session-3'}
+    assert redis.sets['online_session:ip:10.0.0.1'] == set()
+
+
+@pytest.mark.asyncio
+async def test_force_logout_removes_token_and_session_index(redis: _FakeRedis) -> None:
+    await _seed_sessions(redis)
+
+    await OnlineService.delete_online_services(_request(redis), DeleteOnlineModel(tokenIds='session-1,session-2'))
+
+    assert list(redis.strings) == ['access_token:session-3']
+    assert list(redis.zsets['online_session:index']) == ['session-3']
+    assert list(redis.hashes['online_session:info']) == ['session-3']
+    assert redis.sets['online_session:user:ry'] == set()
 
 
 @pytest.mark.asyncio
-async def test_online_list_skips_tokens_that_cannot_be_decoded() -> None:
-    redis = SimpleNamespace(
-        keys=AsyncMock(return_value=['access_token:stale-session']),
-        get=AsyncMock(return_value='invalid-token'),
+async def test_remove_online_session_index_after_token_cleared(redis: _FakeRedis) -> None:
+    await _seed_sessions(redis)
+    # 缓存监控已直接删除登录令牌，仅剩在线会话索引
+    del redis.strings['access_token:session-2']
+
+    await OnlineService.remove_online_session_index(redis, ['session-2'])
+
+    assert list(redis.zsets['online_session:index']) == ['session-1', 'session-3']
+    assert list(redis.hashes['online_session:info']) == ['session-1', 'session-3']
+    assert redis.sets['online_session:user:ry'] == set()
+    assert redis.sets['online_session:ip:10.0.0.2'] == {'session-3'}
+
+
+@pytest.mark.asyncio
+async def test_validate_refreshes_token_and_session_only_below_threshold(redis: _FakeRedis) -> None:
+    await _seed_sessions(redis)
+    token = redis.strings['access_token:session-1']
+    redis.strings['sys_config:sys.account.chrtype'] = '3'
+    redis.round_trips = 0
+    previous_score = redis.zsets['online_session:index']['session-1']
+    threshold_seconds = JwtConfig.jwt_redis_refresh_threshold_minutes * 60
+
+    redis.ttls['access_token:session-1'] = threshold_seconds + 1
+    values = await OnlineService.validate_online_session(
+        redis, 'access_token:session-1', token, 'session-1', ['sys_config:sys.account.chrtype', 'missing']
     )
-    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+    assert values == ['3', None]
+    assert redis.ttls['access_token:session-1'] == threshold_seconds + 1
+    assert redis.zsets['online_session:index']['session-1'] == previous_score
+
+    redis.ttls['access_token:session-1'] = threshold_seconds - 1
+    assert await OnlineService.validate_online_session(redis, 'access_token:session-1', token, 'session-1') == []
+    assert redis.ttls['access_token:session-1'] == JwtConfig.jwt_redis_expire_minutes * 60
+    assert redis.zsets['online_session:index']['session-1'] > previous_score
+
+    assert await OnlineService.validate_online_session(redis, 'access_token:unknown', 'token', 'unknown') is None
+    assert 'unknown' not in redis.zsets['online_session:index']
+    assert redis.round_trips == SESSION_COUNT
+
+
+@pytest.mark.asyncio
+async def test_validate_runs_script_by_sha_and_loads_it_once_when_missing(redis: _FakeRedis) -> None:
+    await _seed_sessions(redis)
+    token = redis.strings['access_token:session-1']
+    redis.ttls['access_token:session-1'] = JwtConfig.jwt_redis_expire_minutes * 60
+    redis.scripts.clear()
+    redis.round_trips = 0
+
+    # Redis重启或脚本缓存被清空后首次执行返回NOSCRIPT，自动加载脚本后重试
+    assert await OnlineService.validate_online_session(redis, 'access_token:session-1', token, 'session-1') == []
+    assert redis.round_trips == NOSCRIPT_ROUND_TRIPS
+    redis.round_trips = 0
+    assert await OnlineService.validate_online_session(redis, 'access_token:session-1', token, 'session-1') == []
+    assert redis.round_trips == 1
+    assert list(redis.scripts.values()) == [OnlineService._VALIDATE_SESSION_SCRIPT]
+
+
+@pytest.mark.asyncio
+async def test_init_online_session_index_backfills_existing_tokens(redis: _FakeRedis) -> None:
+    token = jwt.encode(
+        {'user_id': '1', 'user_name': 'admin', 'dept_name': '研发部门', 'login_info': _login_info('10.0.0.1')},
+        JwtConfig.jwt_secret_key,
+        algorithm=JwtConfig.jwt_algorithm,
+    )
+    redis.strings['access_token:session-1'] = token
+    redis.strings['access_token:broken'] = 'invalid-token'
+
+    with patch('module_admin.service.online_service.JwtUtil.decode', side_effect=_JWT_DECODE):
+        await OnlineService.init_online_session_index(redis)
 
-    with patch(
-        'module_admin.service.online_service.JwtUtil.decode',
-        side_effect=AuthException(data='', message='用户token已失效，请重新登录'),
-    ):
-        result = await OnlineService.get_online_list_services(request, OnlineQueryModel())
+    sessions, total = await OnlineService.get_online_list_services(_request(redis), OnlineQueryModel())
 
-    assert result == []
+    assert total == 1
+    assert sessions[0].token_id == 'session-1'
+    assert sessions[0].ipaddr == '10.0.0.1'
@@ -0,0 +1,259 @@
+import hashlib
+from collections.abc import Iterator
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import jwt
+import pytest
+from redis.asyncio.connection import Encoder
+from redis.commands.core import AsyncScript
+
+from config.env import AppConfig, JwtConfig
+from module_admin.dao.user_dao import UserDao
+from module_admin.entity.do.dept_do import SysDept
+from module_admin.entity.do.role_do import SysRole
+from module_admin.entity.do.user_do import SysUser
+from module_admin.entity.vo.post_vo import DeletePostModel
+from module_admin.service.login_service import LoginService
+from module_admin.service.near_cache_service import SysNearCacheService
+from module_admin.service.online_service import OnlineService
+from module_admin.service.post_service import PostService
+from module_admin.service.user_auth_cache_service import UserAuthCacheService
+
+USER_ID = 2
+OTHER_USER_ID = 3
+SESSION_ID = 'session-id'
+LOCAL_CACHE_SIZE = 1
+EXPECTED_RELOADS = 2
+BENCHMARK_REQUESTS = 20
+# 改造前每次鉴权依次执行：GET令牌、SET令牌与ZADD会话索引管道、MGET权限版本号、3次参数配置GET
+LEGACY_ROUND_TRIPS_PER_REQUEST = 6
+
+
+class _FakePipeline:
+    def __init__(self, redis: '_FakeRedis') -> None:
+        self.redis = redis
+        self.keys: list[str] = []
+
+    async def __aenter__(self) -> '_FakePipeline':
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_value: BaseException | None, traceback: object) -> None:
+        return None
+
+    def incr(self, key: str) -> None:
+        self.keys.append(key)
+
+    def set(self, key: str, value: Any, ex: Any = None) -> None:
+        self.redis.store[key] = value
+
+    def zadd(self, key: str, mapping: dict[str, float], xx: bool = False) -> None:
+        return None
+
+    async def execute(self) -> list[int]:
+        self.redis.round_trips += 1
+        return [await self.redis.incr(key) for key in self.keys]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, Any] = {}
+        self.round_trips = 0
+        self.writes = 0
+        self.connection_pool = SimpleNamespace(get_encoder=lambda: Encoder('utf-8', 'strict', True))
+        # 会话校验脚本已缓存在Redis中
+        self.scripts = {
+            hashlib.sha1(
+                OnlineService._VALIDATE_SESSION_SCRIPT.encode()
+            ).hexdigest(): OnlineService._VALIDATE_SESSION_SCRIPT
+        }
+
+    async def get(self, key: str) -> Any:
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def mget(self, *keys: str) -> list[Any]:
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    def register_script(self, script: str) -> AsyncScript:
+        return AsyncScript(self, script)
+
+    async def evalsha(self, sha: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
+        return await self.eval(self.scripts[sha], numkeys, *keys_and_args)
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> list[Any]:
+        # 令牌剩余过期时间在测试中始终高于续期阈值，只校验令牌并读取附加缓存键
+        self.round_trips += 1
+        keys, args = keys_and_args[:numkeys], keys_and_args[numkeys:]
+        if self.store.get(keys[0]) != args[0]:
+            return [0]
+        return [1, *(self.store.get(key) for key in keys[2:])]
+
+    async def set(self, key: str, value: Any, ex: Any = None) -> None:
+        self.round_trips += 1
+        self.writes += 1
+        self.store[key] = value
+
+    async def incr(self, key: str) -> int:
+        self.store[key] = str(int(self.store.get(key) or 0) + 1)
+        return int(self.store[key])
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+
+def _query_user(user_id: int = USER_ID) -> dict[str, Any]:
+    return {
+        'user_basic_info': SysUser(
+            user_id=user_id,
+            dept_id=100,
+            user_name=f'user{user_id}',
+            nick_name='测试用户',
+            password='hashed-password',
+            status='0',
+            del_flag='0',
+            pwd_update_date=datetime(2026, 10, 1, 12, 0, 0),
+        ),
+        'user_dept_info': SysDept(dept_id=100, dept_name='研发部门', parent_id=0, ancestors='0', status='0'),
+        'user_role_info': [SysRole(role_id=2, role_key='common', role_name='普通角色', status='0')],
+        'user_post_ids': ['1'],
+        'user_perms': ['system:user:list'],
+    }
+
+
+def _token(redis: _FakeRedis, user_id: int = USER_ID) -> str:
+    token = jwt.encode(
+        {'user_id': str(user_id), 'session_id': f'{SESSION_ID}-{user_id}'},
+        JwtConfig.jwt_secret_key,
+        algorithm=JwtConfig.jwt_algorithm,
+    )
+    redis.store[f'access_token:{SESSION_ID}-{user_id}'] = token
+    return token
+
+
+@pytest.fixture(autouse=True)
+def bind_fake_redis() -> Iterator[_FakeRedis]:
+    redis = _FakeRedis()
+    UserAuthCacheService.initialize(redis)
+    with (
+        patch.object(AppConfig, 'app_same_time_login', True),
+        patch.object(AppConfig, 'app_user_auth_cache_enabled', True),
+    ):
+        yield redis
+    UserAuthCacheService.initialize(None)
+
+
+def _request(redis: _FakeRedis) -> SimpleNamespace:
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_reuses_snapshot_without_database_queries(bind_fake_redis: _FakeRedis) -> None:
+    redis = bind_fake_redis
+    token = _token(redis)
+
+    with patch.object(UserDao, 'get_user_auth_info_by_id', new=AsyncMock(return_value=_query_user())) as get_user:
+        first = await LoginService.get_current_user(_request(redis), token, object())
+        second = await LoginService.get_current_user(_request(redis), token, object())
+        # 模拟其他worker：进程内缓存为空时命中Redis快照
+        UserAuthCacheService._local_cache.clear()
+        third = await LoginService.get_current_user(_request(redis), token, object())
+
+    get_user.assert_awaited_once()
+    assert first.model_dump() == second.model_dump() == third.model_dump()
+    assert second.permissions == ['system:user:list']
+    assert second.roles == ['common']
+    assert second.user.dept.dept_name == '研发部门'
+    assert second.user.post_ids == '1'
+    assert second is not first
+    assert all('hashed-password' not in value for key, value in redis.store.items() if key.startswith('user_auth'))
+
+
+@pytest.mark.asyncio
+async def test_permission_epoch_bump_invalidates_snapshots(bind_fake_redis: _FakeRedis) -> None:
+    redis = bind_fake_redis
+    token = _token(redis)
+    other_token = _token(redis, OTHER_USER_ID)
+
+    with patch.object(
+        UserDao, 'get_user_auth_info_by_id', new=AsyncMock(side_effect=lambda db, user_id: _query_user(user_id))
+    ):
+        await LoginService.get_current_user(_request(redis), token, object())
+        await LoginService.get_current_user(_request(redis), other_token, object())
+        assert UserDao.get_user_auth_info_by_id.await_count == EXPECTED_RELOADS
+
+        # 用户版本号只影响对应用户
+        await UserAuthCacheService.bump_user_permission_epoch([USER_ID])
+        await LoginService.get_current_user(_request(redis), token, object())
+        await LoginService.get_current_user(_request(redis), other_token, object())
+        assert UserDao.get_user_auth_info_by_id.await_count == EXPECTED_RELOADS + 1
+
+        # 全局版本号使所有用户快照失效
+        await UserAuthCacheService.bump_permission_epoch()
+        await LoginService.get_current_user(_request(redis), token, object())
+        await LoginService.get_current_user(_request(redis), other_token, object())
+        assert UserDao.get_user_auth_info_by_id.await_count == EXPECTED_RELOADS * 2 + 1
+
+
+def test_local_cache_is_bounded() -> None:
+    snapshot = SimpleNamespace(model_copy=lambda deep=False: snapshot)
+
+    with patch.object(AppConfig, 'app_user_auth_local_cache_size', LOCAL_CACHE_SIZE):
+        UserAuthCacheService._set_local_snapshot(USER_ID, (0, 0), snapshot)
+        UserAuthCacheService._set_local_snapshot(OTHER_USER_ID, (0, 0), snapshot)
+
+    assert list(UserAuthCacheService._local_cache) == [OTHER_USER_ID]
+
+
+@pytest.mark.asyncio
+async def test_post_mutation_bumps_global_permission_epoch(bind_fake_redis: _FakeRedis) -> None:
+    query_db = SimpleNamespace(commit=AsyncMock(), rollback=AsyncMock())
+
+    with (
+        patch('module_admin.service.post_service.PostDao.count_user_post_dao', new=AsyncMock(return_value=0)),
+        patch('module_admin.service.post_service.PostDao.delete_post_dao', new=AsyncMock()),
+        patch.object(PostService, 'post_detail_services', new=AsyncMock(return_value=SimpleNamespace(post_name='x'))),
+    ):
+        await PostService.delete_post_services(query_db, DeletePostModel(postIds='1'))
+
+    assert bind_fake_redis.store['permission_epoch:global'] == '1'
+
+
+async def _authenticate_repeatedly(redis: _FakeRedis, request_count: int) -> Any:
+    token = _token(redis)
+    redis.store['sys_config:sys.account.chrtype'] = '3'
+    redis.store['sys_config:sys.account.passwordValidateDays'] = '0'
+
+    with (
+        patch.object(UserDao, 'get_user_auth_info_by_id', new=AsyncMock(return_value=_query_user())),
+        patch.object(SysNearCacheService, '_listening', False),
+    ):
+        await LoginService.get_current_user(_request(redis), token, object())
+        redis.round_trips = redis.writes = 0
+        for _ in range(request_count):
+            current_user = await LoginService.get_current_user(_request(redis), token, object())
+
+    return current_user
+
+
+@pytest.mark.asyncio
+async def test_authenticated_request_uses_one_redis_round_trip(bind_fake_redis: _FakeRedis) -> None:
+    current_user = await _authenticate_repeatedly(bind_fake_redis, 1)
+
+    # 令牌剩余过期时间高于续期阈值时只读不写，参数配置与权限版本号随令牌校验一并返回
+    assert bind_fake_redis.round_trips == 1
+    assert bind_fake_redis.writes == 0
+    assert current_user.pwd_chrtype == '3'
+    assert current_user.is_password_expired is False
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_repeated_authenticated_requests_round_trip_benchmark(bind_fake_redis: _FakeRedis) -> None:
+    await _authenticate_repeatedly(bind_fake_redis, BENCHMARK_REQUESTS)
+
+    assert bind_fake_redis.round_trips / BENCHMARK_REQUESTS < LEGACY_ROUND_TRIPS_PER_REQUEST
+    assert bind_fake_redis.writes == 0
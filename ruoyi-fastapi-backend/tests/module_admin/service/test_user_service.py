@@ -1,11 +1,27 @@
+import csv
+import io
+import time
+from collections.abc import AsyncIterator
 from types import SimpleNamespace
-from unittest.mock import AsyncMock
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
+import pandas as pd
 import pytest
+import pytest_asyncio
+from fastapi import UploadFile
+from sqlalchemy import ColumnElement, event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from common.enums import PasswordCharacterType
+from common.vo import CrudResponseModel
+from config.database import Base
+from config.env import AppConfig
 from exceptions.exception import ServiceException
+from module_admin.entity.do.dept_do import SysDept
+from module_admin.entity.do.user_do import SysUser
 from module_admin.service.user_service import UserService
+from utils.pwd_util import PwdUtil
 
 
 @pytest.mark.asyncio
@@ -73,3 +89,267 @@ async def test_validate_password_falls_back_to_default_rule(config_value: str |
     redis = SimpleNamespace(get=AsyncMock(return_value=config_value))
 
     await UserService.validate_password_services(redis, 'abcdef')
+
+
+IMPORT_ADMIN_DEPT_ID = 100
+IMPORT_OTHER_DEPT_ID = 101
+IMPORT_EXISTING_USER_ID = 2
+IMPORT_BENCHMARK_ROWS = 100_000
+IMPORT_CHUNK_SELECT_COUNT = 3
+IMPORT_BENCHMARK_SECONDS = 60
+IMPORT_HEADER = ['部门编号', '登录名称', '用户名称', '用户邮箱', '手机号码', '用户性别', '帐号状态']
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+
+    async def set(self, key: str, value: str, ex: Any = None) -> None:
+        self.values[key] = value
+
+    async def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+
+@pytest_asyncio.fixture
+async def import_session_maker() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        # sqlite仅integer主键支持自增，用户表按实际字段手动建表
+        await connection.execute(
+            text(
+                """
+                create table sys_user (
+                    user_id integer primary key autoincrement,
+                    dept_id bigint,
+                    user_name varchar(30) not null,
+                    nick_name varchar(30) not null,
+                    user_type varchar(2) default '00',
+                    email varchar(50) default '',
+                    phonenumber varchar(11) default '',
+                    sex char(1) default '0',
+                    avatar varchar(100) default '',
+                    password varchar(100) default '',
+                    status char(1) default '0',
+                    del_flag char(1) default '0',
+                    login_ip varchar(128) default '',
+                    login_date datetime,
+                    pwd_update_date datetime,
+                    create_by varchar(64) default '',
+                    create_time datetime,
+                    update_by varchar(64) default '',
+                    update_time datetime,
+                    remark varchar(500)
+                )
+                """
+            )
+        )
+        await connection.run_sync(Base.metadata.create_all, tables=[SysDept.__table__])
+    async with maker() as session:
+        session.add_all(
+            [
+                SysDept(dept_id=IMPORT_ADMIN_DEPT_ID, parent_id=0, dept_name='总公司', del_flag='0'),
+                SysDept(dept_id=IMPORT_OTHER_DEPT_ID, parent_id=IMPORT_ADMIN_DEPT_ID, dept_name='分公司', del_flag='0'),
+                SysUser(user_id=1, dept_id=IMPORT_ADMIN_DEPT_ID, user_name='admin', nick_name='管理员', del_flag='0'),
+                SysUser(
+                    user_id=IMPORT_EXISTING_USER_ID,
+                    dept_id=IMPORT_OTHER_DEPT_ID,
+                    user_name='exist',
+                    nick_name='旧昵称',
+                    password='old-password',
+                    del_flag='0',
+                ),
+            ]
+        )
+        await session.commit()
+    with (
+        patch(
+            'module_admin.service.user_service.ConfigService.query_config_list_from_cache_services',
+            new=AsyncMock(return_value='123456'),
+        ),
+        patch.object(UserService, 'validate_password_services', new=AsyncMock()),
+        patch.object(PwdUtil, 'get_password_hash_async', new=AsyncMock(return_value='hashed-password')),
+        patch('module_admin.service.user_service.UserAuthCacheService.bump_permission_epoch', new=AsyncMock()),
+    ):
+        yield maker
+    await engine.dispose()
+
+
+def _import_csv(rows: list[list[Any]]) -> UploadFile:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([IMPORT_HEADER, *rows])
+    return UploadFile(file=io.BytesIO(buffer.getvalue().encode('utf-8-sig')), filename='user.csv')
+
+
+def _import_xlsx(rows: list[list[Any]]) -> UploadFile:
+    buffer = io.BytesIO()
+    pd.DataFrame(rows, columns=IMPORT_HEADER).to_excel(buffer, index=False)
+    return UploadFile(file=io.BytesIO(buffer.getvalue()), filename='user.xlsx')
+
+
+def _import_user(user_id: int, user_name: str, admin: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(user=SimpleNamespace(user_id=user_id, user_name=user_name, admin=admin))
+
+
+async def _import_users(
+    session_maker: async_sessionmaker[AsyncSession],
+    upload_file: UploadFile,
+    update_support: bool,
+    current_user: SimpleNamespace,
+    redis: _FakeRedis,
+    user_data_scope_sql: ColumnElement | None = None,
+    dept_data_scope_sql: ColumnElement | None = None,
+) -> CrudResponseModel:
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=redis)))
+    async with session_maker() as session:
+        return await UserService.batch_import_user_services(
+            request, session, upload_file, update_support, current_user, user_data_scope_sql, dept_data_scope_sql
+        )
+
+
+async def _imported_users(session_maker: async_sessionmaker[AsyncSession]) -> dict[str, SysUser]:
+    async with session_maker() as session:
+        return {user.user_name: user for user in (await session.execute(select(SysUser))).scalars()}
+
+
+@pytest.mark.asyncio
+async def test_batch_import_users_writes_valid_rows_and_reports_row_errors(
+    import_session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    redis = _FakeRedis()
+    rows = [
+        [IMPORT_ADMIN_DEPT_ID, 'new1', '新用户', 'new1@example.com', 13800000000, '女', '停用'],
+        [IMPORT_OTHER_DEPT_ID, 'exist', '新昵称', '', '', '男', '正常'],
+        [IMPORT_ADMIN_DEPT_ID, 'admin', '管理员', '', '', '男', '正常'],
+        ['', '', '', '', '', '', ''],
+        [IMPORT_ADMIN_DEPT_ID, 'new1', '重复用户', '', '', '男', '正常'],
+        [IMPORT_ADMIN_DEPT_ID, 'bad_mail', '邮箱错误', 'not-an-email', '', '男', '正常'],
+        [999, 'no_dept', '部门错误', '', '', '男', '正常'],
+        [IMPORT_ADMIN_DEPT_ID, '', '缺少账号', '', '', '男', '正常'],
+        [IMPORT_ADMIN_DEPT_ID, 'bad_sex', '性别错误', '', '', '其他', '正常'],
+        ['abc', 'bad_dept', '<script>x</script>', '', '', '男', '正常'],
+    ]
+
+    # 每批两行，覆盖跨批次的重复账号识别
+    with patch.object(AppConfig, 'app_user_import_chunk_size', 2):
+        import_result = await _import_users(
+            import_session_maker, _import_csv(rows), True, _import_user(1, 'admin'), redis
+        )
+
+    users = await _imported_users(import_session_maker)
+    result = import_result.result
+    assert (result.add_count, result.update_count, result.error_count) == (1, 1, 7)
+    assert import_result.message.splitlines()[:3] == [
+        '导入完成，新增1条，更新1条，失败7条',
+        '第4行：不允许操作超级管理员用户',
+        '第6行：用户账号在导入文件中重复',
+    ]
+    assert (users['new1'].dept_id, users['new1'].sex, users['new1'].status) == (IMPORT_ADMIN_DEPT_ID, '1', '1')
+    assert (users['new1'].phonenumber, users['new1'].password, users['new1'].create_by) == (
+        '13800000000',
+        'hashed-password',
+        'admin',
+    )
+    assert (users['exist'].nick_name, users['exist'].password, users['exist'].update_by) == (
+        '新昵称',
+        'old-password',
+        'admin',
+    )
+    assert set(users) == {'admin', 'exist', 'new1'}
+
+    error_report = await UserService.get_import_error_report_services(redis, 1, result.error_report_id)
+    report_rows = list(csv.reader(io.StringIO(error_report.decode('utf-8-sig'))))
+    assert report_rows == [
+        ['行号', '登录名称', '错误信息'],
+        ['4', 'admin', '不允许操作超级管理员用户'],
+        ['6', 'new1', '用户账号在导入文件中重复'],
+        ['7', 'bad_mail', '邮箱格式不正确'],
+        ['8', 'no_dept', '部门不存在或没有权限访问部门数据'],
+        ['9', '', '用户账号不能为空'],
+        ['10', 'bad_sex', '用户性别只能为男、女或未知'],
+        ['11', 'bad_dept', '用户昵称不能包含脚本字符'],
+    ]
+    with pytest.raises(ServiceException) as exc_info:
+        await UserService.get_import_error_report_services(redis, IMPORT_EXISTING_USER_ID, result.error_report_id)
+    assert exc_info.value.message == '导入错误报告不存在或已过期'
+
+
+@pytest.mark.asyncio
+async def test_batch_import_users_rejects_existing_users_without_update_support(
+    import_session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    rows = [[IMPORT_OTHER_DEPT_ID, 'exist', '新昵称', '', '', '男', '正常']]
+
+    import_result = await _import_users(
+        import_session_maker, _import_xlsx(rows), False, _import_user(1, 'admin'), _FakeRedis()
+    )
+
+    users = await _imported_users(import_session_maker)
+    assert import_result.message.splitlines()[1] == '第2行：用户账号exist已存在'
+    assert users['exist'].nick_name == '旧昵称'
+
+
+@pytest.mark.asyncio
+async def test_batch_import_users_checks_data_scope_once_per_chunk(
+    import_session_maker: async_sessionmaker[AsyncSession],
+) -> None:
+    rows = [
+        [IMPORT_ADMIN_DEPT_ID, 'scoped1', '本部门用户', '', '', '男', '正常'],
+        [IMPORT_ADMIN_DEPT_ID, 'scoped2', '本部门用户', '', '', '男', '正常'],
+        [IMPORT_OTHER_DEPT_ID, 'other_dept', '其他部门用户', '', '', '男', '正常'],
+        [IMPORT_ADMIN_DEPT_ID, 'exist', '其他部门已有用户', '', '', '男', '正常'],
+    ]
+    select_statements: list[str] = []
+    sync_engine = import_session_maker.kw['bind'].sync_engine
+
+    def count_select(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.lstrip().upper().startswith('SELECT'):
+            select_statements.append(statement)
+
+    event.listen(sync_engine, 'before_cursor_execute', count_select)
+    try:
+        import_result = await _import_users(
+            import_session_maker,
+            _import_xlsx(rows),
+            True,
+            _import_user(IMPORT_EXISTING_USER_ID + 1, 'dept_admin', admin=False),
+            _FakeRedis(),
+            SysUser.dept_id.in_([IMPORT_ADMIN_DEPT_ID]),
+            SysDept.dept_id.in_([IMPORT_ADMIN_DEPT_ID]),
+        )
+    finally:
+        event.remove(sync_engine, 'before_cursor_execute', count_select)
+
+    users = await _imported_users(import_session_maker)
+    # 已存在用户、用户数据权限与部门数据权限各查询一次，与批次行数无关
+    assert len(select_statements) == IMPORT_CHUNK_SELECT_COUNT
+    assert import_result.message.splitlines()[1:3] == [
+        '第4行：部门不存在或没有权限访问部门数据',
+        '第5行：没有权限访问用户数据',
+    ]
+    assert {'scoped1', 'scoped2'} <= set(users)
+    assert 'other_dept' not in users
+    assert users['exist'].nick_name == '旧昵称'
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_batch_import_users_benchmark(import_session_maker: async_sessionmaker[AsyncSession]) -> None:
+    rows = [
+        [IMPORT_ADMIN_DEPT_ID, f'user{index}', f'用户{index}', f'user{index}@example.com', '13800000000', '男', '正常']
+        for index in range(IMPORT_BENCHMARK_ROWS)
+    ]
+    upload_file = _import_csv(rows)
+
+    start_time = time.perf_counter()
+    import_result = await _import_users(
+        import_session_maker, upload_file, False, _import_user(1, 'admin'), _FakeRedis()
+    )
+    elapsed = time.perf_counter() - start_time
+
+    async with import_session_maker() as session:
+        user_count = (await session.execute(select(func.count()).select_from(SysUser))).scalar_one()
+    assert import_result.result.add_count == IMPORT_BENCHMARK_ROWS
+    assert user_count == IMPORT_BENCHMARK_ROWS + 2
+    assert elapsed < IMPORT_BENCHMARK_SECONDS
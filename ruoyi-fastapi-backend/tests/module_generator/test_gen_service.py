@@ -1,14 +1,21 @@
+import io
+import json
+import zipfile
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from config.database import Base
 from exceptions.exception import ServiceException
+from module_generator.entity.do.gen_do import GenTable, GenTableColumn
 from module_generator.entity.vo.gen_vo import EditGenTableModel, GenTableColumnModel
 from module_generator.service.gen_service import GenTableService
+from utils.template_util import TemplateInitializer
 
 
 def test_get_data_source_list_services_returns_camel_case_response(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -63,8 +70,8 @@ async def test_get_gen_db_table_list_by_name_services_transforms_rows(monkeypatc
 async def test_batch_gen_code_services_rejects_tables_from_other_sources() -> None:
     with (
         patch(
-            'module_generator.service.gen_service.GenTableDao.get_gen_table_names',
-            new=AsyncMock(return_value={'sys_user'}),
+            'module_generator.service.gen_service.GenTableDao.get_gen_tables_by_names',
+            new=AsyncMock(return_value=[SimpleNamespace(table_name='sys_user', sub_table_name=None)]),
         ),
         patch('module_generator.service.gen_service.TemplateInitializer.init_jinja2') as init_jinja2,
         pytest.raises(ServiceException) as exc_info,
@@ -119,3 +126,77 @@ async def test_edit_gen_table_services_preserves_alias_fields_for_both_daos() ->
     assert 'updateTime' not in table_payload
     assert 'createTime' not in column_payload
     assert 'updateTime' not in column_payload
+
+
+def _gen_table_do(table_id: int, table_name: str) -> GenTable:
+    business_name = table_name.removeprefix('biz_')
+    return GenTable(
+        table_id=table_id,
+        table_name=table_name,
+        table_comment=f'{business_name}表',
+        data_source_name='primary',
+        class_name=business_name.capitalize(),
+        tpl_category='crud',
+        tpl_web_type='element-plus',
+        package_name='module_biz',
+        module_name='biz',
+        business_name=business_name,
+        function_name=f'{business_name}管理',
+        function_author='RuoYi',
+        form_col_num=1,
+        gen_type='0',
+        gen_path='/',
+        options=json.dumps({'parentMenuId': 3}),
+        columns=[
+            GenTableColumn(
+                column_id=table_id * 10 + index,
+                table_id=table_id,
+                column_name=column_name,
+                column_comment=column_name,
+                column_type=column_type,
+                python_type=python_type,
+                python_field=column_name,
+                is_pk='1' if index == 0 else '0',
+                is_list='1',
+                html_type='input',
+                sort=index,
+            )
+            for index, (column_name, column_type, python_type) in enumerate(
+                [('id', 'bigint', 'int'), ('name', 'varchar(64)', 'str')]
+            )
+        ],
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_gen_code_services_batches_metadata_and_streams_zip() -> None:
+    table_names = ['biz_order', 'biz_customer', 'biz_order']
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[GenTable.__table__, GenTableColumn.__table__])
+    statements: list[str] = []
+    event.listen(engine.sync_engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        session.add_all([_gen_table_do(1, 'biz_order'), _gen_table_do(2, 'biz_customer')])
+        await session.commit()
+        statements.clear()
+        with patch.object(
+            TemplateInitializer, '_create_environment', wraps=TemplateInitializer._create_environment
+        ) as create_environment:
+            TemplateInitializer._environments.clear()
+            zip_chunks = await GenTableService.batch_gen_code_services(session, table_names, 'primary')
+            await GenTableService.batch_gen_code_services(session, table_names[:1], 'primary')
+        query_count = len(statements)
+    await engine.dispose()
+    chunks = [chunk async for chunk in zip_chunks]
+
+    with zipfile.ZipFile(io.BytesIO(b''.join(chunks))) as zip_file:
+        file_names = zip_file.namelist()
+        controller = zip_file.read('backend/module_biz/controller/order_controller.py').decode('utf-8')
+    assert create_environment.call_count == 1
+    # 首次批量生成：业务表及字段各一次查询，单表生成同样不随表数量增加查询次数
+    assert query_count == len(['gen_table', 'gen_table_column']) * 2
+    assert len([chunk for chunk in chunks if chunk]) > 1
+    assert len(file_names) == len(set(file_names))
+    assert 'backend/module_biz/controller/customer_controller.py' in file_names
+    assert 'OrderService' in controller
@@ -0,0 +1,166 @@
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import event, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from config.database import Base
+from module_admin.dao.dept_dao import DeptDao
+from module_admin.entity.do.dept_do import SysDept, SysDeptClosure
+from module_admin.entity.do.user_do import SysUser
+from module_admin.service.dept_service import DeptService
+from scripts.backfill_dept_closure import backfill_dept_closure
+
+BENCHMARK_DEPT_COUNT = 20000
+BENCHMARK_USER_COUNT = 200000
+BENCHMARK_BRANCHING = 8
+BENCHMARK_QUERY_DEPT_IDS = (2, 9, 17, 73, 150, 600, 1201, 4800)
+EXPECTED_MIN_SPEEDUP = 3
+
+
+def _find_in_set(value: Any, ancestors: str | None) -> int:
+    return int(str(value) in (ancestors or '').split(','))
+
+
+async def _create_tables() -> tuple[AsyncEngine, async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+
+    @event.listens_for(engine.sync_engine, 'connect')
+    def register_find_in_set(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.run_async(lambda connection: connection.create_function('find_in_set', 2, _find_in_set))
+
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysDept.__table__])
+        await connection.execute(text('create table sys_user (user_id integer primary key, dept_id integer)'))
+        await connection.execute(text('create index idx_sys_user_dept_id on sys_user (dept_id)'))
+    return engine, session_maker
+
+
+def _registry(session_maker: async_sessionmaker[AsyncSession]) -> SimpleNamespace:
+    return SimpleNamespace(session=session_maker)
+
+
+def test_build_dept_closure_rows_expands_ancestors_with_depth() -> None:
+    rows = DeptService.build_dept_closure_rows([(100, '0'), (101, '0,100'), (103, '0,100,101')])
+
+    assert rows == [
+        {'ancestor_id': 100, 'descendant_id': 100, 'depth': 0},
+        {'ancestor_id': 101, 'descendant_id': 101, 'depth': 0},
+        {'ancestor_id': 100, 'descendant_id': 101, 'depth': 1},
+        {'ancestor_id': 103, 'descendant_id': 103, 'depth': 0},
+        {'ancestor_id': 101, 'descendant_id': 103, 'depth': 1},
+        {'ancestor_id': 100, 'descendant_id': 103, 'depth': 2},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_backfill_creates_table_and_rebuilds_closure_from_ancestors() -> None:
+    engine, session_maker = await _create_tables()
+    try:
+        async with session_maker() as session:
+            session.add_all(
+                [
+                    SysDept(dept_id=100, parent_id=0, ancestors='0', dept_name='集团', del_flag='0'),
+                    SysDept(dept_id=101, parent_id=100, ancestors='0,100', dept_name='深圳', del_flag='0'),
+                    SysDept(dept_id=102, parent_id=100, ancestors='0,100', dept_name='已删除', del_flag='2'),
+                ]
+            )
+            await session.commit()
+
+        with patch('scripts.backfill_dept_closure.DataSourceRegistry', _registry(session_maker)):
+            dry_run_count = await backfill_dept_closure(dry_run=True)
+            closure_count = await backfill_dept_closure()
+            # 重复执行时先清空再重建，结果保持一致
+            await backfill_dept_closure()
+
+        async with session_maker() as session:
+            rows = (
+                await session.execute(
+                    select(SysDeptClosure.ancestor_id, SysDeptClosure.descendant_id, SysDeptClosure.depth)
+                )
+            ).all()
+
+        assert dry_run_count == closure_count == len(rows)
+        assert {tuple(row) for row in rows} == {(100, 100, 0), (101, 101, 0), (100, 101, 1)}
+    finally:
+        await engine.dispose()
+
+
+async def _seed_benchmark_tree(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    ancestors = {1: '0'}
+    dept_rows = [{'dept_id': 1, 'parent_id': 0, 'ancestors': '0', 'dept_name': '部门1', 'del_flag': '0'}]
+    for dept_id in range(2, BENCHMARK_DEPT_COUNT + 1):
+        parent_id = (dept_id - 2) // BENCHMARK_BRANCHING + 1
+        ancestors[dept_id] = f'{ancestors[parent_id]},{parent_id}'
+        dept_rows.append(
+            {
+                'dept_id': dept_id,
+                'parent_id': parent_id,
+                'ancestors': ancestors[dept_id],
+                'dept_name': f'部门{dept_id}',
+                'del_flag': '0',
+            }
+        )
+    user_rows = [
+        {'user_id': user_id, 'dept_id': user_id % BENCHMARK_DEPT_COUNT + 1}
+        for user_id in range(1, BENCHMARK_USER_COUNT + 1)
+    ]
+    async with session_maker() as session:
+        await session.execute(SysDept.__table__.insert(), dept_rows)
+        await session.execute(text('insert into sys_user (user_id, dept_id) values (:user_id, :dept_id)'), user_rows)
+        await session.commit()
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_benchmark_closure_subtree_predicate_against_find_in_set() -> None:
+    engine, session_maker = await _create_tables()
+    try:
+        await _seed_benchmark_tree(session_maker)
+        with patch('scripts.backfill_dept_closure.DataSourceRegistry', _registry(session_maker)):
+            await backfill_dept_closure()
+
+        user_table = SysUser.__table__
+
+        def find_in_set_sql(dept_id: int) -> Any:
+            return (
+                select(func.count())
+                .select_from(user_table)
+                .where(
+                    user_table.c.dept_id.in_(
+                        select(SysDept.dept_id).where(
+                            or_(SysDept.dept_id == dept_id, func.find_in_set(dept_id, SysDept.ancestors))
+                        )
+                    )
+                )
+            )
+
+        def closure_sql(dept_id: int) -> Any:
+            return (
+                select(func.count())
+                .select_from(user_table)
+                .where(user_table.c.dept_id.in_(DeptDao.get_dept_subtree_ids_sql(dept_id)))
+            )
+
+        async with session_maker() as session:
+            start = time.perf_counter()
+            find_in_set_counts = [
+                (await session.execute(find_in_set_sql(dept_id))).scalar() for dept_id in BENCHMARK_QUERY_DEPT_IDS
+            ]
+            find_in_set_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            closure_counts = [
+                (await session.execute(closure_sql(dept_id))).scalar() for dept_id in BENCHMARK_QUERY_DEPT_IDS
+            ]
+            closure_seconds = time.perf_counter() - start
+
+        assert closure_counts == find_in_set_counts
+        assert closure_counts[0] > 0
+        assert closure_seconds * EXPECTED_MIN_SPEEDUP < find_in_set_seconds
+    finally:
+        await engine.dispose()
@@ -53,9 +53,11 @@ async def test_initialize_application_runtime_delegates_plugin_steps() -> None:
         patch('server.DataSourceRegistry.initialize', new_callable=AsyncMock) as initialize_data_sources,
         patch('server.get_plugin_application_runtime', return_value=fake_plugin_runtime),
         patch('server.init_create_table', new_callable=AsyncMock) as init_create_table,
+        patch('server.init_dept_closure', new_callable=AsyncMock) as init_dept_closure,
+        patch('server.init_expire_export_job', new_callable=AsyncMock) as init_expire_export_job,
         patch('server.RedisUtil.check_redis_connection', new_callable=AsyncMock) as check_redis_connection,
-        patch('server.RedisUtil.init_sys_dict', new_callable=AsyncMock) as init_sys_dict,
-        patch('server.RedisUtil.init_sys_config', new_callable=AsyncMock) as init_sys_config,
+        patch('server.RedisUtil.warmup_sys_cache', new_callable=AsyncMock) as warmup_sys_cache,
+        patch('server.OnlineService.init_online_session_index', new_callable=AsyncMock) as init_online_session_index,
         patch('server._start_background_tasks', new_callable=AsyncMock) as start_background_tasks,
     ):
         await _initialize_application_runtime(fake_app, application_leader=True)
@@ -65,6 +67,8 @@ async def test_initialize_application_runtime_delegates_plugin_steps() -> None:
             stage='platform',
             log_success_enabled=True,
         )
+        init_dept_closure.assert_awaited_once_with()
+        init_expire_export_job.assert_awaited_once_with()
         startup_call = fake_plugin_runtime.startup.await_args
         assert startup_call.args == (fake_app,)
         create_plugin_entity_tables = startup_call.kwargs['create_tables']
@@ -78,8 +82,8 @@ async def test_initialize_application_runtime_delegates_plugin_steps() -> None:
             log_enabled=True,
             log_error_enabled=True,
         )
-        init_sys_dict.assert_awaited_once_with(fake_app.state.redis)
-        init_sys_config.assert_awaited_once_with(fake_app.state.redis)
+        warmup_sys_cache.assert_awaited_once_with(fake_app.state.redis)
+        init_online_session_index.assert_awaited_once_with(fake_app.state.redis)
         start_background_tasks.assert_awaited_once_with(fake_app)
         assert fake_app.state.plugin_application_runtime_started is True
 
@@ -104,9 +108,11 @@ async def test_non_leader_plugin_writer_still_runs_global_plugin_sync() -> None:
         patch('server.DataSourceRegistry.initialize', new_callable=AsyncMock) as initialize_data_sources,
         patch('server.get_plugin_application_runtime', return_value=fake_plugin_runtime),
         patch('server.init_create_table', new_callable=AsyncMock) as init_create_table,
+        patch('server.init_dept_closure', new_callable=AsyncMock) as init_dept_closure,
+        patch('server.init_expire_export_job', new_callable=AsyncMock) as init_expire_export_job,
         patch('server.RedisUtil.check_redis_connection', new_callable=AsyncMock) as check_redis_connection,
-        patch('server.RedisUtil.init_sys_dict', new_callable=AsyncMock),
-        patch('server.RedisUtil.init_sys_config', new_callable=AsyncMock),
+        patch('server.RedisUtil.warmup_sys_cache', new_callable=AsyncMock) as warmup_sys_cache,
+        patch('server.OnlineService.init_online_session_index', new_callable=AsyncMock),
         patch('server._start_background_tasks', new_callable=AsyncMock),
     ):
         await _initialize_application_runtime(fake_app, application_leader=False)
@@ -121,6 +127,9 @@ async def test_non_leader_plugin_writer_still_runs_global_plugin_sync() -> None:
         log_enabled=False,
         log_error_enabled=True,
     )
+    warmup_sys_cache.assert_not_awaited()
+    init_dept_closure.assert_not_awaited()
+    init_expire_export_job.assert_not_awaited()
     fake_plugin_runtime.startup.assert_awaited_once()
     assert fake_app.state.plugin_application_runtime_started is True
 
@@ -282,7 +291,7 @@ async def test_lifespan_database_initialization_failure_releases_redis_and_datab
 
 @pytest.mark.asyncio
 async def test_shutdown_application_runtime_preserves_cleanup_order() -> None:
-    """校验插件关闭先执行，随后按Scheduler、Redis、数据库顺序释放资源。"""
+    """校验插件关闭先执行，随后按导出任务、Scheduler、Redis、数据库顺序释放资源。"""
     events: list[str] = []
     app = SimpleNamespace(
         state=SimpleNamespace(
@@ -295,6 +304,9 @@ async def test_shutdown_application_runtime_preserves_cleanup_order() -> None:
     async def record_plugin_shutdown(_app: object) -> None:
         events.append('plugin')
 
+    async def record_export_job_shutdown() -> None:
+        events.append('export_jobs')
+
     async def record_scheduler_shutdown() -> None:
         events.append('scheduler')
 
@@ -310,6 +322,7 @@ async def test_shutdown_application_runtime_preserves_cleanup_order() -> None:
     plugin_runtime.shutdown = AsyncMock(side_effect=record_plugin_shutdown)
     with (
         patch('server.get_plugin_application_runtime', return_value=plugin_runtime),
+        patch('server.ExportJobService.shutdown', new=AsyncMock(side_effect=record_export_job_shutdown)),
         patch(
             'server.SchedulerUtil.close_system_scheduler',
             new=AsyncMock(side_effect=record_scheduler_shutdown),
@@ -323,7 +336,7 @@ async def test_shutdown_application_runtime_preserves_cleanup_order() -> None:
     ):
         await _shutdown_application_runtime(app)
 
-    assert events == ['plugin', 'scheduler', 'redis', 'database', 'logs']
+    assert events == ['plugin', 'export_jobs', 'scheduler', 'redis', 'database', 'logs']
 
 
 @pytest.mark.asyncio
@@ -11,6 +11,7 @@ from config.database import Base
 from module_admin.entity.do.config_do import SysConfig
 from module_admin.entity.do.dept_do import SysDept
 from module_admin.entity.do.dict_do import SysDictData, SysDictType
+from module_admin.entity.do.export_job_do import SysExportJob
 from module_admin.entity.do.file_do import (
     SysFileAccessLog,
     SysFileAcl,
@@ -39,17 +40,18 @@ from plugins.core.management.entity.do.models import (
     SysPluginOperationLog,
 )
 
-EXPECTED_ENTITY_MODEL_COUNT = 35
-EXPECTED_UPDATE_TIME_MODEL_COUNT = 19
+EXPECTED_ENTITY_MODEL_COUNT = 36
+EXPECTED_UPDATE_TIME_MODEL_COUNT = 20
 EXPECTED_CREATE_TIME_ONLY_MODEL_COUNT = 6
 
-# Keep both inventories explicit: there are 35 DO classes and 19 update_time
+# Keep both inventories explicit: there are 36 DO classes and 20 update_time
 # columns. Adding/removing one should be an intentional model change.
 ENTITY_MODELS = (
     SysConfig,
     SysDept,
     SysDictType,
     SysDictData,
+    SysExportJob,
     SysFileInfo,
     SysFileReference,
     SysFileRetentionPolicy,
@@ -88,6 +90,7 @@ UPDATE_TIME_MODELS = (
     SysDept,
     SysDictType,
     SysDictData,
+    SysExportJob,
     SysFileInfo,
     SysFileRetentionPolicy,
     SysJob,
@@ -115,6 +118,7 @@ CREATE_TIME_ONLY_MODELS = (
 )
 
 REQUIRED_CREATE_TIME_MODELS = {
+    SysExportJob,
     SysFileInfo,
     SysFileReference,
     SysFileRetentionPolicy,
@@ -123,6 +127,7 @@ REQUIRED_CREATE_TIME_MODELS = {
 }
 
 REQUIRED_UPDATE_TIME_MODELS = {
+    SysExportJob,
     SysFileInfo,
     SysFileRetentionPolicy,
 }
@@ -0,0 +1,120 @@
+import time
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm.collections import InstrumentedList
+
+from config.database import Base
+from module_admin.entity.do.user_do import SysUser
+from module_generator.entity.do.gen_do import GenTable, GenTableColumn
+from utils.common_util import CamelCaseUtil, SnakeCaseUtil, SqlalchemyUtil
+
+PAGE_ROWS = 100
+BENCHMARK_ROWS = 10_000
+BENCHMARK_REPEATS = 3
+MIN_SPEEDUP = 1.5
+CREATE_TIME = datetime(2026, 10, 1, 12, 0, 0)
+
+
+def _legacy_transform(obj: Any) -> Any:
+    # 改造前的实现：逐行复制实例字典并逐个字段重新计算驼峰字段名
+    def snake_to_camel(snake_str: str) -> str:
+        words = snake_str.split('_')
+        return words[0] + ''.join(word.capitalize() for word in words[1:])
+
+    if isinstance(obj, list):
+        return [_legacy_transform(row) for row in obj]
+    base_dict = obj.__dict__.copy()
+    base_dict.pop('_sa_instance_state', None)
+    for name, value in base_dict.items():
+        if isinstance(value, InstrumentedList):
+            base_dict[name] = _legacy_transform(value)
+    return {snake_to_camel(k): v for k, v in base_dict.items()}
+
+
+def _user(index: int) -> SysUser:
+    return SysUser(
+        user_id=index,
+        dept_id=100 + index % 10,
+        user_name=f'user{index}',
+        nick_name=f'用户{index}',
+        user_type='00',
+        email=f'user{index}@example.com',
+        phonenumber='13800000000',
+        sex='0',
+        avatar='',
+        password='hashed-password',
+        status='0',
+        del_flag='0',
+        login_ip='127.0.0.1',
+        login_date=CREATE_TIME,
+        pwd_update_date=CREATE_TIME,
+        create_by='admin',
+        create_time=CREATE_TIME,
+        update_by='admin',
+        update_time=CREATE_TIME,
+        remark=None,
+    )
+
+
+def test_model_serializer_matches_legacy_instance_dict_semantics() -> None:
+    user = _user(1)
+    # 手动附加的非列属性同样保留
+    user.role_names = ['admin']
+    table = GenTable(table_id=1, table_name='sys_demo', columns=[GenTableColumn(column_id=1, column_name='demo_id')])
+
+    assert CamelCaseUtil.transform_result(user) == _legacy_transform(user)
+    assert CamelCaseUtil.transform_result([table]) == _legacy_transform([table])
+    assert SqlalchemyUtil.serialize_result(user)['user_name'] == 'user1'
+    assert SnakeCaseUtil.transform_result({'userName': 'admin', 'deptId': 100}) == {
+        'user_name': 'admin',
+        'dept_id': 100,
+    }
+
+
+@pytest.mark.asyncio
+async def test_model_serializer_skips_unloaded_columns_and_caches_row_keys() -> None:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    session_maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysUser.__table__])
+    async with session_maker() as session:
+        session.add(_user(1))
+        await session.commit()
+        user = (await session.execute(select(SysUser))).scalar_one()
+        session.expire(user, ['password'])
+        row = (await session.execute(select(SysUser.user_id, SysUser.user_name))).one()
+    await engine.dispose()
+
+    user_dict = CamelCaseUtil.transform_result(user)
+    assert 'password' not in user_dict
+    assert user_dict == _legacy_transform(user)
+    assert CamelCaseUtil.transform_result(row) == {'userId': 1, 'userName': 'user1'}
+    assert SqlalchemyUtil.serialize_result([row]) == [{'user_id': 1, 'user_name': 'user1'}]
+
+
+def test_cached_serializer_matches_legacy_output_on_page() -> None:
+    users = [_user(index) for index in range(PAGE_ROWS)]
+
+    assert CamelCaseUtil.transform_result(users) == _legacy_transform(users)
+
+
+@pytest.mark.benchmark
+def test_benchmark_cached_serializer_on_ten_thousand_row_page() -> None:
+    users = [_user(index) for index in range(BENCHMARK_ROWS)]
+
+    def best_elapsed(transform: Any) -> float:
+        elapsed = []
+        for _ in range(BENCHMARK_REPEATS):
+            start_time = time.perf_counter()
+            transform(users)
+            elapsed.append(time.perf_counter() - start_time)
+        return min(elapsed)
+
+    legacy_elapsed = best_elapsed(_legacy_transform)
+    cached_elapsed = best_elapsed(CamelCaseUtil.transform_result)
+
+    assert legacy_elapsed / cached_elapsed > MIN_SPEEDUP
@@ -0,0 +1,183 @@
+import codecs
+import csv
+import io
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from utils.excel_util import ExcelUtil
+
+OPER_TIME = datetime(2026, 10, 1, 12, 0, 0)
+BATCH_SIZE = 2
+ROW_COUNT = 5
+BENCHMARK_ROW_COUNT = 2_000_000
+RSS_SAMPLE_INTERVAL = 200
+RSS_BUDGET_MB = 64
+MIN_COLUMN_WIDTH = 12
+MAX_COLUMN_WIDTH = 50
+MAPPING_DICT = {'operId': '日志编号', 'businessType': '操作类型', 'status': '操作状态', 'operTime': '操作日期'}
+FORMATTERS = {
+    'status': ExcelUtil.choice_formatter({0: '成功'}, default='失败'),
+    'businessType': ExcelUtil.dict_label_formatter(
+        [{'dictValue': '1', 'dictLabel': '新增'}, {'dictValue': '2', 'dictLabel': '修改'}]
+    ),
+}
+
+
+def _oper_log(index: int) -> dict[str, Any]:
+    return {
+        'operId': index,
+        'title': '用户管理',
+        'businessType': index % 3,
+        'method': 'module_admin.controller.user_controller.get_system_user_list()',
+        'operUrl': '/system/user/list',
+        'operParam': '{"pageNum": 1, "pageSize": 10}',
+        'status': index % 2,
+        'operTime': OPER_TIME,
+    }
+
+
+async def _oper_logs(count: int) -> AsyncIterator[dict[str, Any]]:
+    for index in range(count):
+        yield _oper_log(index)
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> list[bytes]:
+    return [chunk async for chunk in chunks]
+
+
+async def _aenumerate(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    index = 0
+    async for chunk in chunks:
+        yield index, chunk
+        index += 1
+
+
+def _rss_mb() -> int:
+    with open('/proc/self/status', encoding='utf-8') as status_file:
+        for line in status_file:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) // 1024
+    return 0
+
+
+@pytest.mark.asyncio
+async def test_stream_export_writes_xlsx_with_formatted_columns() -> None:
+    with patch('utils.excel_util.EXPORT_CHUNK_SIZE', 1024):
+        chunks = await _collect(
+            ExcelUtil.stream_export(_oper_logs(ROW_COUNT), MAPPING_DICT, FORMATTERS, batch_size=BATCH_SIZE)
+        )
+
+    assert len(chunks) > 1
+    worksheet = load_workbook(io.BytesIO(b''.join(chunks))).active
+    rows = list(worksheet.iter_rows(values_only=True))
+    assert rows[0] == ('日志编号', '操作类型', '操作状态', '操作日期')
+    assert rows[1:3] == [(0, 0, '成功', OPER_TIME), (1, '新增', '失败', OPER_TIME)]
+    assert len(rows) == ROW_COUNT + 1
+    assert worksheet['A1'].font.bold
+
+
+@pytest.mark.asyncio
+async def test_stream_export_styles_xlsx_header_and_column_widths() -> None:
+    mapping_dict = {**MAPPING_DICT, 'method': '请求方法名称及完整调用路径' * 4}
+
+    chunks = await _collect(ExcelUtil.stream_export(_oper_logs(ROW_COUNT), mapping_dict, FORMATTERS))
+
+    worksheet = load_workbook(io.BytesIO(b''.join(chunks))).active
+    header_cell = worksheet['B1']
+    assert header_cell.fill.fill_type == 'solid'
+    assert header_cell.fill.start_color.rgb.lower().endswith('ababab')
+    assert header_cell.border.left.style == header_cell.border.bottom.style == 'thin'
+    assert header_cell.alignment.horizontal == 'center'
+    # 短表头保留最小列宽，长表头按显示宽度加宽但不超过上限
+    assert worksheet.column_dimensions['A'].width == MIN_COLUMN_WIDTH
+    assert worksheet.column_dimensions['E'].width == MAX_COLUMN_WIDTH
+    assert worksheet['A2'].fill.fill_type is None
+
+
+@pytest.mark.asyncio
+async def test_stream_export_writes_csv_and_ndjson_per_batch() -> None:
+    csv_chunks = await _collect(
+        ExcelUtil.stream_export(
+            [_oper_log(index) for index in range(ROW_COUNT)],
+            MAPPING_DICT,
+            FORMATTERS,
+            export_format='csv',
+            batch_size=BATCH_SIZE,
+        )
+    )
+    ndjson_chunks = await _collect(
+        ExcelUtil.stream_export(
+            _oper_logs(ROW_COUNT), MAPPING_DICT, FORMATTERS, export_format='ndjson', batch_size=BATCH_SIZE
+        )
+    )
+
+    # 表头一块，随后每批一块
+    assert len(csv_chunks) == 1 + (ROW_COUNT + BATCH_SIZE - 1) // BATCH_SIZE
+    assert csv_chunks[0].startswith(codecs.BOM_UTF8)
+    csv_rows = list(csv.reader(io.StringIO(b''.join(csv_chunks).decode('utf-8-sig'))))
+    assert csv_rows[0] == ['日志编号', '操作类型', '操作状态', '操作日期']
+    assert csv_rows[2] == ['1', '新增', '失败', str(OPER_TIME)]
+    ndjson_rows = [json.loads(line) for line in b''.join(ndjson_chunks).decode('utf-8').splitlines()]
+    assert len(ndjson_rows) == ROW_COUNT
+    assert ndjson_rows[2] == {'日志编号': 2, '操作类型': '修改', '操作状态': '成功', '操作日期': str(OPER_TIME)}
+
+
+@pytest.mark.asyncio
+async def test_stream_export_strips_illegal_characters_and_stringifies_nested_values() -> None:
+    rows = [{'operId': 1, 'businessType': {'code': 1}, 'status': 'bad\x00value', 'operTime': None}]
+
+    chunks = await _collect(ExcelUtil.stream_export(rows, MAPPING_DICT))
+
+    worksheet = load_workbook(io.BytesIO(b''.join(chunks))).active
+    assert list(worksheet.iter_rows(min_row=2, values_only=True)) == [(1, "{'code': 1}", 'badvalue', None)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('file_format', ['xlsx', 'csv'])
+async def test_iter_import_chunks_maps_headers_and_skips_blank_rows(file_format: str) -> None:
+    header_dict = {'登录名称': 'user_name', '部门编号': 'dept_id', '用户邮箱': 'email'}
+    rows = [['部门编号', '登录名称', '备注'], [100.0, ' admin ', 'x'], [None, None, None], [101, 'ry', None]]
+    if file_format == 'xlsx':
+        workbook = Workbook()
+        for row in rows:
+            workbook.active.append(row)
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+    else:
+        text_buffer = io.StringIO()
+        csv.writer(text_buffer).writerows(
+            [[100, ' admin ', 'x'] if index == 1 else row for index, row in enumerate(rows)]
+        )
+        buffer = io.BytesIO(text_buffer.getvalue().encode('utf-8-sig'))
+
+    chunks = [chunk async for chunk in ExcelUtil.iter_import_chunks(buffer, header_dict, chunk_size=1)]
+
+    assert [chunk.index.tolist() for chunk in chunks] == [[2], [4]]
+    assert [chunk.to_dict('records') for chunk in chunks] == [
+        [{'user_name': 'admin', 'dept_id': '100', 'email': None}],
+        [{'user_name': 'ry', 'dept_id': '101', 'email': None}],
+    ]
+    assert not buffer.closed
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_benchmark_stream_export_of_two_million_operation_logs_stays_within_rss_budget() -> None:
+    baseline_rss = peak_rss = _rss_mb()
+    exported_bytes = 0
+    async for index, chunk in _aenumerate(
+        ExcelUtil.stream_export(_oper_logs(BENCHMARK_ROW_COUNT), MAPPING_DICT, FORMATTERS, export_format='csv')
+    ):
+        exported_bytes += len(chunk)
+        if index % RSS_SAMPLE_INTERVAL == 0:
+            peak_rss = max(peak_rss, _rss_mb())
+    peak_rss = max(peak_rss, _rss_mb())
+
+    assert exported_bytes > BENCHMARK_ROW_COUNT * len(MAPPING_DICT)
+    assert peak_rss - baseline_rss < RSS_BUDGET_MB
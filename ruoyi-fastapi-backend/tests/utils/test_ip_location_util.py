@@ -0,0 +1,155 @@
+import asyncio
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from config.env import AppConfig
+from utils.ip_location_util import (
+    INNER_IP_LOCATION,
+    UNKNOWN_IP_LOCATION,
+    IpLocationDatabase,
+    IpLocationProvider,
+    IpLocationUtil,
+    LocalIpLocationProvider,
+)
+
+LRU_CACHE_SIZE = 2
+LOOKUPS_BEFORE_EVICTION = 3
+LOOKUPS_AFTER_EVICTION = 4
+FAILED_LOOKUP_ATTEMPTS = 2
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.get_calls = 0
+
+    async def get(self, key: str) -> str | None:
+        self.get_calls += 1
+        return self.store.get(key)
+
+    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+        self.store[key] = value
+
+
+class _CountingProvider(IpLocationProvider):
+    name = 'counting'
+
+    def __init__(self, location: str | None = None, error: Exception | None = None) -> None:
+        self.location = location
+        self.error = error
+        self.calls = 0
+
+    async def lookup(self, ip: str) -> str | None:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.location
+
+
+@pytest.fixture
+def database_path(tmp_path: Path) -> Path:
+    output_path = tmp_path / 'ip.db'
+    IpLocationDatabase.build(
+        [
+            ('1.0.0.0', '1.0.0.255', '福建-福州'),
+            ('8.8.8.0', '8.8.8.255', '美国-加州'),
+            ('114.114.114.0', '114.114.114.255', '江苏-南京'),
+            ('2400:3200::', '2400:3200:ffff:ffff:ffff:ffff:ffff:ffff', '浙江-杭州'),
+        ],
+        str(output_path),
+    )
+    return output_path
+
+
+@pytest.fixture(autouse=True)
+def reset_ip_location_util() -> Iterator[None]:
+    IpLocationUtil.set_providers([])
+    yield
+    asyncio.run(IpLocationUtil.close())
+
+
+def test_database_lookup_hits_ipv4_and_ipv6_ranges(database_path: Path) -> None:
+    database = IpLocationDatabase(str(database_path))
+    try:
+        assert database.lookup('8.8.8.8') == '美国-加州'
+        assert database.lookup('1.0.0.0') == '福建-福州'
+        assert database.lookup('114.114.114.255') == '江苏-南京'
+        assert database.lookup('2400:3200::1') == '浙江-杭州'
+        assert database.lookup('8.8.9.1') is None
+        assert database.lookup('0.0.0.1') is None
+        assert database.lookup('not-an-ip') is None
+    finally:
+        database.close()
+
+
+def test_database_rejects_unknown_file_format(tmp_path: Path) -> None:
+    invalid_path = tmp_path / 'invalid.db'
+    invalid_path.write_bytes(b'XXXX' + b'\x00' * 32)
+
+    with pytest.raises(ValueError):
+        IpLocationDatabase(str(invalid_path))
+
+
+def test_resolver_skips_lookup_for_inner_addresses() -> None:
+    provider = _CountingProvider(location='不应命中')
+    IpLocationUtil.set_providers([provider])
+
+    for ip in ('127.0.0.1', 'localhost', '192.168.1.10', '10.0.0.1', '::1'):
+        assert asyncio.run(IpLocationUtil.get_ip_location(ip)) == INNER_IP_LOCATION
+    assert asyncio.run(IpLocationUtil.get_ip_location('bad-ip')) == UNKNOWN_IP_LOCATION
+    assert provider.calls == 0
+
+
+def test_resolver_prefers_local_database_and_falls_back_to_next_provider(database_path: Path) -> None:
+    fallback = _CountingProvider(location='上海-上海')
+    IpLocationUtil.set_providers([LocalIpLocationProvider(IpLocationDatabase(str(database_path))), fallback])
+
+    assert asyncio.run(IpLocationUtil.get_ip_location('8.8.8.8')) == '美国-加州'
+    assert fallback.calls == 0
+    assert asyncio.run(IpLocationUtil.get_ip_location('9.9.9.9')) == '上海-上海'
+    assert fallback.calls == 1
+
+
+def test_resolver_uses_bounded_lru_cache() -> None:
+    provider = _CountingProvider(location='美国-加州')
+    IpLocationUtil.set_providers([provider])
+
+    with patch.object(AppConfig, 'app_ip_location_cache_size', LRU_CACHE_SIZE):
+        asyncio.run(IpLocationUtil.get_ip_location('8.8.8.8'))
+        asyncio.run(IpLocationUtil.get_ip_location('8.8.4.4'))
+        asyncio.run(IpLocationUtil.get_ip_location('8.8.8.8'))
+        asyncio.run(IpLocationUtil.get_ip_location('1.1.1.1'))
+        assert provider.calls == LOOKUPS_BEFORE_EVICTION
+        # 8.8.4.4 为最久未使用条目，已被淘汰
+        asyncio.run(IpLocationUtil.get_ip_location('8.8.4.4'))
+        assert provider.calls == LOOKUPS_AFTER_EVICTION
+        asyncio.run(IpLocationUtil.get_ip_location('1.1.1.1'))
+        assert provider.calls == LOOKUPS_AFTER_EVICTION
+
+
+def test_resolver_shares_result_through_redis_cache() -> None:
+    provider = _CountingProvider(location='美国-加州')
+    IpLocationUtil.set_providers([provider])
+    redis = _FakeRedis()
+
+    assert asyncio.run(IpLocationUtil.get_ip_location('8.8.8.8', redis)) == '美国-加州'
+    assert redis.store == {'ip_location:8.8.8.8': '美国-加州'}
+
+    # 模拟其他worker：进程内缓存为空时直接命中Redis
+    IpLocationUtil.set_providers([provider])
+    assert asyncio.run(IpLocationUtil.get_ip_location('8.8.8.8', redis)) == '美国-加州'
+    assert provider.calls == 1
+
+
+def test_resolver_does_not_cache_provider_failures() -> None:
+    failing = _CountingProvider(error=TimeoutError('upstream timeout'))
+    IpLocationUtil.set_providers([failing])
+    redis = _FakeRedis()
+
+    assert asyncio.run(IpLocationUtil.get_ip_location('8.8.8.8', redis)) == UNKNOWN_IP_LOCATION
+    assert asyncio.run(IpLocationUtil.get_ip_location('8.8.8.8', redis)) == UNKNOWN_IP_LOCATION
+    assert failing.calls == FAILED_LOOKUP_ATTEMPTS
+    assert redis.store == {}
@@ -0,0 +1,433 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Connection, Dialect, delete, event, insert, select, text, update
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from config.database import Base
+from config.env import AppConfig
+from exceptions.exception import ServiceException
+from module_admin.dao.log_dao import OperationLogDao
+from module_admin.entity.do.log_do import SysOperLog
+from module_admin.entity.vo.log_vo import OperLogPageQueryModel
+from utils.page_util import PageCountCache, PageUtil
+
+ROW_COUNT = 95
+PAGE_SIZE = 10
+BENCHMARK_ROWS = 50_000
+BENCHMARK_PAGE_NUM = 4_000
+BENCHMARK_REPEATS = 5
+MIN_SPEEDUP = 3
+MIN_CURSOR_SPEEDUP = 3
+OPER_TIME = datetime(2026, 10, 1, 12, 0, 0)
+NULL_OPER_TIME_START = 8
+NULL_OPER_TIME_END = 23
+WORKER_COUNT = 2
+UNCACHED_REQUESTS = 2
+
+
+def _oper_log(index: int) -> dict:
+    # 每3条日志使用相同的操作时间，验证排序字段相同时按主键续页
+    return {
+        'oper_id': index,
+        'title': f'模块{index % 2}',
+        'business_type': 0,
+        'oper_name': f'user{index % 7}',
+        'status': 0,
+        'oper_time': OPER_TIME + timedelta(seconds=index // 3),
+        'cost_time': index % 5,
+    }
+
+
+async def _seed(session: AsyncSession, count: int) -> None:
+    await session.execute(insert(SysOperLog), [_oper_log(index) for index in range(1, count + 1)])
+    await session.commit()
+
+
+@pytest_asyncio.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    engine = create_async_engine('sqlite+aiosqlite:///:memory:')
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysOperLog.__table__])
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db_session:
+        yield db_session
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def count_cache() -> Iterator[None]:
+    with (
+        patch.object(PageCountCache, '_cache', OrderedDict()),
+        patch.object(PageCountCache, '_table_versions', {}),
+        patch.object(PageCountCache, '_publish_tables', set()),
+    ):
+        yield
+
+
+class _FakePubSub:
+    def __init__(self) -> None:
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.messages.put_nowait({'type': 'subscribe', 'data': 1})
+
+    async def subscribe(self, channel: str) -> None:
+        assert channel == PageCountCache.CHANNEL
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self.messages.get()
+
+    async def close(self) -> None:
+        return None
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.pubsub_instance = _FakePubSub()
+        self.published: list[dict[str, Any]] = []
+
+    def pubsub(self) -> _FakePubSub:
+        return self.pubsub_instance
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.published.append(json.loads(message))
+        return 1
+
+
+async def _walk_cursor_pages(session: AsyncSession, query_object: OperLogPageQueryModel) -> list[list[int]]:
+    pages = []
+    while True:
+        page = await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+        pages.append([row['operId'] for row in page.rows])
+        assert page.total == ROW_COUNT
+        if not page.has_next:
+            assert page.next_cursor is None
+            return pages
+        query_object = query_object.model_copy(update={'cursor': page.next_cursor})
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('order_by_column', 'is_asc'),
+    [(None, None), ('costTime', 'ascending'), ('operName', 'descending')],
+)
+async def test_cursor_pages_match_offset_pages(
+    session: AsyncSession, order_by_column: str | None, is_asc: str | None
+) -> None:
+    await _seed(session, ROW_COUNT)
+    query_object = OperLogPageQueryModel(
+        orderByColumn=order_by_column, isAsc=is_asc, pageSize=PAGE_SIZE, pageMode='cursor'
+    )
+
+    cursor_pages = await _walk_cursor_pages(session, query_object)
+    offset_pages = []
+    for page_num in range(1, len(cursor_pages) + 1):
+        page = await OperationLogDao.get_operation_log_list(
+            session, query_object.model_copy(update={'page_mode': 'offset', 'page_num': page_num}), is_page=True
+        )
+        offset_pages.append([row['operId'] for row in page.rows])
+
+    assert cursor_pages == offset_pages
+    assert len(cursor_pages) == ROW_COUNT // PAGE_SIZE + 1
+    assert sorted(oper_id for page in cursor_pages for oper_id in page) == list(range(1, ROW_COUNT + 1))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(('order_by_column', 'is_asc'), [(None, None), ('operTime', 'ascending')])
+async def test_cursor_pages_include_null_sort_keys_across_page_boundary(
+    session: AsyncSession, order_by_column: str | None, is_asc: str | None
+) -> None:
+    await _seed(session, ROW_COUNT)
+    # 空值行按空值在后排序，跨越多个分页边界
+    null_ids = set(range(NULL_OPER_TIME_START, NULL_OPER_TIME_END + 1))
+    await session.execute(update(SysOperLog).where(SysOperLog.oper_id.in_(null_ids)).values(oper_time=None))
+    await session.commit()
+    query_object = OperLogPageQueryModel(
+        orderByColumn=order_by_column, isAsc=is_asc, pageSize=PAGE_SIZE, pageMode='cursor'
+    )
+
+    oper_ids = [oper_id for page in await _walk_cursor_pages(session, query_object) for oper_id in page]
+
+    descending = is_asc is None
+    non_null_ids = sorted(
+        (oper_id for oper_id in range(1, ROW_COUNT + 1) if oper_id not in null_ids),
+        key=lambda oper_id: (oper_id // 3, oper_id),
+        reverse=descending,
+    )
+    assert oper_ids == non_null_ids + sorted(null_ids, reverse=descending)
+
+
+@pytest.mark.parametrize('dialect', [postgresql.dialect(), mysql.dialect()], ids=['postgresql', 'mysql'])
+def test_keyset_page_query_orders_by_plain_index_columns(dialect: Dialect) -> None:
+    query_object = OperLogPageQueryModel(pageSize=PAGE_SIZE, pageMode='cursor')
+    query = OperationLogDao._get_operation_log_list_query(query_object)
+    keyset = OperationLogDao._get_operation_log_order_by(query_object)
+
+    non_null_sql = str(
+        PageUtil._get_keyset_page_query(query, keyset, frozenset(), [OPER_TIME, 1]).compile(dialect=dialect)
+    )
+    null_sql = str(PageUtil._get_keyset_page_query(query, keyset, frozenset({0}), [None, 1]).compile(dialect=dialect))
+
+    # PostgreSQL要求DISTINCT查询的排序表达式出现在查询列中，排序子句只包含排序列才能由时间索引直接提供顺序
+    for sql in (non_null_sql, null_sql):
+        assert 'DISTINCT' not in sql
+    assert non_null_sql.endswith('ORDER BY sys_oper_log.oper_time DESC, sys_oper_log.oper_id DESC')
+    assert 'sys_oper_log.oper_time IS NOT NULL' in non_null_sql
+    assert non_null_sql.count('IS NULL') == 0
+    assert null_sql.endswith('ORDER BY sys_oper_log.oper_id DESC')
+    assert 'sys_oper_log.oper_time IS NULL' in null_sql
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('cursor', ['not-a-token', 'eyJzIjoieCIsImsiOlsxXX0', 'eyJzIjpbXX0'])
+async def test_invalid_cursor_is_rejected(session: AsyncSession, cursor: str) -> None:
+    await _seed(session, PAGE_SIZE * 2)
+
+    with pytest.raises(ServiceException) as exc_info:
+        await OperationLogDao.get_operation_log_list(
+            session, OperLogPageQueryModel(pageSize=PAGE_SIZE, pageMode='cursor', cursor=cursor), is_page=True
+        )
+    assert exc_info.value.message == '分页游标无效，请从第一页重新查询'
+
+
+@pytest.mark.asyncio
+async def test_cursor_from_other_sort_is_rejected(session: AsyncSession) -> None:
+    await _seed(session, PAGE_SIZE * 2)
+    page = await OperationLogDao.get_operation_log_list(
+        session, OperLogPageQueryModel(pageSize=PAGE_SIZE, pageMode='cursor'), is_page=True
+    )
+
+    with pytest.raises(ServiceException):
+        await OperationLogDao.get_operation_log_list(
+            session,
+            OperLogPageQueryModel(
+                orderByColumn='costTime',
+                isAsc='ascending',
+                pageSize=PAGE_SIZE,
+                pageMode='cursor',
+                cursor=page.next_cursor,
+            ),
+            is_page=True,
+        )
+
+
+def _record_count_connections(engine: AsyncEngine) -> list[int]:
+    count_connections: list[int] = []
+
+    def before_cursor_execute(connection: Connection, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.lstrip().upper().startswith('SELECT COUNT('):
+            count_connections.append(id(connection.connection.dbapi_connection))
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    return count_connections
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('page_mode', ['offset', 'cursor'])
+async def test_total_is_cached_by_query_fingerprint(session: AsyncSession, page_mode: str) -> None:
+    await _seed(session, PAGE_SIZE * 2)
+    count_connections = _record_count_connections(session.bind)
+    query_object = OperLogPageQueryModel(pageSize=PAGE_SIZE, pageMode=page_mode)
+
+    first_page = await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+    next_page = await OperationLogDao.get_operation_log_list(
+        session, query_object.model_copy(update={'page_num': 2, 'cursor': first_page.next_cursor}), is_page=True
+    )
+    assert len(count_connections) == 1
+    filtered_page = await OperationLogDao.get_operation_log_list(
+        session, query_object.model_copy(update={'title': '模块1'}), is_page=True
+    )
+    assert first_page.total == next_page.total == PAGE_SIZE * 2
+    assert filtered_page.total == PAGE_SIZE
+    with patch.object(AppConfig, 'app_page_count_cache_ttl', 0):
+        PageCountCache._cache.clear()
+        for expected_count in range(len(count_connections) + 1, len(count_connections) + 3):
+            await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+            assert len(count_connections) == expected_count
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('statement', ['orm', 'core', 'text'])
+async def test_writes_invalidate_cached_total(session: AsyncSession, statement: str) -> None:
+    await _seed(session, PAGE_SIZE * 2)
+    query_object = OperLogPageQueryModel(pageSize=PAGE_SIZE)
+    page = await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+    assert page.total == PAGE_SIZE * 2
+
+    if statement == 'orm':
+        session.add(SysOperLog(**_oper_log(PAGE_SIZE * 2 + 1)))
+        await session.commit()
+    elif statement == 'core':
+        await session.execute(delete(SysOperLog).where(SysOperLog.oper_id == 1))
+        await session.commit()
+    else:
+        await session.execute(text('delete from sys_oper_log where oper_id = 1'))
+        await session.commit()
+    page = await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+
+    assert page.total == (PAGE_SIZE * 2 + 1 if statement == 'orm' else PAGE_SIZE * 2 - 1)
+
+
+@pytest.mark.asyncio
+async def test_multi_worker_count_cache_follows_redis_invalidation(session: AsyncSession) -> None:
+    await _seed(session, PAGE_SIZE * 2)
+    count_connections = _record_count_connections(session.bind)
+    query_object = OperLogPageQueryModel(pageSize=PAGE_SIZE)
+    redis = _FakeRedis()
+
+    with patch.object(AppConfig, 'app_workers', WORKER_COUNT):
+        # 未订阅失效通知时无法感知其他worker的写入，不使用缓存
+        for _ in range(UNCACHED_REQUESTS):
+            await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+        assert len(count_connections) == UNCACHED_REQUESTS
+        count_before = len(count_connections)
+
+        listener = asyncio.create_task(PageCountCache.listen_invalidation(redis))
+        await asyncio.sleep(0)
+        await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+        await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+        assert len(count_connections) == count_before + 1
+
+        # 其他worker提交写入后通知本worker失效
+        redis.pubsub_instance.messages.put_nowait(
+            {'type': 'message', 'data': json.dumps({'source': 'other-worker', 'tables': ['sys_oper_log']})}
+        )
+        await asyncio.sleep(0)
+        await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+        assert len(count_connections) == count_before + 2
+
+        # 本worker提交写入后通知其他worker
+        await session.execute(delete(SysOperLog).where(SysOperLog.oper_id == 1))
+        await session.commit()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        listener.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    assert redis.published == [{'source': PageCountCache._source_id, 'tables': ['sys_oper_log']}]
+    assert not PageCountCache._listening
+
+
+@pytest.mark.asyncio
+async def test_count_committed_after_cached_read_is_invalidated(tmp_path: Path) -> None:
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "page.db"}')
+    maker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysOperLog.__table__])
+    query_object = OperLogPageQueryModel(pageSize=PAGE_SIZE)
+    async with maker() as writer, maker() as reader:
+        await _seed(writer, PAGE_SIZE)
+        writer.add(SysOperLog(**_oper_log(PAGE_SIZE + 1)))
+        await writer.flush()
+        # 写入会话提交前，其他会话读取并缓存的计数不包含未提交的数据，提交后须重新计数
+        uncommitted_page = await OperationLogDao.get_operation_log_list(reader, query_object, is_page=True)
+        await reader.commit()
+        await writer.commit()
+        committed_page = await OperationLogDao.get_operation_log_list(reader, query_object, is_page=True)
+    await engine.dispose()
+
+    assert uncommitted_page.total == PAGE_SIZE
+    assert committed_page.total == PAGE_SIZE + 1
+
+
+@pytest.mark.asyncio
+async def test_count_runs_on_separate_pooled_connection(tmp_path: Path) -> None:
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "page.db"}')
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, tables=[SysOperLog.__table__])
+    count_connections = _record_count_connections(engine)
+    query_object = OperLogPageQueryModel(pageSize=PAGE_SIZE)
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db_session:
+        await _seed(db_session, PAGE_SIZE * 2)
+        page = await OperationLogDao.get_operation_log_list(db_session, query_object, is_page=True)
+        session_connection = id((await db_session.connection()).sync_connection.connection.dbapi_connection)
+        # 当前事务存在未提交的写入时，计数须在当前会话中执行才能包含这些数据
+        db_session.add(SysOperLog(**_oper_log(PAGE_SIZE * 2 + 1)))
+        await db_session.flush()
+        pending_page = await OperationLogDao.get_operation_log_list(db_session, query_object, is_page=True)
+        with patch.object(AppConfig, 'app_page_concurrent_count_enabled', False):
+            await db_session.commit()
+            await OperationLogDao.get_operation_log_list(db_session, query_object, is_page=True)
+        session_connection_after = id((await db_session.connection()).sync_connection.connection.dbapi_connection)
+    await engine.dispose()
+
+    assert page.total == PAGE_SIZE * 2
+    assert pending_page.total == PAGE_SIZE * 2 + 1
+    assert count_connections[0] != session_connection
+    assert count_connections[1:] == [session_connection, session_connection_after]
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_cursor_page_outperforms_deep_offset_page(session: AsyncSession) -> None:
+    await _seed(session, BENCHMARK_ROWS)
+    query_object = OperLogPageQueryModel(pageNum=BENCHMARK_PAGE_NUM, pageSize=PAGE_SIZE)
+    # 以深页的前一行作为续页位置，使两种分页方式返回同一页数据
+    last_row = (
+        await session.execute(
+            select(SysOperLog)
+            .order_by(*OperationLogDao._get_operation_log_order_by(query_object))
+            .offset((BENCHMARK_PAGE_NUM - 1) * PAGE_SIZE - 1)
+            .limit(1)
+        )
+    ).scalar_one()
+    keyset = OperationLogDao._get_operation_log_order_by(query_object)
+    cursor_query_object = query_object.model_copy(
+        update={
+            'page_mode': 'cursor',
+            'cursor': PageUtil._encode_cursor(keyset, [last_row.oper_time, last_row.oper_id]),
+        }
+    )
+    offset_page = await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+    cursor_page = await OperationLogDao.get_operation_log_list(session, cursor_query_object, is_page=True)
+    assert cursor_page.rows == offset_page.rows
+
+    # 未缓存总数的页码分页每次请求均需全量计数并跳过前序记录，游标分页复用缓存的总数并按索引定位
+    start = time.perf_counter()
+    with patch.object(AppConfig, 'app_page_count_cache_size', 0):
+        for _ in range(BENCHMARK_REPEATS):
+            await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+    offset_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(BENCHMARK_REPEATS):
+        await OperationLogDao.get_operation_log_list(session, cursor_query_object, is_page=True)
+    cursor_elapsed = time.perf_counter() - start
+
+    assert offset_elapsed / cursor_elapsed > MIN_CURSOR_SPEEDUP
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_cached_total_speeds_up_repeated_page_requests(session: AsyncSession) -> None:
+    await _seed(session, BENCHMARK_ROWS)
+    # 按标题模糊查询时计数需扫描全部数据，分页查询按时间索引读取到一页即可停止
+    query_object = OperLogPageQueryModel(title='模块1', pageSize=PAGE_SIZE)
+
+    start = time.perf_counter()
+    with patch.object(AppConfig, 'app_page_count_cache_size', 0):
+        for page_num in range(1, BENCHMARK_REPEATS + 1):
+            uncached_page = await OperationLogDao.get_operation_log_list(
+                session, query_object.model_copy(update={'page_num': page_num}), is_page=True
+            )
+    uncached_elapsed = time.perf_counter() - start
+    await OperationLogDao.get_operation_log_list(session, query_object, is_page=True)
+    start = time.perf_counter()
+    for page_num in range(1, BENCHMARK_REPEATS + 1):
+        cached_page = await OperationLogDao.get_operation_log_list(
+            session, query_object.model_copy(update={'page_num': page_num}), is_page=True
+        )
+    cached_elapsed = time.perf_counter() - start
+
+    assert cached_page.rows == uncached_page.rows
+    assert cached_page.total == uncached_page.total == BENCHMARK_ROWS // 2
+    assert uncached_elapsed / cached_elapsed > MIN_SPEEDUP
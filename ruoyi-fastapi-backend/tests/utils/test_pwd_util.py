@@ -0,0 +1,154 @@
+import asyncio
+import io
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import bcrypt
+import pandas as pd
+import pytest
+
+from config.env import AppConfig
+from exceptions.exception import ServiceException
+from module_admin.service.user_service import UserService
+from utils.pwd_util import PwdUtil
+
+BENCHMARK_LOGINS = 24
+BENCHMARK_ROUNDS = 8
+TICK_INTERVAL = 0.001
+IMPORT_ROWS = 5
+
+
+@pytest.fixture(autouse=True)
+def reset_password_pool() -> Iterator[None]:
+    PwdUtil.shutdown()
+    PwdUtil.reset_metrics()
+    yield
+    PwdUtil.shutdown()
+    PwdUtil.reset_metrics()
+
+
+def test_async_variants_match_sync_results() -> None:
+    async def run() -> tuple[str, bool, bool]:
+        hashed_password = await PwdUtil.get_password_hash_async('admin123')
+        return (
+            hashed_password,
+            await PwdUtil.verify_password_async('admin123', hashed_password),
+            await PwdUtil.verify_password_async('wrong', hashed_password),
+        )
+
+    hashed_password, matched, mismatched = asyncio.run(run())
+
+    assert PwdUtil.verify_password('admin123', hashed_password)
+    assert matched is True
+    assert mismatched is False
+    metrics = PwdUtil.get_metrics()
+    assert metrics['submitted'] == metrics['completed'] == 3  # noqa: PLR2004
+    assert metrics['in_flight'] == 0
+    assert metrics['max_workers'] == AppConfig.app_password_hash_max_workers
+
+
+def test_pending_limit_rejects_after_queue_timeout() -> None:
+    release = threading.Event()
+
+    def blocking_hash(input_password: str) -> str:
+        release.wait(timeout=5)
+        return input_password
+
+    async def run() -> None:
+        first = asyncio.create_task(PwdUtil.get_password_hash_async('first'))
+        await asyncio.sleep(0)
+        with pytest.raises(ServiceException):
+            await PwdUtil.get_password_hash_async('second')
+        release.set()
+        assert await first == 'first'
+
+    with (
+        patch.object(AppConfig, 'app_password_hash_max_pending', 1),
+        patch.object(AppConfig, 'app_password_hash_queue_timeout', 0.05),
+        patch.object(PwdUtil, 'get_password_hash', side_effect=blocking_hash),
+    ):
+        asyncio.run(run())
+
+    metrics = PwdUtil.get_metrics()
+    assert metrics['rejected'] == 1
+    assert metrics['completed'] == 1
+
+
+def test_batch_import_hashes_init_password_once() -> None:
+    buffer = io.BytesIO()
+    pd.DataFrame(
+        {
+            '部门编号': [100] * IMPORT_ROWS,
+            '登录名称': [f'user{index}' for index in range(IMPORT_ROWS)],
+            '用户名称': ['导入用户'] * IMPORT_ROWS,
+            '用户邮箱': ['user@example.com'] * IMPORT_ROWS,
+            '手机号码': ['13800000000'] * IMPORT_ROWS,
+            '用户性别': ['男'] * IMPORT_ROWS,
+            '帐号状态': ['正常'] * IMPORT_ROWS,
+        }
+    ).to_excel(buffer, index=False)
+    upload_file = SimpleNamespace(file=buffer, close=AsyncMock())
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(redis=object())))
+    query_db = SimpleNamespace(commit=AsyncMock(), rollback=AsyncMock())
+    current_user = SimpleNamespace(user=SimpleNamespace(user_id=1, user_name='admin', admin=True))
+
+    with (
+        patch(
+            'module_admin.service.user_service.ConfigService.query_config_list_from_cache_services',
+            new=AsyncMock(return_value='123456'),
+        ),
+        patch.object(UserService, 'validate_password_services', new=AsyncMock()),
+        patch('module_admin.service.user_service.UserDao.get_user_ids_by_user_names', new=AsyncMock(return_value={})),
+        patch(
+            'module_admin.service.user_service.DeptDao.get_dept_ids_in_data_scope', new=AsyncMock(return_value={100})
+        ),
+        patch('module_admin.service.user_service.UserDao.bulk_add_user_dao', new=AsyncMock()) as bulk_add_user_dao,
+        patch('module_admin.service.user_service.UserDao.bulk_edit_user_dao', new=AsyncMock()),
+        patch('module_admin.service.user_service.UserAuthCacheService.bump_permission_epoch', new=AsyncMock()),
+        patch.object(PwdUtil, 'get_password_hash', return_value='hashed-password') as get_password_hash,
+    ):
+        asyncio.run(
+            UserService.batch_import_user_services(request, query_db, upload_file, False, current_user, None, None)
+        )
+
+    get_password_hash.assert_called_once_with('123456')
+    add_users = bulk_add_user_dao.await_args.args[1]
+    assert len(add_users) == IMPORT_ROWS
+    assert {user['password'] for user in add_users} == {'hashed-password'}
+
+
+async def _measure_max_loop_lag(login: Callable[[str, str], Awaitable[bool]]) -> float:
+    # 并发执行登录密码校验，同时以固定间隔采样事件循环调度延迟
+    hashed_password = bcrypt.hashpw(b'admin123', bcrypt.gensalt(rounds=BENCHMARK_ROUNDS)).decode('utf-8')
+    max_lag = 0.0
+    stopped = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal max_lag
+        while not stopped.is_set():
+            expected_time = time.perf_counter() + TICK_INTERVAL
+            await asyncio.sleep(TICK_INTERVAL)
+            max_lag = max(max_lag, time.perf_counter() - expected_time)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_INTERVAL * 2)
+    results = await asyncio.gather(*(login('admin123', hashed_password) for _ in range(BENCHMARK_LOGINS)))
+    stopped.set()
+    await ticker_task
+    assert all(results)
+    return max_lag
+
+
+@pytest.mark.benchmark
+def test_login_storm_event_loop_lag_benchmark() -> None:
+    async def blocking_login(plain_password: str, hashed_password: str) -> bool:
+        return PwdUtil.verify_password(plain_password, hashed_password)
+
+    blocking_lag = asyncio.run(_measure_max_loop_lag(blocking_login))
+    offloaded_lag = asyncio.run(_measure_max_loop_lag(PwdUtil.verify_password_async))
+
+    assert offloaded_lag < blocking_lag
+    assert PwdUtil.get_metrics()['completed'] == BENCHMARK_LOGINS
@@ -0,0 +1,195 @@
+import asyncio
+import os
+import time
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from utils.file_util import FileDownloadResult, FileUtil
+from utils.response_util import ResponseUtil
+from utils.upload_util import UploadUtil
+
+FILE_CONTENT = b'0123456789'
+BENCHMARK_FILE_SIZE = 4 * 1024 * 1024 * 1024
+BENCHMARK_RANGE_SIZE = 128 * 1024 * 1024
+BENCHMARK_CONCURRENCY = 8
+MIN_RANGE_THROUGHPUT_MB = 200
+
+
+def _scope(range_header: str | None = None, extensions: dict[str, Any] | None = None) -> dict[str, Any]:
+    headers = [(b'range', range_header.encode())] if range_header else []
+    return {'type': 'http', 'method': 'GET', 'headers': headers, 'extensions': extensions or {}}
+
+
+async def _receive() -> dict[str, Any]:
+    await asyncio.Event().wait()
+    return {'type': 'http.disconnect'}
+
+
+async def _audited_stream(filepath: Path, start: int, length: int, sent: list[int]) -> AsyncGenerator[bytes, None]:
+    bytes_sent = 0
+    try:
+        async for chunk in UploadUtil.generate_file(filepath, start=start, length=length):
+            bytes_sent += len(chunk)
+            yield chunk
+    finally:
+        sent.append(bytes_sent)
+
+
+def _download_result(
+    filepath: Path, range_header: str | None, sent: list[int], on_sent: AsyncMock | None = None
+) -> FileDownloadResult:
+    byte_range = FileUtil.parse_byte_range(range_header, filepath.stat().st_size)
+    return FileDownloadResult(
+        data=_audited_stream(filepath, byte_range.start, byte_range.length, sent),
+        filename=filepath.name,
+        byte_range=byte_range,
+        filepath=filepath,
+        on_sent=on_sent,
+    )
+
+
+class _RecordingSend:
+    def __init__(self) -> None:
+        self.messages: list[dict[str, Any]] = []
+        self.body_bytes = 0
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        self.messages.append(message)
+        self.body_bytes += len(message.get('body', b''))
+
+
+@pytest.mark.asyncio
+async def test_full_download_uses_pathsend_and_reports_sent_bytes(tmp_path: Path) -> None:
+    filepath = tmp_path / 'report.txt'
+    filepath.write_bytes(FILE_CONTENT)
+    stream_sent: list[int] = []
+    on_sent = AsyncMock()
+    send = _RecordingSend()
+    response = ResponseUtil.file_download(
+        download_result=_download_result(filepath, None, stream_sent, on_sent), media_type='application/octet-stream'
+    )
+
+    await response(_scope(extensions={'http.response.pathsend': {}}), _receive, send)
+
+    assert [message['type'] for message in send.messages] == ['http.response.start', 'http.response.pathsend']
+    assert send.messages[1]['path'] == str(filepath)
+    on_sent.assert_awaited_once_with(len(FILE_CONTENT), '')
+    # 回退数据流未被迭代，不会重复记录审计
+    assert stream_sent == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ('range_header', 'extensions', 'expected'),
+    [
+        ('bytes=3-6', {'http.response.pathsend': {}}, b'3456'),
+        (None, {}, FILE_CONTENT),
+    ],
+)
+async def test_ranged_or_unsupported_download_falls_back_to_stream(
+    tmp_path: Path, range_header: str | None, extensions: dict[str, Any], expected: bytes
+) -> None:
+    filepath = tmp_path / 'report.txt'
+    filepath.write_bytes(FILE_CONTENT)
+    stream_sent: list[int] = []
+    on_sent = AsyncMock()
+    send = _RecordingSend()
+    response = ResponseUtil.file_download(
+        download_result=_download_result(filepath, range_header, stream_sent, on_sent)
+    )
+
+    await response(_scope(range_header, extensions), _receive, send)
+
+    assert response.status_code == (206 if range_header else 200)
+    assert b''.join(message.get('body', b'') for message in send.messages) == expected
+    assert stream_sent == [len(expected)]
+    on_sent.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_head_request_does_not_use_pathsend(tmp_path: Path) -> None:
+    filepath = tmp_path / 'report.txt'
+    filepath.write_bytes(FILE_CONTENT)
+    on_sent = AsyncMock()
+    send = _RecordingSend()
+    response = ResponseUtil.file_download(download_result=_download_result(filepath, None, [], on_sent))
+
+    await response({**_scope(extensions={'http.response.pathsend': {}}), 'method': 'HEAD'}, _receive, send)
+
+    assert 'http.response.pathsend' not in [message['type'] for message in send.messages]
+    on_sent.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_pathsend_reports_failure_when_file_changed(tmp_path: Path) -> None:
+    filepath = tmp_path / 'report.txt'
+    filepath.write_bytes(FILE_CONTENT)
+    on_sent = AsyncMock()
+    download_result = _download_result(filepath, None, [], on_sent)
+    filepath.write_bytes(FILE_CONTENT * 2)
+
+    with pytest.raises(OSError):
+        await ResponseUtil.file_download(download_result=download_result)(
+            _scope(extensions={'http.response.pathsend': {}}), _receive, _RecordingSend()
+        )
+
+    on_sent.assert_awaited_once_with(0, 'OSError')
+
+
+class _CountingSend:
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.headers: dict[bytes, bytes] = {}
+        self.body_bytes = 0
+
+    async def __call__(self, message: dict[str, Any]) -> None:
+        if message['type'] == 'http.response.start':
+            self.status = message['status']
+            self.headers = dict(message['headers'])
+        self.body_bytes += len(message.get('body', b''))
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_benchmark_concurrent_range_downloads_of_multi_gigabyte_file(tmp_path: Path) -> None:
+    # 零拷贝发送由ASGI服务器完成，测试中只能模拟，此处只衡量分段流式读取路径
+    filepath = tmp_path / 'large.bin'
+    # 稀疏文件不占用实际磁盘空间
+    filepath.touch()
+    os.truncate(filepath, BENCHMARK_FILE_SIZE)
+    segment_size = BENCHMARK_FILE_SIZE // BENCHMARK_CONCURRENCY
+    range_headers = [
+        f'bytes={index * segment_size}-{index * segment_size + BENCHMARK_RANGE_SIZE - 1}'
+        for index in range(BENCHMARK_CONCURRENCY)
+    ]
+    sends = [_CountingSend() for _ in range_headers]
+
+    async def download(range_header: str, send: _CountingSend) -> None:
+        download_result = _download_result(filepath, range_header, [])
+        response = ResponseUtil.file_download(
+            download_result=download_result,
+            headers=UploadUtil.build_download_headers(filepath.name, download_result.byte_range),
+            media_type='application/octet-stream',
+        )
+        await response(_scope(range_header, {'http.response.pathsend': {}}), _receive, send)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(download(range_header, send) for range_header, send in zip(range_headers, sends, strict=True))
+    )
+    elapsed = time.perf_counter() - started_at
+
+    assert [send.status for send in sends] == [206] * BENCHMARK_CONCURRENCY
+    assert (
+        sends[-1].headers[b'content-range']
+        == (
+            f'bytes {(BENCHMARK_CONCURRENCY - 1) * segment_size}-'
+            f'{(BENCHMARK_CONCURRENCY - 1) * segment_size + BENCHMARK_RANGE_SIZE - 1}/{BENCHMARK_FILE_SIZE}'
+        ).encode()
+    )
+    assert all(send.body_bytes == BENCHMARK_RANGE_SIZE for send in sends)
+    assert BENCHMARK_RANGE_SIZE * BENCHMARK_CONCURRENCY / elapsed / 1024 / 1024 > MIN_RANGE_THROUGHPUT_MB
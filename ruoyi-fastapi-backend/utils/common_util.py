@@ -1,7 +1,8 @@
 import io
 import os
 import re
-from collections.abc import Generator, Sequence
+from collections.abc import Callable, Generator, Sequence
+from functools import cache, lru_cache
 from typing import Any, Literal, overload
 
 import pandas as pd
@@ -9,7 +10,10 @@ from openpyxl import Workbook
 from openpyxl.styles import Alignment, PatternFill
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
+from sqlalchemy import insert
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.engine.row import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.collections import InstrumentedList
 from sqlalchemy.sql.expression import TextClause, null
 
@@ -62,19 +66,74 @@ class SqlalchemyUtil:
         :return: 字典结果
         """
         if isinstance(obj, Base):
-            base_dict = obj.__dict__.copy()
-            base_dict.pop('_sa_instance_state', None)
-            for name, value in base_dict.items():
-                if isinstance(value, InstrumentedList):
-                    base_dict[name] = cls.serialize_result(value, 'snake_to_camel')
-        elif isinstance(obj, dict):
-            base_dict = obj.copy()
+            return cls._get_model_serializer(type(obj), transform_case)(obj)
+        transform_key = cls._get_key_transformer(transform_case)
+        if transform_key is None:
+            return obj.copy()
+
+        return {transform_key(k): v for k, v in obj.items()}
+
+    @staticmethod
+    def _get_key_transformer(
+        transform_case: Literal['no_case', 'snake_to_camel', 'camel_to_snake'],
+    ) -> Callable[[str], str] | None:
+        """
+        获取字段名转换函数
+
+        :param transform_case: 转换得到的结果形式
+        :return: 带缓存的字段名转换函数，不转换时返回None
+        """
         if transform_case == 'snake_to_camel':
-            return {CamelCaseUtil.snake_to_camel(k): v for k, v in base_dict.items()}
+            return CamelCaseUtil.snake_to_camel
         if transform_case == 'camel_to_snake':
-            return {SnakeCaseUtil.camel_to_snake(k): v for k, v in base_dict.items()}
+            return SnakeCaseUtil.camel_to_snake
+        return None
 
-        return base_dict
+    @classmethod
+    @cache
+    def _get_model_serializer(
+        cls, model: type[Base], transform_case: Literal['no_case', 'snake_to_camel', 'camel_to_snake']
+    ) -> Callable[[Base], dict[str, Any]]:
+        """
+        按模型类编译并缓存序列化函数，字段名映射只计算一次，序列化时直接读取已加载的列属性
+
+        :param model: sqlalchemy模型类
+        :param transform_case: 转换得到的结果形式
+        :return: 模型对象序列化函数
+        """
+        transform_key = cls._get_key_transformer(transform_case) or str
+        column_keys = tuple((prop.key, transform_key(prop.key)) for prop in sa_inspect(model).column_attrs)
+
+        def serialize(obj: Base) -> dict[str, Any]:
+            obj_dict = obj.__dict__
+            # 未加载或已过期的列不在实例字典中，保持与实例字典一致，不触发延迟加载
+            base_dict = {output_key: obj_dict[key] for key, output_key in column_keys if key in obj_dict}
+            if len(obj_dict) > len(base_dict) + 1:
+                # 存在已加载的关系属性或手动附加的属性时按原样补充
+                for name, value in obj_dict.items():
+                    if name == '_sa_instance_state' or (output_key := transform_key(name)) in base_dict:
+                        continue
+                    base_dict[output_key] = (
+                        cls.serialize_result(value, 'snake_to_camel') if isinstance(value, InstrumentedList) else value
+                    )
+            return base_dict
+
+        return serialize
+
+    @classmethod
+    @cache
+    def _get_row_keys(
+        cls, fields: tuple[str, ...], transform_case: Literal['no_case', 'snake_to_camel', 'camel_to_snake']
+    ) -> tuple[str, ...]:
+        """
+        按查询结果行字段元组缓存转换后的字段名
+
+        :param fields: 查询结果行字段元组
+        :param transform_case: 转换得到的结果形式
+        :return: 转换后的字段名元组
+        """
+        transform_key = cls._get_key_transformer(transform_case) or str
+        return tuple(transform_key(field) for field in fields)
 
     @classmethod
     @overload
@@ -138,20 +197,48 @@ class SqlalchemyUtil:
         if isinstance(result, (Base, dict)):
             return cls.base_to_dict(result, transform_case)
         if isinstance(result, list):
+            if result and isinstance(result[0], Base):
+                model = type(result[0])
+                if all(type(row) is model for row in result):
+                    # 同一模型的结果列表复用编译后的序列化函数
+                    serialize = cls._get_model_serializer(model, transform_case)
+                    return [serialize(row) for row in result]
             return [cls.serialize_result(row, transform_case) for row in result]
         if isinstance(result, Row):
             if all(isinstance(row, Base) for row in result):
                 return [cls.base_to_dict(row, transform_case) for row in result]
             if any(isinstance(row, Base) for row in result):
                 return [cls.serialize_result(row, transform_case) for row in result]
-            result_dict = result._asdict()
-            if transform_case == 'snake_to_camel':
-                return {CamelCaseUtil.snake_to_camel(k): v for k, v in result_dict.items()}
-            if transform_case == 'camel_to_snake':
-                return {SnakeCaseUtil.camel_to_snake(k): v for k, v in result_dict.items()}
-            return result_dict
+            return dict(zip(cls._get_row_keys(result._fields, transform_case), result, strict=True))
         return result
 
+    @classmethod
+    async def bulk_insert(
+        cls, db: AsyncSession, model: type[Base], rows: Sequence[dict[str, Any]], chunk_size: int = 1000
+    ) -> int:
+        """
+        批量写入数据，字段集合相同的行合并为一次executemany执行
+
+        executemany复用同一条已编译的INSERT语句，MySQL驱动会将其改写为多行VALUES语句，PostgreSQL驱动则以管道方式批量执行
+
+        :param db: orm对象
+        :param model: sqlalchemy模型类
+        :param rows: 待写入的行字典列表，键为模型字段名，缺省的字段由列默认值填充
+        :param chunk_size: 单次执行最多包含的行数
+        :return: 执行次数
+        """
+        grouped_rows: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for row in rows:
+            grouped_rows.setdefault(tuple(row), []).append(row)
+        chunk_size = max(chunk_size, 1)
+        statement_count = 0
+        for same_column_rows in grouped_rows.values():
+            for start in range(0, len(same_column_rows), chunk_size):
+                await db.execute(insert(model), same_column_rows[start : start + chunk_size])
+                statement_count += 1
+
+        return statement_count
+
     @classmethod
     def get_server_default_null(cls, dialect_name: str, need_explicit_null: bool = True) -> TextClause | None:
         """
@@ -171,10 +258,11 @@ class CamelCaseUtil:
     下划线形式(snake_case)转小驼峰形式(camelCase)工具方法
     """
 
-    @classmethod
-    def snake_to_camel(cls, snake_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def snake_to_camel(snake_str: str) -> str:
         """
-        下划线形式字符串(snake_case)转换为小驼峰形式字符串(camelCase)
+        下划线形式字符串(snake_case)转换为小驼峰形式字符串(camelCase)，转换结果按字符串缓存
 
         :param snake_str: 下划线形式字符串
         :return: 小驼峰形式字符串
@@ -232,10 +320,11 @@ class SnakeCaseUtil:
     小驼峰形式(camelCase)转下划线形式(snake_case)工具方法
     """
 
-    @classmethod
-    def camel_to_snake(cls, camel_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def camel_to_snake(camel_str: str) -> str:
         """
-        小驼峰形式字符串(camelCase)转换为下划线形式字符串(snake_case)
+        小驼峰形式字符串(camelCase)转换为下划线形式字符串(snake_case)，转换结果按字符串缓存
 
         :param camel_str: 小驼峰形式字符串
         :return: 下划线形式字符串
@@ -1,11 +1,35 @@
+import asyncio
+import codecs
+import csv
 import io
+import json
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, BinaryIO, Literal
 
 import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Alignment, PatternFill
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.datavalidation import DataValidation
 
+ExportFormat = Literal['xlsx', 'csv', 'ndjson']
+ExportFormatter = Callable[[Any], Any]
+ExportProgressCallback = Callable[[int], Awaitable[None]]
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CHUNK_SIZE = 64 * 1024
+IMPORT_CHUNK_SIZE = 5000
+_XLSX_SIGNATURE = b'PK\x03\x04'
+_EXCEL_CELL_TYPES = (str, int, float, bool, datetime, date, time, Decimal)
+_XLSX_MIN_COLUMN_WIDTH = 12
+_XLSX_MAX_COLUMN_WIDTH = 50
+
 
 class ExcelUtil:
     """
@@ -42,6 +66,329 @@ class ExcelUtil:
 
         return binary_data
 
+    @classmethod
+    def choice_formatter(cls, choices: dict[Any, Any], default: Any = None) -> ExportFormatter:
+        """
+        工具方法：构建将字段值映射为固定选项文字的格式化函数
+
+        :param choices: 字段值与选项文字的映射
+        :param default: 未匹配时的选项文字，为None时保留原值
+        :return: 格式化函数
+        """
+        return lambda value: choices.get(value, value if default is None else default)
+
+    @classmethod
+    def dict_label_formatter(cls, dict_data_list: Iterable[dict[str, Any]]) -> ExportFormatter:
+        """
+        工具方法：构建将字段值映射为字典标签的格式化函数
+
+        :param dict_data_list: 字典数据列表
+        :return: 格式化函数，未匹配字典值时保留原值
+        """
+        label_dict = {str(item.get('dictValue')): item.get('dictLabel') for item in dict_data_list}
+        return lambda value: label_dict.get(str(value), value)
+
+    @classmethod
+    async def stream_export(
+        cls,
+        rows: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]],
+        mapping_dict: dict[str, str],
+        formatters: dict[str, ExportFormatter] | None = None,
+        export_format: ExportFormat = 'xlsx',
+        batch_size: int = EXPORT_BATCH_SIZE,
+        on_progress: ExportProgressCallback | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        工具方法：逐行格式化数据并流式输出导出文件，内存占用与数据总量无关
+
+        :param rows: 数据行，支持数据库游标等异步迭代器
+        :param mapping_dict: 映射字典，键为数据字段名，值为表头名称，顺序即列顺序
+        :param formatters: 字段格式化函数，键为数据字段名
+        :param export_format: 导出格式，xlsx使用只写模式写入临时文件后分块输出，csv与ndjson按批次直接输出
+        :param batch_size: 每批处理的数据行数
+        :param on_progress: 进度回调，每批数据处理完成后以累计处理行数调用
+        :return: 导出文件的二进制数据块
+        """
+        keys = list(mapping_dict)
+        header = [mapping_dict[key] for key in keys]
+        key_formatters = [(key, (formatters or {}).get(key)) for key in keys]
+
+        def format_row(row: dict[str, Any]) -> list[Any]:
+            return [formatter(row.get(key)) if formatter else row.get(key) for key, formatter in key_formatters]
+
+        batches = cls.__iter_batches(rows, batch_size)
+        if on_progress:
+            batches = cls.__report_progress(batches, on_progress)
+        if export_format == 'csv':
+            yield codecs.BOM_UTF8 + cls.__encode_csv_rows([header])
+            async for batch in batches:
+                yield cls.__encode_csv_rows([format_row(row) for row in batch])
+        elif export_format == 'ndjson':
+            async for batch in batches:
+                yield ''.join(
+                    json.dumps(dict(zip(header, format_row(row), strict=True)), ensure_ascii=False, default=str) + '\n'
+                    for row in batch
+                ).encode('utf-8')
+        else:
+            async for chunk in cls.__stream_xlsx(header, batches, format_row):
+                yield chunk
+
+    @staticmethod
+    async def __iter_batches(
+        rows: AsyncIterable[dict[str, Any]] | Iterable[dict[str, Any]], batch_size: int
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        工具方法：将数据行按批次分组
+
+        :param rows: 数据行
+        :param batch_size: 每批数据行数
+        :return: 数据行批次
+        """
+        batch = []
+        if isinstance(rows, AsyncIterable):
+            async for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        else:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    async def __report_progress(
+        batches: AsyncIterator[list[dict[str, Any]]], on_progress: ExportProgressCallback
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        工具方法：下游处理完每批数据后回调累计处理行数
+
+        :param batches: 数据行批次
+        :param on_progress: 进度回调
+        :return: 数据行批次
+        """
+        processed_rows = 0
+        async for batch in batches:
+            yield batch
+            processed_rows += len(batch)
+            await on_progress(processed_rows)
+
+    @staticmethod
+    def __encode_csv_rows(rows: list[list[Any]]) -> bytes:
+        """
+        工具方法：将数据行编码为csv二进制数据
+
+        :param rows: 数据行
+        :return: csv二进制数据
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode('utf-8')
+
+    @classmethod
+    async def __stream_xlsx(
+        cls,
+        header: list[str],
+        batches: AsyncIterator[list[dict[str, Any]]],
+        format_row: Callable[[dict[str, Any]], list[Any]],
+    ) -> AsyncIterator[bytes]:
+        """
+        工具方法：使用openpyxl只写模式写入xlsx，数据行随写随落盘，保存后分块输出
+
+        :param header: 表头
+        :param batches: 数据行批次
+        :param format_row: 数据行格式化函数
+        :return: xlsx二进制数据块
+        """
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        header_font = Font(bold=True)
+        # 设置表头背景样式为灰色，四周细边框并居中对齐
+        header_fill = PatternFill(start_color='ababab', end_color='ababab', fill_type='solid')
+        header_side = Side(style='thin')
+        header_border = Border(left=header_side, right=header_side, top=header_side, bottom=header_side)
+        header_alignment = Alignment(horizontal='center', vertical='center')
+        header_cells = []
+        for col_num, title in enumerate(header, 1):
+            # 只写模式下列宽需在写入数据行之前设置，按表头显示宽度估算
+            worksheet.column_dimensions[get_column_letter(col_num)].width = cls.__get_column_width(title)
+            cell = WriteOnlyCell(worksheet, value=title)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.border = header_border
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        saved = False
+        try:
+            async for batch in batches:
+                await asyncio.to_thread(cls.__append_xlsx_rows, worksheet, [format_row(row) for row in batch])
+            with tempfile.TemporaryFile() as file:
+                await asyncio.to_thread(workbook.save, file)
+                saved = True
+                await asyncio.to_thread(file.seek, 0)
+                while chunk := await asyncio.to_thread(file.read, EXPORT_CHUNK_SIZE):
+                    yield chunk
+        finally:
+            if not saved:
+                cls.__discard_worksheet(worksheet)
+
+    @staticmethod
+    def __get_column_width(title: str) -> int:
+        """
+        工具方法：根据表头显示宽度计算列宽，中文等宽字符按两个字符计算
+
+        :param title: 表头
+        :return: 列宽
+        """
+        display_width = sum(1 if char.isascii() else 2 for char in str(title)) + 4
+        return min(max(display_width, _XLSX_MIN_COLUMN_WIDTH), _XLSX_MAX_COLUMN_WIDTH)
+
+    @classmethod
+    def __append_xlsx_rows(cls, worksheet: WriteOnlyWorksheet, rows: list[list[Any]]) -> None:
+        """
+        工具方法：向只写工作表追加数据行
+
+        :param worksheet: 只写工作表
+        :param rows: 数据行
+        :return: None
+        """
+        for row in rows:
+            worksheet.append([cls.__to_cell_value(value) for value in row])
+
+    @staticmethod
+    def __to_cell_value(value: Any) -> Any:
+        """
+        工具方法：非单元格类型转为字符串，并移除Excel不支持的控制字符
+
+        :param value: 字段值
+        :return: 单元格值
+        """
+        if value is None or (isinstance(value, _EXCEL_CELL_TYPES) and not isinstance(value, str)):
+            return value
+        return ILLEGAL_CHARACTERS_RE.sub('', str(value))
+
+    @staticmethod
+    def __discard_worksheet(worksheet: WriteOnlyWorksheet) -> None:
+        """
+        工具方法：导出中断时关闭只写工作表并删除其临时文件
+
+        :param worksheet: 只写工作表
+        :return: None
+        """
+        writer = getattr(worksheet, '_writer', None)
+        if writer is None:
+            return
+        try:
+            writer.close()
+            writer.cleanup()
+        except OSError:
+            pass
+
+    @classmethod
+    async def iter_import_chunks(
+        cls, file: BinaryIO, header_dict: dict[str, str], chunk_size: int = IMPORT_CHUNK_SIZE
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        工具方法：流式解析导入文件并按批次输出数据，内存占用与文件行数无关
+
+        :param file: 导入文件对象，xlsx文件使用openpyxl只读模式解析，其余按utf-8编码的csv解析
+        :param header_dict: 表头映射字典，键为表头名称，值为字段名，文件中缺少的列以None填充
+        :param chunk_size: 每批数据行数
+        :return: 数据批次，列为字段名，索引为数据在文件中的行号，单元格值为去除首尾空白的字符串，空单元格为None
+        """
+        chunks = cls.__read_import_chunks(file, header_dict, chunk_size)
+        try:
+            while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+                yield chunk
+        finally:
+            chunks.close()
+
+    @classmethod
+    def __read_import_chunks(
+        cls, file: BinaryIO, header_dict: dict[str, str], chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        工具方法：根据文件头识别导入文件格式并逐批解析
+
+        :param file: 导入文件对象
+        :param header_dict: 表头映射字典
+        :param chunk_size: 每批数据行数
+        :return: 数据批次
+        """
+        file.seek(0)
+        is_xlsx = file.read(len(_XLSX_SIGNATURE)) == _XLSX_SIGNATURE
+        file.seek(0)
+        if is_xlsx:
+            workbook = load_workbook(file, read_only=True, data_only=True)
+            try:
+                yield from cls.__chunk_import_rows(workbook.active.iter_rows(values_only=True), header_dict, chunk_size)
+            finally:
+                workbook.close()
+        else:
+            text_file = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+            try:
+                yield from cls.__chunk_import_rows(csv.reader(text_file), header_dict, chunk_size)
+            finally:
+                text_file.detach()
+
+    @classmethod
+    def __chunk_import_rows(
+        cls, rows: Iterator[Sequence[Any]], header_dict: dict[str, str], chunk_size: int
+    ) -> Iterator[pd.DataFrame]:
+        """
+        工具方法：按表头映射提取数据列并分批构建DataFrame，跳过空行
+
+        :param rows: 含表头的数据行迭代器
+        :param header_dict: 表头映射字典
+        :param chunk_size: 每批数据行数
+        :return: 数据批次
+        """
+        header = next(rows, None)
+        if header is None:
+            return
+        fields = list(header_dict.values())
+        column_indexes: dict[str, int] = {}
+        for index, title in enumerate(header):
+            field = header_dict.get(cls.__to_import_value(title))
+            if field is not None:
+                column_indexes.setdefault(field, index)
+        field_indexes = [column_indexes.get(field) for field in fields]
+        values: list[list[str | None]] = []
+        row_numbers: list[int] = []
+        for row_number, row in enumerate(rows, start=2):
+            record = [
+                cls.__to_import_value(row[index]) if index is not None and index < len(row) else None
+                for index in field_indexes
+            ]
+            if all(value is None for value in record):
+                continue
+            values.append(record)
+            row_numbers.append(row_number)
+            if len(values) >= chunk_size:
+                yield pd.DataFrame(values, columns=fields, index=row_numbers, dtype=object)
+                values, row_numbers = [], []
+        if values:
+            yield pd.DataFrame(values, columns=fields, index=row_numbers, dtype=object)
+
+    @staticmethod
+    def __to_import_value(value: Any) -> str | None:
+        """
+        工具方法：将导入单元格值转为字符串，整数值的浮点数去除小数部分
+
+        :param value: 单元格值
+        :return: 去除首尾空白的字符串，空值返回None
+        """
+        if value is None:
+            return None
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value).strip() or None
+
     @classmethod
     def get_excel_template(cls, header_list: list, selector_header_list: list, option_list: list[dict]) -> bytes:
         """
@@ -4,8 +4,9 @@ import re
 import shutil
 import time
 import uuid
-from collections.abc import AsyncGenerator, Iterator
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterator
 from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -54,10 +55,20 @@ class FileDownloadResult:
     文件下载结果
     """
 
-    data: AsyncGenerator[bytes, None]
     filename: str
     byte_range: FileByteRange
+    # 文件内容数据流，客户端缓存仍然有效（not_modified）时不发送文件内容，为空
+    data: AsyncGenerator[bytes, None] | None = None
     accept_ranges: bool = True
+    # 服务器支持零拷贝发送时直接发送该路径文件，不再读取data
+    filepath: Path | None = None
+    # 零拷贝发送结束后的回调，参数为已发送字节数与失败原因（成功时为空字符串）
+    on_sent: Callable[[int, str], Awaitable[None]] | None = None
+    etag: str | None = None
+    last_modified: float | None = None
+    cache_control: str | None = None
+    # 客户端缓存仍然有效，响应304且不发送文件内容
+    not_modified: bool = False
 
 
 @dataclass(frozen=True)
@@ -125,6 +136,75 @@ class FileUtil:
 
     FILE_RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$', re.IGNORECASE)
 
+    @classmethod
+    def build_file_etag(cls, file_hash: str | None, stat_result: os.stat_result) -> str:
+        """
+        构造文件强校验ETag，优先使用文件SHA-256，缺失时根据文件修改时间与大小生成
+
+        :param file_hash: 文件SHA-256
+        :param stat_result: 文件状态信息
+        :return: 带双引号的ETag
+        """
+        if file_hash:
+            return f'"{file_hash}"'
+        return f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+    @classmethod
+    def is_not_modified(cls, if_none_match: str | None, etag: str) -> bool:
+        """
+        按If-None-Match请求头判断客户端缓存是否仍然有效，比较时忽略弱校验前缀
+
+        :param if_none_match: If-None-Match请求头
+        :param etag: 文件当前ETag
+        :return: 客户端缓存是否仍然有效
+        """
+        if not if_none_match:
+            return False
+        entity_tags = [entity_tag.strip() for entity_tag in if_none_match.split(',')]
+        return '*' in entity_tags or etag in [entity_tag.removeprefix('W/') for entity_tag in entity_tags]
+
+    @classmethod
+    def resolve_if_range(
+        cls, range_header: str | None, if_range: str | None, etag: str, last_modified: float
+    ) -> str | None:
+        """
+        按If-Range请求头决定是否处理Range请求，校验值与文件当前版本不一致时返回完整文件
+
+        :param range_header: Range请求头
+        :param if_range: If-Range请求头
+        :param etag: 文件当前ETag
+        :param last_modified: 文件最后修改时间戳
+        :return: 需要处理的Range请求头，为None时返回完整文件
+        """
+        if not range_header or not if_range:
+            return range_header
+        if_range = if_range.strip()
+        if if_range.startswith(('"', 'W/')):
+            # If-Range只接受强校验比较，弱ETag永远不匹配
+            return range_header if if_range == etag else None
+        try:
+            if_range_time = parsedate_to_datetime(if_range).timestamp()
+        except (TypeError, ValueError):
+            return None
+        return range_header if int(if_range_time) == int(last_modified) else None
+
+    @classmethod
+    def build_cache_headers(cls, download_result: FileDownloadResult) -> dict[str, str]:
+        """
+        构造文件下载缓存校验响应头
+
+        :param download_result: 文件下载结果
+        :return: ETag、Last-Modified与Cache-Control响应头
+        """
+        headers = {}
+        if download_result.etag:
+            headers['ETag'] = download_result.etag
+        if download_result.last_modified is not None:
+            headers['Last-Modified'] = formatdate(download_result.last_modified, usegmt=True)
+        if download_result.cache_control:
+            headers['Cache-Control'] = download_result.cache_control
+        return headers
+
     @classmethod
     def parse_byte_range(cls, range_header: str | None, file_size: int) -> FileByteRange:
         """
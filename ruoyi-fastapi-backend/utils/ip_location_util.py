@@ -0,0 +1,478 @@
+import csv
+import ipaddress
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
+from threading import Lock
+
+import httpx
+from redis import asyncio as aioredis
+from starlette.status import HTTP_200_OK
+
+from common.enums import RedisInitKeyConfig
+from config.env import AppConfig
+from utils.log_util import logger
+
+INNER_IP_LOCATION = '内网IP'
+UNKNOWN_IP_LOCATION = '未知'
+IPV4_VERSION = 4
+CSV_RANGE_COLUMN_COUNT = 3
+
+
+class IpLocationDatabase:
+    """
+    本地IP归属区域数据库
+
+    数据文件格式（小端序）：
+    - 文件头：magic(4s) version(H) reserved(H) ipv4_count(I) ipv6_count(I)
+    - IPv4区间：start(I大端数值) end(I) location_index(I)，按start升序排列
+    - IPv6区间：start(16s大端字节) end(16s) location_index(I)，按start升序排列
+    - 区域表：location_count(I) + location_count个偏移(I) + 长度前缀(H)的UTF-8字符串
+    """
+
+    MAGIC = b'RYIP'
+    VERSION = 1
+    _HEADER = struct.Struct('<4sHHII')
+    _IPV4_RECORD = struct.Struct('<III')
+    _IPV6_RECORD = struct.Struct('<16s16sI')
+    _UINT32 = struct.Struct('<I')
+    _UINT16 = struct.Struct('<H')
+
+    def __init__(self, file_path: str) -> None:
+        """
+        以内存映射方式加载数据库文件
+
+        :param file_path: 数据库文件路径
+        :return: None
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')  # noqa: SIM115
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        magic, version, _, self.ipv4_count, self.ipv6_count = self._HEADER.unpack_from(self._buffer, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            self.close()
+            raise ValueError(f'IP归属区域数据库格式不受支持：{file_path}')
+        self._ipv4_offset = self._HEADER.size
+        self._ipv6_offset = self._ipv4_offset + self.ipv4_count * self._IPV4_RECORD.size
+        self._location_offset = self._ipv6_offset + self.ipv6_count * self._IPV6_RECORD.size
+        self._location_count = self._UINT32.unpack_from(self._buffer, self._location_offset)[0]
+        self._location_blob_offset = self._location_offset + self._UINT32.size * (self._location_count + 1)
+        # 区间起始值单独加载为有序列表，查询时直接二分，记录本身仍按需从内存映射中读取
+        self._ipv4_starts = [
+            self._IPV4_RECORD.unpack_from(self._buffer, self._ipv4_offset + index * self._IPV4_RECORD.size)[0]
+            for index in range(self.ipv4_count)
+        ]
+        self._ipv6_starts = [
+            self._IPV6_RECORD.unpack_from(self._buffer, self._ipv6_offset + index * self._IPV6_RECORD.size)[0]
+            for index in range(self.ipv6_count)
+        ]
+        self._locations: dict[int, str] = {}
+
+    def lookup(self, ip: str) -> str | None:
+        """
+        查询IP所在区间对应的归属区域
+
+        :param ip: IP地址
+        :return: 归属区域，未命中时返回None
+        """
+        try:
+            ip_obj = ipaddress.ip_address(ip)
+        except ValueError:
+            return None
+        if ip_obj.version == IPV4_VERSION:
+            key = int(ip_obj)
+            index = bisect_right(self._ipv4_starts, key) - 1
+            if index < 0:
+                return None
+            _, end, location_index = self._IPV4_RECORD.unpack_from(
+                self._buffer, self._ipv4_offset + index * self._IPV4_RECORD.size
+            )
+        else:
+            key = ip_obj.packed
+            index = bisect_right(self._ipv6_starts, key) - 1
+            if index < 0:
+                return None
+            _, end, location_index = self._IPV6_RECORD.unpack_from(
+                self._buffer, self._ipv6_offset + index * self._IPV6_RECORD.size
+            )
+        if key > end:
+            return None
+        return self._get_location(location_index)
+
+    def _get_location(self, location_index: int) -> str:
+        """
+        读取区域表中的区域名称
+
+        :param location_index: 区域下标
+        :return: 区域名称
+        """
+        location = self._locations.get(location_index)
+        if location is None:
+            relative_offset = self._UINT32.unpack_from(
+                self._buffer, self._location_offset + self._UINT32.size * (location_index + 1)
+            )[0]
+            offset = self._location_blob_offset + relative_offset
+            length = self._UINT16.unpack_from(self._buffer, offset)[0]
+            start = offset + self._UINT16.size
+            location = self._buffer[start : start + length].decode('utf-8')
+            self._locations[location_index] = location
+        return location
+
+    def close(self) -> None:
+        """
+        释放内存映射和文件句柄
+
+        :return: None
+        """
+        try:
+            self._buffer.close()
+        finally:
+            self._file.close()
+
+    @classmethod
+    def build(cls, ranges: Iterable[tuple[str, str, str]], output_path: str) -> int:
+        """
+        根据IP区间生成本地数据库文件
+
+        :param ranges: (起始IP, 结束IP, 归属区域)区间序列
+        :param output_path: 输出文件路径
+        :return: 写入的区间数量
+        """
+        ipv4_records: list[tuple[int, int, int]] = []
+        ipv6_records: list[tuple[bytes, bytes, int]] = []
+        location_indexes: dict[str, int] = {}
+        for start_ip, end_ip, location in ranges:
+            start_obj = ipaddress.ip_address(start_ip.strip())
+            end_obj = ipaddress.ip_address(end_ip.strip())
+            if start_obj.version != end_obj.version or start_obj > end_obj:
+                raise ValueError(f'IP区间不合法：{start_ip} - {end_ip}')
+            location_index = location_indexes.setdefault(location.strip(), len(location_indexes))
+            if start_obj.version == IPV4_VERSION:
+                ipv4_records.append((int(start_obj), int(end_obj), location_index))
+            else:
+                ipv6_records.append((start_obj.packed, end_obj.packed, location_index))
+        ipv4_records.sort()
+        ipv6_records.sort()
+
+        location_offsets: list[int] = []
+        location_blob = bytearray()
+        for location in location_indexes:
+            encoded_location = location.encode('utf-8')
+            location_offsets.append(len(location_blob))
+            location_blob += cls._UINT16.pack(len(encoded_location)) + encoded_location
+
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        with open(output_path, 'wb') as file:
+            file.write(cls._HEADER.pack(cls.MAGIC, cls.VERSION, 0, len(ipv4_records), len(ipv6_records)))
+            for record in ipv4_records:
+                file.write(cls._IPV4_RECORD.pack(*record))
+            for record in ipv6_records:
+                file.write(cls._IPV6_RECORD.pack(*record))
+            file.write(cls._UINT32.pack(len(location_offsets)))
+            for offset in location_offsets:
+                file.write(cls._UINT32.pack(offset))
+            file.write(location_blob)
+
+        return len(ipv4_records) + len(ipv6_records)
+
+    @classmethod
+    def build_from_csv(cls, csv_path: str, output_path: str) -> int:
+        """
+        根据CSV文件（起始IP,结束IP,归属区域）生成本地数据库文件
+
+        :param csv_path: CSV文件路径
+        :param output_path: 输出文件路径
+        :return: 写入的区间数量
+        """
+        with open(csv_path, encoding='utf-8', newline='') as file:
+            rows = (
+                row for row in csv.reader(file) if len(row) >= CSV_RANGE_COLUMN_COUNT and not row[0].startswith('#')
+            )
+            return cls.build(((row[0], row[1], row[2]) for row in rows), output_path)
+
+
+class IpLocationProvider(ABC):
+    """
+    IP归属区域查询提供者基类
+    """
+
+    name = 'base'
+
+    @abstractmethod
+    async def lookup(self, ip: str) -> str | None:
+        """
+        查询IP归属区域
+
+        :param ip: IP地址
+        :return: 归属区域，未命中时返回None
+        """
+
+    async def close(self) -> None:
+        """
+        释放提供者持有的资源，默认不持有需要释放的资源
+
+        :return: None
+        """
+        return
+
+
+class LocalIpLocationProvider(IpLocationProvider):
+    """
+    基于本地内存映射数据库的IP归属区域查询提供者
+    """
+
+    name = 'local'
+
+    def __init__(self, database: IpLocationDatabase) -> None:
+        self.database = database
+
+    async def lookup(self, ip: str) -> str | None:
+        return self.database.lookup(ip)
+
+    async def close(self) -> None:
+        self.database.close()
+
+
+class HttpIpLocationProvider(IpLocationProvider):
+    """
+    基于外部HTTP接口的IP归属区域查询提供者，复用连接池并限制超时
+    """
+
+    name = 'http'
+
+    def __init__(self, url_template: str, timeout: float, max_connections: int = 20) -> None:
+        self.url_template = url_template
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: httpx.AsyncClient | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        获取复用的HTTP客户端
+
+        :return: HTTP客户端
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                ),
+            )
+        return self._client
+
+    async def lookup(self, ip: str) -> str | None:
+        ip_result = await self._get_client().get(self.url_template.format(ip=ip))
+        if ip_result.status_code != HTTP_200_OK:
+            return None
+        data = ip_result.json().get('data') or {}
+        prov = data.get('prov')
+        city = data.get('city')
+        if prov or city:
+            return f'{prov}-{city}'
+        return None
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+class IpLocationUtil:
+    """
+    IP归属区域解析工具
+
+    解析顺序：内网地址判断 -> 进程内LRU缓存 -> Redis共享缓存 -> 查询提供者链（本地数据库优先，HTTP接口兜底）
+    """
+
+    _lock = Lock()
+    _providers: list[IpLocationProvider] | None = None
+    _cache: OrderedDict[str, str] = OrderedDict()
+
+    @classmethod
+    def initialize(cls) -> None:
+        """
+        根据配置初始化查询提供者链，应用启动时调用，未调用时首次查询会自动初始化
+
+        :return: None
+        """
+        with cls._lock:
+            if cls._providers is None:
+                cls._providers = cls._build_providers()
+
+    @classmethod
+    def _build_providers(cls) -> list[IpLocationProvider]:
+        """
+        根据配置构建查询提供者链
+
+        :return: 查询提供者列表
+        """
+        providers: list[IpLocationProvider] = []
+        db_path = AppConfig.app_ip_location_db_path
+        if db_path:
+            try:
+                providers.append(LocalIpLocationProvider(IpLocationDatabase(db_path)))
+            except (OSError, ValueError, struct.error) as exc:
+                logger.warning(f'IP归属区域本地数据库加载失败，已跳过：{exc}')
+        if AppConfig.app_ip_location_http_enabled and AppConfig.app_ip_location_http_url:
+            providers.append(
+                HttpIpLocationProvider(
+                    url_template=AppConfig.app_ip_location_http_url,
+                    timeout=AppConfig.app_ip_location_http_timeout,
+                )
+            )
+        return providers
+
+    @classmethod
+    def set_providers(cls, providers: list[IpLocationProvider]) -> None:
+        """
+        替换查询提供者链，用于接入自定义数据源
+
+        :param providers: 查询提供者列表，按顺序查询直到命中
+        :return: None
+        """
+        with cls._lock:
+            cls._providers = list(providers)
+            cls._cache.clear()
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        应用关闭时释放查询提供者资源
+
+        :return: None
+        """
+        with cls._lock:
+            providers, cls._providers = cls._providers or [], None
+            cls._cache.clear()
+        for provider in providers:
+            await cls._close_provider(provider)
+
+    @staticmethod
+    async def _close_provider(provider: IpLocationProvider) -> None:
+        """
+        关闭单个查询提供者，失败时仅记录告警
+
+        :param provider: 查询提供者
+        :return: None
+        """
+        try:
+            await provider.close()
+        except Exception as exc:
+            logger.warning(f'IP归属区域查询提供者{provider.name}关闭失败：{exc}')
+
+    @classmethod
+    async def get_ip_location(cls, ip: str, redis: aioredis.Redis | None = None) -> str:
+        """
+        查询IP归属区域
+
+        :param ip: 需要查询的IP
+        :param redis: Redis连接对象，传入时启用跨进程共享缓存
+        :return: IP归属区域
+        """
+        inner_location = cls._get_inner_location(ip)
+        if inner_location is not None:
+            return inner_location
+        cached_location = cls._get_local_cache(ip)
+        if cached_location is not None:
+            return cached_location
+        cache_ttl = AppConfig.app_ip_location_cache_ttl
+        redis_key = f'{RedisInitKeyConfig.IP_LOCATION.key}:{ip}'
+        if redis is not None and cache_ttl > 0:
+            try:
+                cached_location = await redis.get(redis_key)
+            except Exception as exc:
+                logger.warning(f'IP归属区域Redis缓存读取失败：{exc}')
+            if cached_location:
+                cls._set_local_cache(ip, cached_location)
+                return cached_location
+
+        location, cacheable = await cls._lookup_providers(ip)
+        if cacheable:
+            cls._set_local_cache(ip, location)
+            if redis is not None and cache_ttl > 0:
+                try:
+                    await redis.set(redis_key, location, ex=cache_ttl)
+                except Exception as exc:
+                    logger.warning(f'IP归属区域Redis缓存写入失败：{exc}')
+        return location
+
+    @classmethod
+    async def _lookup_providers(cls, ip: str) -> tuple[str, bool]:
+        """
+        按顺序调用查询提供者
+
+        :param ip: 需要查询的IP
+        :return: 归属区域及结果是否可缓存，提供者异常时结果不缓存以便后续重试
+        """
+        if cls._providers is None:
+            cls.initialize()
+        cacheable = True
+        for provider in list(cls._providers or []):
+            try:
+                location = await provider.lookup(ip)
+            except Exception as exc:
+                cacheable = False
+                logger.warning(f'IP归属区域查询提供者{provider.name}查询失败：{type(exc).__name__}')
+                continue
+            if location:
+                return location, True
+        return UNKNOWN_IP_LOCATION, cacheable
+
+    @staticmethod
+    def _get_inner_location(ip: str) -> str | None:
+        """
+        判断是否为无需查询的内网或非法地址
+
+        :param ip: 需要查询的IP
+        :return: 内网/未知标识，需要继续查询时返回None
+        """
+        if not ip or ip == 'localhost':
+            return INNER_IP_LOCATION
+        try:
+            ip_obj = ipaddress.ip_address(ip)
+        except ValueError:
+            return UNKNOWN_IP_LOCATION
+        if ip_obj.is_private or ip_obj.is_loopback or ip_obj.is_link_local or ip_obj.is_unspecified:
+            return INNER_IP_LOCATION
+        return None
+
+    @classmethod
+    def _get_local_cache(cls, ip: str) -> str | None:
+        """
+        读取进程内LRU缓存
+
+        :param ip: IP地址
+        :return: 缓存的归属区域
+        """
+        with cls._lock:
+            location = cls._cache.get(ip)
+            if location is not None:
+                cls._cache.move_to_end(ip)
+            return location
+
+    @classmethod
+    def _set_local_cache(cls, ip: str, location: str) -> None:
+        """
+        写入进程内LRU缓存并淘汰最久未使用的条目
+
+        :param ip: IP地址
+        :param location: 归属区域
+        :return: None
+        """
+        max_size = AppConfig.app_ip_location_cache_size
+        if max_size <= 0:
+            return
+        with cls._lock:
+            cls._cache[ip] = location
+            cls._cache.move_to_end(ip)
+            while len(cls._cache) > max_size:
+                cls._cache.popitem(last=False)
@@ -1,11 +1,323 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
 import math
+import re
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from itertools import product
 from typing import Any
 
-from sqlalchemy import Row, Select, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from sqlalchemy import ColumnElement, Connection, Engine, Result, Row, Select, Table, and_, event, func, or_, select
+from sqlalchemy.engine.interfaces import DBAPICursor, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import UnaryExpression
+from sqlalchemy.sql.util import find_tables
 
 from common.vo import PageModel
+from config.env import AppConfig
+from exceptions.exception import ServiceException
 from utils.common_util import CamelCaseUtil
+from utils.log_util import logger
+
+CountCacheVersions = tuple[int, ...]
+
+
+class PageCountCache:
+    """
+    分页总记录数缓存
+
+    按计数语句及绑定参数生成的指纹在进程内短期缓存总记录数，数据权限条件已编译在语句与参数中，不同数据范围互不复用；
+    缓存项记录所涉及数据表的写入版本号，本进程对这些表执行写入语句或提交包含写入的事务时版本号递增，缓存随即失效。
+    提交包含写入的事务后通过Redis发布订阅通知其他worker递增对应数据表版本号；
+    多worker部署时仅在订阅连接正常时使用缓存，订阅断开期间直接计数，避免错过失效通知后持续返回旧的总记录数
+    """
+
+    CHANNEL = 'page_count_cache:invalidate'
+    _RECONNECT_DELAY = 5
+    _cache: OrderedDict[str, tuple[float, tuple[str, ...], CountCacheVersions, int]] = OrderedDict()
+    _table_versions: dict[str, int] = {}
+    _global_version: int = 0
+    _pending_tables_key = 'page_count_cache_pending_tables'
+    _all_tables = '*'
+    _text_dml_pattern = re.compile(r'^\s*(insert|update|delete|replace|merge|truncate)\b', re.IGNORECASE)
+    _source_id = uuid.uuid4().hex
+    _listening = False
+    _redis: aioredis.Redis | None = None
+    _loop: asyncio.AbstractEventLoop | None = None
+    _publish_tables: set[str] = set()
+    _publish_task: asyncio.Task | None = None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        判断当前worker是否可以使用缓存，多worker部署时需订阅其他worker的失效通知
+
+        :return: 是否可以使用缓存
+        """
+        return AppConfig.app_page_count_cache_size > 0 and (AppConfig.app_workers <= 1 or cls._listening)
+
+    @classmethod
+    def get_fingerprint(cls, db: AsyncSession, count_query: Select) -> str:
+        """
+        获取计数语句指纹
+
+        :param db: orm对象
+        :param count_query: 计数语句
+        :return: 计数语句指纹
+        """
+        compiled = count_query.compile(dialect=db.bind.dialect)
+        return hashlib.sha256(f'{compiled}|{sorted(compiled.params.items())!r}'.encode()).hexdigest()
+
+    @classmethod
+    def get_tables(cls, count_query: Select) -> tuple[str, ...]:
+        """
+        获取计数语句涉及的数据表，包含子查询与数据权限条件中引用的数据表
+
+        :param count_query: 计数语句
+        :return: 数据表名称元组
+        """
+        return tuple(
+            sorted(
+                {
+                    table.name
+                    for table in find_tables(count_query, include_aliases=True, include_selects=True)
+                    if isinstance(table, Table)
+                }
+            )
+        )
+
+    @classmethod
+    def get_versions(cls, tables: tuple[str, ...]) -> CountCacheVersions:
+        """
+        获取数据表当前写入版本号
+
+        :param tables: 数据表名称元组
+        :return: 全局版本号及各数据表版本号
+        """
+        return (cls._global_version, *(cls._table_versions.get(table, 0) for table in tables))
+
+    @classmethod
+    def get_total(cls, fingerprint: str) -> int | None:
+        """
+        获取未过期且数据表未发生写入的缓存总记录数
+
+        :param fingerprint: 计数语句指纹
+        :return: 总记录数，未命中时返回None
+        """
+        cached = cls._cache.get(fingerprint) if cls.is_enabled() else None
+        if cached is None:
+            return None
+        expire_at, tables, versions, total = cached
+        if expire_at <= time.monotonic() or versions != cls.get_versions(tables):
+            cls._cache.pop(fingerprint, None)
+            return None
+        cls._cache.move_to_end(fingerprint)
+        return total
+
+    @classmethod
+    def set_total(cls, fingerprint: str, tables: tuple[str, ...], versions: CountCacheVersions, total: int) -> None:
+        """
+        写入缓存总记录数
+
+        :param fingerprint: 计数语句指纹
+        :param tables: 计数语句涉及的数据表
+        :param versions: 执行计数前读取的数据表版本号，计数期间发生写入时缓存项在下次读取时即失效
+        :param total: 总记录数
+        :return: None
+        """
+        if not cls.is_enabled():
+            return
+        cls._cache[fingerprint] = (time.monotonic() + AppConfig.app_page_count_cache_ttl, tables, versions, total)
+        cls._cache.move_to_end(fingerprint)
+        while len(cls._cache) > AppConfig.app_page_count_cache_size:
+            cls._cache.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, tables: set[str]) -> None:
+        """
+        递增数据表写入版本号，使相关缓存失效
+
+        :param tables: 发生写入的数据表，包含通配符时使全部缓存失效
+        :return: None
+        """
+        if cls._all_tables in tables:
+            cls._global_version += 1
+            return
+        for table in tables:
+            cls._table_versions[table] = cls._table_versions.get(table, 0) + 1
+
+    @classmethod
+    def has_pending_writes(cls, connection: Connection) -> bool:
+        """
+        判断连接当前事务中是否存在未提交的写入
+
+        :param connection: 同步连接对象
+        :return: 是否存在未提交的写入
+        """
+        return bool(connection.info.get(cls._pending_tables_key))
+
+    @classmethod
+    def on_after_cursor_execute(
+        cls,
+        connection: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext,
+        executemany: bool,
+    ) -> None:
+        """
+        语句执行后记录写入的数据表并使相关缓存失效，事务提交时再次失效，避免其他会话在提交前缓存旧的计数；
+        无法解析数据表的文本写入语句使全部缓存失效
+
+        :param connection: 同步连接对象
+        :param cursor: DBAPI游标对象
+        :param statement: 执行的SQL语句
+        :param parameters: 语句参数
+        :param context: 执行上下文
+        :param executemany: 是否批量执行
+        :return: None
+        """
+        compiled_statement = getattr(context.compiled, 'statement', None)
+        if isinstance(compiled_statement, UpdateBase) and isinstance(compiled_statement.table, Table):
+            tables = {compiled_statement.table.name}
+        elif cls._text_dml_pattern.match(statement):
+            tables = {cls._all_tables}
+        else:
+            return
+        connection.info.setdefault(cls._pending_tables_key, set()).update(tables)
+        cls.invalidate(tables)
+
+    @classmethod
+    def on_commit(cls, connection: Connection) -> None:
+        """
+        事务提交后使写入数据表的相关缓存失效
+
+        :param connection: 同步连接对象
+        :return: None
+        """
+        tables = connection.info.pop(cls._pending_tables_key, None)
+        if tables:
+            cls.invalidate(tables)
+            cls._request_publish(tables)
+
+    @classmethod
+    def on_rollback(cls, connection: Connection) -> None:
+        """
+        事务回滚后清除未提交的写入记录
+
+        :param connection: 同步连接对象
+        :return: None
+        """
+        connection.info.pop(cls._pending_tables_key, None)
+
+    @classmethod
+    def _request_publish(cls, tables: set[str]) -> None:
+        """
+        登记待通知其他worker的写入数据表，由事件循环合并后发布，提交事件可能在任意线程触发
+
+        :param tables: 发生写入的数据表
+        :return: None
+        """
+        loop = cls._loop
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(cls._schedule_publish, frozenset(tables))
+
+    @classmethod
+    def _schedule_publish(cls, tables: frozenset[str]) -> None:
+        """
+        合并待通知的数据表，同一时间只保留一个发布任务
+
+        :param tables: 发生写入的数据表
+        :return: None
+        """
+        cls._publish_tables.update(tables)
+        if cls._publish_task is None or cls._publish_task.done():
+            cls._publish_task = asyncio.create_task(cls._publish_pending())
+
+    @classmethod
+    async def _publish_pending(cls) -> None:
+        """
+        发布待通知的数据表写入，发布期间新登记的数据表在下一轮发布
+
+        :return: None
+        """
+        while cls._publish_tables and cls._redis is not None:
+            tables, cls._publish_tables = cls._publish_tables, set()
+            message = json.dumps({'source': cls._source_id, 'tables': sorted(tables)})
+            try:
+                await cls._redis.publish(cls.CHANNEL, message)
+            except RedisError as e:
+                logger.error(f'发布分页总记录数缓存失效通知失败，其他worker将在缓存过期后刷新：{e}')
+        cls._publish_tables.clear()
+
+    @classmethod
+    def _handle_message(cls, message: dict[str, Any]) -> None:
+        """
+        处理订阅通道消息
+
+        :param message: 订阅消息
+        :return: None
+        """
+        message_type = message.get('type')
+        if message_type == 'subscribe':
+            # 订阅建立前可能已错过失效通知，清空后再启用缓存
+            cls.invalidate({cls._all_tables})
+            cls._listening = True
+        elif message_type == 'message':
+            payload = json.loads(message.get('data'))
+            if payload.get('source') != cls._source_id:
+                cls.invalidate(set(payload.get('tables') or [cls._all_tables]))
+
+    @classmethod
+    async def listen_invalidation(cls, redis: aioredis.Redis) -> None:
+        """
+        发布本worker提交的写入并监听其他worker的失效通知，连接异常时停用缓存并自动重连
+
+        :param redis: Redis连接对象
+        :return: None
+        """
+        cls._redis = redis
+        cls._loop = asyncio.get_running_loop()
+        try:
+            while True:
+                pubsub = redis.pubsub()
+                try:
+                    await pubsub.subscribe(cls.CHANNEL)
+                    async for message in pubsub.listen():
+                        cls._handle_message(message)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f'❌ 分页总记录数缓存失效通知监听异常: {e}，{cls._RECONNECT_DELAY}秒后重试...')
+                finally:
+                    cls._listening = False
+                    cls.invalidate({cls._all_tables})
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+                await asyncio.sleep(cls._RECONNECT_DELAY)
+        finally:
+            cls._redis = None
+            cls._loop = None
+
+
+event.listen(Engine, 'after_cursor_execute', PageCountCache.on_after_cursor_execute)
+event.listen(Engine, 'commit', PageCountCache.on_commit)
+event.listen(Engine, 'rollback', PageCountCache.on_rollback)
 
 
 class PageUtil:
@@ -39,7 +351,14 @@ class PageUtil:
 
     @classmethod
     async def paginate(
-        cls, db: AsyncSession, query: Select, page_num: int, page_size: int, is_page: bool = False
+        cls,
+        db: AsyncSession,
+        query: Select,
+        page_num: int,
+        page_size: int,
+        is_page: bool = False,
+        keyset: Sequence[UnaryExpression] | None = None,
+        cursor: str | None = None,
     ) -> PageModel | list[dict[str, Any] | list[dict[Any, Any]]]:
         """
         输入查询语句和分页信息，返回分页数据列表结果
@@ -49,11 +368,16 @@ class PageUtil:
         :param page_num: 当前页码
         :param page_size: 当前页面数据量
         :param is_page: 是否开启分页
+        :param keyset: 游标分页排序键，传入时按排序键定位下一页而不使用OFFSET，最后一个排序键须为主键，可为空的排序键按空值在后排序
+        :param cursor: 游标分页的续页令牌，为空时返回第一页
         :return: 分页数据对象
         """
-        if is_page:
-            total = (await db.execute(select(func.count('*')).select_from(query.subquery()))).scalar()
-            query_result = await db.execute(query.offset((page_num - 1) * page_size).limit(page_size))
+        if is_page and keyset:
+            result = await cls._paginate_by_keyset(db, query, page_num, page_size, keyset, cursor)
+        elif is_page:
+            total, query_result = await cls._execute_page(
+                db, query, query.offset((page_num - 1) * page_size).limit(page_size)
+            )
             paginated_data: list[Row] = []
             for row in query_result:
                 if row and len(row) == 1:
@@ -80,6 +404,283 @@ class PageUtil:
 
         return result
 
+    @classmethod
+    async def _paginate_by_keyset(
+        cls,
+        db: AsyncSession,
+        query: Select,
+        page_num: int,
+        page_size: int,
+        keyset: Sequence[UnaryExpression],
+        cursor: str | None,
+    ) -> PageModel:
+        """
+        按排序键定位分页，续页查询通过排序键比较走索引范围扫描，耗时与页码深度无关
+
+        :param db: orm对象
+        :param query: sqlalchemy查询语句
+        :param page_num: 当前页码
+        :param page_size: 当前页面数据量
+        :param keyset: 游标分页排序键
+        :param cursor: 续页令牌
+        :return: 分页数据对象
+        """
+        values = cls._decode_cursor(cursor, keyset) if cursor else None
+        total: int | None = None
+        paginated_data: list[Any] = []
+        for null_keys in cls._get_keyset_segments(keyset, values):
+            page_query = cls._get_keyset_page_query(query, keyset, null_keys, values).limit(
+                page_size + 1 - len(paginated_data)
+            )
+            # 仅续页令牌所在分段按排序键定位，其后分段从头读取
+            values = None
+            if total is None:
+                total, query_result = await cls._execute_page(db, query, page_query)
+            else:
+                query_result = await db.execute(page_query)
+            paginated_data.extend(row[0] if row and len(row) == 1 else row for row in query_result)
+            if len(paginated_data) > page_size:
+                break
+        has_next = len(paginated_data) > page_size
+        next_cursor = None
+        if has_next:
+            paginated_data = paginated_data[:page_size]
+            next_cursor = cls._encode_cursor(keyset, cls._get_keyset_values(paginated_data[-1], keyset))
+
+        return PageModel[Any](
+            rows=CamelCaseUtil.transform_result(paginated_data),
+            pageNum=page_num,
+            pageSize=page_size,
+            total=total,
+            hasNext=has_next,
+            nextCursor=next_cursor,
+        )
+
+    @classmethod
+    async def _execute_page(cls, db: AsyncSession, query: Select, page_query: Select) -> tuple[int, Result]:
+        """
+        获取总记录数及分页数据，总记录数优先读取缓存，未命中时在连接池的另一个连接上与分页查询并发执行计数
+
+        :param db: orm对象
+        :param query: sqlalchemy查询语句
+        :param page_query: 分页查询语句
+        :return: 总记录数及分页查询结果
+        """
+        count_query = select(func.count('*')).select_from(query.order_by(None).subquery())
+        fingerprint = PageCountCache.get_fingerprint(db, count_query)
+        total = PageCountCache.get_total(fingerprint)
+        if total is not None:
+            return total, await db.execute(page_query)
+        tables = PageCountCache.get_tables(count_query)
+        versions = PageCountCache.get_versions(tables)
+        if await cls._can_count_concurrently(db):
+            total, query_result = await asyncio.gather(cls._execute_count(db.bind, count_query), db.execute(page_query))
+        else:
+            total = (await db.execute(count_query)).scalar()
+            query_result = await db.execute(page_query)
+        PageCountCache.set_total(fingerprint, tables, versions, total)
+
+        return total, query_result
+
+    @classmethod
+    async def _can_count_concurrently(cls, db: AsyncSession) -> bool:
+        """
+        判断是否可在独立连接上并发执行计数，连接池无空闲连接或当前事务存在未提交的写入时在当前会话中顺序执行
+
+        :param db: orm对象
+        :return: 是否可并发执行计数
+        """
+        if not AppConfig.app_page_concurrent_count_enabled or not isinstance(db.bind, AsyncEngine):
+            return False
+        pool = db.bind.sync_engine.pool
+        if not isinstance(pool, QueuePool) or pool.checkedout() >= pool.size():
+            return False
+        connection = await db.connection()
+
+        return not PageCountCache.has_pending_writes(connection.sync_connection)
+
+    @classmethod
+    async def _execute_count(cls, engine: AsyncEngine, count_query: Select) -> int:
+        """
+        在独立连接上执行计数
+
+        :param engine: 异步数据库引擎
+        :param count_query: 计数语句
+        :return: 总记录数
+        """
+        async with engine.connect() as connection:
+            return (await connection.execute(count_query)).scalar()
+
+    @classmethod
+    def _is_nullable_key(cls, order_by: UnaryExpression) -> bool:
+        """
+        判断排序键对应的列是否可为空
+
+        :param order_by: 游标分页排序键
+        :return: 排序键对应的列是否可为空
+        """
+        return getattr(order_by.element, 'nullable', True) and not getattr(order_by.element, 'primary_key', False)
+
+    @classmethod
+    def _get_keyset_segments(cls, keyset: Sequence[UnaryExpression], values: list[Any] | None) -> list[frozenset[int]]:
+        """
+        按空值在后的顺序获取待读取的分段，每个分段为取值为空的可为空排序键下标集合；
+        从续页令牌所在分段开始，排序键均为空值时只剩该分段
+
+        :param keyset: 游标分页排序键
+        :param values: 上一页最后一行的排序键值，为空时从第一个分段开始
+        :return: 分段列表
+        """
+        nullable_indexes = [index for index, order_by in enumerate(keyset) if cls._is_nullable_key(order_by)]
+        segments = [
+            frozenset(index for index, is_null in zip(nullable_indexes, null_flags, strict=True) if is_null)
+            for null_flags in product((False, True), repeat=len(nullable_indexes))
+        ]
+        if values is None:
+            return segments
+        cursor_segment = frozenset(index for index in nullable_indexes if values[index] is None)
+
+        return segments[segments.index(cursor_segment) :]
+
+    @classmethod
+    def _get_keyset_page_query(
+        cls,
+        query: Select,
+        keyset: Sequence[UnaryExpression],
+        null_keys: frozenset[int],
+        values: list[Any] | None,
+    ) -> Select:
+        """
+        构建分段内的游标分页查询语句，分段内可为空的排序键固定为空或非空，
+        排序与定位条件只包含非空排序键，MySQL与PostgreSQL均可直接使用排序列上的索引提供顺序并进行范围扫描
+
+        :param query: sqlalchemy查询语句
+        :param keyset: 游标分页排序键
+        :param null_keys: 分段内取值为空的排序键下标集合
+        :param values: 上一页最后一行的排序键值，为空时从分段开头读取
+        :return: 分段内的游标分页查询语句
+        """
+        conditions: list[ColumnElement[bool]] = []
+        order_by_list: list[UnaryExpression] = []
+        seek_values: list[Any] = []
+        for index, order_by in enumerate(keyset):
+            if index in null_keys:
+                conditions.append(order_by.element.is_(None))
+                continue
+            if cls._is_nullable_key(order_by):
+                conditions.append(order_by.element.is_not(None))
+            order_by_list.append(order_by)
+            if values is not None:
+                seek_values.append(values[index])
+        if values is not None:
+            conditions.append(cls._get_keyset_seek_condition(order_by_list, seek_values))
+
+        return query.where(*conditions).order_by(None).order_by(*order_by_list)
+
+    @classmethod
+    def _get_keyset_seek_condition(cls, keyset: Sequence[UnaryExpression], values: list[Any]) -> ColumnElement[bool]:
+        """
+        根据上一页最后一行的排序键值构建定位条件，展开为 a < x OR (a = x AND b < y) 形式，
+        支持各排序键方向不一致的情况，且MySQL与PostgreSQL均可使用联合索引进行范围扫描
+
+        :param keyset: 游标分页排序键
+        :param values: 上一页最后一行的排序键值
+        :return: 定位条件
+        """
+        conditions = []
+        for index, (order_by, value) in enumerate(zip(keyset, values, strict=True)):
+            column = order_by.element
+            seek = column < value if order_by.modifier is operators.desc_op else column > value
+            conditions.append(
+                and_(*[key.element == key_value for key, key_value in zip(keyset[:index], values, strict=False)], seek)
+            )
+
+        return or_(*conditions)
+
+    @classmethod
+    def _get_keyset_values(cls, row: Any, keyset: Sequence[UnaryExpression]) -> list[Any]:
+        """
+        获取数据行的排序键值
+
+        :param row: 单实体查询的orm对象或多列查询的数据行
+        :param keyset: 游标分页排序键
+        :return: 排序键值列表
+        """
+        if isinstance(row, Row):
+            return [row._mapping[order_by.element.key] for order_by in keyset]
+        return [getattr(row, order_by.element.key) for order_by in keyset]
+
+    @classmethod
+    def _get_keyset_signature(cls, keyset: Sequence[UnaryExpression]) -> str:
+        """
+        获取排序键签名，用于校验续页令牌与当前排序方式是否一致
+
+        :param keyset: 游标分页排序键
+        :return: 排序键签名
+        """
+        signature = ','.join(
+            f'{order_by.element.key}:{"desc" if order_by.modifier is operators.desc_op else "asc"}'
+            for order_by in keyset
+        )
+        return hashlib.sha256(signature.encode()).hexdigest()[:16]
+
+    @classmethod
+    def _encode_cursor(cls, keyset: Sequence[UnaryExpression], values: list[Any]) -> str:
+        """
+        将排序键值编码为不透明的续页令牌
+
+        :param keyset: 游标分页排序键
+        :param values: 排序键值列表
+        :return: 续页令牌
+        """
+        payload = {
+            's': cls._get_keyset_signature(keyset),
+            'k': [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        }
+        token = base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+        return token.rstrip('=')
+
+    @classmethod
+    def _decode_cursor(cls, cursor: str, keyset: Sequence[UnaryExpression]) -> list[Any]:
+        """
+        解析续页令牌中的排序键值
+
+        :param cursor: 续页令牌
+        :param keyset: 游标分页排序键
+        :return: 排序键值列表
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            if payload['s'] != cls._get_keyset_signature(keyset) or len(payload['k']) != len(keyset):
+                raise ValueError('cursor does not match keyset')
+            values = []
+            for order_by, value in zip(keyset, payload['k'], strict=True):
+                if value is None and cls._is_nullable_key(order_by):
+                    values.append(None)
+                    continue
+                if isinstance(value, bool) or not isinstance(value, str | int | float):
+                    raise TypeError('cursor value must be a scalar')
+                values.append(datetime.fromisoformat(value) if order_by.element.type.python_type is datetime else value)
+        except (binascii.Error, UnicodeDecodeError, NotImplementedError, TypeError, KeyError, ValueError) as e:
+            raise ServiceException(message='分页游标无效，请从第一页重新查询') from e
+
+        return values
+
+    @classmethod
+    async def stream(cls, db: AsyncSession, query: Select, batch_size: int = 1000) -> AsyncIterator[Any]:
+        """
+        输入查询语句，通过服务端游标分批读取并逐行返回结果，内存占用与数据总量无关
+
+        :param db: orm对象
+        :param query: sqlalchemy查询语句
+        :param batch_size: 每批从游标读取的数据行数
+        :return: 驼峰命名的数据行迭代器，单实体查询返回字典，多实体查询返回字典列表
+        """
+        query_result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in query_result.partitions():
+            for row in partition:
+                yield CamelCaseUtil.transform_result(row[0] if row and len(row) == 1 else row)
+
 
 def get_page_obj(data_list: list, page_num: int, page_size: int) -> PageModel:
     """
@@ -1,11 +1,39 @@
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
 import bcrypt
 
+from config.env import AppConfig
+from exceptions.exception import ServiceException
+from utils.log_util import logger
+
+T = TypeVar('T')
+
 
 class PwdUtil:
     """
     密码工具类
     """
 
+    _executor: ThreadPoolExecutor | None = None
+    _executor_lock = threading.Lock()
+    _semaphore: asyncio.Semaphore | None = None
+    _semaphore_loop: asyncio.AbstractEventLoop | None = None
+    _metrics: dict[str, int | float] = {
+        'submitted': 0,
+        'completed': 0,
+        'failed': 0,
+        'rejected': 0,
+        'in_flight': 0,
+        'total_wait_seconds': 0.0,
+        'max_wait_seconds': 0.0,
+        'total_run_seconds': 0.0,
+    }
+
     @classmethod
     def verify_password(cls, plain_password: str, hashed_password: str) -> bool:
         """
@@ -28,3 +56,142 @@ class PwdUtil:
         :return: 加密成功的密码
         """
         return bcrypt.hashpw(input_password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+
+    @classmethod
+    async def verify_password_async(cls, plain_password: str, hashed_password: str) -> bool:
+        """
+        工具方法：在密码计算线程池中校验密码，避免bcrypt阻塞事件循环
+
+        :param plain_password: 当前输入的密码
+        :param hashed_password: 数据库存储的密码
+        :return: 校验结果
+        """
+        if not hashed_password:
+            return cls.verify_password(plain_password, hashed_password)
+        return await cls._run_in_executor(cls.verify_password, plain_password, hashed_password)
+
+    @classmethod
+    async def get_password_hash_async(cls, input_password: str) -> str:
+        """
+        工具方法：在密码计算线程池中对密码进行加密，避免bcrypt阻塞事件循环
+
+        :param input_password: 输入的密码
+        :return: 加密成功的密码
+        """
+        return await cls._run_in_executor(cls.get_password_hash, input_password)
+
+    @classmethod
+    def get_metrics(cls) -> dict[str, int | float]:
+        """
+        获取密码计算线程池运行指标
+
+        :return: 线程池配置与累计提交、完成、失败、拒绝次数及排队、执行耗时
+        """
+        return {
+            'max_workers': AppConfig.app_password_hash_max_workers,
+            'max_pending': AppConfig.app_password_hash_max_pending,
+            **cls._metrics,
+        }
+
+    @classmethod
+    def reset_metrics(cls) -> None:
+        """
+        重置密码计算线程池累计指标
+
+        :return: None
+        """
+        for key in cls._metrics:
+            if key != 'in_flight':
+                cls._metrics[key] = 0.0 if key.endswith('_seconds') else 0
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        应用关闭时释放密码计算线程池
+
+        :return: None
+        """
+        with cls._executor_lock:
+            executor, cls._executor = cls._executor, None
+        cls._semaphore = None
+        cls._semaphore_loop = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        获取密码计算线程池，首次使用时按配置创建
+
+        :return: 密码计算线程池
+        """
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=max(1, AppConfig.app_password_hash_max_workers),
+                        thread_name_prefix='pwd-hash',
+                    )
+        return cls._executor
+
+    @classmethod
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        """
+        获取当前事件循环的排队信号量，用于限制同时提交到线程池的任务数
+
+        :return: 排队信号量
+        """
+        loop = asyncio.get_running_loop()
+        if cls._semaphore is None or cls._semaphore_loop is not loop:
+            cls._semaphore = asyncio.Semaphore(max(1, AppConfig.app_password_hash_max_pending))
+            cls._semaphore_loop = loop
+        return cls._semaphore
+
+    @classmethod
+    async def _run_in_executor(cls, func: Callable[..., T], *args: Any) -> T:
+        """
+        在密码计算线程池中执行任务，排队任务数达到上限时等待，等待超时则拒绝
+
+        :param func: 待执行的同步函数
+        :param args: 函数参数
+        :return: 函数执行结果
+        """
+        semaphore = cls._get_semaphore()
+        cls._metrics['submitted'] += 1
+        start_time = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=AppConfig.app_password_hash_queue_timeout)
+        except asyncio.TimeoutError:
+            cls._metrics['rejected'] += 1
+            logger.warning('密码计算任务排队超时，当前请求已被拒绝')
+            raise ServiceException(message='系统繁忙，请稍后再试') from None
+        cls._metrics['in_flight'] += 1
+        try:
+            result, wait_seconds, run_seconds = await asyncio.get_running_loop().run_in_executor(
+                cls._get_executor(), cls._timed_call, start_time, func, *args
+            )
+        except Exception:
+            cls._metrics['failed'] += 1
+            raise
+        finally:
+            cls._metrics['in_flight'] -= 1
+            semaphore.release()
+        cls._metrics['completed'] += 1
+        cls._metrics['total_wait_seconds'] += wait_seconds
+        cls._metrics['max_wait_seconds'] = max(cls._metrics['max_wait_seconds'], wait_seconds)
+        cls._metrics['total_run_seconds'] += run_seconds
+        return result
+
+    @staticmethod
+    def _timed_call(submit_time: float, func: Callable[..., T], *args: Any) -> tuple[T, float, float]:
+        """
+        在工作线程中执行任务并计算排队与执行耗时
+
+        :param submit_time: 任务提交时间
+        :param func: 待执行的同步函数
+        :param args: 函数参数
+        :return: 函数执行结果、排队耗时与执行耗时
+        """
+        start_time = time.perf_counter()
+        result = func(*args)
+        return result, start_time - submit_time, time.perf_counter() - start_time
@@ -1,3 +1,5 @@
+import asyncio
+import os
 from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
@@ -7,8 +9,83 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from starlette.background import BackgroundTask
+from starlette.types import Receive, Scope, Send
 
 from common.constant import HttpStatusConstant
+from utils.file_util import FileDownloadResult, FileUtil
+
+
+class FileDownloadResponse(StreamingResponse):
+    """
+    文件下载响应
+
+    ASGI服务器声明支持http.response.pathsend扩展时，完整文件交由服务器直接发送（如os.sendfile），不经过Python读取；
+    分段下载、HEAD请求或服务器不支持该扩展时回退为分块流式读取；app.py默认使用的uvicorn不支持该扩展，默认部署始终为分块流式读取
+    """
+
+    _PATHSEND = 'http.response.pathsend'
+
+    def __init__(
+        self,
+        download_result: FileDownloadResult,
+        status_code: int = status.HTTP_200_OK,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(
+            content=download_result.data,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+            background=background,
+        )
+        self.download_result = download_result
+
+    def _can_pathsend(self, scope: Scope) -> bool:
+        """
+        判断当前请求是否可以由服务器直接发送文件
+
+        :param scope: ASGI请求作用域
+        :return: 是否可以直接发送文件
+        """
+        return (
+            self.download_result.filepath is not None
+            and not self.download_result.byte_range.is_partial
+            and scope.get('method', '').upper() != 'HEAD'
+            and self._PATHSEND in (scope.get('extensions') or {})
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._can_pathsend(scope):
+            await super().__call__(scope, receive, send)
+            return
+
+        # 回退数据流尚未开始迭代，关闭时不会触发其中的审计等收尾逻辑，由on_sent回调完成
+        await self.body_iterator.aclose()
+        byte_range = self.download_result.byte_range
+        bytes_sent = 0
+        error_message = 'StreamClosed'
+        try:
+            stat_result = await asyncio.to_thread(os.stat, self.download_result.filepath)
+            if stat_result.st_size != byte_range.file_size:
+                raise OSError('文件在下载期间发生变化')
+            await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.raw_headers})
+            await send({'type': self._PATHSEND, 'path': str(self.download_result.filepath)})
+            bytes_sent = byte_range.length
+        except asyncio.CancelledError:
+            error_message = 'CancelledError'
+            raise
+        except Exception as exc:
+            error_message = exc.__class__.__name__
+            raise
+        else:
+            error_message = ''
+        finally:
+            if self.download_result.on_sent is not None:
+                await self.download_result.on_sent(bytes_sent, error_message)
+        if self.background is not None:
+            await self.background()
 
 
 class ResponseUtil:
@@ -319,3 +396,34 @@ class ResponseUtil:
             media_type=media_type,
             background=background,
         )
+
+    @classmethod
+    def file_download(
+        cls,
+        *,
+        download_result: FileDownloadResult,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> Response:
+        """
+        文件下载响应方法，服务器支持时零拷贝发送完整文件，客户端缓存仍然有效时返回304
+
+        :param download_result: 文件下载结果
+        :param headers: 可选，响应头信息
+        :param media_type: 可选，响应结果媒体类型
+        :param background: 可选，响应返回后执行的后台任务
+        :return: 文件下载响应结果
+        """
+        cache_headers = FileUtil.build_cache_headers(download_result)
+        if download_result.not_modified:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers, background=background)
+        return FileDownloadResponse(
+            download_result,
+            status_code=status.HTTP_206_PARTIAL_CONTENT
+            if download_result.byte_range.is_partial
+            else status.HTTP_200_OK,
+            headers={**(headers or {}), **cache_headers},
+            media_type=media_type,
+            background=background,
+        )
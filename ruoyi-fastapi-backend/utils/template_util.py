@@ -3,10 +3,10 @@ import os
 from datetime import datetime
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from common.constant import GenConstant
-from config.env import DataBaseConfig
+from config.env import DataBaseConfig, GenConfig
 from exceptions.exception import ServiceWarning
 from module_generator.entity.vo.gen_vo import GenTableColumnModel, GenTableModel
 from utils.common_util import CamelCaseUtil, SnakeCaseUtil
@@ -18,17 +18,40 @@ class TemplateInitializer:
     模板引擎初始化类
     """
 
+    _environments: dict[str, Environment] = {}
+
     @classmethod
     def init_jinja2(cls) -> Environment:
         """
-        初始化 Jinja2 模板引擎
+        获取 Jinja2 模板引擎，进程内按模板目录缓存，首次创建时预编译全部模板，后续调用直接复用
+
+        :return: Jinja2 环境对象
+        """
+        template_dir = os.path.join(os.getcwd(), 'module_generator', 'templates')
+        env = cls._environments.get(template_dir)
+        if env is None:
+            env = cls._create_environment(template_dir)
+            cls._environments[template_dir] = env
+        return env
+
+    @classmethod
+    def _create_environment(cls, template_dir: str) -> Environment:
+        """
+        创建 Jinja2 模板引擎并预编译全部模板，配置字节码缓存目录时编译结果同时写入磁盘供其他进程复用
 
+        :param template_dir: 模板目录
         :return: Jinja2 环境对象
         """
         try:
-            template_dir = os.path.join(os.getcwd(), 'module_generator', 'templates')
             env = Environment(
                 loader=FileSystemLoader(template_dir),
+                bytecode_cache=(
+                    FileSystemBytecodeCache(GenConfig.TEMPLATE_BYTECODE_CACHE_PATH)
+                    if GenConfig.TEMPLATE_BYTECODE_CACHE_PATH
+                    else None
+                ),
+                cache_size=-1,
+                auto_reload=False,
                 keep_trailing_newline=True,
                 trim_blocks=True,
                 lstrip_blocks=True,
@@ -40,6 +63,8 @@ class TemplateInitializer:
                     'get_sqlalchemy_type': TemplateUtils.get_sqlalchemy_type,
                 }
             )
+            for template in env.list_templates(extensions=['jinja2']):
+                env.get_template(template)
             return env
         except Exception as e:
             raise RuntimeError(f'初始化Jinja2模板引擎失败: {e}') from e
@@ -1,15 +1,19 @@
 import base64
+import hashlib
+import hmac
 import json
 import os
 import time
+import uuid
 from collections import Counter, defaultdict, deque
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from threading import Lock
 from typing import Any
 
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from fastapi import FastAPI, Request
 from redis import asyncio as aioredis
@@ -67,6 +71,7 @@ class DecryptedTransportEnvelope:
     aes_key: 当前请求协商出的AES会话密钥
     aad: 通过校验后的AAD上下文
     plaintext: 解密得到的原始请求载荷
+    session_id: 会话模式下使用的传输会话编号
     """
 
     kid: str
@@ -75,6 +80,24 @@ class DecryptedTransportEnvelope:
     aes_key: bytes
     aad: dict[str, str]
     plaintext: bytes
+    session_id: str | None = None
+
+
+@dataclass(frozen=True)
+class TransportSession:
+    """
+    传输会话载体
+
+    session_id: 传输会话编号
+    kid: 协商会话时使用的密钥版本标识
+    aes_key: 协商出的AES会话密钥
+    token_hash: 绑定的登录令牌摘要
+    """
+
+    session_id: str
+    kid: str
+    aes_key: bytes
+    token_hash: str
 
 
 # 传输层密钥管理
@@ -85,6 +108,7 @@ class TransportKeyProvider:
 
     _lock = Lock()
     _key_pairs: dict[str, TransportKeyPair] | None = None
+    _private_keys: dict[str, tuple[str, rsa.RSAPrivateKey]] = {}
     _MIN_RSA_KEY_SIZE = 2048
     _RSA_KEY_SIZE_STEP = 256
 
@@ -168,6 +192,28 @@ class TransportKeyProvider:
         """
         return cls.get_key_pair(kid).private_key_pem
 
+    @classmethod
+    def get_private_key(cls, kid: str | None = None) -> rsa.RSAPrivateKey:
+        """
+        获取已解析的私钥对象，按kid缓存解析结果，避免每次请求重复解析PEM
+
+        :param kid: 密钥版本标识，未传入时默认使用当前版本
+        :return: 私钥对象
+        """
+        key_pair = cls.get_key_pair(kid)
+        cached_private_key = cls._private_keys.get(key_pair.kid)
+        # 缓存中保留PEM原文，密钥轮换后PEM变化时重新解析
+        if cached_private_key is None or cached_private_key[0] != key_pair.private_key_pem:
+            with cls._lock:
+                cached_private_key = cls._private_keys.get(key_pair.kid)
+                if cached_private_key is None or cached_private_key[0] != key_pair.private_key_pem:
+                    private_key = serialization.load_pem_private_key(
+                        key_pair.private_key_pem.encode('utf-8'), password=None
+                    )
+                    cached_private_key = (key_pair.private_key_pem, private_key)
+                    cls._private_keys[key_pair.kid] = cached_private_key
+        return cached_private_key[1]
+
     @classmethod
     def get_key_pair(cls, kid: str | None = None) -> TransportKeyPair:
         """
@@ -378,6 +424,158 @@ class TransportSecurityUtil:
         return any(path == required_path or path.startswith(f'{required_path}/') for required_path in required_paths)
 
 
+# 传输会话管理
+class TransportSessionUtil:
+    """
+    传输会话工具
+
+    客户端通过一次RSA加密请求协商AES会话密钥后，后续请求仅携带会话编号与AES-GCM密文，
+    会话绑定登录令牌并设置有效期，退出登录或强退时随令牌一并撤销
+    """
+
+    _SESSION_KEY_PREFIX = 'transport:session'
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """
+        判断是否启用传输会话模式
+
+        :return: 是否启用传输会话模式
+        """
+        return TransportCryptoConfig.transport_crypto_session_enabled
+
+    @classmethod
+    def get_request_token(cls, request: Request) -> str | None:
+        """
+        从请求头中提取登录令牌
+
+        :param request: 当前请求对象
+        :return: 登录令牌，不存在时返回None
+        """
+        scheme, _, token = request.headers.get('authorization', '').partition(' ')
+        if scheme.lower() != 'bearer' or not token:
+            return None
+        return token.strip()
+
+    @classmethod
+    async def create_session(cls, redis: aioredis.Redis, kid: str, aes_key: bytes, token: str) -> dict[str, Any]:
+        """
+        创建绑定登录令牌的传输会话
+
+        :param redis: Redis连接对象
+        :param kid: 协商会话时使用的密钥版本标识
+        :param aes_key: 协商出的AES会话密钥
+        :param token: 登录令牌
+        :return: 传输会话编号与过期时间
+        """
+        session_id = uuid.uuid4().hex
+        token_hash = cls._hash_token(token)
+        ttl_seconds = TransportCryptoConfig.transport_crypto_session_ttl_seconds
+        session_value = json.dumps({'kid': kid, 'key': _urlsafe_b64encode(aes_key), 'tokenHash': token_hash})
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(cls._get_session_key(session_id), session_value, ex=ttl_seconds)
+            pipe.sadd(cls._get_token_sessions_key(token_hash), session_id)
+            pipe.expire(cls._get_token_sessions_key(token_hash), ttl_seconds)
+            await pipe.execute()
+
+        return {'sessionId': session_id, 'kid': kid, 'expireAt': int(time.time()) + ttl_seconds}
+
+    @classmethod
+    async def get_session(cls, request: Request, session_id: str) -> TransportSession:
+        """
+        获取当前请求可用的传输会话，并校验会话与请求携带的登录令牌一致
+
+        :param request: 当前请求对象
+        :param session_id: 传输会话编号
+        :return: 传输会话
+        """
+        if not cls.is_enabled():
+            raise ValueError('传输会话模式未启用')
+        redis = getattr(request.app.state, 'redis', None)
+        if redis is None:
+            raise ValueError('传输会话不可用，请重新协商')
+        session_value = await redis.get(cls._get_session_key(session_id))
+        if not session_value:
+            raise ValueError('传输会话不存在或已过期，请重新协商')
+        session_data = json.loads(session_value)
+        token = cls.get_request_token(request)
+        if not token or not hmac.compare_digest(cls._hash_token(token), str(session_data.get('tokenHash', ''))):
+            logger.warning('传输会话与登录令牌不匹配，sid={}', session_id)
+            raise ValueError('传输会话与当前登录令牌不匹配')
+
+        return TransportSession(
+            session_id=session_id,
+            kid=str(session_data['kid']),
+            aes_key=_urlsafe_b64decode(str(session_data['key'])),
+            token_hash=str(session_data['tokenHash']),
+        )
+
+    @classmethod
+    async def revoke_session(cls, redis: aioredis.Redis, transport_session: TransportSession) -> None:
+        """
+        撤销指定传输会话
+
+        :param redis: Redis连接对象
+        :param transport_session: 传输会话
+        :return: None
+        """
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.delete(cls._get_session_key(transport_session.session_id))
+            pipe.srem(cls._get_token_sessions_key(transport_session.token_hash), transport_session.session_id)
+            await pipe.execute()
+
+    @classmethod
+    async def revoke_token_sessions(cls, redis: aioredis.Redis, tokens: list[str | None]) -> None:
+        """
+        撤销登录令牌绑定的全部传输会话
+
+        :param redis: Redis连接对象
+        :param tokens: 登录令牌列表
+        :return: None
+        """
+        token_sessions_keys = [cls._get_token_sessions_key(cls._hash_token(token)) for token in tokens if token]
+        if not token_sessions_keys:
+            return
+        async with redis.pipeline(transaction=False) as pipe:
+            for token_sessions_key in token_sessions_keys:
+                pipe.smembers(token_sessions_key)
+            session_id_groups = await pipe.execute()
+        session_keys = [
+            cls._get_session_key(session_id) for session_ids in session_id_groups for session_id in session_ids
+        ]
+        await redis.delete(*session_keys, *token_sessions_keys)
+
+    @classmethod
+    def _get_session_key(cls, session_id: str) -> str:
+        """
+        获取传输会话Key
+
+        :param session_id: 传输会话编号
+        :return: 传输会话Key
+        """
+        return f'{cls._SESSION_KEY_PREFIX}:sid:{session_id}'
+
+    @classmethod
+    def _get_token_sessions_key(cls, token_hash: str) -> str:
+        """
+        获取登录令牌绑定的传输会话集合Key
+
+        :param token_hash: 登录令牌摘要
+        :return: 传输会话集合Key
+        """
+        return f'{cls._SESSION_KEY_PREFIX}:token:{token_hash}'
+
+    @staticmethod
+    def _hash_token(token: str) -> str:
+        """
+        计算登录令牌摘要，避免在Redis中保存令牌原文
+
+        :param token: 登录令牌
+        :return: 登录令牌摘要
+        """
+        return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
 # 传输层加解密核心能力
 class TransportCryptoUtil:
     """
@@ -386,7 +584,10 @@ class TransportCryptoUtil:
 
     _ENVELOPE_VERSION = '1'
     _RESPONSE_ENVELOPE_ALGORITHM = 'AES_256_GCM'
+    _CHUNKED_RESPONSE_ENVELOPE_ALGORITHM = 'AES_256_GCM_CHUNKED'
     _REQUIRED_ENVELOPE_FIELDS = ('kid', 'ts', 'nonce', 'ek', 'iv', 'ct', 'aad')
+    _SESSION_REQUEST_ENVELOPE_ALGORITHM = 'SESSION_AES_256_GCM'
+    _REQUIRED_SESSION_ENVELOPE_FIELDS = ('sid', 'ts', 'nonce', 'iv', 'ct', 'aad')
 
     @classmethod
     def get_response_envelope_algorithm(cls) -> str:
@@ -397,6 +598,39 @@ class TransportCryptoUtil:
         """
         return cls._RESPONSE_ENVELOPE_ALGORITHM
 
+    @classmethod
+    def get_chunked_response_envelope_algorithm(cls) -> str:
+        """
+        获取分段流式响应信封算法标识
+
+        :return: 分段流式响应信封算法标识
+        """
+        return cls._CHUNKED_RESPONSE_ENVELOPE_ALGORITHM
+
+    @classmethod
+    def create_chunked_response_encryptor(
+        cls,
+        aes_key: bytes,
+        kid: str,
+        method: str,
+        path: str,
+    ) -> 'TransportChunkedResponseEncryptor':
+        """
+        创建分段流式响应加密器，响应体随应用输出逐段加密下发，无需缓冲完整响应
+
+        :param aes_key: 请求协商出的AES会话密钥
+        :param kid: 当前使用的密钥版本标识
+        :param method: 当前HTTP请求方法
+        :param path: 当前HTTP请求路径
+        :return: 分段流式响应加密器
+        """
+        return TransportChunkedResponseEncryptor(
+            aes_key=aes_key,
+            kid=kid,
+            aad={'method': method.upper(), 'path': path, 'direction': 'response'},
+            chunk_size=TransportCryptoConfig.transport_crypto_response_chunk_size,
+        )
+
     @classmethod
     def decrypt_envelope(
         cls,
@@ -413,9 +647,64 @@ class TransportCryptoUtil:
         :return: 解密后的请求信封对象
         """
         cls._validate_envelope(envelope)
-        kid = str(envelope['kid'])
         aad = cls._extract_and_validate_aad(envelope, expected_method, expected_path)
         aes_key = cls.decrypt_request_key(envelope)
+
+        return cls._decrypt_payload(envelope, str(envelope['kid']), aes_key, aad)
+
+    @classmethod
+    def decrypt_session_envelope(
+        cls,
+        envelope: dict[str, Any],
+        transport_session: TransportSession,
+        expected_method: str,
+        expected_path: str,
+    ) -> DecryptedTransportEnvelope:
+        """
+        使用已协商的传输会话密钥解密请求信封，无需执行RSA解密
+
+        :param envelope: 会话模式请求加密信封
+        :param transport_session: 信封中会话编号对应的传输会话
+        :param expected_method: 当前请求预期HTTP方法
+        :param expected_path: 当前请求预期路径
+        :return: 解密后的请求信封对象
+        """
+        cls._validate_envelope(envelope, cls._REQUIRED_SESSION_ENVELOPE_FIELDS, cls._SESSION_REQUEST_ENVELOPE_ALGORITHM)
+        aad = cls._extract_and_validate_aad(envelope, expected_method, expected_path)
+
+        return cls._decrypt_payload(
+            envelope, transport_session.kid, transport_session.aes_key, aad, transport_session.session_id
+        )
+
+    @classmethod
+    def is_session_envelope(cls, envelope: dict[str, Any]) -> bool:
+        """
+        判断请求信封是否为携带会话编号的会话模式信封
+
+        :param envelope: 请求加密信封
+        :return: 是否为会话模式信封
+        """
+        return isinstance(envelope, dict) and bool(envelope.get('sid'))
+
+    @classmethod
+    def _decrypt_payload(
+        cls,
+        envelope: dict[str, Any],
+        kid: str,
+        aes_key: bytes,
+        aad: dict[str, str],
+        session_id: str | None = None,
+    ) -> DecryptedTransportEnvelope:
+        """
+        使用AES会话密钥解密请求信封中的密文
+
+        :param envelope: 请求加密信封
+        :param kid: 密钥版本标识
+        :param aes_key: AES会话密钥
+        :param aad: 通过校验后的AAD上下文
+        :param session_id: 会话模式下使用的传输会话编号
+        :return: 解密后的请求信封对象
+        """
         iv = _urlsafe_b64decode(str(envelope['iv']))
         ciphertext = _urlsafe_b64decode(str(envelope['ct']))
         plaintext = AESGCM(aes_key).decrypt(iv, ciphertext, cls._build_aad_bytes(aad))
@@ -427,6 +716,7 @@ class TransportCryptoUtil:
             aes_key=aes_key,
             aad=aad,
             plaintext=plaintext,
+            session_id=session_id,
         )
 
     @classmethod
@@ -437,9 +727,7 @@ class TransportCryptoUtil:
         :param envelope: 请求加密信封
         :return: 请求协商出的AES会话密钥
         """
-        kid = str(envelope['kid'])
-        private_key_pem = TransportKeyProvider.get_private_key_pem(kid)
-        private_key = serialization.load_pem_private_key(private_key_pem.encode('utf-8'), password=None)
+        private_key = TransportKeyProvider.get_private_key(str(envelope['kid']))
         encrypted_key = _urlsafe_b64decode(str(envelope['ek']))
         return private_key.decrypt(
             encrypted_key,
@@ -523,32 +811,48 @@ class TransportCryptoUtil:
             'publicKeyUrl': '/transport/crypto/public-key',
             'requestEnvelopeAlgorithm': TransportCryptoConfig.transport_crypto_algorithm,
             'responseEnvelopeAlgorithm': cls.get_response_envelope_algorithm(),
+            'chunkedResponseEnvelopeAlgorithm': cls.get_chunked_response_envelope_algorithm(),
             'enabledPaths': cls._split_paths(TransportCryptoConfig.transport_crypto_enabled_paths),
             'requiredPaths': cls._split_paths(TransportCryptoConfig.transport_crypto_required_paths),
             'excludePaths': cls._split_paths(TransportCryptoConfig.transport_crypto_exclude_paths),
             'maxEncryptedGetUrlLength': TransportCryptoConfig.transport_crypto_max_get_url_length,
+            'sessionEnabled': TransportCryptoConfig.transport_crypto_session_enabled,
+            'sessionUrl': '/transport/crypto/session',
+            'sessionEnvelopeAlgorithm': cls._SESSION_REQUEST_ENVELOPE_ALGORITHM,
+            'sessionTtlSeconds': TransportCryptoConfig.transport_crypto_session_ttl_seconds,
             'configExpireAt': int(time.time()) + TransportCryptoConfig.transport_crypto_frontend_config_ttl_seconds,
         }
 
     @classmethod
-    def _validate_envelope(cls, envelope: dict[str, Any]) -> None:
+    def _validate_envelope(
+        cls,
+        envelope: dict[str, Any],
+        required_fields: tuple[str, ...] | None = None,
+        algorithm: str | None = None,
+    ) -> None:
         """
         校验请求加密信封的结构、协议版本与算法是否有效
 
         :param envelope: 请求加密信封
+        :param required_fields: 必要字段，未传入时使用RSA信封必要字段
+        :param algorithm: 预期算法标识，未传入时使用配置的请求信封算法
         :return: None
         """
         if not isinstance(envelope, dict):
             raise ValueError('加密请求信封格式不合法')
 
-        missing_fields = [field_name for field_name in cls._REQUIRED_ENVELOPE_FIELDS if not envelope.get(field_name)]
+        missing_fields = [
+            field_name
+            for field_name in required_fields or cls._REQUIRED_ENVELOPE_FIELDS
+            if not envelope.get(field_name)
+        ]
         if missing_fields:
             raise ValueError(f'加密请求缺少必要字段: {",".join(missing_fields)}')
 
         if str(envelope.get('v', '')) != cls._ENVELOPE_VERSION:
             raise ValueError('加密请求协议版本不受支持')
 
-        if str(envelope.get('alg', '')) != TransportCryptoConfig.transport_crypto_algorithm:
+        if str(envelope.get('alg', '')) != (algorithm or TransportCryptoConfig.transport_crypto_algorithm):
             raise ValueError('加密请求算法不受支持')
 
     @classmethod
@@ -598,6 +902,120 @@ class TransportCryptoUtil:
         return [path.strip() for path in path_value.split(',') if path.strip()]
 
 
+# 传输层分段流式响应加密
+class TransportChunkedResponseEncryptor:
+    """
+    分段流式响应加密器
+
+    响应体按固定大小切分为AES-GCM分段，以换行分隔的JSON帧逐段输出：
+    首帧为不含密文的信封头，包含协议版本、kid、算法、AAD与基础IV；
+    数据帧包含分段序号与密文；末帧为认证尾帧，加密内容为分段总数与明文总长度。
+    每个分段的IV由基础IV与分段序号异或得到，分段序号与是否为尾帧参与AAD认证，
+    客户端可据此发现分段被重排、删除或截断
+    """
+
+    _IV_LENGTH = 12
+    _COUNTER_OFFSET = 4
+
+    def __init__(self, aes_key: bytes, kid: str, aad: dict[str, str], chunk_size: int) -> None:
+        """
+        初始化分段流式响应加密器
+
+        :param aes_key: 请求协商出的AES会话密钥
+        :param kid: 当前使用的密钥版本标识
+        :param aad: 响应AAD上下文
+        :param chunk_size: 单个分段的明文字节数
+        :return: None
+        """
+        self._aesgcm = AESGCM(aes_key)
+        self._kid = kid
+        self._aad = aad
+        self._chunk_size = max(1, chunk_size)
+        self._base_iv = os.urandom(self._IV_LENGTH)
+        self._pending = bytearray()
+        self._sequence = 0
+        self._total_length = 0
+
+    def start(self) -> bytes:
+        """
+        生成信封头帧
+
+        :return: 信封头帧字节串
+        """
+        header = {
+            'v': TransportCryptoUtil._ENVELOPE_VERSION,
+            'kid': self._kid,
+            'alg': TransportCryptoUtil._CHUNKED_RESPONSE_ENVELOPE_ALGORITHM,
+            'aad': self._aad,
+            'iv': _urlsafe_b64encode(self._base_iv),
+        }
+        return self._encode_frame(header)
+
+    def update(self, data: bytes) -> Iterator[bytes]:
+        """
+        写入一段响应体，凑满分段大小的部分立即加密输出，剩余部分暂存等待后续数据
+
+        :param data: 应用输出的响应体片段
+        :return: 已加密的数据帧迭代器
+        """
+        view = memoryview(data)
+        if self._pending:
+            fill_length = self._chunk_size - len(self._pending)
+            self._pending += view[:fill_length]
+            view = view[fill_length:]
+            if len(self._pending) < self._chunk_size:
+                return
+            yield self._encrypt_frame(self._pending)
+            self._pending = bytearray()
+        while len(view) >= self._chunk_size:
+            yield self._encrypt_frame(view[: self._chunk_size])
+            view = view[self._chunk_size :]
+        self._pending += view
+
+    def finalize(self) -> Iterator[bytes]:
+        """
+        输出暂存的剩余数据帧与认证尾帧
+
+        :return: 剩余数据帧与认证尾帧迭代器
+        """
+        if self._pending:
+            yield self._encrypt_frame(self._pending)
+            self._pending = bytearray()
+        trailer = json.dumps({'chunks': self._sequence, 'length': self._total_length}).encode('utf-8')
+        yield self._encrypt_frame(trailer, final=True)
+
+    def _encrypt_frame(self, chunk: bytes | bytearray | memoryview, final: bool = False) -> bytes:
+        """
+        加密单个分段并编码为数据帧
+
+        :param chunk: 分段明文
+        :param final: 是否为认证尾帧
+        :return: 数据帧字节串
+        """
+        sequence = self._sequence
+        counter = int.from_bytes(self._base_iv[self._COUNTER_OFFSET :], 'big') ^ sequence
+        iv = self._base_iv[: self._COUNTER_OFFSET] + counter.to_bytes(self._IV_LENGTH - self._COUNTER_OFFSET, 'big')
+        chunk_aad = TransportCryptoUtil._build_aad_bytes({**self._aad, 'seq': sequence, 'final': final})
+        ciphertext = self._aesgcm.encrypt(iv, chunk, chunk_aad)
+        if not final:
+            self._sequence += 1
+            self._total_length += len(chunk)
+        frame = {'seq': sequence, 'ct': _urlsafe_b64encode(ciphertext)}
+        if final:
+            frame['final'] = True
+        return self._encode_frame(frame)
+
+    @staticmethod
+    def _encode_frame(frame: dict[str, Any]) -> bytes:
+        """
+        将帧编码为以换行结尾的JSON字节串
+
+        :param frame: 帧字典
+        :return: 帧字节串
+        """
+        return json.dumps(frame, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
 # 传输层监控读写与聚合
 class TransportCryptoMonitorUtil:
     """